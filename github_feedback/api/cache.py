@@ -0,0 +1,497 @@
+"""Maintenance of the on-disk GitHub API response cache.
+
+Responses are cached by requests-cache in a single SQLite file. This module
+adds what a long-lived, shared cache needs on top of it:
+
+- zlib compression of stored responses (:func:`cache_serializer`); rows
+  written before compression was turned on stay readable
+- usage tables in the same database holding the last access of every
+  entry and hit/miss counts per endpoint, which drive LRU eviction down to
+  a configured size and the ``gfa cache stats`` report
+- pruning of expired entries and VACUUM
+- per-endpoint stale-while-revalidate policies (:class:`CachePolicy`):
+  an entry past its TTL is still served while :class:`BackgroundRevalidator`
+  refreshes it off the request path, up to a maximum staleness
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import pickle
+import sqlite3
+import threading
+import time
+import zlib
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple
+from urllib.parse import urlparse
+
+from requests_cache.serializers import CattrStage, SerializerPipeline, Stage
+
+from .metrics import endpoint_template
+
+logger = logging.getLogger(__name__)
+
+RESPONSES_TABLE = "responses"
+REDIRECTS_TABLE = "redirects"
+ACCESS_TABLE = "gfa_cache_access"
+ENDPOINTS_TABLE = "gfa_cache_endpoints"
+
+# Marks compressed rows so uncompressed ones from older versions still load
+_COMPRESSED_PREFIX = b"GFZ1"
+_COMPRESSION_LEVEL = 6
+# Buffered lookups are written to the usage tables in batches of this size
+_FLUSH_THRESHOLD = 256
+# Eviction goes below the limit so the next runs do not evict again at once
+_EVICTION_TARGET = 0.9
+_DELETE_CHUNK = 500
+# Background refreshes are conditional requests; two workers keep them off the rate limit
+_REVALIDATE_WORKERS = 2
+
+AGE_BUCKETS: List[Tuple[float, str]] = [
+    (3600, "< 1h"),
+    (86400, "1h - 1d"),
+    (7 * 86400, "1d - 7d"),
+    (30 * 86400, "7d - 30d"),
+    (math.inf, ">= 30d"),
+]
+
+
+def default_cache_name() -> Path:
+    """Return the cache path passed to requests-cache (without ``.sqlite``)."""
+    return Path.home() / ".cache" / "github_feedback" / "api_cache"
+
+
+def _compress(data: bytes) -> bytes:
+    return _COMPRESSED_PREFIX + zlib.compress(data, _COMPRESSION_LEVEL)
+
+
+def _decompress(data: bytes) -> bytes:
+    if data[:len(_COMPRESSED_PREFIX)] == _COMPRESSED_PREFIX:
+        return zlib.decompress(data[len(_COMPRESSED_PREFIX):])
+    return data
+
+
+def cache_serializer(compress: bool = True) -> SerializerPipeline:
+    """Pickle serializer of requests-cache with optional zlib compression.
+
+    Both variants read compressed and uncompressed rows and share one name:
+    requests-cache hashes the serializer into cache keys, so toggling
+    compression keeps existing entries addressable. Entries written by the
+    stock pickle serializer get different keys; they are never looked up
+    again and go first on eviction or ``gfa cache prune-expired``.
+    """
+    stages = [
+        CattrStage(),
+        Stage(pickle),
+        Stage(dumps=_compress if compress else bytes, loads=_decompress),
+    ]
+    return SerializerPipeline(stages, name="pickle+zlib", is_binary=True)
+
+
+def _api_path(url: str) -> str:
+    """Return the API path of a cached URL (GitHub Enterprise prefix removed)."""
+    path = urlparse(url).path
+    if path.startswith("/api/v3/"):
+        path = path[len("/api/v3"):]
+    return path
+
+
+@dataclass(frozen=True, slots=True)
+class CachePolicy:
+    """Freshness of cached responses for one endpoint.
+
+    Attributes:
+        ttl: Seconds a response is served as fresh
+        max_stale: Seconds past ``ttl`` a response is still served while it
+            is refreshed in the background; 0 makes the TTL a hard limit
+    """
+
+    ttl: int
+    max_stale: int = 0
+
+    @property
+    def expire_after(self) -> int:
+        """Seconds until requests-cache stops serving the entry at all."""
+        return self.ttl + self.max_stale
+
+    def is_stale(self, expires_delta: Optional[int]) -> bool:
+        """Return whether a cached entry is past its TTL but still servable.
+
+        Args:
+            expires_delta: Seconds until the entry expires in requests-cache
+                (``CachedResponse.expires_delta``); a 304 revalidation resets it
+        """
+        return self.max_stale > 0 and expires_delta is not None and expires_delta < self.max_stale
+
+
+class BackgroundRevalidator:
+    """Refreshes stale cache entries on a small worker pool.
+
+    Refreshes are keyed by cache key: while one is queued or running, later
+    stale hits on the same entry do not schedule another request.
+    """
+
+    def __init__(self, max_workers: int = _REVALIDATE_WORKERS) -> None:
+        self.max_workers = max_workers
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._in_flight: Set[str] = set()
+        self._futures: Set[Future] = set()
+
+    @property
+    def pending(self) -> int:
+        """Number of refreshes queued or running."""
+        with self._lock:
+            return len(self._in_flight)
+
+    def submit(self, key: str, refresh: Callable[[], object]) -> bool:
+        """Schedule ``refresh`` for ``key`` unless one is already in flight.
+
+        Returns:
+            True if a refresh was scheduled
+        """
+        with self._lock:
+            if key in self._in_flight:
+                return False
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="gfa-revalidate"
+                )
+            self._in_flight.add(key)
+            future = self._executor.submit(self._run, key, refresh)
+            self._futures.add(future)
+        future.add_done_callback(self._discard)
+        return True
+
+    def _run(self, key: str, refresh: Callable[[], object]) -> None:
+        try:
+            refresh()
+        except Exception as exc:  # The stale entry stays until it expires
+            logger.debug(f"Background revalidation of {key} failed: {exc}")
+        finally:
+            with self._lock:
+                self._in_flight.discard(key)
+
+    def _discard(self, future: Future) -> None:
+        with self._lock:
+            self._futures.discard(future)
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until scheduled refreshes finish; return False on timeout."""
+        with self._lock:
+            futures = list(self._futures)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for future in futures:
+            remaining = None if deadline is None else max(deadline - time.monotonic(), 0)
+            try:
+                future.result(timeout=remaining)
+            except TimeoutError:
+                return False
+        return True
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the workers; queued refreshes are dropped unless ``wait``."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=not wait)
+
+
+@dataclass(slots=True)
+class EndpointCacheStats:
+    """Cache contents and lookups of one endpoint template."""
+
+    entries: int = 0
+    stored_bytes: int = 0
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+@dataclass(slots=True)
+class CacheStats:
+    """Snapshot of the response cache for ``gfa cache stats``."""
+
+    path: Path
+    file_bytes: int = 0
+    entries: int = 0
+    expired: int = 0
+    stored_bytes: int = 0
+    body_bytes: int = 0
+    max_bytes: int = 0
+    endpoints: Dict[str, EndpointCacheStats] = field(default_factory=dict)
+    age_histogram: Dict[str, int] = field(default_factory=lambda: {label: 0 for _, label in AGE_BUCKETS})
+
+    @property
+    def hits(self) -> int:
+        return sum(stats.hits for stats in self.endpoints.values())
+
+    @property
+    def misses(self) -> int:
+        return sum(stats.misses for stats in self.endpoints.values())
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    @property
+    def compression_ratio(self) -> float:
+        """Response body bytes per stored byte (1.0 when nothing is stored)."""
+        return self.body_bytes / self.stored_bytes if self.stored_bytes else 1.0
+
+
+class ResponseCache:
+    """Usage tracking, LRU eviction and upkeep of the SQLite response cache.
+
+    Lookups are buffered in memory and written in batches, so the request
+    path never waits on SQLite; call :meth:`flush` before reading usage.
+    """
+
+    def __init__(self, cache_name: Optional[Path] = None, max_size_mb: int = 0) -> None:
+        """Initialize the cache manager.
+
+        Args:
+            cache_name: Cache path as given to requests-cache (default:
+                ``~/.cache/github_feedback/api_cache``)
+            max_size_mb: Limit on stored response bytes; 0 disables eviction
+        """
+        self.cache_name = Path(cache_name) if cache_name is not None else default_cache_name()
+        self.db_path = Path(str(self.cache_name) + ".sqlite")
+        self.max_bytes = max_size_mb * 1024 * 1024
+        self._lock = threading.Lock()
+        self._accessed: Dict[str, float] = {}
+        self._counts: Dict[str, List[int]] = defaultdict(lambda: [0, 0])
+        self._pending = 0
+
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(str(self.db_path), timeout=5)
+        try:
+            conn.execute(f"CREATE TABLE IF NOT EXISTS {ACCESS_TABLE} (key TEXT PRIMARY KEY, last_access REAL NOT NULL)")
+            conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {ENDPOINTS_TABLE} ("
+                "endpoint TEXT PRIMARY KEY, hits INTEGER NOT NULL DEFAULT 0, misses INTEGER NOT NULL DEFAULT 0)"
+            )
+            yield conn
+            conn.commit()
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _has_table(conn: sqlite3.Connection, table: str) -> bool:
+        row = conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)).fetchone()
+        return row is not None
+
+    def file_bytes(self) -> int:
+        """Return the on-disk size of the database, including its WAL file."""
+        total = 0
+        for suffix in ("", "-wal"):
+            path = Path(str(self.db_path) + suffix)
+            if path.exists():
+                total += path.stat().st_size
+        return total
+
+    def record(self, key: str, endpoint: str, from_cache: bool) -> None:
+        """Buffer one lookup of cache entry ``key``."""
+        with self._lock:
+            self._accessed[key] = time.time()
+            self._counts[endpoint][0 if from_cache else 1] += 1
+            self._pending += 1
+            should_flush = self._pending >= _FLUSH_THRESHOLD
+        if should_flush:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write buffered lookups to the usage tables."""
+        with self._lock:
+            accessed, counts = self._accessed, self._counts
+            self._accessed, self._counts = {}, defaultdict(lambda: [0, 0])
+            self._pending = 0
+        if not accessed or not self.db_path.exists():
+            return
+        try:
+            with self._connection() as conn:
+                conn.executemany(
+                    f"INSERT INTO {ACCESS_TABLE} (key, last_access) VALUES (?, ?) "
+                    "ON CONFLICT(key) DO UPDATE SET last_access = MAX(last_access, excluded.last_access)",
+                    accessed.items(),
+                )
+                conn.executemany(
+                    f"INSERT INTO {ENDPOINTS_TABLE} (endpoint, hits, misses) VALUES (?, ?, ?) "
+                    "ON CONFLICT(endpoint) DO UPDATE SET hits = hits + excluded.hits, misses = misses + excluded.misses",
+                    [(endpoint, hits, misses) for endpoint, (hits, misses) in counts.items()],
+                )
+        except sqlite3.Error as exc:
+            logger.warning(f"Failed to record API cache usage: {exc}")
+
+    def _delete(self, conn: sqlite3.Connection, keys: List[str]) -> None:
+        """Delete responses, their usage rows and redirects pointing to them."""
+        for start in range(0, len(keys), _DELETE_CHUNK):
+            chunk = keys[start:start + _DELETE_CHUNK]
+            marks = ",".join("?" * len(chunk))
+            conn.execute(f"DELETE FROM {RESPONSES_TABLE} WHERE key IN ({marks})", chunk)
+            conn.execute(f"DELETE FROM {ACCESS_TABLE} WHERE key IN ({marks})", chunk)
+        if self._has_table(conn, REDIRECTS_TABLE):
+            conn.execute(f"DELETE FROM {REDIRECTS_TABLE} WHERE value NOT IN (SELECT key FROM {RESPONSES_TABLE})")
+
+    def enforce_size_limit(self) -> int:
+        """Evict least recently used responses while over the size limit.
+
+        Entries never looked up since tracking started count as the oldest.
+        Freed pages are reused by SQLite; :meth:`vacuum` returns them to
+        the file system.
+
+        Returns:
+            Number of evicted responses
+        """
+        if not self.max_bytes or not self.db_path.exists():
+            return 0
+        self.flush()
+        with self._connection() as conn:
+            if not self._has_table(conn, RESPONSES_TABLE):
+                return 0
+            total = conn.execute(f"SELECT COALESCE(SUM(LENGTH(value)), 0) FROM {RESPONSES_TABLE}").fetchone()[0]
+            if total <= self.max_bytes:
+                return 0
+            target = int(self.max_bytes * _EVICTION_TARGET)
+            rows = conn.execute(
+                f"SELECT r.key, LENGTH(r.value) FROM {RESPONSES_TABLE} r "
+                f"LEFT JOIN {ACCESS_TABLE} a ON a.key = r.key "
+                "ORDER BY COALESCE(a.last_access, 0), r.expires"
+            ).fetchall()
+            victims: List[str] = []
+            for key, size in rows:
+                if total <= target:
+                    break
+                victims.append(key)
+                total -= size or 0
+            self._delete(conn, victims)
+        logger.info(f"Evicted {len(victims)} cached responses to stay under {self.max_bytes // (1024 * 1024)} MB")
+        return len(victims)
+
+    def prune_expired(self) -> int:
+        """Delete expired responses.
+
+        Returns:
+            Number of deleted responses
+        """
+        if not self.db_path.exists():
+            return 0
+        self.flush()
+        with self._connection() as conn:
+            if not self._has_table(conn, RESPONSES_TABLE):
+                return 0
+            keys = [
+                row[0]
+                for row in conn.execute(
+                    f"SELECT key FROM {RESPONSES_TABLE} WHERE expires IS NOT NULL AND expires <= ?",
+                    (round(time.time()),),
+                )
+            ]
+            self._delete(conn, keys)
+        return len(keys)
+
+    def vacuum(self) -> Tuple[int, int]:
+        """Rebuild the database file and fold the WAL back into it.
+
+        Returns:
+            File size in bytes before and after
+        """
+        if not self.db_path.exists():
+            return 0, 0
+        self.flush()
+        before = self.file_bytes()
+        conn = sqlite3.connect(str(self.db_path), timeout=5, isolation_level=None)
+        try:
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            conn.execute("VACUUM")
+            # In WAL mode VACUUM writes the rebuilt pages to the -wal file
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        finally:
+            conn.close()
+        return before, self.file_bytes()
+
+    def stats(self, serializer: Optional[SerializerPipeline] = None) -> CacheStats:
+        """Summarise entries, sizes, ages and hit ratios per endpoint.
+
+        Every response is deserialised to read its URL, age and body size,
+        so this reads the whole cache.
+        """
+        stats = CacheStats(path=self.db_path, max_bytes=self.max_bytes)
+        if not self.db_path.exists():
+            return stats
+        self.flush()
+        serializer = serializer or cache_serializer()
+        endpoints: Dict[str, EndpointCacheStats] = defaultdict(EndpointCacheStats)
+        now = datetime.now(timezone.utc)
+        now_ts = time.time()
+
+        with self._connection() as conn:
+            if self._has_table(conn, RESPONSES_TABLE):
+                for value, expires in conn.execute(f"SELECT value, expires FROM {RESPONSES_TABLE}"):
+                    stored = len(value or b"")
+                    stats.entries += 1
+                    stats.stored_bytes += stored
+                    if expires is not None and expires <= now_ts:
+                        stats.expired += 1
+                    try:
+                        response = serializer.loads(value)
+                    except Exception:  # Rows from incompatible requests-cache versions
+                        endpoint = endpoints["<unreadable>"]
+                        endpoint.entries += 1
+                        endpoint.stored_bytes += stored
+                        continue
+                    endpoint = endpoints[endpoint_template(_api_path(response.url))]
+                    endpoint.entries += 1
+                    endpoint.stored_bytes += stored
+                    stats.body_bytes += response.size
+                    created_at = response.created_at
+                    if created_at.tzinfo is None:
+                        created_at = created_at.replace(tzinfo=timezone.utc)
+                    age = (now - created_at).total_seconds()
+                    label = next(label for bound, label in AGE_BUCKETS if age < bound)
+                    stats.age_histogram[label] += 1
+            for name, hits, misses in conn.execute(f"SELECT endpoint, hits, misses FROM {ENDPOINTS_TABLE}"):
+                endpoints[name].hits += hits
+                endpoints[name].misses += misses
+
+        stats.file_bytes = self.file_bytes()
+        stats.endpoints = dict(endpoints)
+        return stats
+
+
+def delete_cache_files(cache_name: Optional[Path] = None) -> List[Path]:
+    """Delete the cache database and its WAL/shared-memory files."""
+    db_path = Path(str(cache_name or default_cache_name()) + ".sqlite")
+    removed: List[Path] = []
+    for suffix in ("", "-wal", "-shm"):
+        path = Path(str(db_path) + suffix)
+        if path.exists():
+            path.unlink()
+            removed.append(path)
+    return removed
+
+
+__all__ = [
+    "AGE_BUCKETS",
+    "BackgroundRevalidator",
+    "CachePolicy",
+    "CacheStats",
+    "EndpointCacheStats",
+    "ResponseCache",
+    "cache_serializer",
+    "default_cache_name",
+    "delete_cache_files",
+]
@@ -0,0 +1,231 @@
+"""Record/replay transport adapter for GitHub API traffic.
+
+A cassette is a JSON file of request→response pairs captured from real API
+traffic. Mounted on the client's ``requests`` session, :class:`CassetteAdapter`
+either records every exchange that goes over the wire or replays a cassette
+offline, so pagination, retry and caching code paths run against
+real-shaped responses (``Link``, ``ETag`` and ``X-RateLimit-*`` headers
+included) without network access.
+
+Example:
+    >>> client = GitHubApiClient(config, enable_cache=False)
+    >>> with use_cassette(client, Path("tests/cassettes/octo-repo.json")):
+    ...     commits = client.request_all("repos/octo/repo/commits")
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+import logging
+import os
+import threading
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Deque, Dict, Iterator, List, Literal, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+from ..core.utils import FileSystemManager
+
+logger = logging.getLogger(__name__)
+
+CASSETTE_VERSION = 1
+
+CassetteMode = Literal["record", "replay", "auto"]
+
+# Request headers never written to a cassette
+REDACTED_REQUEST_HEADERS = frozenset({"authorization", "cookie"})
+
+# Response headers describing the wire encoding of the recorded body, which
+# no longer applies once the body is stored decoded
+DROPPED_RESPONSE_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding", "set-cookie"})
+
+
+class CassetteMissError(requests.RequestException):
+    """Raised in replay mode when no recorded response matches a request."""
+
+
+def request_key(method: str, url: str) -> str:
+    """Match key for a request: method plus URL with sorted query parameters."""
+    parts = urlsplit(url)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return f"{method.upper()} {urlunsplit((parts.scheme, parts.netloc, parts.path, query, ''))}"
+
+
+def _encode_body(content: bytes) -> Dict[str, str]:
+    try:
+        return {"body": content.decode("utf-8")}
+    except UnicodeDecodeError:
+        return {"body_base64": base64.b64encode(content).decode("ascii")}
+
+
+def _decode_body(response: Dict[str, Any]) -> bytes:
+    if "body_base64" in response:
+        return base64.b64decode(response["body_base64"])
+    return response.get("body", "").encode("utf-8")
+
+
+class CassetteAdapter(HTTPAdapter):
+    """Transport adapter that records to or replays from a cassette file.
+
+    Modes:
+        ``record``: send requests over the network and capture every exchange
+        ``replay``: answer from the cassette only; unmatched requests raise
+            :class:`CassetteMissError`
+        ``auto``: replay when the cassette exists, otherwise record
+
+    Identical requests are answered in recorded order, repeating the last
+    response once the recording is exhausted, which keeps replays of retried
+    or re-fetched pages deterministic.
+    """
+
+    def __init__(self, path: Path, mode: CassetteMode = "auto", **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        if mode == "auto":
+            mode = "replay" if path.exists() else "record"
+        if mode not in ("record", "replay"):
+            raise ValueError(f"Unknown cassette mode: {mode}")
+        self.path = path
+        self.mode: CassetteMode = mode
+        self._lock = threading.Lock()
+        self._interactions: List[Dict[str, Any]] = []
+        self._replay: Dict[str, Deque[Dict[str, Any]]] = defaultdict(deque)
+        self._last: Dict[str, Dict[str, Any]] = {}
+        if mode == "replay":
+            self._load()
+
+    @property
+    def interactions(self) -> List[Dict[str, Any]]:
+        """Exchanges recorded (or loaded) so far."""
+        with self._lock:
+            return list(self._interactions)
+
+    def _load(self) -> None:
+        try:
+            payload = json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError as exc:
+            raise FileNotFoundError(f"Cassette not found: {self.path}") from exc
+        if payload.get("version") != CASSETTE_VERSION:
+            raise ValueError(f"Unsupported cassette version in {self.path}: {payload.get('version')}")
+        self._interactions = payload.get("interactions", [])
+        for interaction in self._interactions:
+            request = interaction["request"]
+            self._replay[request_key(request["method"], request["url"])].append(interaction["response"])
+
+    def save(self) -> Path:
+        """Write recorded interactions to the cassette file (record mode only)."""
+        if self.mode != "record":
+            return self.path
+        with self._lock:
+            payload = {"version": CASSETTE_VERSION, "interactions": list(self._interactions)}
+        FileSystemManager.ensure_parent_directory(self.path)
+        tmp_path = self.path.with_name(f".{self.path.name}.tmp")
+        tmp_path.write_text(json.dumps(payload, indent=2, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp_path, self.path)
+        return self.path
+
+    def send(self, request: requests.PreparedRequest, **kwargs: Any) -> requests.Response:
+        if self.mode == "replay":
+            return self._replay_response(request)
+
+        response = super().send(request, **kwargs)
+        self._record(request, response)
+        return response
+
+    def _record(self, request: requests.PreparedRequest, response: requests.Response) -> None:
+        body = request.body or b""
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        interaction = {
+            "request": {
+                "method": request.method,
+                "url": request.url,
+                "headers": {
+                    name: value
+                    for name, value in request.headers.items()
+                    if name.lower() not in REDACTED_REQUEST_HEADERS
+                },
+                **_encode_body(body),
+            },
+            "response": {
+                "status": response.status_code,
+                "reason": response.reason,
+                "headers": {
+                    name: value
+                    for name, value in response.headers.items()
+                    if name.lower() not in DROPPED_RESPONSE_HEADERS
+                },
+                **_encode_body(response.content),  # Reading content consumes the raw stream
+            },
+        }
+        with self._lock:
+            self._interactions.append(interaction)
+
+    def _replay_response(self, request: requests.PreparedRequest) -> requests.Response:
+        key = request_key(request.method or "GET", request.url or "")
+        with self._lock:
+            queue = self._replay.get(key)
+            if queue:
+                recorded = queue.popleft()
+                self._last[key] = recorded
+            else:
+                recorded = self._last.get(key)
+        if recorded is None:
+            raise CassetteMissError(f"No recorded response for {key} in {self.path}", request=request)
+
+        response = requests.Response()
+        response.status_code = recorded["status"]
+        response.reason = recorded.get("reason", "")
+        response.headers = CaseInsensitiveDict(recorded.get("headers", {}))
+        response._content = _decode_body(recorded)
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers) or "utf-8"
+        response.url = request.url or ""
+        response.request = request
+        response.connection = self
+        return response
+
+
+def mount_cassette(
+    session: requests.Session, path: Path, mode: CassetteMode = "auto"
+) -> CassetteAdapter:
+    """Mount a cassette adapter for HTTP and HTTPS on ``session``."""
+    adapter = CassetteAdapter(path, mode)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return adapter
+
+
+@contextmanager
+def use_cassette(client: Any, path: Path, mode: CassetteMode = "auto") -> Iterator[CassetteAdapter]:
+    """Record or replay a :class:`~github_feedback.api.client.GitHubApiClient`'s traffic.
+
+    The previous adapters are restored on exit, and a recording is saved
+    even when the block raises so partial sessions can be inspected.
+    """
+    session: requests.Session = client._get_session()
+    previous: List[Tuple[str, Any]] = [
+        (prefix, session.adapters[prefix]) for prefix in ("https://", "http://") if prefix in session.adapters
+    ]
+    adapter = mount_cassette(session, path, mode)
+    try:
+        yield adapter
+    finally:
+        adapter.save()
+        for prefix, original in previous:
+            session.mount(prefix, original)
+        logger.debug(f"Cassette {path} ({adapter.mode}): {len(adapter.interactions)} interaction(s)")
+
+
+__all__ = [
+    "CASSETTE_VERSION",
+    "CassetteAdapter",
+    "CassetteMissError",
+    "mount_cassette",
+    "request_key",
+    "use_cassette",
+]
@@ -4,9 +4,11 @@ from __future__ import annotations
 
 import json
 import logging
+import re
 import time
+import weakref
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, TypeVar, Union
+from typing import Any, Callable, Dict, Iterator, List, Optional, TypeVar, Union
 
 import requests
 import requests_cache
@@ -15,6 +17,16 @@ from ..core.config import Config
 from ..core.console import Console
 from ..core.constants import HTTP_STATUS, HTTP_STATUS_CODES, RETRY_CONFIG
 from ..core.exceptions import ApiError, AuthenticationError, ConfigurationError
+from ..core.tracing import span
+from .cache import (
+    BackgroundRevalidator,
+    CachePolicy,
+    ResponseCache,
+    cache_serializer,
+    default_cache_name,
+    delete_cache_files,
+)
+from .metrics import ApiCallMetrics, ApiMetricsCollector, endpoint_template, get_global_api_collector
 
 logger = logging.getLogger(__name__)
 console = Console()
@@ -23,6 +35,21 @@ console = Console()
 T = TypeVar('T', List[Dict[str, Any]], Dict[str, Any])
 
 
+def _endpoint_pattern(endpoint: str) -> re.Pattern[str]:
+    """Match ``endpoint`` as whole path segments of a URL or API path.
+
+    Under ``repos/{owner}/{repo}`` only the segments after the repository
+    name count, so repositories called ``reviews-bot`` or ``files`` do not
+    select the policy of a different endpoint.
+    """
+    key = re.escape(endpoint)
+    return re.compile(
+        rf"/repos/[^/?#]+/[^/?#]+(?:/[^?#]*)?/{key}(?=[/?#]|$)"
+        rf"|^(?![^?#]*/repos/)[^?#]*/{key}(?=[/?#]|$)",
+        re.IGNORECASE,
+    )
+
+
 class GitHubApiClient:
     """Repository pattern wrapper around GitHub REST API.
 
@@ -33,18 +60,25 @@ class GitHubApiClient:
     - Error handling
     """
 
-    # Endpoint-specific cache TTL mapping (in seconds)
-    # Different endpoints have different data volatility
-    CACHE_TTL_MAP = {
-        'commits': 86400,      # 24 hours - commits are immutable
-        'tags': 86400,         # 24 hours - tags rarely change
-        'branches': 7200,      # 2 hours - branches can be updated
-        'pulls': 1800,         # 30 minutes - PRs change frequently
-        'issues': 1800,        # 30 minutes - issues change frequently
-        'reviews': 3600,       # 1 hour - reviews are semi-stable
-        'comments': 3600,      # 1 hour - comments are semi-stable
-        'files': 7200,         # 2 hours - file lists are relatively stable
-        'default': 3600,       # 1 hour - default for unknown endpoints
+    # Endpoint-specific cache policies, matched in order against the path.
+    # Different endpoints have different data volatility: past its TTL an
+    # entry is still served for up to max_stale seconds while a background
+    # request revalidates it, so interactive views never wait on the network.
+    CACHE_POLICIES = {
+        'reviews': CachePolicy(3600, max_stale=86400),       # 1 hour, stale up to 1 day
+        'comments': CachePolicy(3600, max_stale=86400),      # 1 hour, stale up to 1 day
+        'files': CachePolicy(7200, max_stale=86400),         # 2 hours - file lists are relatively stable
+        'pulls': CachePolicy(1800, max_stale=6 * 3600),      # 30 minutes - PRs change frequently
+        'issues': CachePolicy(1800, max_stale=6 * 3600),     # 30 minutes - issues change frequently
+        'commits': CachePolicy(86400, max_stale=7 * 86400),  # 24 hours - commits are immutable
+        'tags': CachePolicy(86400, max_stale=7 * 86400),     # 24 hours - tags rarely change
+        'branches': CachePolicy(7200, max_stale=86400),      # 2 hours - branches can be updated
+        'user/repos': CachePolicy(1800, max_stale=86400),    # 30 minutes - `gfa list-repos`
+        'default': CachePolicy(3600),                        # 1 hour, hard limit for unknown endpoints
+    }
+    # Path patterns of the endpoint policies, shared by _cache_policy and requests-cache
+    POLICY_PATTERNS = {
+        endpoint: _endpoint_pattern(endpoint) for endpoint in CACHE_POLICIES if endpoint != 'default'
     }
 
     def __init__(
@@ -61,7 +95,7 @@ class GitHubApiClient:
             session: Optional requests session for connection pooling
             enable_cache: Whether to enable request caching (default: True)
             cache_expire_after: Cache expiration time in seconds (default: 3600)
-                Note: This is overridden by endpoint-specific TTLs in CACHE_TTL_MAP
+                Note: This is overridden by endpoint-specific policies in CACHE_POLICIES
 
         Raises:
             ConfigurationError: If PAT is not configured
@@ -71,6 +105,9 @@ class GitHubApiClient:
         self.cache_expire_after = cache_expire_after
         self.session = session
         self._headers: Dict[str, str] = {}
+        self.metrics = ApiMetricsCollector(parent=get_global_api_collector())
+        self.response_cache: Optional[ResponseCache] = None
+        self.revalidator = BackgroundRevalidator()
 
         pat = self.config.get_pat()
         if not pat:
@@ -83,20 +120,28 @@ class GitHubApiClient:
             "Accept": "application/vnd.github+json",
         }
 
-    def _get_cache_ttl(self, path: str) -> int:
-        """Get cache TTL for a specific endpoint path.
+    def _cache_policy(self, path: str) -> CachePolicy:
+        """Get the cache policy for a specific endpoint path.
 
         Args:
             path: API endpoint path (e.g., "repos/owner/repo/commits")
 
         Returns:
-            Cache TTL in seconds based on endpoint type
+            First policy in CACHE_POLICIES whose key matches whole path
+            segments (see POLICY_PATTERNS), with stale serving removed when
+            ``api.cache_stale_while_revalidate`` is off
         """
-        path_lower = path.lower()
-        for key, ttl in self.CACHE_TTL_MAP.items():
-            if key in path_lower:
-                return ttl
-        return self.CACHE_TTL_MAP['default']
+        segment_path = "/" + path.lstrip("/")
+        policy = next(
+            (
+                self.CACHE_POLICIES[key] for key, pattern in self.POLICY_PATTERNS.items()
+                if pattern.search(segment_path)
+            ),
+            CachePolicy(self.cache_expire_after, self.CACHE_POLICIES['default'].max_stale),
+        )
+        if not self.config.api.cache_stale_while_revalidate:
+            return CachePolicy(policy.ttl)
+        return policy
 
     def _optimize_sqlite_cache(self, cache_path: Path) -> None:
         """Optimize SQLite cache database for better performance.
@@ -140,22 +185,21 @@ class GitHubApiClient:
         if self.session is None:
             if self.enable_cache:
                 # Create cache directory in user's home config
-                cache_dir = Path.home() / ".cache" / "github_feedback"
-                cache_dir.mkdir(parents=True, exist_ok=True)
-                cache_path = cache_dir / "api_cache"
-
-                # Build URL-specific expiration map
-                # This allows different TTLs for different endpoints
-                from requests_cache import DO_NOT_CACHE
-                urls_expire_after = {}
-
-                # For commits and tags, use longer cache
-                for endpoint in ['commits', 'tags']:
-                    urls_expire_after[f'*/{endpoint}*'] = self.CACHE_TTL_MAP[endpoint]
-
-                # For frequently changing data, use shorter cache
-                for endpoint in ['pulls', 'issues']:
-                    urls_expire_after[f'*/{endpoint}*'] = self.CACHE_TTL_MAP[endpoint]
+                cache_path = default_cache_name()
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+
+                # Build URL-specific expiration map from the endpoint policies.
+                # requests-cache keeps entries until TTL + max staleness; _send
+                # serves the stale part and revalidates in the background.
+                stale_while_revalidate = self.config.api.cache_stale_while_revalidate
+                urls_expire_after = {
+                    pattern: (
+                        self.CACHE_POLICIES[endpoint].expire_after
+                        if stale_while_revalidate
+                        else self.CACHE_POLICIES[endpoint].ttl
+                    )
+                    for endpoint, pattern in self.POLICY_PATTERNS.items()
+                }
 
                 # Create cached session with endpoint-specific TTLs
                 # Note: 304 (Not Modified) is excluded from allowable_codes because
@@ -163,19 +207,27 @@ class GitHubApiClient:
                 self.session = requests_cache.CachedSession(
                     cache_name=str(cache_path),
                     backend="sqlite",
-                    expire_after=self.cache_expire_after,  # Default TTL
+                    expire_after=self._cache_policy('').expire_after,  # Default TTL
                     urls_expire_after=urls_expire_after,   # Endpoint-specific TTLs
                     allowable_codes=[200, 301, 302],
                     # Don't cache POST/PUT/DELETE/PATCH requests
                     allowable_methods=["GET", "HEAD"],
+                    # Compress stored responses (large file/patch listings)
+                    serializer=cache_serializer(self.config.api.cache_compression),
                 )
 
                 # Optimize SQLite cache database performance
                 self._optimize_sqlite_cache(cache_path)
 
+                # Track usage for LRU eviction and `gfa cache stats`
+                self.response_cache = ResponseCache(cache_path, max_size_mb=self.config.api.cache_max_size_mb)
+                self.response_cache.enforce_size_limit()
+                weakref.finalize(self, self.response_cache.flush)
+
                 logger.debug(
-                    f"Initialized cached session with endpoint-specific TTLs "
-                    f"(default={self.cache_expire_after}s, commits/tags=24h, pulls/issues=30m)"
+                    f"Initialized cached session with endpoint-specific policies "
+                    f"(default={self.cache_expire_after}s, commits/tags=24h, pulls/issues=30m, "
+                    f"stale-while-revalidate={stale_while_revalidate})"
                 )
             else:
                 self.session = requests.Session()
@@ -293,6 +345,60 @@ class GitHubApiClient:
 
         return False
 
+    def _send(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]],
+        attempt: int,
+        revalidate: bool = False,
+    ) -> requests.Response:
+        """Issue one GET attempt, recording a trace span and API metrics.
+
+        A cached response past its endpoint TTL but within its maximum
+        staleness is returned as is, and a background request revalidates it.
+
+        Args:
+            path: API endpoint path
+            params: Optional query parameters
+            attempt: Zero-based attempt number (non-zero attempts are retries)
+            revalidate: Revalidate the cached entry with GitHub (conditional request)
+
+        Returns:
+            Raw HTTP response
+        """
+        started = time.perf_counter()
+        session = self._get_session()
+        refresh_kwargs = {"refresh": True} if revalidate and isinstance(session, requests_cache.CachedSession) else {}
+        with span(f"GET {path}", "http", attempt=attempt, revalidate=revalidate) as http_span:
+            try:
+                response = session.get(
+                    self._build_api_url(path),
+                    params=params,
+                    timeout=self._get_timeout(),
+                    **refresh_kwargs,
+                )
+            except requests.RequestException as exc:
+                self.metrics.record(ApiCallMetrics(
+                    endpoint=endpoint_template(path),
+                    duration_seconds=time.perf_counter() - started,
+                    retry=attempt > 0,
+                    error_type=type(exc).__name__,
+                ))
+                raise
+            call = ApiCallMetrics.from_response(path, response, time.perf_counter() - started, attempt)
+            cache_key = getattr(response, "cache_key", None)
+            if call.from_cache and not revalidate and cache_key:
+                call.stale = self._cache_policy(path).is_stale(getattr(response, "expires_delta", None))
+                if call.stale:
+                    self.revalidator.submit(cache_key, lambda: self._send(path, params, 0, revalidate=True))
+            self.metrics.record(call)
+            if self.response_cache is not None and cache_key and not revalidate:
+                self.response_cache.record(cache_key, call.endpoint, call.from_cache)
+            http_span.set(
+                status=call.status, from_cache=call.from_cache, stale=call.stale, bytes=call.bytes_received
+            )
+        return response
+
     def _execute_with_retry(
         self,
         path: str,
@@ -321,11 +427,7 @@ class GitHubApiClient:
 
         for attempt in range(max_retries + 1):
             try:
-                response = self._get_session().get(
-                    self._build_api_url(path),
-                    params=params,
-                    timeout=self._get_timeout(),
-                )
+                response = self._send(path, params, attempt)
 
                 if response.status_code == HTTP_STATUS['unauthorized']:
                     raise AuthenticationError("GitHub API rejected the provided PAT")
@@ -525,21 +627,8 @@ class GitHubApiClient:
         Raises:
             ValueError: If per_page or max_pages is not positive
         """
-        if per_page <= 0:
-            raise ValueError(f"per_page must be positive, got {per_page}")
-        if max_pages <= 0:
-            raise ValueError(f"max_pages must be positive, got {max_pages}")
-
         results: List[Dict[str, Any]] = []
-        page = 1
-
-        while page <= max_pages:
-            page_params = base_params | {"page": page, "per_page": per_page}
-            data = self.request_list(path, page_params)
-
-            if not data:
-                break
-
+        for data in self.iter_pages(path, base_params, per_page=per_page, max_pages=max_pages):
             # Check early stop condition for each item
             if early_stop:
                 for item in data:
@@ -549,18 +638,62 @@ class GitHubApiClient:
             else:
                 results.extend(data)
 
-            if len(data) < per_page:
-                break
+        return results
+
+    def iter_pages(
+        self,
+        path: str,
+        base_params: Dict[str, Any],
+        per_page: int = 100,
+        max_pages: int = 100,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Yield the pages of a list endpoint one at a time.
 
-            page += 1
+        Callers that only aggregate over the items (counts, buckets) hold
+        a single page in memory instead of the whole listing.
 
-        return results
+        Args:
+            path: API endpoint path
+            base_params: Base query parameters
+            per_page: Items per page (default: 100)
+            max_pages: Maximum number of pages to fetch (default: 100, prevents infinite loops)
+
+        Yields:
+            Non-empty pages of items
+
+        Raises:
+            ValueError: If per_page or max_pages is not positive
+        """
+        if per_page <= 0:
+            raise ValueError(f"per_page must be positive, got {per_page}")
+        if max_pages <= 0:
+            raise ValueError(f"max_pages must be positive, got {max_pages}")
+
+        for page in range(1, max_pages + 1):
+            page_params = base_params | {"page": page, "per_page": per_page}
+            data = self.request_list(path, page_params)
+
+            if not data:
+                return
+
+            yield data
+
+            if len(data) < per_page:
+                return
 
     def close(self) -> None:
-        """Close the requests session and release resources."""
+        """Close the requests session and release resources.
+
+        Background revalidations still running are allowed to finish first,
+        so their refreshed entries reach the cache.
+        """
+        self.revalidator.shutdown(wait=True)
         if self.session is not None:
             self.session.close()
             self.session = None
+        if self.response_cache is not None:
+            self.response_cache.flush()
+            self.response_cache.enforce_size_limit()
 
     def __enter__(self) -> "GitHubApiClient":
         """Context manager entry."""
@@ -611,13 +744,10 @@ class GitHubApiClient:
         Returns:
             True if cache was cleared successfully, False otherwise
         """
-        cache_dir = Path.home() / ".cache" / "github_feedback"
-        cache_path = cache_dir / "api_cache.sqlite"
-
         try:
-            if cache_path.exists():
-                cache_path.unlink()
-                logger.info(f"Cleared API cache: {cache_path}")
+            removed = delete_cache_files()
+            if removed:
+                logger.info(f"Cleared API cache: {removed[0]}")
                 console.print(f"[success]Cleared API cache successfully[/]")
                 return True
             else:
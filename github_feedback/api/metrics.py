@@ -0,0 +1,382 @@
+"""Per-endpoint telemetry for GitHub REST API calls."""
+
+from __future__ import annotations
+
+import json
+import logging
+import re
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from threading import Lock
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+from ..core.histogram import LatencyHistogram
+from ..core.utils import FileSystemManager
+
+logger = logging.getLogger(__name__)
+
+_NAMED_SEGMENTS = {"repos": ("{owner}", "{repo}"), "users": ("{user}",), "orgs": ("{org}",)}
+_SHA_PATTERN = re.compile(r"^[0-9a-f]{40}$")
+
+
+def endpoint_template(path: str) -> str:
+    """Collapse a request path into its endpoint template.
+
+    ``repos/octo/app/pulls/12/files`` becomes
+    ``repos/{owner}/{repo}/pulls/{number}/files`` so statistics group by
+    endpoint rather than by repository or pull request.
+    """
+    segments = [segment for segment in path.split("?", 1)[0].strip("/").split("/") if segment]
+    template = []
+    index = 0
+    while index < len(segments):
+        segment = segments[index]
+        template.append(segment)
+        placeholders = _NAMED_SEGMENTS.get(segment) if index == 0 else None
+        if placeholders:
+            names = segments[index + 1:index + 1 + len(placeholders)]
+            template.extend(placeholders[:len(names)])
+            index += 1 + len(names)
+            continue
+        if segment.isdigit():
+            template[-1] = "{number}"
+        elif _SHA_PATTERN.match(segment):
+            template[-1] = "{sha}"
+        index += 1
+    return "/".join(template)
+
+
+def _int_header(headers: Mapping[str, str], name: str) -> Optional[int]:
+    try:
+        return int(headers[name])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+@dataclass
+class ApiCallMetrics:
+    """Metrics for a single GitHub API request attempt."""
+
+    endpoint: str  # Endpoint template, e.g. "repos/{owner}/{repo}/pulls"
+    duration_seconds: float
+    status: int = 0  # 0 when no response was received
+    bytes_received: int = 0
+    from_cache: bool = False
+    not_modified: bool = False  # Revalidated with a 304 from GitHub
+    stale: bool = False  # Served past its TTL while refreshed in the background
+    retry: bool = False
+    error_type: str | None = None
+    rate_limit_resource: str | None = None
+    rate_limit_limit: int | None = None
+    rate_limit_remaining: int | None = None
+    rate_limit_reset: int | None = None
+    timestamp: float = field(default_factory=time.time)
+
+    @classmethod
+    def from_response(
+        cls, path: str, response: Any, duration_seconds: float, attempt: int = 0
+    ) -> ApiCallMetrics:
+        """Build metrics from a ``requests``/``requests_cache`` response."""
+        from_cache = getattr(response, "from_cache", False) is True
+        metrics = cls(
+            endpoint=endpoint_template(path),
+            duration_seconds=duration_seconds,
+            status=response.status_code,
+            bytes_received=len(response.content or b""),
+            from_cache=from_cache,
+            not_modified=response.status_code == 304 or getattr(response, "revalidated", False) is True,
+            retry=attempt > 0,
+        )
+        # Cached responses replay the headers of the original request
+        if not from_cache:
+            headers = response.headers
+            metrics.rate_limit_resource = headers.get("X-RateLimit-Resource", "core")
+            metrics.rate_limit_limit = _int_header(headers, "X-RateLimit-Limit")
+            metrics.rate_limit_remaining = _int_header(headers, "X-RateLimit-Remaining")
+            metrics.rate_limit_reset = _int_header(headers, "X-RateLimit-Reset")
+        return metrics
+
+
+@dataclass
+class EndpointStats:
+    """Aggregated metrics for one endpoint template."""
+
+    endpoint: str
+    requests: int = 0
+    cache_hits: int = 0
+    not_modified: int = 0
+    stale_hits: int = 0
+    retries: int = 0
+    errors: int = 0
+    bytes_received: int = 0
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    statuses: dict[int, int] = field(default_factory=dict)
+
+    def add(self, metrics: ApiCallMetrics) -> None:
+        self.requests += 1
+        self.cache_hits += metrics.from_cache
+        self.not_modified += metrics.not_modified
+        self.stale_hits += metrics.stale
+        self.retries += metrics.retry
+        self.errors += metrics.error_type is not None or metrics.status >= 400
+        self.bytes_received += metrics.bytes_received
+        self.latency.add(metrics.duration_seconds)
+        self.statuses[metrics.status] = self.statuses.get(metrics.status, 0) + 1
+
+    def merge(self, other: EndpointStats) -> None:
+        self.requests += other.requests
+        self.cache_hits += other.cache_hits
+        self.not_modified += other.not_modified
+        self.stale_hits += other.stale_hits
+        self.retries += other.retries
+        self.errors += other.errors
+        self.bytes_received += other.bytes_received
+        self.latency.merge(other.latency)
+        for status, count in other.statuses.items():
+            self.statuses[status] = self.statuses.get(status, 0) + count
+
+    @property
+    def cache_hit_rate(self) -> float:
+        return self.cache_hits / self.requests if self.requests > 0 else 0.0
+
+    @property
+    def p50(self) -> float:
+        """Median latency in seconds."""
+        return self.latency.quantile(0.5)
+
+    @property
+    def p95(self) -> float:
+        """95th percentile latency in seconds."""
+        return self.latency.quantile(0.95)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "cache_hits": self.cache_hits,
+            "not_modified": self.not_modified,
+            "stale_hits": self.stale_hits,
+            "retries": self.retries,
+            "errors": self.errors,
+            "bytes_received": self.bytes_received,
+            "cache_hit_rate": round(self.cache_hit_rate, 4),
+            "latency_seconds": self.latency.to_dict(),
+            "statuses": {str(status): count for status, count in sorted(self.statuses.items())},
+        }
+
+
+@dataclass
+class RateLimitUsage:
+    """Rate-limit budget observed for one resource (``core``, ``search``)."""
+
+    resource: str
+    limit: int = 0
+    remaining: int | None = None  # Latest reported value
+    consumed: int = 0  # Budget used during this run, across reset windows
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"limit": self.limit, "remaining": self.remaining, "consumed": self.consumed}
+
+
+@dataclass
+class AggregatedApiMetrics:
+    """Aggregated API metrics across endpoints."""
+
+    endpoints: dict[str, EndpointStats] = field(default_factory=dict)
+    rate_limits: dict[str, RateLimitUsage] = field(default_factory=dict)
+
+    def _total(self, attribute: str) -> int:
+        return sum(getattr(stats, attribute) for stats in self.endpoints.values())
+
+    @property
+    def total_requests(self) -> int:
+        return self._total("requests")
+
+    @property
+    def cache_hits(self) -> int:
+        return self._total("cache_hits")
+
+    @property
+    def not_modified(self) -> int:
+        return self._total("not_modified")
+
+    @property
+    def stale_hits(self) -> int:
+        return self._total("stale_hits")
+
+    @property
+    def retries(self) -> int:
+        return self._total("retries")
+
+    @property
+    def errors(self) -> int:
+        return self._total("errors")
+
+    @property
+    def bytes_received(self) -> int:
+        return self._total("bytes_received")
+
+    @property
+    def cache_hit_rate(self) -> float:
+        """Calculate cache hit rate."""
+        return self.cache_hits / self.total_requests if self.total_requests > 0 else 0.0
+
+    @property
+    def rate_limit_consumed(self) -> int:
+        return sum(usage.consumed for usage in self.rate_limits.values())
+
+    def busiest(self, limit: int = 10) -> list[EndpointStats]:
+        """Endpoints ordered by total time spent waiting on them."""
+        return sorted(self.endpoints.values(), key=lambda stats: stats.latency.total, reverse=True)[:limit]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "totals": {
+                "requests": self.total_requests,
+                "cache_hits": self.cache_hits,
+                "not_modified": self.not_modified,
+                "stale_hits": self.stale_hits,
+                "retries": self.retries,
+                "errors": self.errors,
+                "bytes_received": self.bytes_received,
+                "cache_hit_rate": round(self.cache_hit_rate, 4),
+                "rate_limit_consumed": self.rate_limit_consumed,
+            },
+            "endpoints": {name: stats.to_dict() for name, stats in sorted(self.endpoints.items())},
+            "rate_limits": {name: usage.to_dict() for name, usage in sorted(self.rate_limits.items())},
+        }
+
+    def format_summary(self, limit: int = 10) -> str:
+        """Format a human-readable summary of metrics."""
+        lines = [
+            "=== GitHub API Metrics Summary ===",
+            f"Total Requests: {self.total_requests}",
+            f"Cache Hit Rate: {self.cache_hit_rate:.1%} ({self.cache_hits} hits, "
+            f"{self.stale_hits} stale, {self.not_modified} revalidated)",
+            f"Retries: {self.retries}",
+            f"Errors: {self.errors}",
+            f"Bytes Received: {self.bytes_received:,}",
+            f"Rate Limit Consumed: {self.rate_limit_consumed}",
+        ]
+
+        if self.endpoints:
+            lines.append("\nEndpoints (by total latency):")
+            for stats in self.busiest(limit):
+                lines.append(
+                    f"  - {stats.endpoint}: {stats.requests} req, "
+                    f"cache {stats.cache_hit_rate:.0%}, "
+                    f"p50 {stats.p50 * 1000:.0f}ms, p95 {stats.p95 * 1000:.0f}ms"
+                )
+
+        return "\n".join(lines)
+
+
+class ApiMetricsCollector:
+    """Thread-safe collector for GitHub API metrics.
+
+    Each :class:`~github_feedback.api.client.GitHubApiClient` owns a
+    collector whose parent is the global one, so a client's own numbers are
+    available alongside the totals of every client in the process.
+    """
+
+    def __init__(self, parent: Optional[ApiMetricsCollector] = None) -> None:
+        self._parent = parent
+        self._endpoints: dict[str, EndpointStats] = {}
+        # (resource, reset) -> [limit, highest remaining, lowest remaining]
+        self._windows: dict[Tuple[str, int], list[int]] = {}
+        self._latest_remaining: dict[str, Tuple[int, int]] = {}
+        self._lock = Lock()
+
+    def record(self, metrics: ApiCallMetrics) -> None:
+        """Record metrics for a single request attempt.
+
+        Args:
+            metrics: Metrics to record
+        """
+        with self._lock:
+            stats = self._endpoints.get(metrics.endpoint)
+            if stats is None:
+                stats = self._endpoints[metrics.endpoint] = EndpointStats(metrics.endpoint)
+            stats.add(metrics)
+
+            if metrics.rate_limit_remaining is not None and metrics.rate_limit_resource:
+                key = (metrics.rate_limit_resource, metrics.rate_limit_reset or 0)
+                window = self._windows.get(key)
+                limit = metrics.rate_limit_limit or 0
+                remaining = metrics.rate_limit_remaining
+                if window is None:
+                    self._windows[key] = [limit, remaining, remaining]
+                else:
+                    window[0] = max(window[0], limit)
+                    window[1] = max(window[1], remaining)
+                    window[2] = min(window[2], remaining)
+                latest = self._latest_remaining.get(metrics.rate_limit_resource)
+                if latest is None or key[1] > latest[0] or (key[1] == latest[0] and remaining < latest[1]):
+                    self._latest_remaining[metrics.rate_limit_resource] = (key[1], remaining)
+
+        if self._parent is not None:
+            self._parent.record(metrics)
+
+    def get_aggregated(self) -> AggregatedApiMetrics:
+        """Get aggregated metrics across all recorded requests.
+
+        Returns:
+            AggregatedApiMetrics with per-endpoint statistics
+        """
+        with self._lock:
+            aggregated = AggregatedApiMetrics()
+            for name, stats in self._endpoints.items():
+                copy = EndpointStats(name)
+                copy.merge(stats)
+                aggregated.endpoints[name] = copy
+
+            for (resource, _reset), (limit, highest, lowest) in self._windows.items():
+                usage = aggregated.rate_limits.setdefault(resource, RateLimitUsage(resource))
+                usage.limit = max(usage.limit, limit)
+                # The first response of a window already spent one request
+                usage.consumed += highest - lowest + 1
+            for resource, (_reset, remaining) in self._latest_remaining.items():
+                aggregated.rate_limits[resource].remaining = remaining
+
+        return aggregated
+
+    def save_json(self, path: Path) -> Path:
+        """Write the aggregated metrics to ``path`` as JSON."""
+        FileSystemManager.ensure_parent_directory(path)
+        path.write_text(json.dumps(self.get_aggregated().to_dict(), indent=2) + "\n", encoding="utf-8")
+        return path
+
+    def clear(self) -> None:
+        """Clear all collected metrics."""
+        with self._lock:
+            self._endpoints.clear()
+            self._windows.clear()
+            self._latest_remaining.clear()
+
+
+# Global metrics collector instance
+_global_collector = ApiMetricsCollector()
+
+
+def get_global_api_collector() -> ApiMetricsCollector:
+    """Get the global API metrics collector instance."""
+    return _global_collector
+
+
+def print_api_metrics_summary() -> None:
+    """Print a summary of collected API metrics to the logger."""
+    summary = get_global_api_collector().get_aggregated().format_summary()
+    logger.info(f"\n{summary}")
+    print(f"\n{summary}")
+
+
+__all__ = [
+    "ApiCallMetrics",
+    "AggregatedApiMetrics",
+    "ApiMetricsCollector",
+    "EndpointStats",
+    "RateLimitUsage",
+    "endpoint_template",
+    "get_global_api_collector",
+    "print_api_metrics_summary",
+]
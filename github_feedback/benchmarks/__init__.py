@@ -0,0 +1,25 @@
+"""Benchmark scenarios and regression checks behind ``gfa bench``."""
+
+from .harness import (
+    BenchmarkReport,
+    BenchmarkResult,
+    BenchProbe,
+    Regression,
+    Scenario,
+    compare_to_baseline,
+    run_benchmarks,
+    run_scenario,
+)
+from .scenarios import SCENARIOS
+
+__all__ = [
+    "BenchProbe",
+    "BenchmarkReport",
+    "BenchmarkResult",
+    "Regression",
+    "SCENARIOS",
+    "Scenario",
+    "compare_to_baseline",
+    "run_benchmarks",
+    "run_scenario",
+]
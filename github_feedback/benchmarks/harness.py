@@ -0,0 +1,303 @@
+"""Benchmark runner, JSON baselines and regression checks."""
+
+from __future__ import annotations
+
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from multiprocessing import get_context
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+
+from ..core.constants import BENCHMARK_THRESHOLDS
+from ..core.utils import FileSystemManager
+
+try:  # Unavailable on Windows
+    import resource
+except ImportError:  # pragma: no cover - platform dependent
+    resource = None  # type: ignore[assignment]
+
+BASELINE_VERSION = 1
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process in MiB (0 when unsupported)."""
+    if resource is None:
+        return 0.0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in KiB elsewhere
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+class BenchProbe:
+    """Handed to a scenario to mark the timed section and report counters.
+
+    Work outside :meth:`timed` (fixture generation, warm-up runs) is not
+    measured. A scenario that never enters :meth:`timed` is timed whole.
+    """
+
+    def __init__(self) -> None:
+        self.wall_seconds: Optional[float] = None
+        self.items = 0
+        self.requests = 0
+        self.cache_hits = 0
+
+    @contextmanager
+    def timed(self) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.wall_seconds = (self.wall_seconds or 0.0) + time.perf_counter() - start
+
+
+@dataclass(slots=True)
+class Scenario:
+    """A named workload run by ``gfa bench``."""
+
+    name: str
+    description: str
+    run: Callable[[BenchProbe, Path, float], None]
+
+
+@dataclass(slots=True)
+class BenchmarkResult:
+    """Measurements of one scenario run."""
+
+    name: str
+    wall_seconds: float
+    items: int = 0
+    requests: int = 0
+    cache_hits: int = 0
+    peak_rss_mb: float = 0.0
+
+    @property
+    def cache_hit_ratio(self) -> float:
+        """Share of HTTP responses served from the local cache."""
+        total = self.requests + self.cache_hits
+        return self.cache_hits / total if total else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self) | {"cache_hit_ratio": round(self.cache_hit_ratio, 4)}
+
+    @classmethod
+    def from_dict(cls, payload: Dict[str, Any]) -> BenchmarkResult:
+        return cls(
+            name=payload["name"],
+            wall_seconds=float(payload["wall_seconds"]),
+            items=int(payload.get("items", 0)),
+            requests=int(payload.get("requests", 0)),
+            cache_hits=int(payload.get("cache_hits", 0)),
+            peak_rss_mb=float(payload.get("peak_rss_mb", 0.0)),
+        )
+
+
+@dataclass(slots=True)
+class Regression:
+    """A metric that got worse than its baseline allows."""
+
+    scenario: str
+    metric: str
+    baseline: float
+    current: float
+    limit: float
+
+    def describe(self) -> str:
+        relation = "below floor" if self.metric == "cache_hit_ratio" else "exceeds limit"
+        return (
+            f"{self.scenario}: {self.metric} {self.current:.4g} "
+            f"{relation} {self.limit:.4g} (baseline {self.baseline:.4g})"
+        )
+
+
+@dataclass(slots=True)
+class BenchmarkReport:
+    """Results of a benchmark run plus the environment they were taken in."""
+
+    results: List[BenchmarkResult]
+    scale: float
+    created_at: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+    environment: Dict[str, str] = field(
+        default_factory=lambda: {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": str(os.cpu_count() or 0),
+        }
+    )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "version": BASELINE_VERSION,
+            "created_at": self.created_at,
+            "scale": self.scale,
+            "environment": self.environment,
+            "results": {result.name: result.to_dict() for result in self.results},
+        }
+
+    def merge(self, previous: BenchmarkReport) -> BenchmarkReport:
+        """Return this report plus the scenarios of ``previous`` this run did not cover."""
+        names = {result.name for result in self.results}
+        kept = [result for result in previous.results if result.name not in names]
+        return BenchmarkReport(
+            results=[*kept, *self.results],
+            scale=self.scale,
+            created_at=self.created_at,
+            environment=self.environment,
+        )
+
+    def save(self, path: Path) -> Path:
+        FileSystemManager.ensure_parent_directory(path)
+        path.write_text(json.dumps(self.to_dict(), indent=2) + "\n", encoding="utf-8")
+        return path
+
+    @classmethod
+    def load(cls, path: Path) -> BenchmarkReport:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+        if payload.get("version") != BASELINE_VERSION:
+            raise ValueError(f"Unsupported benchmark baseline version in {path}: {payload.get('version')}")
+        return cls(
+            results=[BenchmarkResult.from_dict(item) for item in payload.get("results", {}).values()],
+            scale=float(payload.get("scale", 1.0)),
+            created_at=payload.get("created_at", ""),
+            environment=payload.get("environment", {}),
+        )
+
+
+def run_scenario(scenario: Scenario, scale: float = 1.0) -> BenchmarkResult:
+    """Run ``scenario`` in this process inside a scratch directory."""
+    probe = BenchProbe()
+    with tempfile.TemporaryDirectory(prefix=f"gfa-bench-{scenario.name}-") as workdir:
+        start = time.perf_counter()
+        scenario.run(probe, Path(workdir), scale)
+        elapsed = time.perf_counter() - start
+    return BenchmarkResult(
+        name=scenario.name,
+        wall_seconds=probe.wall_seconds if probe.wall_seconds is not None else elapsed,
+        items=probe.items,
+        requests=probe.requests,
+        cache_hits=probe.cache_hits,
+        peak_rss_mb=round(peak_rss_mb(), 1),
+    )
+
+
+def _run_named_scenario(name: str, scale: float) -> BenchmarkResult:
+    from .scenarios import SCENARIOS
+
+    return run_scenario(SCENARIOS[name], scale)
+
+
+def run_benchmarks(
+    scenarios: Sequence[Scenario],
+    *,
+    scale: float = 1.0,
+    repeat: int = 1,
+    isolate: bool = True,
+    on_result: Optional[Callable[[BenchmarkResult], None]] = None,
+) -> BenchmarkReport:
+    """Run scenarios and collect their measurements.
+
+    Args:
+        scenarios: Scenarios to run, in order
+        scale: Multiplier applied to every scenario's fixture size
+        repeat: Runs per scenario; the median wall time is reported
+        isolate: Run each repetition in a fresh interpreter so peak RSS
+            belongs to that scenario alone (scenarios must be registered in
+            :data:`~github_feedback.benchmarks.scenarios.SCENARIOS`)
+        on_result: Called with each scenario's aggregated result
+    """
+    results: List[BenchmarkResult] = []
+    for scenario in scenarios:
+        runs: List[BenchmarkResult] = []
+        for _ in range(max(1, repeat)):
+            if isolate:
+                with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as executor:
+                    runs.append(executor.submit(_run_named_scenario, scenario.name, scale).result())
+            else:
+                runs.append(run_scenario(scenario, scale))
+        result = BenchmarkResult(
+            name=scenario.name,
+            wall_seconds=round(statistics.median(run.wall_seconds for run in runs), 4),
+            items=runs[-1].items,
+            requests=runs[-1].requests,
+            cache_hits=runs[-1].cache_hits,
+            peak_rss_mb=max(run.peak_rss_mb for run in runs),
+        )
+        results.append(result)
+        if on_result:
+            on_result(result)
+    return BenchmarkReport(results=results, scale=scale)
+
+
+def compare_to_baseline(
+    report: BenchmarkReport,
+    baseline: BenchmarkReport,
+    thresholds: Optional[Dict[str, float]] = None,
+) -> List[Regression]:
+    """List metrics of ``report`` that regressed past ``baseline``.
+
+    Wall time, peak RSS and request counts may grow by their relative
+    threshold; the cache hit ratio may drop by its absolute threshold.
+    Scenarios missing from the baseline are not compared.
+
+    Raises:
+        ValueError: If the two runs used different fixture scales
+    """
+    if report.scale != baseline.scale:
+        raise ValueError(
+            f"Baseline was recorded at scale {baseline.scale}, this run used {report.scale}"
+        )
+    limits = BENCHMARK_THRESHOLDS | (thresholds or {})
+    previous = {result.name: result for result in baseline.results}
+    regressions: List[Regression] = []
+
+    for result in report.results:
+        base = previous.get(result.name)
+        if base is None:
+            continue
+
+        wall_limit = max(
+            base.wall_seconds * (1 + limits["wall_seconds"]),
+            base.wall_seconds + limits["min_wall_delta_seconds"],
+        )
+        checks = [
+            ("wall_seconds", base.wall_seconds, result.wall_seconds, wall_limit),
+            ("requests", base.requests, result.requests, base.requests * (1 + limits["requests"])),
+        ]
+        if base.peak_rss_mb and result.peak_rss_mb:
+            checks.append((
+                "peak_rss_mb", base.peak_rss_mb, result.peak_rss_mb,
+                base.peak_rss_mb * (1 + limits["peak_rss_mb"]),
+            ))
+        for metric, before, now, limit in checks:
+            if now > limit:
+                regressions.append(Regression(result.name, metric, before, now, limit))
+
+        ratio_floor = base.cache_hit_ratio - limits["cache_hit_ratio"]
+        if result.cache_hit_ratio < ratio_floor:
+            regressions.append(Regression(
+                result.name, "cache_hit_ratio", base.cache_hit_ratio, result.cache_hit_ratio, ratio_floor
+            ))
+
+    return regressions
+
+
+__all__ = [
+    "BASELINE_VERSION",
+    "BenchProbe",
+    "BenchmarkReport",
+    "BenchmarkResult",
+    "Regression",
+    "Scenario",
+    "compare_to_baseline",
+    "peak_rss_mb",
+    "run_benchmarks",
+    "run_scenario",
+]
@@ -0,0 +1,249 @@
+"""Representative workloads measured by ``gfa bench``.
+
+Each scenario builds its fixture (a synthetic repository served by
+:class:`~github_feedback.testing.MockGitHubServer`, review folders on disk,
+generated commit messages) outside the timed section, then measures one
+production code path. Fixture sizes are multiplied by the run's scale.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import requests
+import requests_cache
+
+from ..collectors.collector import Collector
+from ..core.config import Config
+from ..core.models import AnalysisFilters, AnalysisStatus, MetricSnapshot, MonthlyTrend
+from ..llm.heuristics import CommitMessageAnalyzer
+from ..reporters.reporter import Reporter
+from ..review_reports.data_loader import ARTEFACTS_FILENAME, SUMMARY_FILENAME, ReviewDataLoader
+from ..testing import MockGitHubServer, RepoSpec, SyntheticGitHub
+from .harness import BenchProbe, Scenario
+
+BENCH_REPO = "bench/repo"
+
+
+def _scaled(count: int, scale: float, minimum: int = 1) -> int:
+    return max(minimum, int(count * scale))
+
+
+class _BenchConfig(Config):
+    """Configuration whose PAT comes from memory instead of the keyring."""
+
+    def get_pat(self) -> Optional[str]:
+        return "bench-token"
+
+
+class _ResponseCounter:
+    """Count responses a session answered from its cache."""
+
+    def __init__(self, session: requests.Session) -> None:
+        self.cache_hits = 0
+        session.hooks["response"].append(self._hook)
+
+    def _hook(self, response: requests.Response, *args, **kwargs) -> None:
+        if getattr(response, "from_cache", False) is True:
+            self.cache_hits += 1
+
+
+@contextmanager
+def _mock_github(
+    spec: RepoSpec, workdir: Path, *, cache: bool = False
+) -> Iterator[Tuple[MockGitHubServer, Collector, _ResponseCounter]]:
+    """Serve ``spec`` and yield a collector talking to it."""
+    dataset = SyntheticGitHub.generate([spec], login="bench-user")
+    with MockGitHubServer(dataset) as server:
+        session: requests.Session
+        if cache:
+            session = requests_cache.CachedSession(
+                cache_name=str(workdir / "api_cache"),
+                backend="sqlite",
+                allowable_codes=[200, 301, 302],
+                allowable_methods=["GET", "HEAD"],
+            )
+        else:
+            session = requests.Session()
+        config = _BenchConfig()
+        config.server.api_url = server.url
+        collector = Collector(config, session)
+        session.headers.update(collector.api_client._headers)
+        yield server, collector, _ResponseCounter(session)
+
+
+def _recent_spec(**sizes: int) -> RepoSpec:
+    end = datetime.now(timezone.utc)
+    return RepoSpec(BENCH_REPO, start=end - timedelta(days=300), end=end, **sizes)
+
+
+def _collect_sizes(scale: float) -> Dict[str, int]:
+    return {
+        "commits": _scaled(3000, scale),
+        "pull_requests": _scaled(600, scale),
+        "issues": _scaled(400, scale),
+        "branches": 3,
+    }
+
+
+def collect(probe: BenchProbe, workdir: Path, scale: float) -> None:
+    """Full ``Collector.collect`` over a cold cache."""
+    spec = _recent_spec(**_collect_sizes(scale))
+    with _mock_github(spec, workdir, cache=True) as (server, collector, counter):
+        with probe.timed():
+            result = collector.collect(BENCH_REPO, months=12)
+        probe.items = result.commits + result.pull_requests + result.issues
+        probe.requests = server.stats.requests
+        probe.cache_hits = counter.cache_hits
+
+
+def collect_cached(probe: BenchProbe, workdir: Path, scale: float) -> None:
+    """``Collector.collect`` re-run over the cache left by a first run."""
+    spec = _recent_spec(**_collect_sizes(scale))
+    with _mock_github(spec, workdir, cache=True) as (server, collector, counter):
+        collector.collect(BENCH_REPO, months=12)
+        requests_before, hits_before = server.stats.requests, counter.cache_hits
+        with probe.timed():
+            result = collector.collect(BENCH_REPO, months=12)
+        probe.items = result.commits + result.pull_requests + result.issues
+        probe.requests = server.stats.requests - requests_before
+        probe.cache_hits = counter.cache_hits - hits_before
+
+
+def count_commits(probe: BenchProbe, workdir: Path, scale: float) -> None:
+    """``CommitCollector.count_commits`` across many overlapping branches."""
+    spec = _recent_spec(commits=_scaled(3000, scale), branches=_scaled(12, scale, 2), pull_requests=1)
+    with _mock_github(spec, workdir) as (server, collector, _counter):
+        repository = server.dataset.repository(BENCH_REPO)
+        filters = AnalysisFilters(include_branches=[branch["name"] for branch in repository.branches])
+        since = spec.start
+        with probe.timed():
+            probe.items = collector.commit_collector.count_commits(BENCH_REPO, since, filters)
+        probe.requests = server.stats.requests
+
+
+def _write_review_dirs(reviews_dir: Path, count: int) -> None:
+    repo_dir = reviews_dir / BENCH_REPO.replace("/", "__")
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    for number in range(1, count + 1):
+        pr_dir = repo_dir / f"pr-{number}"
+        pr_dir.mkdir(parents=True)
+        (pr_dir / ARTEFACTS_FILENAME).write_text(
+            json.dumps({
+                "number": number,
+                "title": f"feat: improve module {number % 97}",
+                "author": f"dev{number % 7}",
+                "html_url": f"https://github.com/{BENCH_REPO}/pull/{number}",
+                "created_at": (start + timedelta(hours=number)).isoformat(),
+                "body": "Adds caching and tests.\n" * 5,
+                "review_bodies": ["Looks good overall."] * 2,
+                "review_comments": ["Consider extracting this helper."] * 3,
+                "additions": number % 400,
+                "deletions": number % 120,
+                "changed_files": number % 15 + 1,
+            }),
+            encoding="utf-8",
+        )
+        (pr_dir / SUMMARY_FILENAME).write_text(
+            json.dumps({
+                "overview": "Clear change with focused tests.",
+                "strengths": [{"message": "Small, focused diff", "example": "module.py"}],
+                "improvements": [{"message": "Add edge-case tests", "example": "test_module.py"}],
+            }),
+            encoding="utf-8",
+        )
+
+
+def load_reviews(probe: BenchProbe, workdir: Path, scale: float) -> None:
+    """``ReviewDataLoader.load_reviews`` importing thousands of PR folders."""
+    reviews_dir = workdir / "reviews"
+    _write_review_dirs(reviews_dir, _scaled(5000, scale))
+    with probe.timed():
+        probe.items = len(ReviewDataLoader(reviews_dir).load_reviews(BENCH_REPO))
+
+
+def _metric_snapshot(index: int) -> MetricSnapshot:
+    months = [f"2024-{month:02d}" for month in range(1, 13)]
+    return MetricSnapshot(
+        repo=f"bench/report-{index}",
+        months=12,
+        generated_at=datetime.now(timezone.utc),
+        status=AnalysisStatus.ANALYSED,
+        summary={"overall": "Steady delivery with growing review depth.", "velocity": "High"},
+        stats={
+            "commits": {"total": 1200 + index, "per_month": 100.0, "active_days": 210},
+            "pull_requests": {"total": 340, "merged": 300, "avg_size": 182.5},
+            "reviews": {"total": 510, "avg_comments": 3.2, "response_hours": 5.4},
+            "issues": {"opened": 120, "closed": 98},
+        },
+        evidence={
+            "pull_requests": [f"https://github.com/bench/repo/pull/{n}" for n in range(1, 21)],
+            "commits": [f"https://github.com/bench/repo/commit/{n:040x}" for n in range(1, 21)],
+        },
+        highlights=[f"Shipped feature {n} ahead of schedule" for n in range(10)],
+        spotlight_examples={
+            "pull_requests": [f"PR #{n} · Improve module {n} — dev{n % 5}" for n in range(1, 11)]
+        },
+        yearbook_story=["A year of steady, well-reviewed changes."] * 3,
+        awards=[f"🏆 Award {n}" for n in range(8)],
+        monthly_trends=[
+            MonthlyTrend(month=month, commits=80 + i, pull_requests=20 + i, reviews=30 + i, issues=8)
+            for i, month in enumerate(months)
+        ],
+    )
+
+
+def generate_markdown(probe: BenchProbe, workdir: Path, scale: float) -> None:
+    """``Reporter.generate_markdown`` for a batch of distinct snapshots."""
+    snapshots = [_metric_snapshot(index) for index in range(_scaled(200, scale))]
+    with probe.timed():
+        for snapshot in snapshots:
+            Reporter(output_dir=workdir / "reports").generate_markdown(snapshot)
+    probe.items = len(snapshots)
+
+
+_GOOD_PREFIXES = ["feat", "fix", "docs", "refactor", "test", "perf", "chore"]
+_POOR_MESSAGES = ["wip", "fix", "update", "asdf", "changes", "minor fixes", "temp"]
+
+
+def _commit_messages(count: int, seed: int = 0) -> List[Dict[str, str]]:
+    rng = random.Random(seed)
+    commits = []
+    for index in range(count):
+        if rng.random() < 0.6:
+            message = f"{rng.choice(_GOOD_PREFIXES)}(core): handle edge case {index} in parser"
+            if rng.random() < 0.3:
+                message += "\n\nExplain why the previous behaviour was wrong and how this fixes it."
+        else:
+            message = rng.choice(_POOR_MESSAGES)
+        commits.append({"sha": f"{rng.getrandbits(160):040x}", "message": message})
+    return commits
+
+
+def heuristic_commits(probe: BenchProbe, workdir: Path, scale: float) -> None:
+    """Heuristic commit-message analysis over a large history."""
+    commits = _commit_messages(_scaled(100_000, scale))
+    with probe.timed():
+        CommitMessageAnalyzer.analyze(commits)
+    probe.items = len(commits)
+
+
+SCENARIOS: Dict[str, Scenario] = {
+    scenario.name: scenario
+    for scenario in (
+        Scenario("collect", "Collector.collect, cold cache", collect),
+        Scenario("collect_cached", "Collector.collect, warm cache", collect_cached),
+        Scenario("count_commits", "count_commits over many branches", count_commits),
+        Scenario("load_reviews", "ReviewDataLoader.load_reviews, 5k PR folders", load_reviews),
+        Scenario("generate_markdown", "Reporter.generate_markdown, 200 reports", generate_markdown),
+        Scenario("heuristic_commits", "CommitMessageAnalyzer on 100k messages", heuristic_commits),
+    )
+}
+
+
+__all__ = ["BENCH_REPO", "SCENARIOS"]
@@ -0,0 +1,156 @@
+"""Benchmark command for the CLI."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import List, Optional
+
+import typer
+
+try:  # pragma: no cover - optional rich dependency
+    from rich import box
+    from rich.table import Table
+except ModuleNotFoundError:  # pragma: no cover - fallback when rich is missing
+    Table = None
+    box = None
+
+from ..benchmarks import SCENARIOS, BenchmarkReport, BenchmarkResult, compare_to_baseline, run_benchmarks
+from ..core.console import Console
+
+console = Console()
+
+DEFAULT_BASELINE_PATH = Path("benchmarks") / "baseline.json"
+
+
+def _render_results(report: BenchmarkReport, baseline: Optional[BenchmarkReport]) -> None:
+    previous = {result.name: result for result in baseline.results} if baseline else {}
+
+    def change(result: BenchmarkResult) -> str:
+        base = previous.get(result.name)
+        if base is None or not base.wall_seconds:
+            return "-"
+        return f"{(result.wall_seconds / base.wall_seconds - 1) * 100:+.1f}%"
+
+    if Table is None:
+        for result in report.results:
+            console.print(
+                f"{result.name}: {result.wall_seconds:.3f}s items={result.items} "
+                f"requests={result.requests} cache_hit={result.cache_hit_ratio:.0%} "
+                f"peak_rss={result.peak_rss_mb:.1f}MiB vs_baseline={change(result)}"
+            )
+        return
+
+    table = Table(title=f"Benchmarks (scale {report.scale:g})", box=box.ROUNDED, header_style="bold cyan")
+    table.add_column("Scenario", no_wrap=True)
+    table.add_column("Wall s", justify="right")
+    table.add_column("Items", justify="right")
+    table.add_column("Requests", justify="right")
+    table.add_column("Cache", justify="right")
+    table.add_column("RSS MiB", justify="right")
+    table.add_column("Δ base", justify="right")
+    for result in report.results:
+        table.add_row(
+            result.name,
+            f"{result.wall_seconds:.3f}",
+            f"{result.items:,}",
+            f"{result.requests:,}",
+            f"{result.cache_hit_ratio:.0%}",
+            f"{result.peak_rss_mb:.1f}",
+            change(result),
+        )
+    console.print(table)
+
+
+def bench(
+    scenarios: Optional[List[str]],
+    baseline_path: Path,
+    update_baseline: bool,
+    output: Optional[Path],
+    scale: float,
+    repeat: int,
+    threshold: Optional[float],
+    isolate: bool,
+    list_scenarios: bool,
+) -> None:
+    """Run benchmark scenarios and compare them against a JSON baseline.
+
+    Exits with code 1 when any metric regresses past its threshold.
+
+    Examples:
+        gfa bench --update-baseline
+        gfa bench --scenario collect --scenario load_reviews
+        gfa bench --scale 0.1 --threshold 0.5
+    """
+    if list_scenarios:
+        for scenario in SCENARIOS.values():
+            console.print(f"[accent]{scenario.name}[/] - {scenario.description}")
+        return
+
+    names = scenarios or list(SCENARIOS)
+    unknown = [name for name in names if name not in SCENARIOS]
+    if unknown:
+        console.print_error(
+            f"Unknown benchmark scenario(s): {', '.join(unknown)}. "
+            f"Available: {', '.join(SCENARIOS)}"
+        )
+        raise typer.Exit(code=2)
+    if scale <= 0:
+        console.print_error("--scale must be positive")
+        raise typer.Exit(code=2)
+
+    baseline: Optional[BenchmarkReport] = None
+    if baseline_path.exists():
+        try:
+            baseline = BenchmarkReport.load(baseline_path)
+        except (ValueError, KeyError) as exc:
+            if not update_baseline:
+                console.print_error(exc, "Failed to read benchmark baseline")
+                raise typer.Exit(code=2) from exc
+            console.print(f"[warning]Replacing unreadable baseline {baseline_path}: {exc}[/]")
+
+    report = run_benchmarks(
+        [SCENARIOS[name] for name in names],
+        scale=scale,
+        repeat=repeat,
+        isolate=isolate,
+        on_result=lambda result: console.log(f"{result.name}: {result.wall_seconds:.3f}s"),
+    )
+    _render_results(report, None if update_baseline else baseline)
+
+    if output:
+        report.save(output)
+        console.print(f"[info]Results written to[/] {output}")
+
+    if update_baseline:
+        # Scenarios left out of this run keep their recorded results
+        if baseline is not None and baseline.scale == report.scale:
+            report = report.merge(baseline)
+        elif baseline is not None:
+            console.print(
+                f"[warning]Baseline was recorded at scale {baseline.scale:g}; "
+                f"replacing it with this run at scale {report.scale:g}[/]"
+            )
+        report.save(baseline_path)
+        console.print_success(f"Baseline saved to {baseline_path}")
+        return
+
+    if baseline is None:
+        console.print(
+            f"[warning]No baseline at {baseline_path}; run with --update-baseline to record one.[/]"
+        )
+        return
+
+    thresholds = {"wall_seconds": threshold} if threshold is not None else None
+    try:
+        regressions = compare_to_baseline(report, baseline, thresholds)
+    except ValueError as exc:
+        console.print_error(exc)
+        raise typer.Exit(code=2) from exc
+
+    if regressions:
+        console.print(f"[danger]{len(regressions)} benchmark regression(s):[/]")
+        for regression in regressions:
+            console.print(f"  - {regression.describe()}")
+        raise typer.Exit(code=1)
+
+    console.print_success("No benchmark regressions against the baseline")
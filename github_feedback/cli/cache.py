@@ -0,0 +1,126 @@
+"""API response cache commands for the CLI."""
+
+from __future__ import annotations
+
+import typer
+
+try:  # pragma: no cover - optional rich dependency
+    from rich import box
+    from rich.table import Table
+except ModuleNotFoundError:  # pragma: no cover - fallback when rich is missing
+    Table = None
+    box = None
+
+from ..api.cache import CacheStats, ResponseCache
+from ..core.config import Config
+from ..core.console import Console
+
+console = Console()
+
+
+def _mib(size: int) -> str:
+    return f"{size / (1024 * 1024):.1f} MiB"
+
+
+def _response_cache() -> ResponseCache:
+    """Return the cache manager with the configured size limit."""
+    try:
+        config = Config.load()
+    except ValueError as exc:
+        console.print_error(exc)
+        raise typer.Exit(code=1) from exc
+    return ResponseCache(max_size_mb=config.api.cache_max_size_mb)
+
+
+def _render_stats(stats: CacheStats, limit: int) -> None:
+    limit_text = _mib(stats.max_bytes) if stats.max_bytes else "unlimited"
+    console.print(f"[info]Cache:[/] {stats.path}")
+    console.print(
+        f"File {_mib(stats.file_bytes)} · stored {_mib(stats.stored_bytes)} of {limit_text} · "
+        f"{stats.entries:,} entries ({stats.expired:,} expired) · "
+        f"compression {stats.compression_ratio:.1f}x · hit ratio {stats.hit_ratio:.0%}"
+    )
+
+    endpoints = sorted(stats.endpoints.items(), key=lambda item: item[1].stored_bytes, reverse=True)[:limit]
+    ages = stats.age_histogram
+    if Table is None:
+        for name, endpoint in endpoints:
+            console.print(
+                f"{name}: entries={endpoint.entries} stored={_mib(endpoint.stored_bytes)} "
+                f"hits={endpoint.hits} misses={endpoint.misses} hit_ratio={endpoint.hit_ratio:.0%}"
+            )
+        console.print("Age: " + ", ".join(f"{label}={count}" for label, count in ages.items()))
+        return
+
+    table = Table(title="Cache by Endpoint", box=box.ROUNDED, header_style="bold cyan")
+    table.add_column("Endpoint", no_wrap=True)
+    table.add_column("Entries", justify="right")
+    table.add_column("Stored", justify="right")
+    table.add_column("Hits", justify="right")
+    table.add_column("Misses", justify="right")
+    table.add_column("Hit ratio", justify="right")
+    for name, endpoint in endpoints:
+        table.add_row(
+            name,
+            f"{endpoint.entries:,}",
+            _mib(endpoint.stored_bytes),
+            f"{endpoint.hits:,}",
+            f"{endpoint.misses:,}",
+            f"{endpoint.hit_ratio:.0%}",
+        )
+    console.print(table)
+
+    age_table = Table(title="Entry Age", box=box.ROUNDED, header_style="bold cyan")
+    age_table.add_column("Age", no_wrap=True)
+    age_table.add_column("Entries", justify="right")
+    age_table.add_column("", no_wrap=True)
+    peak = max(ages.values(), default=0) or 1
+    for label, count in ages.items():
+        age_table.add_row(label, f"{count:,}", "█" * round(30 * count / peak))
+    console.print(age_table)
+
+
+def cache_stats(limit: int = 15) -> None:
+    """Show size, entries, hit ratio by endpoint and an age histogram.
+
+    Examples:
+        gfa cache stats
+        gfa cache stats --limit 30
+    """
+    cache = _response_cache()
+    if not cache.db_path.exists():
+        console.print("[info]No API cache found[/]")
+        return
+    _render_stats(cache.stats(), limit)
+
+
+def cache_prune_expired() -> None:
+    """Delete expired responses, then evict down to the size limit.
+
+    Examples:
+        gfa cache prune-expired
+    """
+    cache = _response_cache()
+    if not cache.db_path.exists():
+        console.print("[info]No API cache found[/]")
+        return
+    pruned = cache.prune_expired()
+    evicted = cache.enforce_size_limit()
+    console.print(f"[success]Removed {pruned:,} expired responses[/]")
+    if evicted:
+        console.print(f"[success]Evicted {evicted:,} least recently used responses to fit the size limit[/]")
+    console.print("[info]Run `gfa cache vacuum` to return the freed space to the file system[/]")
+
+
+def cache_vacuum() -> None:
+    """Compact the cache database file.
+
+    Examples:
+        gfa cache vacuum
+    """
+    cache = _response_cache()
+    if not cache.db_path.exists():
+        console.print("[info]No API cache found[/]")
+        return
+    before, after = cache.vacuum()
+    console.print(f"[success]Vacuumed API cache: {_mib(before)} → {_mib(after)}[/]")
@@ -20,6 +20,7 @@ from ..core.constants import (
     PARALLEL_CONFIG,
     TaskType,
 )
+from ..core.tracing import phase
 from ..llm.client import LLMClient
 from ..core.models import AnalysisFilters, DetailedFeedbackSnapshot
 
@@ -131,6 +132,10 @@ def collect_detailed_feedback(
             max_files_in_prompt=config.llm.max_files_in_prompt,
             max_files_with_patch_snippets=config.llm.max_files_with_patch_snippets,
             web_url=config.server.web_url,
+            endpoints=config.llm.endpoints,
+            hedge_percentile=config.llm.hedge_percentile,
+            stream=config.llm.stream,
+            prompt_token_budget=config.llm.prompt_token_budget,
         )
 
         # Parallelize LLM analysis calls
@@ -315,6 +320,7 @@ def collect_yearend_data(
     )
 
 
+@phase("Phase 1: Personal Activity Collection")
 def collect_personal_activity(
     collector: Collector,
     repo_input: str,
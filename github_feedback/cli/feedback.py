@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import typer
 
@@ -15,14 +15,20 @@ from . import data_collection as cli_data_collection
 from . import yearinreview as cli_yearinreview
 from . import report_integration as cli_report_integration
 from ..analyzer import Analyzer
+from ..api.metrics import get_global_api_collector
 from ..collectors.collector import Collector
 from ..core.config import Config
 from ..core.console import Console
-from ..core.constants import PARALLEL_CONFIG, TaskType
+from ..core.constants import PARALLEL_CONFIG
+from ..core.memory import MemoryReport
+from ..core.tracing import format_top_functions, instrument, phase
 from ..llm.client import LLMClient
+from ..llm.metrics import get_global_collector
 from ..core.models import AnalysisFilters, MetricSnapshot
+from ..reporters.document import ReportDocument
 from ..reporters.reporter import Reporter
 from ..reporters.review_reporter import ReviewReporter
+from ..review_triage import TriageRules
 from ..reviewer import Reviewer
 from ..core.utils import validate_repo_format
 
@@ -35,7 +41,7 @@ def generate_artifacts(
     output_dir: Path,
     metrics_payload: dict,
     save_intermediate_report: bool = True,
-) -> tuple[List[tuple[str, Path]], Optional[str]]:
+) -> tuple[List[tuple[str, Path]], Optional[ReportDocument]]:
     """Generate all report artifacts and return brief report content in memory.
 
     Args:
@@ -49,7 +55,7 @@ def generate_artifacts(
     Returns:
         Tuple of (artifacts, brief_content):
             - artifacts: List of (label, path) tuples for generated artifacts
-            - brief_content: Markdown content for brief report (None if not generated)
+            - brief_content: Document tree of the brief report (None if not generated)
     """
     artifacts = []
 
@@ -60,8 +66,8 @@ def generate_artifacts(
     # Generate markdown report content in memory (no _internal folder needed)
     brief_content = None
     if save_intermediate_report:
-        # Generate content in memory without creating files
-        brief_content = reporter.generate_markdown_content(metrics)
+        # Render the document tree in memory without creating files
+        brief_content = reporter.render_document(metrics)
     else:
         markdown_path = reporter.generate_markdown(metrics)
         artifacts.append(("Markdown report", markdown_path))
@@ -69,10 +75,81 @@ def generate_artifacts(
     return artifacts, brief_content
 
 
+def _run_batched_reviews(
+    reviewer: Reviewer,
+    repo_input: str,
+    updates: dict[int, datetime],
+    max_workers: int,
+) -> dict[str, tuple[Path, Path, Path] | None]:
+    """Collect PR details in parallel, then review small PRs in shared batches.
+
+    Args:
+        reviewer: Reviewer configured with a batch size above one
+        repo_input: Repository name in owner/repo format
+        updates: ``updated_at`` of each PR to review, from the PR listing
+        max_workers: Maximum number of concurrent tasks per phase
+
+    Returns:
+        Mapping of ``pr_<number>`` task keys to review paths (None on failure)
+    """
+    review_results: dict[str, tuple[Path, Path, Path] | None] = {}
+    collect_tasks = {}
+    for pr_number in sorted(updates):
+        cached = reviewer.cached_review(repo_input, pr_number, updates[pr_number])
+        if cached:
+            review_results[f"pr_{pr_number}"] = cached
+        else:
+            collect_tasks[f"pr_{pr_number}"] = (
+                reviewer.collect_bundle,
+                (repo_input, pr_number),
+                f"PR #{pr_number}",
+            )
+
+    bundles = cli_helpers.run_parallel_tasks(
+        collect_tasks,
+        max_workers,
+        PARALLEL_CONFIG['pr_review_timeout'],
+        task_type="collection",
+    )
+    collected = [bundles[key] for key in collect_tasks if bundles.get(key) is not None]
+
+    batches = reviewer.plan_batches(collected)
+    batched = sum(1 for batch in batches if len(batch) > 1)
+    if batched:
+        console.print(
+            f"[info]Reviewing {len(collected)} PRs in {len(batches)} LLM requests "
+            f"({batched} batched)[/]"
+        )
+
+    batch_tasks = {
+        f"batch_{index}": (
+            reviewer.review_batch,
+            (batch,),
+            "PRs " + ", ".join(f"#{bundle.number}" for bundle in batch),
+        )
+        for index, batch in enumerate(batches)
+    }
+    batch_results = cli_helpers.run_parallel_tasks(
+        batch_tasks,
+        max_workers,
+        PARALLEL_CONFIG['pr_review_timeout'],
+        task_type="analysis",
+    )
+    for batch_result in batch_results.values():
+        for pr_number, *paths in batch_result or []:
+            review_results[f"pr_{pr_number}"] = tuple(paths)
+
+    return review_results
+
+
 def run_feedback_analysis(
     config: Config,
     repo_input: str,
     output_dir: Path,
+    *,
+    collector: Optional[Collector] = None,
+    author: Optional[str] = None,
+    updates: Optional[Dict[int, datetime]] = None,
 ) -> tuple[Path | None, list[tuple[int, Path, Path, Path]]]:
     """Run feedback analysis for all PRs authored by the authenticated user.
 
@@ -80,16 +157,21 @@ def run_feedback_analysis(
         config: Configuration object
         repo_input: Repository name in owner/repo format
         output_dir: Output directory for review artifacts
+        collector: Collector to reuse instead of creating one
+        author: Authenticated username, when already known
+        updates: Authored PR numbers mapped to their last update time, when
+            already listed by the caller
 
     Returns:
         Tuple of (integrated_report_path, pr_results)
         where pr_results is a list of (pr_number, artefact_path, summary_path, markdown_path)
     """
-    try:
-        collector = Collector(config)
-    except ValueError as exc:
-        console.print_error(exc)
-        return None, []
+    if collector is None:
+        try:
+            collector = Collector(config)
+        except ValueError as exc:
+            console.print_error(exc)
+            return None, []
 
     llm_client = LLMClient(
         endpoint=config.llm.endpoint,
@@ -98,54 +180,78 @@ def run_feedback_analysis(
         max_files_in_prompt=config.llm.max_files_in_prompt,
         max_files_with_patch_snippets=config.llm.max_files_with_patch_snippets,
         web_url=config.server.web_url,
+        endpoints=config.llm.endpoints,
+        hedge_percentile=config.llm.hedge_percentile,
+        stream=config.llm.stream,
+        prompt_token_budget=config.llm.prompt_token_budget,
     )
 
     reviews_dir = output_dir / "reviews"
-    reviewer = Reviewer(collector=collector, llm=llm_client, output_dir=reviews_dir)
+    reviewer = Reviewer(
+        collector=collector,
+        llm=llm_client,
+        output_dir=reviews_dir,
+        batch_size=config.llm.review_batch_size,
+        triage=TriageRules(
+            docs_only=config.llm.triage_docs_only,
+            dependency_bumps=config.llm.triage_dependency_bumps,
+            max_changed_lines=config.llm.triage_max_changed_lines,
+        ),
+    )
 
     # Get authenticated user
-    with console.status("[accent]Retrieving authenticated user...", spinner="dots"):
-        try:
-            author = collector.get_authenticated_user()
-        except (ValueError, PermissionError) as exc:
-            console.print(f"[error]Failed to get authenticated user: {exc}[/]")
-            return None, []
+    if author is None:
+        with console.status("[accent]Retrieving authenticated user...", spinner="dots"):
+            try:
+                author = collector.get_authenticated_user()
+            except (ValueError, PermissionError) as exc:
+                console.print(f"[error]Failed to get authenticated user: {exc}[/]")
+                return None, []
 
     # Find user's PRs
-    with console.status("[accent]Finding your pull requests...", spinner="dots"):
-        numbers = collector.list_authored_pull_requests(
-            repo=repo_input,
-            author=author,
-            state="all",
-        )
+    if updates is None:
+        with console.status("[accent]Finding your pull requests...", spinner="dots"):
+            updates = collector.list_authored_pull_request_updates(
+                repo=repo_input,
+                author=author,
+                state="all",
+            )
 
-    if not numbers:
+    if not updates:
         console.print(
             f"[warning]No pull requests found authored by '{author}' in {repo_input}.[/]"
         )
         return None, []
 
-    pr_numbers = sorted(set(numbers))
+    pr_numbers = sorted(updates)
     total_prs = len(pr_numbers)
 
     # Generate PR reviews in parallel
     console.print(f"[info]Analyzing {total_prs} PRs in parallel...[/]")
 
-    review_tasks = {
-        f"pr_{pr_number}": (
-            reviewer.review_pull_request,
-            (repo_input, pr_number),
-            f"PR #{pr_number}"
-        )
-        for pr_number in pr_numbers
-    }
+    # Each additional LLM endpoint adds capacity for concurrent reviews
+    max_workers = PARALLEL_CONFIG['max_workers_pr_review'] * llm_client.endpoint_count
 
-    review_results = cli_helpers.run_parallel_tasks(
-        review_tasks,
-        PARALLEL_CONFIG['max_workers_pr_review'],
-        PARALLEL_CONFIG['pr_review_timeout'],
-        task_type="analysis"
-    )
+    # The review manifest is written once for the whole run
+    with reviewer.batched_manifest_writes():
+        if reviewer.batch_size > 1:
+            review_results = _run_batched_reviews(reviewer, repo_input, updates, max_workers)
+        else:
+            review_tasks = {
+                f"pr_{pr_number}": (
+                    reviewer.review_pull_request,
+                    (repo_input, pr_number, False, updates[pr_number]),
+                    f"PR #{pr_number}"
+                )
+                for pr_number in pr_numbers
+            }
+
+            review_results = cli_helpers.run_parallel_tasks(
+                review_tasks,
+                max_workers,
+                PARALLEL_CONFIG['pr_review_timeout'],
+                task_type="analysis"
+            )
 
     # Collect results
     results = []
@@ -157,6 +263,12 @@ def run_feedback_analysis(
         else:
             console.print(f"[warning]⚠ PR #{pr_number} review failed or timed out[/]", style="warning")
 
+    # Counted per reviewer: the metrics collector is shared by every repository of a run
+    if reviewer.triage_skipped:
+        console.print(
+            f"[info]Skipped LLM review for {reviewer.triage_skipped} trivial PR(s) using heuristics[/]"
+        )
+
     # Generate integrated report
     output_dir_resolved = cli_helpers.resolve_output_dir(output_dir)
     reviews_dir = output_dir_resolved / "reviews"
@@ -178,7 +290,7 @@ def run_feedback_analysis(
 def generate_integrated_full_report(
     output_dir: Path,
     repo_name: str,
-    brief_content: str,
+    brief_content: ReportDocument | str,
     feedback_report_path: Path,
 ) -> Path:
     """Generate an improved integrated report with better UX.
@@ -186,7 +298,7 @@ def generate_integrated_full_report(
     Args:
         output_dir: Output directory for the integrated report
         repo_name: Repository name in owner/repo format
-        brief_content: Brief report markdown content (from memory)
+        brief_content: Brief report document tree or markdown content (from memory)
         feedback_report_path: Path to the feedback integrated report markdown file
 
     Returns:
@@ -203,11 +315,12 @@ def generate_integrated_full_report(
     )
 
 
+@phase("Phase 4: Report Generation")
 def generate_reports_and_artifacts(
     metrics: MetricSnapshot,
     reporter: Reporter,
     output_dir_resolved: Path,
-) -> tuple[List[tuple[str, Path]], Optional[str]]:
+) -> tuple[List[tuple[str, Path]], Optional[ReportDocument]]:
     """Generate report artifacts.
 
     Args:
@@ -227,6 +340,7 @@ def generate_reports_and_artifacts(
     return artifacts, brief_content
 
 
+@phase("Phase 6: PR Review Analysis")
 def run_pr_reviews(
     config: Config,
     repo_input: str,
@@ -259,10 +373,11 @@ def run_pr_reviews(
     return feedback_report_path, pr_results
 
 
+@phase("Phase 7: Final Report Generation")
 def generate_final_report(
     output_dir_resolved: Path,
     repo_input: str,
-    brief_content: Optional[str],
+    brief_content: Optional[ReportDocument],
     feedback_report_path: Optional[Path],
 ) -> Optional[Path]:
     """Generate integrated full report.
@@ -335,7 +450,7 @@ def run_year_in_review_analysis(
     # Discover repositories
     console.print()
     console.rule("Phase 1: Repository Discovery")
-    with console.status(
+    with phase("Phase 1: Repository Discovery"), console.status(
         f"[accent]Finding repositories you contributed to in {year}...", spinner="dots"
     ):
         repositories = collector.get_year_in_review_repositories(year=year, min_contributions=3)
@@ -358,45 +473,32 @@ def run_year_in_review_analysis(
         console.print(f"  {idx}. {full_name} ({year_commits} commits)")
     console.print()
 
-    # Analyze each repository in parallel
+    # Analyze every repository in one dependency graph
     console.print()
     console.rule("Phase 2: Repository Analysis")
     console.print(f"[accent]Analyzing {len(repositories)} repositories in parallel...[/]")
 
     output_dir_resolved = cli_helpers.resolve_output_dir(output_dir)
 
-    # Create analysis tasks
-    analysis_tasks = {}
-    for repo_data in repositories:
-        full_name = repo_data.get("full_name", "")
-        if not full_name:
-            continue
-
-        key = f"repo_{full_name.replace('/', '__')}"
-        analysis_tasks[key] = (
-            analyze_single_repository_for_year_review,
-            (config, full_name, year, output_dir_resolved),
-            f"Repository: {full_name}",
+    with phase("Phase 2: Repository Analysis"):
+        analysis_results = cli_yearinreview.run_year_in_review_graph(
+            config=config,
+            collector=collector,
+            author=author,
+            repositories=repositories,
+            year=year,
+            output_dir=output_dir_resolved,
+            run_feedback_analysis_func=run_feedback_analysis,
+            collect_detailed_feedback_func=cli_data_collection.collect_detailed_feedback,
         )
 
-    # Run analyses in parallel
-    analysis_results = cli_helpers.run_parallel_tasks(
-        analysis_tasks,
-        max_workers=3,  # Limit concurrency to avoid rate limits
-        timeout=600,  # 10 minutes per repository
-        task_type=TaskType.ANALYSIS,
-    )
-
     # Collect successful analyses
     repository_analyses = []
     for repo_data in repositories:
         full_name = repo_data.get("full_name", "")
-        key = f"repo_{full_name.replace('/', '__')}"
-
-        if key in analysis_results and analysis_results[key] is not None:
-            repo_analysis = analysis_results[key]
-            if repo_analysis:
-                repository_analyses.append(repo_analysis)
+        repo_analysis = analysis_results.get(full_name)
+        if repo_analysis is not None:
+            repository_analyses.append(repo_analysis)
         else:
             console.print(f"[warning]⚠ Skipped {full_name} due to analysis failure[/]")
 
@@ -410,12 +512,13 @@ def run_year_in_review_analysis(
     console.print()
     console.rule("Phase 3: Generating Year-in-Review Report")
 
-    year_reporter = YearInReviewReporter(output_dir=output_dir_resolved / "year-in-review")
-    report_path = year_reporter.create_year_in_review_report(
-        year=year,
-        username=author,
-        repository_analyses=repository_analyses,
-    )
+    with phase("Phase 3: Generating Year-in-Review Report"):
+        year_reporter = YearInReviewReporter(output_dir=output_dir_resolved / "year-in-review")
+        report_path = year_reporter.create_year_in_review_report(
+            year=year,
+            username=author,
+            repository_analyses=repository_analyses,
+        )
 
     # Display summary
     console.print()
@@ -429,35 +532,8 @@ def run_year_in_review_analysis(
     console.print("[info]💡 Next steps:[/]")
     console.print(f"  • View the report: [accent]cat {report_path}[/]")
     console.print("  • Review individual repository reports in: [accent]reports/reviews/[/]")
-
-
-def analyze_single_repository_for_year_review(
-    config: Config,
-    repo_name: str,
-    year: int,
-    output_dir: Path,
-) -> Optional['RepositoryAnalysis']:
-    """Analyze a single repository for year-in-review.
-
-    Args:
-        config: Configuration object
-        repo_name: Repository name (owner/repo)
-        year: Year being analyzed
-        output_dir: Output directory
-
-    Returns:
-        RepositoryAnalysis object or None if analysis fails
-    """
-    from ..year_in_review.models import RepositoryAnalysis
-
-    return cli_yearinreview.analyze_single_repository_for_year_review(
-        config=config,
-        repo_name=repo_name,
-        year=year,
-        output_dir=output_dir,
-        run_feedback_analysis_func=run_feedback_analysis,
-        collect_detailed_feedback_func=cli_data_collection.collect_detailed_feedback,
-    )
+    display_api_metrics(output_dir_resolved)
+    display_llm_metrics(output_dir_resolved)
 
 
 def display_final_summary(
@@ -498,6 +574,88 @@ def display_final_summary(
                 console.print(f"  • {label}: [accent]{path}[/]")
 
 
+def display_api_metrics(output_dir_resolved: Path, limit: int = 8) -> Optional[Path]:
+    """Display GitHub API telemetry for the run and save it as JSON.
+
+    Args:
+        output_dir_resolved: Output directory for ``api_metrics.json``
+        limit: Number of endpoints to list, slowest in total first
+
+    Returns:
+        Path to the JSON export, or None when no API request was made
+    """
+    collector = get_global_api_collector()
+    aggregated = collector.get_aggregated()
+    if not aggregated.total_requests:
+        return None
+
+    console.print()
+    console.rule("GitHub API Usage")
+    console.print(
+        f"[info]Requests:[/] {aggregated.total_requests:,}  "
+        f"[info]Cache hits:[/] {aggregated.cache_hits:,} ({aggregated.cache_hit_rate:.0%})  "
+        f"[info]304 revalidated:[/] {aggregated.not_modified:,}  "
+        f"[info]Retries:[/] {aggregated.retries:,}  "
+        f"[info]Received:[/] {aggregated.bytes_received / 1024 / 1024:.1f} MiB"
+    )
+    for resource, usage in sorted(aggregated.rate_limits.items()):
+        console.print(
+            f"[info]Rate limit ({resource}):[/] {usage.consumed:,} used, "
+            f"{usage.remaining if usage.remaining is not None else '?'} of {usage.limit:,} remaining"
+        )
+    for stats in aggregated.busiest(limit):
+        console.print(
+            f"  • [accent]{stats.endpoint}[/] {stats.requests:,} req, "
+            f"cache {stats.cache_hit_rate:.0%}, retries {stats.retries}, "
+            f"p50 {stats.p50 * 1000:.0f}ms, p95 {stats.p95 * 1000:.0f}ms"
+        )
+
+    path = collector.save_json(output_dir_resolved / "api_metrics.json")
+    console.print(f"[info]API metrics written to[/] {path}")
+    return path
+
+
+def display_llm_metrics(output_dir_resolved: Path) -> Optional[Tuple[Path, Path]]:
+    """Display LLM usage for the run and export it as JSON and Prometheus text.
+
+    Args:
+        output_dir_resolved: Output directory for ``llm_metrics.json`` and
+            ``llm_metrics.prom`` (readable by node_exporter's textfile collector)
+
+    Returns:
+        Paths to the JSON and Prometheus exports, or None when no LLM call was made
+    """
+    collector = get_global_collector()
+    aggregated = collector.get_aggregated()
+    if not aggregated.total_calls and not aggregated.skipped_calls:
+        return None
+
+    console.print()
+    console.rule("LLM Usage")
+    console.print(
+        f"[info]Calls:[/] {aggregated.total_calls:,}  "
+        f"[info]Cache hits:[/] {aggregated.cache_hits:,} ({aggregated.cache_hit_rate:.0%})  "
+        f"[info]Retries:[/] {aggregated.total_retries:,} ({aggregated.total_retry_seconds:.1f}s)  "
+        f"[info]Tokens:[/] {aggregated.total_tokens:,}"
+    )
+    if aggregated.cache_hits:
+        console.print(
+            f"[info]Cache savings:[/] ~{aggregated.cache_saved_seconds:.1f}s, "
+            f"~{aggregated.cache_saved_tokens:,} tokens, ~${aggregated.cache_saved_cost:.4f}"
+        )
+    for name, stats in sorted(aggregated.prompt_types.items(), key=lambda item: item[1].calls, reverse=True):
+        console.print(
+            f"  • [accent]{name}[/] {stats.calls:,} calls, "
+            f"p50 {stats.duration.quantile(0.5):.1f}s, p95 {stats.duration.quantile(0.95):.1f}s, "
+            f"prompt p95 {stats.prompt_tokens.quantile(0.95):,.0f} tokens"
+        )
+
+    json_path = collector.save_json(output_dir_resolved / "llm_metrics.json")
+    prometheus_path = collector.save_prometheus(output_dir_resolved / "llm_metrics.prom")
+    console.print(f"[info]LLM metrics written to[/] {json_path} and {prometheus_path}")
+    return json_path, prometheus_path
+
+
 def feedback(
     repo: Optional[str] = typer.Option(
         None,
@@ -528,6 +686,21 @@ def feedback(
         "--year",
         help="Specific year for year-in-review (default: current year)",
     ),
+    profile: Optional[Path] = typer.Option(
+        None,
+        "--profile",
+        help="Write cProfile stats of the run to this file and print the top functions",
+    ),
+    trace: Optional[Path] = typer.Option(
+        None,
+        "--trace",
+        help="Write a Chrome trace (chrome://tracing, Perfetto) of phases, collectors, HTTP and LLM calls",
+    ),
+    memory_profile: Optional[Path] = typer.Option(
+        None,
+        "--memory-profile",
+        help="Write per-phase tracemalloc snapshots to this JSON file and print the top allocating call sites",
+    ),
 ) -> None:
     """Analyze repository activity and generate detailed reports with PR feedback.
 
@@ -544,7 +717,45 @@ def feedback(
         gfa feedback --interactive
         gfa feedback --year-in-review
         gfa feedback --year-in-review --year 2024
+        gfa feedback --repo myorg/myrepo --trace trace.json --profile run.prof
+        gfa feedback --year-in-review --memory-profile memory.json
     """
+    try:
+        with instrument(trace_path=trace, profile_path=profile, memory_path=memory_profile):
+            _run_feedback(repo, output_dir, interactive, year_in_review, year)
+    finally:
+        _report_instrumentation(trace, profile, memory_profile)
+
+
+def _report_instrumentation(
+    trace: Optional[Path],
+    profile: Optional[Path],
+    memory_profile: Optional[Path] = None,
+) -> None:
+    """Point the user at the files written by ``--trace``/``--profile``/``--memory-profile``."""
+    if profile and profile.exists():
+        import pstats
+
+        console.print()
+        console.rule("Profile: Top Functions by Cumulative Time")
+        console.print(format_top_functions(pstats.Stats(str(profile)), limit=25))
+        console.print(f"[info]Profile written to[/] {profile} (open with snakeviz or pstats)")
+    if memory_profile and memory_profile.exists():
+        console.print()
+        console.rule("Memory Profile: Top Allocating Call Sites per Phase")
+        console.print(MemoryReport.load(memory_profile).format_summary())
+        console.print(f"[info]Memory profile written to[/] {memory_profile}")
+    if trace and trace.exists():
+        console.print(f"[info]Trace written to[/] {trace} (open in chrome://tracing or ui.perfetto.dev)")
+
+
+def _run_feedback(
+    repo: Optional[str],
+    output_dir: Path,
+    interactive: bool,
+    year_in_review: bool,
+    year: Optional[int],
+) -> None:
     from datetime import datetime, timedelta, timezone
 
     # Initialize configuration and components
@@ -599,6 +810,10 @@ def feedback(
         model=config.llm.model,
         timeout=config.llm.timeout,
         web_url=config.server.web_url,
+        endpoints=config.llm.endpoints,
+        hedge_percentile=config.llm.hedge_percentile,
+        stream=config.llm.stream,
+        prompt_token_budget=config.llm.prompt_token_budget,
     )
     reporter = Reporter(output_dir=output_dir_resolved, llm_client=llm_client, web_url=config.server.web_url)
 
@@ -611,16 +826,18 @@ def feedback(
     console.rule("Phase 2: Detailed Feedback Analysis")
     from github_feedback.core.constants import DAYS_PER_MONTH_APPROX
     since = datetime.now(timezone.utc) - timedelta(days=DAYS_PER_MONTH_APPROX * max(months, 1))
-    detailed_feedback_snapshot = cli_data_collection.collect_detailed_feedback(
-        collector, analyzer, config, repo_input, since, filters, author
-    )
+    with phase("Phase 2: Detailed Feedback Analysis"):
+        detailed_feedback_snapshot = cli_data_collection.collect_detailed_feedback(
+            collector, analyzer, config, repo_input, since, filters, author
+        )
 
     # Collect year-end data
     console.print()
     console.rule("Phase 2.5: Year-End Review Data")
-    monthly_trends_data, tech_stack_data, collaboration_data = cli_data_collection.collect_yearend_data(
-        collector, repo_input, since, filters, author
-    )
+    with phase("Phase 2.5: Year-End Review Data"):
+        monthly_trends_data, tech_stack_data, collaboration_data = cli_data_collection.collect_yearend_data(
+            collector, repo_input, since, filters, author
+        )
 
     # Compute metrics and display
     metrics = cli_metrics.compute_and_display_metrics(
@@ -641,3 +858,5 @@ def feedback(
 
     # Display summary
     display_final_summary(author, repo_input, pr_results, integrated_report_path, artifacts)
+    display_api_metrics(output_dir_resolved)
+    display_llm_metrics(output_dir_resolved)
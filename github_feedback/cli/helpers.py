@@ -31,6 +31,7 @@ from ..core.exceptions import (
     LLMAnalysisError,
     LLMTimeoutError,
 )
+from ..core.tracing import traced_task
 
 console = Console()
 logger = logging.getLogger(__name__)
@@ -187,7 +188,7 @@ def run_parallel_tasks(
 
             with ThreadPoolExecutor(max_workers=max_workers) as executor:
                 futures = {
-                    executor.submit(func, *args): (key, label)
+                    executor.submit(traced_task(func, label), *args): (key, label)
                     for key, (func, args, label) in tasks.items()
                 }
 
@@ -212,7 +213,7 @@ def run_parallel_tasks(
         # Fallback to simple progress without Rich
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
             futures = {
-                executor.submit(func, *args): (key, label)
+                executor.submit(traced_task(func, label), *args): (key, label)
                 for key, (func, args, label) in tasks.items()
             }
 
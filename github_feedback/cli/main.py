@@ -4,12 +4,15 @@ from __future__ import annotations
 
 import os
 from pathlib import Path
+from typing import List, Optional
 
 import typer
 
 from ..core.console import Console
 
 # Import CLI command modules
+from . import bench as cli_bench
+from . import cache as cli_cache
 from . import config as cli_config
 from . import feedback as cli_feedback
 from . import repos as cli_repos
@@ -18,6 +21,8 @@ from . import repos as cli_repos
 app = typer.Typer(help="Analyze GitHub repositories and generate feedback reports.")
 config_app = typer.Typer(help="Manage configuration settings")
 app.add_typer(config_app, name="config")
+cache_app = typer.Typer(help="Inspect and maintain the API response cache")
+app.add_typer(cache_app, name="cache")
 
 console = Console()
 
@@ -94,9 +99,24 @@ def feedback(
         "--year",
         help="Specific year for year-in-review (default: current year)",
     ),
+    profile: Optional[Path] = typer.Option(
+        None,
+        "--profile",
+        help="Write cProfile stats of the run to this file and print the top functions",
+    ),
+    trace: Optional[Path] = typer.Option(
+        None,
+        "--trace",
+        help="Write a Chrome trace (chrome://tracing, Perfetto) of phases, collectors, HTTP and LLM calls",
+    ),
+    memory_profile: Optional[Path] = typer.Option(
+        None,
+        "--memory-profile",
+        help="Write per-phase tracemalloc snapshots to this JSON file and print the top allocating call sites",
+    ),
 ) -> None:
     """Analyze repository activity and generate detailed reports with PR feedback."""
-    cli_feedback.feedback(repo, output_dir, interactive, year_in_review, year)
+    cli_feedback.feedback(repo, output_dir, interactive, year_in_review, year, profile, trace, memory_profile)
 
 
 @app.command(name="list-repos")
@@ -155,6 +175,65 @@ def clear_cache() -> None:
     cli_repos.clear_cache()
 
 
+@app.command()
+def bench(
+    scenario: Optional[List[str]] = typer.Option(
+        None,
+        "--scenario",
+        "-s",
+        help="Scenario to run (repeatable; default: all)",
+    ),
+    baseline: Path = typer.Option(
+        cli_bench.DEFAULT_BASELINE_PATH,
+        "--baseline",
+        "-b",
+        help="JSON baseline to compare against",
+    ),
+    update_baseline: bool = typer.Option(
+        False,
+        "--update-baseline",
+        help="Record this run as the new baseline instead of comparing",
+    ),
+    output: Optional[Path] = typer.Option(
+        None,
+        "--output",
+        "-o",
+        help="Also write this run's results to a JSON file",
+    ),
+    scale: float = typer.Option(
+        1.0,
+        "--scale",
+        help="Multiplier for fixture sizes (e.g. 0.1 for a quick run)",
+    ),
+    repeat: int = typer.Option(
+        1,
+        "--repeat",
+        "-n",
+        min=1,
+        help="Runs per scenario; the median wall time is reported",
+    ),
+    threshold: Optional[float] = typer.Option(
+        None,
+        "--threshold",
+        help="Allowed relative wall-time slowdown (default: 0.25)",
+    ),
+    isolate: bool = typer.Option(
+        True,
+        "--isolate/--no-isolate",
+        help="Run each scenario in a fresh process so peak RSS is per scenario",
+    ),
+    list_scenarios: bool = typer.Option(
+        False,
+        "--list",
+        help="List available scenarios and exit",
+    ),
+) -> None:
+    """Benchmark collection, review loading, reporting and heuristics against local fixtures."""
+    cli_bench.bench(
+        scenario, baseline, update_baseline, output, scale, repeat, threshold, isolate, list_scenarios
+    )
+
+
 # ============================================================================
 # Config Commands
 # ============================================================================
@@ -197,6 +276,36 @@ def config_hosts(
     cli_config.config_hosts(action, host)
 
 
+# ============================================================================
+# Cache Commands
+# ============================================================================
+
+@cache_app.command("stats")
+def cache_stats(
+    limit: int = typer.Option(
+        15,
+        "--limit",
+        "-l",
+        min=1,
+        help="Number of endpoints to show, largest first",
+    ),
+) -> None:
+    """Show cache size, entries, hit ratio by endpoint and entry ages."""
+    cli_cache.cache_stats(limit)
+
+
+@cache_app.command("prune-expired")
+def cache_prune_expired() -> None:
+    """Delete expired responses and evict down to api.cache_max_size_mb."""
+    cli_cache.cache_prune_expired()
+
+
+@cache_app.command("vacuum")
+def cache_vacuum() -> None:
+    """Compact the cache database file."""
+    cli_cache.cache_vacuum()
+
+
 # ============================================================================
 # Deprecated Commands (for backward compatibility)
 # ============================================================================
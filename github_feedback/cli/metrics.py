@@ -28,6 +28,7 @@ except ModuleNotFoundError:  # pragma: no cover - fallback when rich is missing
 from ..analyzer import Analyzer
 from ..core.console import Console
 from ..core.models import AnalysisStatus, DetailedFeedbackSnapshot, MetricSnapshot
+from ..core.tracing import phase
 
 console = Console()
 
@@ -215,6 +216,7 @@ def prepare_metrics_payload(metrics: MetricSnapshot) -> dict:
     return metrics_payload
 
 
+@phase("Phase 3: Metrics Computation")
 def compute_and_display_metrics(
     analyzer: Analyzer,
     collection,
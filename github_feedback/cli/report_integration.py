@@ -6,63 +6,74 @@ import json
 import re
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Union
 
 from ..core.console import Console
+from ..reporters.document import Node, ReportDocument, Section
 
 console = Console()
 
+# Sections of the brief report reused by the integrated report
+BRIEF_SECTION_HEADINGS = {
+    "awards": "## 🏆 Awards Cabinet",
+    "highlights": "## ✨ Growth Highlights",
+    "monthly_trends": "## 📈 Monthly Trends",
+    "feedback": "## 💡 Detailed Feedback",
+    "retrospective": "## 🔍 Deep Retrospective Analysis",
+    "tech_stack": "## 💻 Tech Stack Analysis",
+    "collaboration": "## 🤝 PR 활동 요약",
+    "witch": "## 🔮 마녀의 독설",
+}
 
-def extract_section_content(content: str, section_header: str, next_section_prefix: str = "##") -> str:
+# Sections of the PR feedback report reused by the integrated report
+FEEDBACK_SECTION_HEADINGS = {
+    "personal_dev": "## 👤 개인 성장 분석",
+    "strengths": "## ✨ 장점",
+    "improvements": "## 💡 보완점",
+    "growth": "## 🌱 올해 성장한 점",
+}
+
+ReportSource = Union[str, ReportDocument]
+
+
+def as_document(content: ReportSource) -> ReportDocument:
+    """Parse markdown into a document tree unless it already is one."""
+    return content if isinstance(content, ReportDocument) else ReportDocument.parse(content)
+
+
+def extract_section_content(content: ReportSource, section_header: str) -> str:
     """Extract content of a specific section from markdown.
 
     Args:
-        content: Full markdown content
+        content: Full markdown content or its document tree
         section_header: Header to look for (e.g., "## 🏆 Awards Cabinet")
-        next_section_prefix: Prefix for next section (default "##")
 
     Returns:
         Extracted section content or empty string if not found
     """
-    # Escape special regex characters in header
-    escaped_header = re.escape(section_header)
-
-    # Find section start
-    pattern = rf'^{escaped_header}\s*$'
-    match = re.search(pattern, content, re.MULTILINE)
-    if not match:
-        return ""
-
-    start_pos = match.end()
-
-    # Find next section of same or higher level
-    next_section_pattern = rf'^{re.escape(next_section_prefix)} '
-    next_match = re.search(next_section_pattern, content[start_pos:], re.MULTILINE)
+    return as_document(content).content(section_header)
 
-    if next_match:
-        end_pos = start_pos + next_match.start()
-        return content[start_pos:end_pos].strip()
 
-    return content[start_pos:].strip()
-
-
-def create_executive_summary(brief_content: str, feedback_content: str, output_dir: Path) -> str:
+def create_executive_summary(
+    brief_content: ReportSource, feedback_content: ReportSource, output_dir: Path
+) -> Section:
     """Create executive summary from brief and feedback reports.
 
     Args:
-        brief_content: Brief report content
-        feedback_content: Feedback report content
+        brief_content: Brief report content or document tree
+        feedback_content: Feedback report content or document tree
         output_dir: Output directory to find personal_development.json
 
     Returns:
-        Executive summary markdown section
+        Executive summary section
     """
-    lines = ["## 🎯 한눈에 보기 (Executive Summary)", ""]
+    brief = as_document(brief_content)
+    lines: List[Node] = [""]
     lines.append("> 핵심 성과와 개선 포인트를 빠르게 파악하세요")
     lines.append("")
 
     # Extract key achievements from brief (awards section)
-    awards_section = extract_section_content(brief_content, "## 🏆 Awards Cabinet")
+    awards_section = brief.content(BRIEF_SECTION_HEADINGS["awards"])
     if awards_section:
         # Count total awards
         award_matches = re.findall(r'\|\s*[^|]+\s*\|\s*([^|]+)\s*\|', awards_section)
@@ -71,7 +82,7 @@ def create_executive_summary(brief_content: str, feedback_content: str, output_d
             lines.append(f"**🏆 획득 어워드**: {total_awards}개")
 
     # Extract highlights from brief
-    highlights_section = extract_section_content(brief_content, "## ✨ Growth Highlights")
+    highlights_section = brief.content(BRIEF_SECTION_HEADINGS["highlights"])
     if highlights_section:
         highlight_matches = re.findall(r'\|\s*\d+\s*\|\s*([^|]+)\s*\|', highlights_section)
         if highlight_matches and len(highlight_matches) > 0:
@@ -119,12 +130,12 @@ def create_executive_summary(brief_content: str, feedback_content: str, output_d
     lines.append("")
     lines.append("---")
     lines.append("")
-    return "\n".join(lines)
+    return Section(title="🎯 한눈에 보기 (Executive Summary)", level=2, blocks=lines)
 
 
-def create_improved_toc() -> str:
+def create_improved_toc() -> Section:
     """Create improved table of contents with better structure."""
-    lines = ["## 📑 목차", ""]
+    lines: List[Node] = [""]
 
     sections = [
         ("1", "🎯 한눈에 보기", "핵심 성과와 개선점 요약"),
@@ -140,7 +151,7 @@ def create_improved_toc() -> str:
     lines.append("")
     lines.append("---")
     lines.append("")
-    return "\n".join(lines)
+    return Section(title="📑 목차", level=2, blocks=lines)
 
 
 def read_feedback_report(feedback_report_path: Path) -> str:
@@ -169,159 +180,183 @@ def read_feedback_report(feedback_report_path: Path) -> str:
         raise RuntimeError(f"Failed to read feedback report: {exc}") from exc
 
 
-def extract_sections_from_brief(brief_content: str) -> dict[str, str]:
-    """Extract all key sections from brief report.
+def extract_sections_from_brief(brief_content: ReportSource) -> dict[str, Optional[Section]]:
+    """Look up all key sections of the brief report.
 
     Args:
-        brief_content: Brief report markdown content
+        brief_content: Brief report markdown content or document tree
 
     Returns:
-        Dictionary mapping section names to content
+        Dictionary mapping section names to sections (None when missing)
     """
-    return {
-        "awards": extract_section_content(brief_content, "## 🏆 Awards Cabinet"),
-        "highlights": extract_section_content(brief_content, "## ✨ Growth Highlights"),
-        "monthly_trends": extract_section_content(brief_content, "## 📈 Monthly Trends"),
-        "feedback": extract_section_content(brief_content, "## 💡 Detailed Feedback"),
-        "retrospective": extract_section_content(brief_content, "## 🔍 Deep Retrospective Analysis"),
-        "tech_stack": extract_section_content(brief_content, "## 💻 Tech Stack Analysis"),
-        "collaboration": extract_section_content(brief_content, "## 🤝 PR 활동 요약"),
-        "witch": extract_section_content(brief_content, "## 🔮 마녀의 독설"),
-    }
+    brief = as_document(brief_content)
+    return {name: brief.find(heading) for name, heading in BRIEF_SECTION_HEADINGS.items()}
 
 
-def extract_sections_from_feedback(feedback_content: str) -> dict[str, str]:
-    """Extract all key sections from feedback report.
+def extract_sections_from_feedback(feedback_content: ReportSource) -> dict[str, Optional[Section]]:
+    """Look up all key sections of the feedback report.
 
     Args:
-        feedback_content: Feedback report markdown content
+        feedback_content: Feedback report markdown content or document tree
 
     Returns:
-        Dictionary mapping section names to content
+        Dictionary mapping section names to sections (None when missing)
     """
-    return {
-        "personal_dev": extract_section_content(feedback_content, "## 👤 개인 성장 분석"),
-        "strengths": extract_section_content(feedback_content, "## ✨ 장점"),
-        "improvements": extract_section_content(feedback_content, "## 💡 보완점"),
-        "growth": extract_section_content(feedback_content, "## 🌱 올해 성장한 점"),
-    }
+    feedback = as_document(feedback_content)
+    return {name: feedback.find(heading) for name, heading in FEEDBACK_SECTION_HEADINGS.items()}
+
+
+def _graft(section: Optional[Section], level: int, placeholder: str) -> List[Node]:
+    """Body of ``section`` re-levelled to sit under a heading of ``level``."""
+    if section is None or not section.content():
+        return [placeholder] if placeholder else []
+    blocks = section.nested_under(level)
+    # Trim blank lines around the body like str.strip() would
+    while blocks and isinstance(blocks[0], str) and not blocks[0].strip():
+        blocks.pop(0)
+    while blocks and isinstance(blocks[-1], str) and not blocks[-1].strip():
+        blocks.pop()
+    return blocks
+
+
+def _details(label: str, section: Optional[Section], placeholder: str) -> List[Node]:
+    return [
+        "<details>",
+        f"<summary><b>{label}</b> (클릭하여 펼치기)</summary>",
+        "",
+        *_graft(section, 2, placeholder),
+        "",
+        "</details>",
+        "",
+    ]
 
 
-def build_integrated_report_content(
+def build_integrated_document(
     repo_name: str,
-    exec_summary: str,
-    toc: str,
-    brief_sections: dict[str, str],
-    feedback_sections: dict[str, str],
-) -> str:
-    """Build integrated report content from extracted sections.
+    exec_summary: Section,
+    toc: Section,
+    brief_sections: dict[str, Optional[Section]],
+    feedback_sections: dict[str, Optional[Section]],
+    generated_at: Optional[datetime] = None,
+) -> ReportDocument:
+    """Merge the brief and feedback sections into the integrated report tree.
 
     Args:
         repo_name: Repository name
-        exec_summary: Executive summary content
-        toc: Table of contents content
-        brief_sections: Sections extracted from brief report
-        feedback_sections: Sections extracted from feedback report
+        exec_summary: Executive summary section
+        toc: Table of contents section
+        brief_sections: Sections looked up in the brief report
+        feedback_sections: Sections looked up in the feedback report
+        generated_at: Generation timestamp shown in the footer (defaults to now)
 
     Returns:
-        Complete integrated report markdown content
+        Integrated report document
     """
-    return f"""# 📊 {repo_name} 통합 분석 보고서
-
-> 레포지토리 전체 분석과 PR 리뷰를 통합한 종합 보고서입니다.
-
-{exec_summary}
-
-{toc}
-
-## 2. 🏆 주요 성과
-
-> 이번 기간 동안 달성한 어워드와 성장 하이라이트
-
-### 🏅 획득 어워드
-
-{brief_sections.get('awards') or "_어워드 정보가 없습니다._"}
-
-### ✨ 성장 하이라이트
-
-{brief_sections.get('highlights') or "_하이라이트 정보가 없습니다._"}
-
----
-
-## 3. 💡 개선 피드백
-
-> 구체적인 장점, 보완점, 실행 가능한 제안
-
-{feedback_sections.get('personal_dev') or "_개인 성장 분석 정보가 없습니다._"}
-
-### 🔮 마녀의 독설
-
-{brief_sections.get('witch') or "_마녀의 독설 인사이트가 없습니다._"}
-
-### 코드 품질 피드백
-
-{brief_sections.get('feedback') or "_상세 피드백 정보가 없습니다._"}
-
----
-
-## 4. 📊 상세 분석
-
-> 데이터 기반의 심층 분석 (필요한 섹션을 클릭하여 펼쳐보세요)
-
-<details>
-<summary><b>📈 월별 활동 트렌드</b> (클릭하여 펼치기)</summary>
-
-{brief_sections.get('monthly_trends') or "_월별 트렌드 정보가 없습니다._"}
-
-</details>
-
-<details>
-<summary><b>💻 기술 스택 분석</b> (클릭하여 펼치기)</summary>
-
-{brief_sections.get('tech_stack') or "_기술 스택 정보가 없습니다._"}
-
-</details>
-
-<details>
-<summary><b>🤝 협업 분석</b> (클릭하여 펼치기)</summary>
-
-{brief_sections.get('collaboration') or "_협업 정보가 없습니다._"}
-
-</details>
-
-<details>
-<summary><b>🔍 심층 회고</b> (클릭하여 펼치기)</summary>
-
-{brief_sections.get('retrospective') or "_회고 분석 정보가 없습니다._"}
-
-</details>
-
----
-
-## 5. 📝 부록
-
-> 개별 PR 리뷰 및 상세 사례 (필요시 펼쳐보세요)
-
-<details>
-<summary><b>📝 상세 사례</b> (클릭하여 펼치기)</summary>
-
-{feedback_sections.get('growth') or ""}
-
-{feedback_sections.get('strengths') or ""}
-
-{feedback_sections.get('improvements') or ""}
-
-</details>
+    generated_at = generated_at or datetime.now()
+
+    achievements = Section(
+        title="2. 🏆 주요 성과",
+        level=2,
+        blocks=[
+            "",
+            "> 이번 기간 동안 달성한 어워드와 성장 하이라이트",
+            "",
+            Section("🏅 획득 어워드", 3, [
+                "", *_graft(brief_sections.get("awards"), 3, "_어워드 정보가 없습니다._"), "",
+            ]),
+            Section("✨ 성장 하이라이트", 3, [
+                "", *_graft(brief_sections.get("highlights"), 3, "_하이라이트 정보가 없습니다._"), "",
+                "---",
+                "",
+            ]),
+        ],
+    )
 
----
+    improvements = Section(
+        title="3. 💡 개선 피드백",
+        level=2,
+        blocks=[
+            "",
+            "> 구체적인 장점, 보완점, 실행 가능한 제안",
+            "",
+            *_graft(feedback_sections.get("personal_dev"), 2, "_개인 성장 분석 정보가 없습니다._"),
+            "",
+            Section("🔮 마녀의 독설", 3, [
+                "", *_graft(brief_sections.get("witch"), 3, "_마녀의 독설 인사이트가 없습니다._"), "",
+            ]),
+            Section("코드 품질 피드백", 3, [
+                "", *_graft(brief_sections.get("feedback"), 3, "_상세 피드백 정보가 없습니다._"), "",
+                "---",
+                "",
+            ]),
+        ],
+    )
 
-<div align="center">
+    analysis = Section(
+        title="4. 📊 상세 분석",
+        level=2,
+        blocks=[
+            "",
+            "> 데이터 기반의 심층 분석 (필요한 섹션을 클릭하여 펼쳐보세요)",
+            "",
+            *_details("📈 월별 활동 트렌드", brief_sections.get("monthly_trends"), "_월별 트렌드 정보가 없습니다._"),
+            *_details("💻 기술 스택 분석", brief_sections.get("tech_stack"), "_기술 스택 정보가 없습니다._"),
+            *_details("🤝 협업 분석", brief_sections.get("collaboration"), "_협업 정보가 없습니다._"),
+            *_details("🔍 심층 회고", brief_sections.get("retrospective"), "_회고 분석 정보가 없습니다._"),
+            "---",
+            "",
+        ],
+    )
 
-*Generated by GitHub Feedback Analysis Tool*
-*Report generated on: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}*
+    appendix_body: List[Node] = []
+    for name in ("growth", "strengths", "improvements"):
+        body = _graft(feedback_sections.get(name), 2, "")
+        if body:
+            appendix_body.extend([*body, ""])
+    appendix = Section(
+        title="5. 📝 부록",
+        level=2,
+        blocks=[
+            "",
+            "> 개별 PR 리뷰 및 상세 사례 (필요시 펼쳐보세요)",
+            "",
+            "<details>",
+            "<summary><b>📝 상세 사례</b> (클릭하여 펼치기)</summary>",
+            "",
+            *appendix_body,
+            "</details>",
+            "",
+            "---",
+            "",
+            '<div align="center">',
+            "",
+            "*Generated by GitHub Feedback Analysis Tool*",
+            f"*Report generated on: {generated_at.strftime('%Y-%m-%d %H:%M:%S')}*",
+            "",
+            "</div>",
+            "",
+        ],
+    )
 
-</div>
-"""
+    document = ReportDocument()
+    document.append(
+        Section(
+            title=f"📊 {repo_name} 통합 분석 보고서",
+            level=1,
+            blocks=[
+                "",
+                "> 레포지토리 전체 분석과 PR 리뷰를 통합한 종합 보고서입니다.",
+                "",
+                exec_summary,
+                toc,
+                achievements,
+                improvements,
+                analysis,
+                appendix,
+            ],
+        )
+    )
+    return document
 
 
 def write_integrated_report(output_dir: Path, content: str) -> Path:
@@ -381,7 +416,7 @@ def write_integrated_report(output_dir: Path, content: str) -> Path:
 def generate_integrated_full_report(
     output_dir: Path,
     repo_name: str,
-    brief_content: str,
+    brief_content: ReportSource,
     feedback_report_path: Path,
 ) -> Path:
     """Generate an improved integrated report with better UX.
@@ -389,7 +424,7 @@ def generate_integrated_full_report(
     Args:
         output_dir: Output directory for the integrated report
         repo_name: Repository name in owner/repo format
-        brief_content: Brief report markdown content (from memory)
+        brief_content: Brief report markdown content or document tree (from memory)
         feedback_report_path: Path to the feedback integrated report markdown file
 
     Returns:
@@ -398,19 +433,20 @@ def generate_integrated_full_report(
     Raises:
         RuntimeError: If file operations fail
     """
-    # Read feedback report
-    feedback_content = read_feedback_report(feedback_report_path)
+    # Parse each report once; sections are then looked up by heading
+    brief = as_document(brief_content)
+    feedback = ReportDocument.parse(read_feedback_report(feedback_report_path))
 
     # Extract sections
-    brief_sections = extract_sections_from_brief(brief_content)
-    feedback_sections = extract_sections_from_feedback(feedback_content)
+    brief_sections = extract_sections_from_brief(brief)
+    feedback_sections = extract_sections_from_feedback(feedback)
 
     # Create components
-    exec_summary = create_executive_summary(brief_content, feedback_content, output_dir)
+    exec_summary = create_executive_summary(brief, feedback, output_dir)
     toc = create_improved_toc()
 
-    # Build integrated content
-    integrated_content = build_integrated_report_content(
+    # Merge into the integrated document
+    integrated = build_integrated_document(
         repo_name=repo_name,
         exec_summary=exec_summary,
         toc=toc,
@@ -419,4 +455,4 @@ def generate_integrated_full_report(
     )
 
     # Write to file
-    return write_integrated_report(output_dir, integrated_content)
+    return write_integrated_report(output_dir, integrated.to_markdown())
@@ -152,7 +152,7 @@ def clear_cache() -> None:
     Examples:
         gfa clear-cache
     """
-    from .api_client import GitHubApiClient
+    from ..api.client import GitHubApiClient
 
     console.print("[info]Clearing API cache...[/]")
     GitHubApiClient.clear_cache()
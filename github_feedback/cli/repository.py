@@ -24,6 +24,7 @@ from ..core.constants import (
     SPINNERS,
     TABLE_CONFIG,
 )
+from ..core.tracing import phase
 from ..core.utils import validate_repo_format
 
 console = Console()
@@ -258,6 +259,7 @@ def select_enterprise_host_interactive(custom_hosts: list[str]) -> Optional[Tupl
             return None
 
 
+@phase("Phase 0: Authentication")
 def get_authenticated_user(collector: Collector) -> str:
     """Authenticate and get the current GitHub user.
 
@@ -11,7 +11,10 @@ from ..analyzer import Analyzer
 from ..collectors.collector import Collector
 from ..core.config import Config
 from ..core.console import Console
+from ..core.constants import PARALLEL_CONFIG, YEAR_IN_REVIEW_TASK_COSTS
 from ..core.models import AnalysisFilters
+from ..core.snapshot import SNAPSHOT_SUFFIX, read_metrics, update_snapshot, write_snapshot
+from ..core.task_graph import DependencyFailedError, GraphTask, TaskGraph
 from ..year_in_review.models import RepositoryAnalysis
 
 console = Console()
@@ -23,44 +26,42 @@ def _get_year_in_review_metrics_dir(output_dir: Path) -> Path:
 
 
 def _get_year_in_review_metrics_path(output_dir: Path, repo_name: str) -> Path:
-    """Return the canonical metrics path for the given repository."""
+    """Return the canonical metrics snapshot path for the given repository."""
     safe_repo = repo_name.replace("/", "__")
-    return _get_year_in_review_metrics_dir(output_dir) / f"{safe_repo}.json"
+    return _get_year_in_review_metrics_dir(output_dir) / f"{safe_repo}{SNAPSHOT_SUFFIX}"
 
 
-def _get_legacy_year_in_review_metrics_path(output_dir: Path, repo_name: str) -> Path:
-    """Return the legacy metrics path that stored metrics inside repo-named folders."""
+def _get_legacy_year_in_review_metrics_paths(output_dir: Path, repo_name: str) -> list[Path]:
+    """Return older metrics locations: JSON next to the snapshot and repo-named folders."""
     safe_repo = repo_name.replace("/", "__")
-    return output_dir / safe_repo / "metrics.json"
+    return [
+        _get_year_in_review_metrics_dir(output_dir) / f"{safe_repo}.json",
+        output_dir / safe_repo / "metrics.json",
+    ]
 
 
-def _load_year_in_review_metrics_data(
-    primary_path: Path, legacy_path: Path
-) -> tuple[dict, bool]:
-    """Load metrics data from the new or legacy path.
+def _find_year_in_review_metrics(output_dir: Path, repo_name: str) -> tuple[Optional[Path], bool]:
+    """Locate the stored metrics for a repository.
 
     Returns:
-        Tuple containing the loaded metrics (or empty dict) and a flag indicating whether
-        the data originated from the legacy path.
+        Tuple of the existing path (or None) and whether it is a legacy JSON file.
     """
-    for path, is_legacy in ((primary_path, False), (legacy_path, True)):
-        if path.exists():
-            try:
-                with path.open("r", encoding="utf-8") as handle:
-                    return json.load(handle), is_legacy
-            except Exception:
-                return {}, is_legacy
-
-    return {}, False
+    primary_path = _get_year_in_review_metrics_path(output_dir, repo_name)
+    if primary_path.exists():
+        return primary_path, False
+    for legacy_path in _get_legacy_year_in_review_metrics_paths(output_dir, repo_name):
+        if legacy_path.exists():
+            return legacy_path, True
+    return None, False
 
 
 def _cleanup_legacy_metrics_path(legacy_path: Path) -> None:
-    """Remove the legacy metrics file/directory if it exists and is now unused."""
+    """Remove the legacy metrics file (and its repo-named folder) if now unused."""
     try:
         if legacy_path.exists():
             legacy_path.unlink()
         parent = legacy_path.parent
-        if parent.exists():
+        if parent.exists() and parent.name != "metrics":
             parent.rmdir()
     except OSError:
         # If the directory isn't empty or can't be removed, ignore silently.
@@ -95,14 +96,16 @@ def _load_personal_development_data(
     return strengths, improvements, growth_indicators
 
 
-def _load_communication_skills_data(
-    output_dir: Path, repo_name: str
-) -> tuple[Optional[float], Optional[float], Optional[float], Optional[float], dict, dict, dict, dict]:
-    """Load communication skills data from metrics.json.
+CommunicationSkills = tuple[
+    Optional[float], Optional[float], Optional[float], Optional[float], dict, dict, dict, dict
+]
+
+
+def _communication_skills_from_feedback(detailed_feedback: dict) -> CommunicationSkills:
+    """Derive communication skill scores from a detailed feedback dictionary.
 
     Args:
-        output_dir: Output directory
-        repo_name: Repository name
+        detailed_feedback: ``DetailedFeedbackSnapshot.to_dict()`` output
 
     Returns:
         Tuple of (commit_message_quality, pr_title_quality, review_tone_quality,
@@ -117,14 +120,8 @@ def _load_communication_skills_data(
     review_tone_stats = {}
     issue_stats = {}
 
-    metrics_path = _get_year_in_review_metrics_path(output_dir, repo_name)
-    legacy_metrics_path = _get_legacy_year_in_review_metrics_path(output_dir, repo_name)
-    metrics_data, _ = _load_year_in_review_metrics_data(metrics_path, legacy_metrics_path)
-
-    if metrics_data:
+    if detailed_feedback:
         try:
-            detailed_feedback = metrics_data.get("detailed_feedback", {})
-
             # Commit message quality
             if "commit_feedback" in detailed_feedback:
                 cf = detailed_feedback["commit_feedback"]
@@ -186,9 +183,8 @@ def _load_communication_skills_data(
                         "unclear": unclear_issues
                     }
 
-            console.print(f"[success]✅ Loaded communication skills data from metrics.json[/]")
         except Exception as e:
-            console.print(f"[warning]⚠️  Could not load metrics.json: {e}[/]")
+            console.print(f"[warning]⚠️  Could not read communication skills data: {e}[/]")
 
     return (
         commit_message_quality,
@@ -268,6 +264,7 @@ def _collect_commit_counts(
     repo_name: str,
     author: str,
     year: int,
+    year_commits: Optional[int] = None,
 ) -> tuple[int, int]:
     """Collect total and yearly commit counts.
 
@@ -276,6 +273,8 @@ def _collect_commit_counts(
         repo_name: Repository name
         author: GitHub username
         year: Year being analyzed
+        year_commits: Commits in the year already counted during repository
+            discovery; fetched here only when unknown
 
     Returns:
         Tuple of (total_commits, year_commits_count)
@@ -288,6 +287,9 @@ def _collect_commit_counts(
     )
     total_commits = len(all_commits)
 
+    if year_commits is not None:
+        return total_commits, year_commits
+
     # Get commits in the year
     since = datetime(year, 1, 1)
     until = datetime(year, 12, 31, 23, 59, 59)
@@ -297,12 +299,12 @@ def _collect_commit_counts(
         "since": since.isoformat() + "Z",
         "until": until.isoformat() + "Z",
     }
-    year_commits = collector.api_client.request_all(
+    year_commits_list = collector.api_client.request_all(
         f"/repos/{owner}/{repo}/commits",
         params=year_commits_params,
     )
 
-    return total_commits, len(year_commits)
+    return total_commits, len(year_commits_list)
 
 
 def _save_detailed_feedback_to_metrics(
@@ -310,7 +312,7 @@ def _save_detailed_feedback_to_metrics(
     repo_name: str,
     detailed_feedback_snapshot,
 ) -> None:
-    """Save detailed feedback snapshot to metrics.json.
+    """Save detailed feedback snapshot to the repository's metrics snapshot.
 
     Args:
         output_dir: Output directory
@@ -320,90 +322,111 @@ def _save_detailed_feedback_to_metrics(
     if not detailed_feedback_snapshot:
         return
 
-    console.print(f"[dim]💾 Saving detailed feedback to metrics.json...[/]")
+    console.print(f"[dim]💾 Saving detailed feedback to metrics snapshot...[/]")
     metrics_path = _get_year_in_review_metrics_path(output_dir, repo_name)
-    legacy_metrics_path = _get_legacy_year_in_review_metrics_path(output_dir, repo_name)
-    from ..core.utils import FileSystemManager
-
-    metrics_dir = metrics_path.parent
-    FileSystemManager.ensure_directory(metrics_dir)
-
-    metrics_data, loaded_from_legacy = _load_year_in_review_metrics_data(
-        metrics_path, legacy_metrics_path
-    )
+    existing_path, is_legacy = _find_year_in_review_metrics(output_dir, repo_name)
 
-    # Add detailed_feedback to metrics
-    metrics_data["detailed_feedback"] = detailed_feedback_snapshot.to_dict()
+    updates = {"detailed_feedback": detailed_feedback_snapshot.to_dict()}
+    if is_legacy and existing_path is not None:
+        # Migrate the legacy JSON once; later saves only re-encode this section
+        try:
+            legacy_data = read_metrics(existing_path)
+        except (OSError, ValueError):
+            legacy_data = {}
+        write_snapshot(metrics_path, {**legacy_data, **updates})
+        _cleanup_legacy_metrics_path(existing_path)
+    else:
+        try:
+            update_snapshot(metrics_path, updates)
+        except (OSError, ValueError) as exc:  # SnapshotFormatError is a ValueError
+            console.print(f"[warning]Replacing unreadable metrics snapshot {metrics_path}: {exc}[/]")
+            write_snapshot(metrics_path, updates)
 
-    # Save updated metrics
-    with metrics_path.open("w", encoding="utf-8") as f:
-        json.dump(metrics_data, f, indent=2, ensure_ascii=False)
+    console.print(f"[success]✅ Saved detailed feedback to {metrics_path}[/]")
 
-    if loaded_from_legacy:
-        _cleanup_legacy_metrics_path(legacy_metrics_path)
 
-    console.print(f"[success]✅ Saved detailed feedback to {metrics_path}[/]")
+def _year_in_review_filters() -> AnalysisFilters:
+    """Return the filters used for every year-in-review collection."""
+    return AnalysisFilters(
+        include_branches=[],
+        exclude_branches=[],
+        include_paths=[],
+        exclude_paths=[],
+        include_languages=[],
+        exclude_bots=True,
+    )
 
 
-def analyze_single_repository_for_year_review(
+def add_repository_tasks(
+    graph: TaskGraph,
+    *,
     config: Config,
+    collector: Collector,
+    analyzer: Analyzer,
+    author: str,
     repo_name: str,
     year: int,
     output_dir: Path,
     run_feedback_analysis_func,
     collect_detailed_feedback_func,
-) -> Optional[RepositoryAnalysis]:
-    """Analyze a single repository for year-in-review.
+    year_commits: Optional[int] = None,
+) -> str:
+    """Add the year-in-review tasks of one repository to ``graph``.
+
+    The authored PR listing feeds the feedback analysis directly, detailed
+    feedback is handed to the final task in memory instead of being re-read
+    from disk, and the independent fetches run alongside the LLM-bound PR
+    reviews that dominate the critical path.
 
     Args:
+        graph: Graph shared by every repository of the run
         config: Configuration object
+        collector: Collector shared across repositories
+        analyzer: Analyzer shared across repositories
+        author: Authenticated username
         repo_name: Repository name (owner/repo)
         year: Year being analyzed
         output_dir: Output directory
         run_feedback_analysis_func: Function to run feedback analysis
         collect_detailed_feedback_func: Function to collect detailed feedback
+        year_commits: Commits in the year counted during repository discovery
 
     Returns:
-        RepositoryAnalysis object or None if analysis fails
+        Key of the task whose result is the RepositoryAnalysis
     """
-    try:
-        # Initialize components
-        collector = Collector(config)
-        author = collector.get_authenticated_user()
-        safe_repo = repo_name.replace("/", "__")
-        analyzer = Analyzer(web_base_url=config.server.web_url)
-
-        # Calculate year date range
-        since = datetime(year, 1, 1)
-        until = datetime(year, 12, 31, 23, 59, 59)
-
-        # Set up filters
-        filters = AnalysisFilters(
-            include_branches=[],
-            exclude_branches=[],
-            include_paths=[],
-            exclude_paths=[],
-            include_languages=[],
-            exclude_bots=True,
-        )
+    safe_repo = repo_name.replace("/", "__")
+    filters = _year_in_review_filters()
+    since = datetime(year, 1, 1)
+    timeout = PARALLEL_CONFIG['year_in_review_task_timeout']
+    # Busier repositories have more PRs and commits to process
+    scale = 1.0 + (year_commits or 0) / 100
 
-        # Collect PRs authored in the year
-        pr_numbers = collector.list_authored_pull_requests(
-            repo=repo_name,
-            author=author,
-            state="all",
+    def key(name: str) -> str:
+        return f"{safe_repo}:{name}"
+
+    def cost(name: str, scaled: bool = True) -> float:
+        return YEAR_IN_REVIEW_TASK_COSTS[name] * (scale if scaled else 1.0)
+
+    def list_pull_requests() -> dict:
+        return collector.list_authored_pull_request_updates(
+            repo=repo_name, author=author, state="all"
         )
 
-        # Run feedback analysis (generates integrated_report.md and personal_development.json)
-        feedback_report_path, pr_results = run_feedback_analysis_func(
+    def run_feedback(updates: dict):
+        # Generates integrated_report.md and personal_development.json
+        return run_feedback_analysis_func(
             config=config,
             repo_input=repo_name,
             output_dir=output_dir,
+            collector=collector,
+            author=author,
+            updates=updates,
         )
 
-        # Collect detailed feedback for communication skills analysis
+    def collect_detailed_feedback() -> dict:
+        # Persisted to the metrics snapshot and handed to assemble() in memory
         console.print(f"[dim]📊 Collecting detailed feedback for {repo_name}...[/]")
-        detailed_feedback_snapshot = collect_detailed_feedback_func(
+        snapshot = collect_detailed_feedback_func(
             collector=collector,
             analyzer=analyzer,
             config=config,
@@ -412,15 +435,15 @@ def analyze_single_repository_for_year_review(
             filters=filters,
             author=author,
         )
+        _save_detailed_feedback_to_metrics(output_dir, repo_name, snapshot)
+        return snapshot.to_dict() if snapshot else {}
 
-        # Save detailed feedback to metrics.json
-        _save_detailed_feedback_to_metrics(output_dir, repo_name, detailed_feedback_snapshot)
+    def assemble(feedback, detailed_feedback: dict, tech_stack: dict, commit_counts) -> RepositoryAnalysis:
+        feedback_report_path, pr_results = feedback
+        total_commits, year_commits_count = commit_counts
 
-        # Load personal development data
         reviews_dir = output_dir / "reviews" / safe_repo
         strengths, improvements, growth_indicators = _load_personal_development_data(reviews_dir)
-
-        # Load communication skills data from metrics.json
         (
             commit_message_quality,
             pr_title_quality,
@@ -430,17 +453,7 @@ def analyze_single_repository_for_year_review(
             pr_title_stats,
             review_tone_stats,
             issue_stats,
-        ) = _load_communication_skills_data(output_dir, repo_name)
-
-        # Collect tech stack data
-        tech_stack = _collect_tech_stack_data(collector, repo_name, year, filters)
-
-        # Get commit counts
-        total_commits, year_commits_count = _collect_commit_counts(
-            collector, repo_name, author, year
-        )
-
-        # Get personal development path
+        ) = _communication_skills_from_feedback(detailed_feedback)
         personal_dev_path = reviews_dir / "personal_development.json"
 
         return RepositoryAnalysis(
@@ -464,6 +477,145 @@ def analyze_single_repository_for_year_review(
             issue_stats=issue_stats,
         )
 
+    graph.add(
+        key("pull_requests"), list_pull_requests,
+        cost=cost("pull_requests"), label=f"{repo_name}: pull requests", timeout=timeout,
+    )
+    graph.add(
+        key("feedback"), run_feedback, deps=[key("pull_requests")],
+        cost=cost("feedback"), label=f"{repo_name}: PR reviews", group="feedback", timeout=timeout,
+    )
+    graph.add(
+        key("detailed_feedback"), collect_detailed_feedback,
+        cost=cost("detailed_feedback"), label=f"{repo_name}: detailed feedback", timeout=timeout,
+    )
+    graph.add(
+        key("tech_stack"), lambda: _collect_tech_stack_data(collector, repo_name, year, filters),
+        cost=cost("tech_stack", scaled=False), label=f"{repo_name}: tech stack", timeout=timeout,
+    )
+    graph.add(
+        key("commits"), lambda: _collect_commit_counts(collector, repo_name, author, year, year_commits),
+        cost=cost("commits"), label=f"{repo_name}: commits", timeout=timeout,
+    )
+    return graph.add(
+        key("analysis"), assemble,
+        deps=[key("feedback"), key("detailed_feedback"), key("tech_stack"), key("commits")],
+        cost=cost("assemble", scaled=False), label=f"{repo_name}: analysis",
+    )
+
+
+def run_year_in_review_graph(
+    config: Config,
+    collector: Collector,
+    author: str,
+    repositories: list[dict],
+    year: int,
+    output_dir: Path,
+    run_feedback_analysis_func,
+    collect_detailed_feedback_func,
+) -> dict[str, Optional[RepositoryAnalysis]]:
+    """Analyze every repository in one task graph, critical path first.
+
+    Args:
+        config: Configuration object
+        collector: Collector shared by every task
+        author: Authenticated username
+        repositories: Repositories from discovery (``full_name`` and ``_year_commits``)
+        year: Year being analyzed
+        output_dir: Output directory
+        run_feedback_analysis_func: Function to run feedback analysis
+        collect_detailed_feedback_func: Function to collect detailed feedback
+
+    Returns:
+        Dict mapping repository name to its RepositoryAnalysis, or None when
+        one of its tasks failed
+    """
+    graph = TaskGraph()
+    analyzer = Analyzer(web_base_url=config.server.web_url)
+    analysis_keys: dict[str, str] = {}
+    for repo_data in repositories:
+        repo_name = repo_data.get("full_name", "")
+        if not repo_name or repo_name in analysis_keys:
+            continue
+        analysis_keys[repo_name] = add_repository_tasks(
+            graph,
+            config=config,
+            collector=collector,
+            analyzer=analyzer,
+            author=author,
+            repo_name=repo_name,
+            year=year,
+            output_dir=output_dir,
+            run_feedback_analysis_func=run_feedback_analysis_func,
+            collect_detailed_feedback_func=collect_detailed_feedback_func,
+            year_commits=repo_data.get("_year_commits"),
+        )
+
+    def report(task: GraphTask, error: Optional[BaseException]) -> None:
+        if error is None:
+            console.print(f"[success]✓ {task.label}[/]")
+        elif isinstance(error, DependencyFailedError):
+            console.print(f"[dim]↷ {task.label} skipped[/]")
+        else:
+            console.print(f"[warning]⚠ {task.label} failed: {error}[/]")
+
+    run = graph.run(
+        PARALLEL_CONFIG['max_workers_year_in_review'],
+        group_limits={"feedback": PARALLEL_CONFIG['max_concurrent_repo_feedback']},
+        on_done=report,
+    )
+
+    task_time = sum(run.durations.values())
+    console.print(
+        f"[dim]Ran {len(graph)} tasks in {run.elapsed:.1f}s "
+        f"({task_time:.1f}s of task time, {task_time / run.elapsed if run.elapsed else 0:.1f}x overlap)[/]"
+    )
+    return {repo_name: run.results.get(key) for repo_name, key in analysis_keys.items()}
+
+
+def analyze_single_repository_for_year_review(
+    config: Config,
+    repo_name: str,
+    year: int,
+    output_dir: Path,
+    run_feedback_analysis_func,
+    collect_detailed_feedback_func,
+    *,
+    collector: Optional[Collector] = None,
+    author: Optional[str] = None,
+    year_commits: Optional[int] = None,
+) -> Optional[RepositoryAnalysis]:
+    """Analyze a single repository for year-in-review.
+
+    Args:
+        config: Configuration object
+        repo_name: Repository name (owner/repo)
+        year: Year being analyzed
+        output_dir: Output directory
+        run_feedback_analysis_func: Function to run feedback analysis
+        collect_detailed_feedback_func: Function to collect detailed feedback
+        collector: Collector to reuse instead of creating one
+        author: Authenticated username, when already known
+        year_commits: Commits in the year counted during repository discovery
+
+    Returns:
+        RepositoryAnalysis object or None if analysis fails
+    """
+    try:
+        collector = collector or Collector(config)
+        author = author or collector.get_authenticated_user()
     except Exception as exc:
         console.print(f"[warning]Failed to analyze {repo_name}: {exc}[/]")
         return None
+
+    results = run_year_in_review_graph(
+        config,
+        collector,
+        author,
+        [{"full_name": repo_name, "_year_commits": year_commits}],
+        year,
+        output_dir,
+        run_feedback_analysis_func,
+        collect_detailed_feedback_func,
+    )
+    return results.get(repo_name)
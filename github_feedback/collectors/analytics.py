@@ -14,6 +14,7 @@ from ..api.params import build_commits_params, build_list_params, build_paginati
 from .base import BaseCollector
 from ..core.console import Console
 from ..core.constants import THREAD_POOL_CONFIG
+from ..core.tracing import trace_methods, traced_task
 from ..filters import FilterHelper
 from ..core.models import AnalysisFilters
 
@@ -21,6 +22,7 @@ logger = logging.getLogger(__name__)
 console = Console()
 
 
+@trace_methods("collector")
 class AnalyticsCollector(BaseCollector):
     """Collector specialized for analytics and statistics."""
 
@@ -58,45 +60,46 @@ class AnalyticsCollector(BaseCollector):
             )
 
             try:
-                commits = self.api_client.request_all(f"repos/{repo}/commits", params)
-                for commit in commits:
-                    sha = commit.get("sha", "")
-                    if sha in seen_shas:
-                        continue
-                    seen_shas.add(sha)
-
-                    author = commit.get("author")
-                    if self.filter_helper.filter_bot(author, filters):
-                        continue
-
-                    commit_data = commit.get("commit", {})
-                    date_str = commit_data.get("author", {}).get("date", "")
-                    if date_str:
-                        commit_date = self.parse_timestamp(date_str)
-                        month_key = commit_date.strftime("%Y-%m")
-                        monthly_data[month_key]["commits"] += 1
+                # Counted page by page so large histories are never held whole
+                for commits in self.api_client.iter_pages(f"repos/{repo}/commits", params):
+                    for commit in commits:
+                        sha = commit.get("sha", "")
+                        if sha in seen_shas:
+                            continue
+                        seen_shas.add(sha)
+
+                        author = commit.get("author")
+                        if self.filter_helper.filter_bot(author, filters):
+                            continue
+
+                        commit_data = commit.get("commit", {})
+                        date_str = commit_data.get("author", {}).get("date", "")
+                        if date_str:
+                            commit_date = self.parse_timestamp(date_str)
+                            month_key = commit_date.strftime("%Y-%m")
+                            monthly_data[month_key]["commits"] += 1
             except (requests.HTTPError, ValueError) as exc:
                 logger.warning(f"Failed to collect commits for monthly trends: {exc}")
 
         # Collect PRs by month
         try:
             params = build_list_params()
-            prs = self.api_client.request_all(f"repos/{repo}/pulls", params)
-            for pr in prs:
-                created_at_raw = pr.get("created_at")
-                if not created_at_raw:
-                    continue
+            for prs in self.api_client.iter_pages(f"repos/{repo}/pulls", params):
+                for pr in prs:
+                    created_at_raw = pr.get("created_at")
+                    if not created_at_raw:
+                        continue
 
-                created_at = self.parse_timestamp(created_at_raw).astimezone()
-                if created_at < since:
-                    continue
+                    created_at = self.parse_timestamp(created_at_raw).astimezone()
+                    if created_at < since:
+                        continue
 
-                author = pr.get("user")
-                if self.filter_helper.filter_bot(author, filters):
-                    continue
+                    author = pr.get("user")
+                    if self.filter_helper.filter_bot(author, filters):
+                        continue
 
-                month_key = created_at.strftime("%Y-%m")
-                monthly_data[month_key]["pull_requests"] += 1
+                    month_key = created_at.strftime("%Y-%m")
+                    monthly_data[month_key]["pull_requests"] += 1
         except (requests.HTTPError, ValueError) as exc:
             logger.warning(f"Failed to collect PRs for monthly trends: {exc}")
 
@@ -170,7 +173,7 @@ class AnalyticsCollector(BaseCollector):
         max_workers = THREAD_POOL_CONFIG['max_workers_pr_fetch']
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
             futures = {
-                executor.submit(fetch_pr_files, pr): pr for pr in prs_to_process
+                executor.submit(traced_task(fetch_pr_files, "fetch_pr_files"), pr): pr for pr in prs_to_process
             }
 
             for future in as_completed(futures):
@@ -270,7 +273,7 @@ class AnalyticsCollector(BaseCollector):
         max_workers = THREAD_POOL_CONFIG['max_workers_pr_fetch']
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
             futures = {
-                executor.submit(fetch_pr_reviews, pr): pr for pr in prs_to_process
+                executor.submit(traced_task(fetch_pr_reviews, "fetch_pr_reviews"), pr): pr for pr in prs_to_process
             }
 
             for future in as_completed(futures):
@@ -26,6 +26,7 @@ from ..core.models import (
 from .prs import PullRequestCollector
 from ..repository_manager import RepositoryManager
 from .reviews import ReviewCollector
+from ..core.tracing import trace_methods
 
 logger = logging.getLogger(__name__)
 console = Console()
@@ -60,6 +61,7 @@ def handle_future_result(future, task_name: str, repo: str, timeout: int, defaul
         return default_value
 
 
+@trace_methods("collector")
 @dataclass
 class Collector:
     """Facade for GitHub data collection using specialized collectors.
@@ -273,6 +275,16 @@ class Collector:
         """Return pull request numbers where the user is the author."""
         return self.pr_collector.list_authored_pull_requests(repo, author, state)
 
+    def list_authored_pull_request_updates(
+        self, repo: str, author: str, state: str = "all"
+    ) -> Dict[int, datetime]:
+        """Return the last update time of each PR the user authored."""
+        return self.pr_collector.list_authored_pull_request_updates(repo, author, state)
+
+    def get_pull_request_head_sha(self, repo: str, number: int) -> str:
+        """Return the SHA of a pull request's current head commit."""
+        return self.pr_collector.get_pull_request_head_sha(repo, number)
+
     def collect_pull_request_details(
         self, repo: str, number: int
     ) -> PullRequestReviewBundle:
@@ -12,10 +12,12 @@ from ..api.params import build_commits_params, build_pagination_params
 from .base import BaseCollector
 from ..core.constants import THREAD_POOL_CONFIG
 from ..core.models import AnalysisFilters
+from ..core.tracing import trace_methods, traced_task
 
 logger = logging.getLogger(__name__)
 
 
+@trace_methods("collector")
 class CommitCollector(BaseCollector):
     """Collector specialized for commit-related operations."""
 
@@ -106,7 +108,7 @@ class CommitCollector(BaseCollector):
         )
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
             futures = {
-                executor.submit(count_commits_for_branch, branch): branch
+                executor.submit(traced_task(count_commits_for_branch, "count_commits_for_branch"), branch): branch
                 for branch in include_branches
             }
 
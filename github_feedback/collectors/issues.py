@@ -9,8 +9,10 @@ from ..api.params import build_list_params
 from .base import BaseCollector
 from ..filters import FilterHelper
 from ..core.models import AnalysisFilters
+from ..core.tracing import trace_methods
 
 
+@trace_methods("collector")
 class IssueCollector(BaseCollector):
     """Collector specialized for issue operations."""
 
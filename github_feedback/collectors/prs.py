@@ -6,13 +6,15 @@ import json
 import logging
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
-from typing import Any, Dict, Iterable, List, Optional, Set
+from typing import Any, Dict, Iterable, List, Optional
 
 import requests
 
 from ..api.params import build_list_params, build_pagination_params
 from .base import BaseCollector
 from ..core.constants import THREAD_POOL_CONFIG
+from ..core.utils import safe_truncate_str
+from ..core.tracing import trace_methods, traced_task
 from ..core.models import (
     AnalysisFilters,
     PullRequestFile,
@@ -22,7 +24,43 @@ from ..core.models import (
 
 logger = logging.getLogger(__name__)
 
+TRUNCATION_MARKER = "\n... [truncated]"
 
+
+def _cap_text(text: Optional[str], limit: int) -> Optional[str]:
+    """Return ``text`` cut to ``limit`` characters, marking the cut."""
+    if not text or len(text) <= limit:
+        return text
+    return safe_truncate_str(text, limit) + TRUNCATION_MARKER
+
+
+def _cap_patch(patch: str, limit: int) -> Optional[str]:
+    """Cut a diff to ``limit`` characters at a line boundary.
+
+    Returns None when not even one line fits, so callers keep the file's
+    stats without its diff.
+    """
+    if len(patch) <= limit:
+        return patch
+    cut = patch.rfind("\n", 0, limit)
+    if cut <= 0:
+        return None
+    return patch[:cut] + TRUNCATION_MARKER
+
+
+def _normalise_state(state: str) -> str:
+    """Validate a PR state filter, defaulting blank values to ``all``.
+
+    Raises:
+        ValueError: If state is not open, closed or all
+    """
+    state_normalised = state.lower().strip() or "all"
+    if state_normalised not in {"open", "closed", "all"}:
+        raise ValueError("state must be one of 'open', 'closed', or 'all'")
+    return state_normalised
+
+
+@trace_methods("collector")
 class PullRequestCollector(BaseCollector):
     """Collector specialized for pull request operations."""
 
@@ -122,7 +160,7 @@ class PullRequestCollector(BaseCollector):
         max_workers = THREAD_POOL_CONFIG['max_workers_pr_fetch']
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
             future_to_pr = {
-                executor.submit(fetch_pr_data, pr_num): pr_num
+                executor.submit(traced_task(fetch_pr_data, "fetch_pr_data"), pr_num): pr_num
                 for pr_num in pr_numbers_to_fetch
             }
 
@@ -316,8 +354,16 @@ class PullRequestCollector(BaseCollector):
             f"{repo_root}/{repo}/pull/{number}",
         )
 
+        limits = self.config.memory
         files: List[PullRequestFile] = []
-        for entry in files_payload:
+        patch_budget = limits.max_patch_chars_per_pr
+        for entry in files_payload[:limits.max_files_per_pr]:
+            patch = entry.get("patch")
+            if patch is not None:
+                # Keep patches within the per-file cap and the PR-wide budget;
+                # files past the budget keep their stats without a diff.
+                patch = _cap_patch(patch, min(limits.max_patch_chars, max(patch_budget, 0)))
+                patch_budget -= len(patch or "")
             files.append(
                 PullRequestFile(
                     filename=entry.get("filename", ""),
@@ -325,38 +371,56 @@ class PullRequestCollector(BaseCollector):
                     additions=int(entry.get("additions", 0) or 0),
                     deletions=int(entry.get("deletions", 0) or 0),
                     changes=int(entry.get("changes", 0) or 0),
-                    patch=entry.get("patch"),
+                    patch=patch,
                 )
             )
+        if len(files_payload) > len(files):
+            logger.debug(f"Kept {len(files)} of {len(files_payload)} files of {repo}#{number} (memory.max_files_per_pr)")
 
+        max_text = limits.max_review_text_chars
+        max_comments = limits.max_review_comments_per_pr
         review_bodies = [
-            review.get("body", "").strip()
+            _cap_text(review.get("body", "").strip(), max_text)
             for review in review_payload
             if review.get("body")
-        ]
+        ][:max_comments]
         review_comments = [
-            comment.get("body", "").strip()
+            _cap_text(comment.get("body", "").strip(), max_text)
             for comment in review_comment_payload
             if comment.get("body")
-        ]
+        ][:max_comments]
 
         return PullRequestReviewBundle(
             repo=repo,
             number=number,
             title=pr_payload.get("title", ""),
-            body=pr_payload.get("body", ""),
+            body=_cap_text(pr_payload.get("body", ""), max_text),
             author=(pr_payload.get("user") or {}).get("login", ""),
             html_url=html_url,
             created_at=self.parse_timestamp(created_at_raw).astimezone(timezone.utc),
             updated_at=self.parse_timestamp(updated_at_raw).astimezone(timezone.utc),
             additions=int(pr_payload.get("additions", 0) or 0),
             deletions=int(pr_payload.get("deletions", 0) or 0),
-            changed_files=int(pr_payload.get("changed_files", 0) or len(files)),
+            changed_files=int(pr_payload.get("changed_files", 0) or len(files_payload)),
             review_bodies=review_bodies,
             review_comments=review_comments,
             files=files,
+            head_sha=(pr_payload.get("head") or {}).get("sha", ""),
         )
 
+    def get_pull_request_head_sha(self, repo: str, number: int) -> str:
+        """Return the SHA of the pull request's current head commit.
+
+        Args:
+            repo: Repository name (owner/repo)
+            number: Pull request number
+
+        Returns:
+            Head commit SHA, or an empty string when unavailable
+        """
+        pr_payload = self.api_client.request_json(f"repos/{repo}/pulls/{number}")
+        return (pr_payload.get("head") or {}).get("sha", "")
+
     def list_authored_pull_requests(
         self, repo: str, author: str, state: str = "all"
     ) -> List[int]:
@@ -373,22 +437,38 @@ class PullRequestCollector(BaseCollector):
         Raises:
             ValueError: If state is not valid
         """
-        state_normalised = state.lower().strip() or "all"
-        if state_normalised not in {"open", "closed", "all"}:
-            raise ValueError("state must be one of 'open', 'closed', or 'all'")
+        return list(self.list_authored_pull_request_updates(repo, author, state))
+
+    def list_authored_pull_request_updates(
+        self, repo: str, author: str, state: str = "all"
+    ) -> Dict[int, datetime]:
+        """Return the last update time of each PR the user authored.
 
-        params = build_list_params(state=state_normalised, creator=author)
+        The timestamps come from the same listing call as the PR numbers, so
+        callers can detect changed PRs without fetching each one.
+
+        Args:
+            repo: Repository name (owner/repo)
+            author: GitHub username
+            state: PR state filter (open/closed/all)
+
+        Returns:
+            Mapping of PR number to ``updated_at`` in listing order
+
+        Raises:
+            ValueError: If state is not valid
+        """
+        params = build_list_params(state=_normalise_state(state), creator=author)
 
         issues = self.api_client.request_all(f"repos/{repo}/issues", params)
-        numbers: List[int] = []
-        seen: Set[int] = set()
+        updates: Dict[int, datetime] = {}
         for issue in issues:
             if "pull_request" not in issue:
                 continue
             number = int(issue.get("number", 0) or 0)
-            if not number or number in seen:
+            if not number or number in updates:
                 continue
-            seen.add(number)
-            numbers.append(number)
+            updated_at_raw = issue.get("updated_at") or datetime.now(timezone.utc).isoformat()
+            updates[number] = self.parse_timestamp(updated_at_raw).astimezone(timezone.utc)
 
-        return numbers
+        return updates
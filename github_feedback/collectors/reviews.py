@@ -14,11 +14,13 @@ from .base import BaseCollector
 from ..core.console import Console
 from ..core.constants import THREAD_POOL_CONFIG
 from ..core.models import AnalysisFilters
+from ..core.tracing import trace_methods, traced_task
 
 logger = logging.getLogger(__name__)
 console = Console()
 
 
+@trace_methods("collector")
 class ReviewCollector(BaseCollector):
     """Collector specialized for review operations."""
 
@@ -84,7 +86,7 @@ class ReviewCollector(BaseCollector):
 
         max_workers = THREAD_POOL_CONFIG['max_workers_pr_fetch']
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = {executor.submit(fetch_pr_reviews, pr): pr for pr in valid_prs}
+            futures = {executor.submit(traced_task(fetch_pr_reviews, "fetch_pr_reviews"), pr): pr for pr in valid_prs}
             for future in as_completed(futures):
                 completed_count += 1
                 pr_num = futures[future]
@@ -18,6 +18,8 @@ from tomli_w import dump as toml_dump
 import keyring
 from keyring.errors import KeyringError
 
+from .constants import LLM_DEFAULTS
+
 CONFIG_DIR = Path.home() / ".config" / "github_feedback"
 CONFIG_FILE = CONFIG_DIR / "config.toml"
 CONFIG_VERSION = "1.0.0"
@@ -193,8 +195,33 @@ class LLMConfig(BaseModel):
     max_files_in_prompt: int = 10
     max_files_with_patch_snippets: int = 5
     max_retries: int = 3
-
-    @field_validator("timeout", "max_files_in_prompt", "max_files_with_patch_snippets", "max_retries")
+    # Additional OpenAI-compatible endpoints serving the same model; requests
+    # are balanced across ``endpoint`` and these by observed latency.
+    endpoints: list[str] = []
+    # Latency percentile after which a slow request is hedged to a second
+    # endpoint (0 disables hedging).
+    hedge_percentile: float = LLM_DEFAULTS['hedge_percentile']
+    # Stream responses over SSE so malformed JSON is rejected mid-generation
+    stream: bool = False
+    # Estimated token budget for the diff-bearing user prompt of a PR review
+    prompt_token_budget: int = 6000
+    # Small PRs packed into one review request within ``prompt_token_budget``
+    # (1 reviews every PR with its own request)
+    review_batch_size: int = 1
+    # Heuristic triage (opt-in): trivial PRs get the rule-based review without an LLM call
+    triage_docs_only: bool = False
+    triage_dependency_bumps: bool = False
+    # PRs with at most this many changed lines are triaged (0 disables)
+    triage_max_changed_lines: int = 0
+
+    @field_validator(
+        "timeout",
+        "max_files_in_prompt",
+        "max_files_with_patch_snippets",
+        "max_retries",
+        "prompt_token_budget",
+        "review_batch_size",
+    )
     @classmethod
     def validate_positive(cls, v: int, info) -> int:
         """Validate that numeric fields are positive."""
@@ -202,6 +229,14 @@ class LLMConfig(BaseModel):
             raise ValueError(f"{info.field_name} must be positive, got {v}")
         return v
 
+    @field_validator("triage_max_changed_lines")
+    @classmethod
+    def validate_non_negative(cls, v: int, info) -> int:
+        """Validate that thresholds which may be disabled with 0 are not negative."""
+        if v < 0:
+            raise ValueError(f"{info.field_name} must not be negative, got {v}")
+        return v
+
     @field_validator("endpoint")
     @classmethod
     def validate_endpoint(cls, v: str) -> str:
@@ -210,6 +245,23 @@ class LLMConfig(BaseModel):
             raise ValueError(f"endpoint must be a valid HTTP(S) URL, got: {v}")
         return v
 
+    @field_validator("endpoints")
+    @classmethod
+    def validate_endpoints(cls, v: list[str]) -> list[str]:
+        """Validate that every additional endpoint is an HTTP(S) URL."""
+        for url in v:
+            if not url.startswith(("http://", "https://")):
+                raise ValueError(f"endpoints must be valid HTTP(S) URLs, got: {url}")
+        return v
+
+    @field_validator("hedge_percentile")
+    @classmethod
+    def validate_hedge_percentile(cls, v: float) -> float:
+        """Validate that the hedge percentile lies in [0, 1)."""
+        if not 0 <= v < 1:
+            raise ValueError(f"hedge_percentile must be in [0, 1), got {v}")
+        return v
+
 
 class DefaultsConfig(BaseModel):
     """Default values used when running analyses."""
@@ -230,6 +282,9 @@ class APIConfig(BaseModel):
 
     timeout: int = 30
     max_retries: int = 3
+    cache_max_size_mb: int = 1024  # Least recently used responses are evicted past this; 0 = unlimited
+    cache_compression: bool = True
+    cache_stale_while_revalidate: bool = True  # Serve expired entries within CACHE_POLICIES max staleness
 
     @field_validator("timeout", "max_retries")
     @classmethod
@@ -239,6 +294,14 @@ class APIConfig(BaseModel):
             raise ValueError(f"{info.field_name} must be positive, got {v}")
         return v
 
+    @field_validator("cache_max_size_mb")
+    @classmethod
+    def validate_non_negative(cls, v: int, info) -> int:
+        """Validate that the cache size limit is not negative."""
+        if v < 0:
+            raise ValueError(f"{info.field_name} must be non-negative, got {v}")
+        return v
+
 
 class ReporterConfig(BaseModel):
     """Configuration for report generation."""
@@ -256,6 +319,35 @@ class ReporterConfig(BaseModel):
         return v
 
 
+class MemoryConfig(BaseModel):
+    """Bounds on data held in memory while collecting pull request details.
+
+    Patches and review texts are the bulk of a year-in-review run over a
+    large organisation; past these caps they are truncated or dropped
+    rather than accumulated.
+    """
+
+    max_patch_chars: int = 20_000
+    max_patch_chars_per_pr: int = 200_000
+    max_files_per_pr: int = 300
+    max_review_text_chars: int = 4_000
+    max_review_comments_per_pr: int = 200
+
+    @field_validator(
+        "max_patch_chars",
+        "max_patch_chars_per_pr",
+        "max_files_per_pr",
+        "max_review_text_chars",
+        "max_review_comments_per_pr",
+    )
+    @classmethod
+    def validate_positive(cls, v: int, info) -> int:
+        """Validate that memory caps are positive."""
+        if v <= 0:
+            raise ValueError(f"{info.field_name} must be positive, got {v}")
+        return v
+
+
 @dataclass(slots=True)
 class Config:
     """Top-level configuration container."""
@@ -266,6 +358,7 @@ class Config:
     api: APIConfig = field(default_factory=APIConfig)
     defaults: DefaultsConfig = field(default_factory=DefaultsConfig)
     reporter: ReporterConfig = field(default_factory=ReporterConfig)
+    memory: MemoryConfig = field(default_factory=MemoryConfig)
 
     @classmethod
     def load(cls, path: Path = CONFIG_FILE) -> "Config":
@@ -302,10 +395,19 @@ class Config:
             api = APIConfig(**raw.get("api", {}))
             defaults = DefaultsConfig(**raw.get("defaults", {}))
             reporter = ReporterConfig(**raw.get("reporter", {}))
+            memory = MemoryConfig(**raw.get("memory", {}))
         except ValidationError as exc:
             raise ValueError(f"Invalid configuration: {exc}") from exc
 
-        return cls(version=version, server=server, llm=llm, api=api, defaults=defaults, reporter=reporter)
+        return cls(
+            version=version,
+            server=server,
+            llm=llm,
+            api=api,
+            defaults=defaults,
+            reporter=reporter,
+            memory=memory,
+        )
 
     def dump(self, path: Path = CONFIG_FILE, backup: bool = True) -> None:
         """Persist the configuration to disk.
@@ -330,6 +432,7 @@ class Config:
             "api": self.api.model_dump(),
             "defaults": self.defaults.model_dump(),
             "reporter": self.reporter.model_dump(),
+            "memory": self.memory.model_dump(),
         }
 
         with path.open("wb") as handle:
@@ -458,6 +561,7 @@ class Config:
             "api": self.api.model_dump(),
             "defaults": self.defaults.model_dump(),
             "reporter": self.reporter.model_dump(),
+            "memory": self.memory.model_dump(),
         }
 
     @property
@@ -473,6 +577,7 @@ class Config:
             "api": self.api,
             "defaults": self.defaults,
             "reporter": self.reporter,
+            "memory": self.memory,
         }
 
     def set_value(self, key: str, value: str) -> None:
@@ -517,6 +622,8 @@ class Config:
                 converted_value = float(value)
             elif field_type == bool or field_type == "bool":
                 converted_value = value.lower() in ("true", "1", "yes", "on")
+            elif getattr(field_type, "__origin__", None) is list:
+                converted_value = [item.strip() for item in value.split(",") if item.strip()]
             else:
                 converted_value = value
 
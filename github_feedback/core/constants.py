@@ -245,6 +245,14 @@ DISPLAY_LIMITS = {
     'growth_indicators': 2,  # Number of growth indicators to show per learning insight (reduced for brevity)
 }
 
+# Bounds keeping review report sections cheap for users with thousands of PRs
+REVIEW_REPORT_LIMITS = {
+    'pr_list_page_size': 200,  # PRs per table before the PR list is split into page files
+    'timeline_max_rows': 100,  # Above this many PRs the timeline shows aggregated buckets
+    'timeline_max_buckets': 36,  # Monthly buckets beyond this fall back to yearly buckets
+    'top_changed_prs': 10,  # PRs listed in the code change ranking
+}
+
 # Parallel processing configuration
 PARALLEL_CONFIG = {
     'max_workers_data_collection': 5,  # Concurrent data collection tasks (Phase 1) - increased from 3
@@ -256,6 +264,20 @@ PARALLEL_CONFIG = {
     'analysis_timeout': 180,  # Timeout for LLM analysis in seconds
     'yearend_timeout': 180,  # Timeout for year-end data collection in seconds
     'pr_review_timeout': 180,  # Timeout for PR review in seconds
+    'max_workers_year_in_review': 6,  # Concurrent year-in-review graph tasks across repositories
+    'max_concurrent_repo_feedback': 3,  # Repositories whose PR reviews run at once (LLM heavy)
+    'year_in_review_task_timeout': 600,  # Timeout for a single year-in-review task in seconds
+}
+
+# Relative duration estimates of year-in-review tasks, used to run the
+# critical path first. Repository-bound tasks are scaled by activity.
+YEAR_IN_REVIEW_TASK_COSTS = {
+    'pull_requests': 1.0,  # List authored PRs
+    'feedback': 20.0,  # LLM review of every authored PR plus the integrated report
+    'detailed_feedback': 6.0,  # Communication data collection and LLM analysis
+    'tech_stack': 4.0,  # Repository PR listing plus per-PR file fetches
+    'commits': 1.0,  # Author commit pagination
+    'assemble': 0.1,  # Build the RepositoryAnalysis
 }
 
 # =============================================================================
@@ -399,6 +421,15 @@ HTTP_STATUS = {
     'retryable_errors': (403, 429, 500, 502, 503, 504),
 }
 
+# Benchmark regression thresholds (`gfa bench`)
+BENCHMARK_THRESHOLDS = {
+    'wall_seconds': 0.25,  # Allowed relative slowdown over the baseline
+    'peak_rss_mb': 0.25,  # Allowed relative memory growth
+    'requests': 0.0,  # Any extra API request is a regression
+    'cache_hit_ratio': 0.05,  # Allowed absolute drop in cache hit ratio
+    'min_wall_delta_seconds': 0.05,  # Slowdowns below this are timer noise
+}
+
 # Thread pool configuration
 THREAD_POOL_CONFIG = {
     'max_workers_pr_fetch': 8,  # Increased from 5 for faster parallel PR fetching
@@ -420,6 +451,12 @@ LLM_DEFAULTS = {
     'sample_size_prs': 20,
     'sample_size_reviews': 15,
     'sample_size_issues': 15,
+    'prompt_token_budget': 6000,  # Estimated token budget for a PR review user prompt
+    'hedge_percentile': 0.95,  # Hedge a request once it outlives this latency percentile
+    'hedge_min_samples': 20,  # Latency samples required before hedging kicks in
+    'latency_window': 200,  # Recent latency samples kept per endpoint
+    'latency_ewma_alpha': 0.3,  # Smoothing factor for per-endpoint latency EWMA
+    'endpoint_failure_cooldown': 30,  # Seconds a failing endpoint is deprioritised
 }
 
 # Text processing limits
@@ -0,0 +1,208 @@
+"""Per-phase memory profiling with :mod:`tracemalloc`.
+
+While profiling is on, every pipeline phase takes a snapshot on entry and
+exit. The report lists, per phase, the traced memory at both ends, the peak
+reached inside the phase and the call sites whose allocations grew the most.
+Peaks are process-wide, so work running on other threads during a phase
+counts towards it.
+
+Example:
+    >>> start_memory_profiling()
+    >>> with memory_phase("Phase 1"):
+    ...     collector.collect(repo, months)
+    >>> stop_memory_profiling().save(Path("memory.json"))
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, ContextManager, Dict, Iterator, List, Optional
+
+from .utils import FileSystemManager
+
+_SNAPSHOT_FILTERS = [
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, __file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+]
+
+
+def _mib(size: int) -> float:
+    return size / (1024 * 1024)
+
+
+@dataclass(slots=True)
+class AllocationSite:
+    """Net allocations attributed to one source line during a phase."""
+
+    location: str
+    size_diff: int
+    count_diff: int
+
+
+@dataclass(slots=True)
+class PhaseMemory:
+    """Memory measurements of one phase."""
+
+    name: str
+    start_bytes: int
+    end_bytes: int
+    peak_bytes: int
+    top_sites: List[AllocationSite] = field(default_factory=list)
+
+    @property
+    def retained_bytes(self) -> int:
+        """Memory still held when the phase ended."""
+        return self.end_bytes - self.start_bytes
+
+
+@dataclass(slots=True)
+class MemoryReport:
+    """Memory profile of a run, one entry per completed phase."""
+
+    phases: List[PhaseMemory] = field(default_factory=list)
+    peak_bytes: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "peak_bytes": self.peak_bytes,
+            "phases": [asdict(phase) | {"retained_bytes": phase.retained_bytes} for phase in self.phases],
+        }
+
+    @classmethod
+    def load(cls, path: Path) -> MemoryReport:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+        phases = []
+        for entry in payload.get("phases", []):
+            sites = [AllocationSite(**site) for site in entry.get("top_sites", [])]
+            phases.append(PhaseMemory(
+                name=entry["name"],
+                start_bytes=entry["start_bytes"],
+                end_bytes=entry["end_bytes"],
+                peak_bytes=entry["peak_bytes"],
+                top_sites=sites,
+            ))
+        return cls(phases=phases, peak_bytes=payload.get("peak_bytes", 0))
+
+    def save(self, path: Path) -> Path:
+        FileSystemManager.ensure_parent_directory(path)
+        path.write_text(json.dumps(self.to_dict(), indent=2) + "\n", encoding="utf-8")
+        return path
+
+    def format_summary(self, sites: int = 3) -> str:
+        """Format a human-readable summary of the profile."""
+        lines = [f"=== Memory Profile (peak {_mib(self.peak_bytes):.1f} MiB) ==="]
+        for phase in self.phases:
+            lines.append(
+                f"{phase.name}: peak {_mib(phase.peak_bytes):.1f} MiB, "
+                f"retained {_mib(phase.retained_bytes):+.1f} MiB"
+            )
+            for site in phase.top_sites[:sites]:
+                lines.append(f"  - {site.location}: {_mib(site.size_diff):+.2f} MiB ({site.count_diff:+,} blocks)")
+        return "\n".join(lines)
+
+
+class MemoryProfiler:
+    """Record tracemalloc snapshots around phases."""
+
+    def __init__(self, top: int = 10, frames: int = 1) -> None:
+        self.top = top
+        self.frames = frames
+        self.report = MemoryReport()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._started_tracemalloc = False
+
+    def start(self) -> MemoryProfiler:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+            self._started_tracemalloc = True
+        return self
+
+    def stop(self) -> MemoryReport:
+        if tracemalloc.is_tracing():
+            self.report.peak_bytes = max(self.report.peak_bytes, tracemalloc.get_traced_memory()[1])
+            if self._started_tracemalloc:
+                tracemalloc.stop()
+        self._started_tracemalloc = False
+        return self.report
+
+    def _snapshot(self) -> tracemalloc.Snapshot:
+        return tracemalloc.take_snapshot().filter_traces(_SNAPSHOT_FILTERS)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Measure the enclosed block as phase ``name``."""
+        stack: List[List[int]] = self._local.__dict__.setdefault("stack", [])
+        before = self._snapshot()
+        start_bytes, peak_so_far = tracemalloc.get_traced_memory()
+        if stack:
+            # Keep the enclosing phase's peak before resetting the counter
+            stack[-1][0] = max(stack[-1][0], peak_so_far)
+        tracemalloc.reset_peak()
+        entry = [start_bytes]
+        stack.append(entry)
+        try:
+            yield
+        finally:
+            end_bytes, peak = tracemalloc.get_traced_memory()
+            peak = max(entry[0], peak)
+            stack.pop()
+            if stack:
+                stack[-1][0] = max(stack[-1][0], peak)
+            statistics = self._snapshot().compare_to(before, "lineno")
+            sites = [
+                AllocationSite(
+                    location=f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}",
+                    size_diff=stat.size_diff,
+                    count_diff=stat.count_diff,
+                )
+                for stat in statistics[:self.top]
+                if stat.size_diff > 0
+            ]
+            with self._lock:
+                self.report.peak_bytes = max(self.report.peak_bytes, peak)
+                self.report.phases.append(PhaseMemory(name, start_bytes, end_bytes, peak, sites))
+
+
+_profiler: Optional[MemoryProfiler] = None
+
+
+def start_memory_profiling(top: int = 10) -> MemoryProfiler:
+    """Start tracing allocations and recording phases process-wide."""
+    global _profiler
+    _profiler = MemoryProfiler(top=top).start()
+    return _profiler
+
+
+def stop_memory_profiling() -> Optional[MemoryReport]:
+    """Stop memory profiling and return the report of the active profiler."""
+    global _profiler
+    profiler, _profiler = _profiler, None
+    return profiler.stop() if profiler is not None else None
+
+
+def memory_phase(name: str) -> ContextManager[None]:
+    """Measure a phase on the active profiler (a no-op when profiling is off)."""
+    profiler = _profiler
+    if profiler is None:
+        return nullcontext()
+    return profiler.phase(name)
+
+
+__all__ = [
+    "AllocationSite",
+    "MemoryProfiler",
+    "MemoryReport",
+    "PhaseMemory",
+    "memory_phase",
+    "start_memory_profiling",
+    "stop_memory_profiling",
+]
@@ -89,6 +89,7 @@ class PullRequestReviewBundle:
     review_bodies: List[str]
     review_comments: List[str]
     files: List[PullRequestFile]
+    head_sha: str = ""
 
     def to_dict(self) -> Dict[str, object]:
         """Convert the bundle into a JSON serialisable structure."""
@@ -108,6 +109,7 @@ class PullRequestReviewBundle:
             "review_bodies": self.review_bodies,
             "review_comments": self.review_comments,
             "files": [file.to_dict() for file in self.files],
+            "head_sha": self.head_sha,
         }
 
 
@@ -0,0 +1,207 @@
+"""Compact, versioned metrics snapshot files with lazy section access.
+
+Layout::
+
+    b"GFMS" | version (1 byte) | index length (4 bytes, big endian) | index | sections
+
+The index is a small JSON object mapping each top-level key of the metrics
+payload to ``[offset, length, codec]`` relative to the end of the index.
+Every section is compact JSON, zlib-compressed when that makes it smaller.
+Readers parse the header and index only, then seek to the sections they
+need, so loading ``detailed_feedback`` never decodes the rest of the file.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import struct
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple
+
+from .utils import FileSystemManager
+
+SNAPSHOT_MAGIC = b"GFMS"
+SNAPSHOT_VERSION = 1
+SNAPSHOT_SUFFIX = ".gfms"
+
+# Sections smaller than this are stored uncompressed
+COMPRESSION_MIN_BYTES = 512
+
+_HEADER = struct.Struct(">4sBI")
+_CODEC_JSON = "json"
+_CODEC_ZLIB = "json+zlib"
+
+
+class SnapshotFormatError(ValueError):
+    """Raised when a file is not a readable metrics snapshot."""
+
+
+def _encode_section(value: Any) -> Tuple[bytes, str]:
+    raw = json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    if len(raw) >= COMPRESSION_MIN_BYTES:
+        compressed = zlib.compress(raw, 6)
+        if len(compressed) < len(raw):
+            return compressed, _CODEC_ZLIB
+    return raw, _CODEC_JSON
+
+
+def _decode_section(blob: bytes, codec: str) -> Any:
+    if codec == _CODEC_ZLIB:
+        blob = zlib.decompress(blob)
+    elif codec != _CODEC_JSON:
+        raise SnapshotFormatError(f"Unknown snapshot section codec: {codec}")
+    return json.loads(blob.decode("utf-8"))
+
+
+def _write_blobs(path: Path, blobs: List[Tuple[str, bytes, str]]) -> Path:
+    """Atomically write already encoded sections to ``path``."""
+    index: Dict[str, List[Any]] = {}
+    offset = 0
+    for name, blob, codec in blobs:
+        index[name] = [offset, len(blob), codec]
+        offset += len(blob)
+    index_bytes = json.dumps(index, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    FileSystemManager.ensure_parent_directory(path)
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    with tmp_path.open("wb") as handle:
+        handle.write(_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, len(index_bytes)))
+        handle.write(index_bytes)
+        for _, blob, _ in blobs:
+            handle.write(blob)
+    os.replace(tmp_path, path)
+    return path
+
+
+def write_snapshot(path: Path, data: Mapping[str, Any]) -> Path:
+    """Write ``data`` as a snapshot with one section per top-level key.
+
+    Raises:
+        TypeError: If a value is not JSON serialisable
+        OSError: If the file cannot be written
+    """
+    return _write_blobs(path, [(name, *_encode_section(value)) for name, value in data.items()])
+
+
+def is_snapshot(path: Path) -> bool:
+    """Whether ``path`` starts with the snapshot magic bytes."""
+    try:
+        with path.open("rb") as handle:
+            return handle.read(len(SNAPSHOT_MAGIC)) == SNAPSHOT_MAGIC
+    except OSError:
+        return False
+
+
+class MetricsSnapshotFile:
+    """Lazy reader for a snapshot file.
+
+    Only the header and index are read on construction; sections are read
+    and decoded on first access and then kept.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._cache: Dict[str, Any] = {}
+        with path.open("rb") as handle:
+            header = handle.read(_HEADER.size)
+            if len(header) != _HEADER.size:
+                raise SnapshotFormatError(f"{path} is too short to be a metrics snapshot")
+            magic, version, index_length = _HEADER.unpack(header)
+            if magic != SNAPSHOT_MAGIC:
+                raise SnapshotFormatError(f"{path} is not a metrics snapshot")
+            if version != SNAPSHOT_VERSION:
+                raise SnapshotFormatError(f"Unsupported metrics snapshot version {version} in {path}")
+            try:
+                self._index: Dict[str, List[Any]] = json.loads(handle.read(index_length).decode("utf-8"))
+            except (UnicodeDecodeError, json.JSONDecodeError) as exc:
+                raise SnapshotFormatError(f"Corrupt metrics snapshot index in {path}: {exc}") from exc
+        self._data_offset = _HEADER.size + index_length
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._index
+
+    def sections(self) -> List[str]:
+        """Names of the stored sections in write order."""
+        return list(self._index)
+
+    def _read_blob(self, name: str) -> Tuple[bytes, str]:
+        offset, length, codec = self._index[name]
+        with self.path.open("rb") as handle:
+            handle.seek(self._data_offset + offset)
+            blob = handle.read(length)
+        if len(blob) != length:
+            raise SnapshotFormatError(f"Truncated section {name!r} in {self.path}")
+        return blob, codec
+
+    def section(self, name: str, default: Any = None) -> Any:
+        """Decode a single section, or return ``default`` when it is absent."""
+        if name not in self._index:
+            return default
+        if name not in self._cache:
+            self._cache[name] = _decode_section(*self._read_blob(name))
+        return self._cache[name]
+
+    def load(self) -> Dict[str, Any]:
+        """Decode every section into a plain dictionary."""
+        return {name: self.section(name) for name in self._index}
+
+    def iter_raw(self) -> Iterator[Tuple[str, bytes, str]]:
+        """Yield ``(name, encoded bytes, codec)`` without decoding sections."""
+        for name in self._index:
+            yield (name, *self._read_blob(name))
+
+
+def update_snapshot(path: Path, updates: Mapping[str, Any]) -> Path:
+    """Replace or add sections, copying the untouched ones without decoding them.
+
+    Creates the snapshot when ``path`` does not exist yet.
+    """
+    blobs: List[Tuple[str, bytes, str]] = []
+    if path.exists():
+        blobs = [raw for raw in MetricsSnapshotFile(path).iter_raw() if raw[0] not in updates]
+    blobs.extend((name, *_encode_section(value)) for name, value in updates.items())
+    return _write_blobs(path, blobs)
+
+
+def read_metrics(path: Path, section: Optional[str] = None, default: Any = None) -> Any:
+    """Read a snapshot or a legacy JSON metrics file.
+
+    Args:
+        path: Snapshot (``.gfms``) or JSON metrics file
+        section: Top-level key to return instead of the whole payload
+        default: Returned when ``section`` is missing
+
+    Raises:
+        OSError: If the file cannot be read
+        ValueError: If the file is neither a snapshot nor valid JSON
+    """
+    if is_snapshot(path):
+        snapshot = MetricsSnapshotFile(path)
+        return snapshot.load() if section is None else snapshot.section(section, default)
+
+    with path.open("r", encoding="utf-8") as handle:
+        data = json.load(handle)
+    return data if section is None else data.get(section, default)
+
+
+def export_json(path: Path, destination: Path, indent: Optional[int] = 2) -> Path:
+    """Export a snapshot (or JSON metrics file) as human-readable JSON."""
+    data = read_metrics(path)
+    FileSystemManager.ensure_parent_directory(destination)
+    destination.write_text(json.dumps(data, indent=indent, ensure_ascii=False), encoding="utf-8")
+    return destination
+
+
+__all__ = [
+    "MetricsSnapshotFile",
+    "SNAPSHOT_SUFFIX",
+    "SNAPSHOT_VERSION",
+    "SnapshotFormatError",
+    "export_json",
+    "is_snapshot",
+    "read_metrics",
+    "update_snapshot",
+    "write_snapshot",
+]
@@ -0,0 +1,313 @@
+"""Dependency-aware task scheduler that runs the critical path first.
+
+Tasks declare the tasks whose results they consume. A task starts as soon
+as its dependencies finished, and among ready tasks the one with the longest
+estimated path to the end of the graph runs first, so the slowest chain of
+work starts early and the total wall time approaches the critical path.
+"""
+
+from __future__ import annotations
+
+import heapq
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from .tracing import traced_task
+
+
+class DependencyFailedError(RuntimeError):
+    """Recorded for a task that did not run because a dependency failed."""
+
+    def __init__(self, key: str, dependency: str) -> None:
+        super().__init__(f"Skipped {key}: dependency {dependency} failed")
+        self.key = key
+        self.dependency = dependency
+
+
+@dataclass(slots=True)
+class GraphTask:
+    """A unit of work; ``func`` receives the results of ``deps`` in order."""
+
+    key: str
+    func: Callable[..., Any]
+    deps: Tuple[str, ...] = ()
+    cost: float = 1.0  # Relative duration estimate used for prioritisation
+    label: str = ""
+    group: Optional[str] = None  # Tasks in a group share a concurrency limit
+    timeout: Optional[float] = None
+
+
+@dataclass(slots=True)
+class TaskGraphRun:
+    """Outcome of :meth:`TaskGraph.run`."""
+
+    results: Dict[str, Any] = field(default_factory=dict)
+    errors: Dict[str, BaseException] = field(default_factory=dict)
+    durations: Dict[str, float] = field(default_factory=dict)
+    elapsed: float = 0.0
+
+    def ok(self, key: str) -> bool:
+        return key in self.results
+
+
+class TaskGraph:
+    """Directed acyclic graph of tasks executed on a thread pool.
+
+    Example:
+        >>> graph = TaskGraph()
+        >>> graph.add("user", fetch_user)
+        >>> graph.add("prs", lambda user: list_prs(user), deps=["user"], cost=5)
+        >>> run = graph.run(max_workers=4)
+        >>> run.results["prs"]
+    """
+
+    def __init__(self) -> None:
+        self._tasks: Dict[str, GraphTask] = {}
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._tasks
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    def add(
+        self,
+        key: str,
+        func: Callable[..., Any],
+        *,
+        deps: Sequence[str] = (),
+        cost: float = 1.0,
+        label: Optional[str] = None,
+        group: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> str:
+        """Register a task and return its key.
+
+        Raises:
+            ValueError: If the key is already registered
+        """
+        if key in self._tasks:
+            raise ValueError(f"Duplicate task key: {key}")
+        self._tasks[key] = GraphTask(
+            key=key,
+            func=func,
+            deps=tuple(deps),
+            cost=max(0.0, cost),
+            label=label or key,
+            group=group,
+            timeout=timeout,
+        )
+        return key
+
+    def _dependents(self) -> Dict[str, List[str]]:
+        dependents: Dict[str, List[str]] = {key: [] for key in self._tasks}
+        for task in self._tasks.values():
+            for dep in task.deps:
+                if dep not in self._tasks:
+                    raise ValueError(f"Task {task.key} depends on unknown task {dep}")
+                dependents[dep].append(task.key)
+        return dependents
+
+    def _topological_order(self, dependents: Mapping[str, List[str]]) -> List[str]:
+        indegree = {key: len(task.deps) for key, task in self._tasks.items()}
+        order = [key for key, count in indegree.items() if count == 0]
+        for key in order:  # The list grows while iterating (Kahn's algorithm)
+            for dependent in dependents[key]:
+                indegree[dependent] -= 1
+                if indegree[dependent] == 0:
+                    order.append(dependent)
+        if len(order) != len(self._tasks):
+            cyclic = sorted(key for key, count in indegree.items() if count > 0)
+            raise ValueError(f"Task graph has a cycle through: {', '.join(cyclic)}")
+        return order
+
+    def priorities(self) -> Dict[str, float]:
+        """Estimated cost of the longest path from each task to the end of the graph.
+
+        Raises:
+            ValueError: On unknown dependencies or cycles
+        """
+        dependents = self._dependents()
+        ranks: Dict[str, float] = {}
+        for key in reversed(self._topological_order(dependents)):
+            ranks[key] = self._tasks[key].cost + max(
+                (ranks[dependent] for dependent in dependents[key]), default=0.0
+            )
+        return ranks
+
+    def critical_path(self) -> List[str]:
+        """Keys on the longest estimated chain of dependent tasks."""
+        ranks = self.priorities()
+        dependents = self._dependents()
+        path: List[str] = []
+        candidates = [key for key, task in self._tasks.items() if not task.deps]
+        while candidates:
+            key = max(candidates, key=lambda k: ranks[k])
+            path.append(key)
+            candidates = dependents[key]
+        return path
+
+    def run(
+        self,
+        max_workers: int,
+        *,
+        group_limits: Optional[Mapping[str, int]] = None,
+        on_done: Optional[Callable[[GraphTask, Optional[BaseException]], None]] = None,
+    ) -> TaskGraphRun:
+        """Execute every task, critical path first.
+
+        A failing task does not stop the graph; its dependents are recorded
+        as :class:`DependencyFailedError` and everything else keeps running.
+        A task exceeding its ``timeout`` is recorded as :class:`TimeoutError`
+        and no longer waited for, though its thread cannot be interrupted;
+        that thread keeps its group slot until it returns. Tasks left waiting
+        only for such slots fail with :class:`TimeoutError` if the thread has
+        not returned within another ``timeout``.
+
+        Args:
+            max_workers: Maximum number of tasks running at once
+            group_limits: Maximum concurrently running tasks per group
+            on_done: Called on the scheduling thread after each task finishes,
+                fails or is skipped
+
+        Raises:
+            ValueError: On unknown dependencies or cycles
+        """
+        ranks = self.priorities()
+        dependents = self._dependents()
+        limits = {group: max(1, limit) for group, limit in (group_limits or {}).items()}
+        pending = {key: len(task.deps) for key, task in self._tasks.items()}
+        outcome = TaskGraphRun()
+        started = time.monotonic()
+
+        sequence = {key: index for index, key in enumerate(self._tasks)}
+        ready: List[Tuple[float, int, str]] = []
+
+        def push(key: str) -> None:
+            heapq.heappush(ready, (-ranks[key], sequence[key], key))
+
+        for key, count in pending.items():
+            if count == 0:
+                push(key)
+
+        running: Dict[Future, Tuple[str, float]] = {}
+        # Timed out tasks keep their group slot until their thread really ends
+        orphaned: Dict[Future, str] = {}
+        group_running: Dict[str, int] = {}
+
+        def release(key: str) -> None:
+            group = self._tasks[key].group
+            if group is not None:
+                group_running[group] -= 1
+
+        def settle(key: str, error: Optional[BaseException]) -> None:
+            task = self._tasks[key]
+            if error is None:
+                for dependent in dependents[key]:
+                    pending[dependent] -= 1
+                    if pending[dependent] == 0:
+                        push(dependent)
+            else:
+                outcome.errors[key] = error
+            if on_done is not None:
+                on_done(task, error)
+            if error is not None:
+                skip(key)
+
+        def skip(failed: str) -> None:
+            stack = list(dependents[failed])
+            while stack:
+                dependent = stack.pop()
+                if dependent in outcome.errors:
+                    continue
+                outcome.errors[dependent] = DependencyFailedError(dependent, failed)
+                pending[dependent] = -1  # Never becomes ready
+                if on_done is not None:
+                    on_done(self._tasks[dependent], outcome.errors[dependent])
+                stack.extend(dependents[dependent])
+
+        executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="task-graph")
+        finished = abandoned = False
+        try:
+            while ready or running:
+                deferred: List[Tuple[float, int, str]] = []
+                while ready and len(running) < max_workers:
+                    entry = heapq.heappop(ready)
+                    task = self._tasks[entry[2]]
+                    if task.group is not None and group_running.get(task.group, 0) >= limits.get(
+                        task.group, max_workers
+                    ):
+                        deferred.append(entry)
+                        continue
+                    if task.group is not None:
+                        group_running[task.group] = group_running.get(task.group, 0) + 1
+                    args = [outcome.results[dep] for dep in task.deps]
+                    running[executor.submit(traced_task(task.func, task.key), *args)] = (task.key, time.monotonic())
+                for entry in deferred:
+                    heapq.heappush(ready, entry)
+
+                if not running:
+                    if not (ready and orphaned):
+                        break
+                    # Only tasks waiting for slots held by timed out tasks remain: give
+                    # those another timeout's worth of time, then fail the waiters
+                    grace = max(self._tasks[key].timeout or 0.0 for key in orphaned.values())
+                    done, _ = wait(list(orphaned), timeout=grace, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        release(orphaned.pop(future))
+                    if not done:
+                        while ready:
+                            key = heapq.heappop(ready)[2]
+                            settle(key, TimeoutError(
+                                f"{self._tasks[key].label} waited {grace}s for a slot held by a timed out task"
+                            ))
+                    continue
+
+                now = time.monotonic()
+                deadlines = [
+                    start + self._tasks[key].timeout - now
+                    for key, start in running.values()
+                    if self._tasks[key].timeout is not None
+                ]
+                done, _ = wait(
+                    [*running, *orphaned],
+                    timeout=max(0.0, min(deadlines)) if deadlines else None,
+                    return_when=FIRST_COMPLETED,
+                )
+
+                now = time.monotonic()
+                for future in done:
+                    if future in orphaned:
+                        release(orphaned.pop(future))  # Result was already reported as a timeout
+                        continue
+                    key, start = running.pop(future)
+                    release(key)
+                    outcome.durations[key] = now - start
+                    try:
+                        outcome.results[key] = future.result()
+                    except Exception as exc:
+                        settle(key, exc)
+                    else:
+                        settle(key, None)
+
+                for future, (key, start) in list(running.items()):
+                    timeout = self._tasks[key].timeout
+                    if timeout is not None and now - start >= timeout:
+                        del running[future]
+                        if self._tasks[key].group is not None:
+                            orphaned[future] = key
+                        abandoned = True
+                        outcome.durations[key] = now - start
+                        settle(key, TimeoutError(f"{self._tasks[key].label} timed out after {timeout}s"))
+            finished = True
+        finally:
+            # Do not block on threads of timed out tasks or after an interrupt
+            executor.shutdown(wait=finished and not abandoned, cancel_futures=True)
+
+        outcome.elapsed = time.monotonic() - started
+        return outcome
+
+
+__all__ = ["DependencyFailedError", "GraphTask", "TaskGraph", "TaskGraphRun"]
@@ -0,0 +1,341 @@
+"""Opt-in span tracing and multi-threaded profiling for the analysis pipeline.
+
+Spans are recorded as Chrome trace "complete" events with the recording
+thread's ID, so a saved trace opens in ``chrome://tracing`` or Perfetto
+with one track per worker thread. Nesting follows from timestamps: a span
+opened inside another on the same thread is drawn beneath it.
+
+Tracing is off unless :func:`start_tracing` was called; :func:`span` then
+returns a shared no-op context manager, so instrumented code costs a single
+global lookup per call.
+
+Pipeline phases use :func:`phase`, which also takes a memory snapshot
+while :mod:`.memory` profiling is on.
+
+Example:
+    >>> tracer = start_tracing()
+    >>> with span("Phase 1", "phase"):
+    ...     collector.collect(repo, months)
+    >>> stop_tracing().save(Path("trace.json"))
+"""
+
+from __future__ import annotations
+
+import cProfile
+import functools
+import io
+import json
+import os
+import pstats
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, TypeVar
+
+from .memory import memory_phase, start_memory_profiling, stop_memory_profiling
+from .utils import FileSystemManager
+
+F = TypeVar("F", bound=Callable[..., Any])
+T = TypeVar("T")
+
+
+class _NullSpan:
+    """Span used while tracing is disabled."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> _NullSpan:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        return None
+
+    def set(self, **args: Any) -> None:
+        """Ignore span arguments."""
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Span:
+    """An open span; arguments can be added until it closes."""
+
+    __slots__ = ("_tracer", "name", "category", "args", "_start")
+
+    def __init__(self, tracer: Tracer, name: str, category: str, args: Dict[str, Any]) -> None:
+        self._tracer = tracer
+        self.name = name
+        self.category = category
+        self.args = args
+        self._start = 0
+
+    def __enter__(self) -> Span:
+        self._start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, traceback: Any) -> None:
+        if exc_type is not None:
+            self.args["error"] = exc_type.__name__
+        self._tracer.record(self.name, self.category, self._start, time.perf_counter_ns(), self.args)
+
+    def set(self, **args: Any) -> None:
+        """Attach arguments shown in the trace viewer's details pane."""
+        self.args.update(args)
+
+
+class Tracer:
+    """Thread-safe collector of Chrome trace events."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._events: List[Dict[str, Any]] = []
+        self._thread_names: Dict[int, str] = {}
+        self._origin_ns = time.perf_counter_ns()
+        self._pid = os.getpid()
+
+    def span(self, name: str, category: str = "", **args: Any) -> Span:
+        return Span(self, name, category, args)
+
+    def record(
+        self, name: str, category: str, start_ns: int, end_ns: int, args: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Add a completed span measured with :func:`time.perf_counter_ns`."""
+        thread = threading.current_thread()
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": (start_ns - self._origin_ns) / 1000,
+            "dur": (end_ns - start_ns) / 1000,
+            "pid": self._pid,
+            "tid": thread.ident,
+        }
+        if args:
+            event["args"] = {key: _json_safe(value) for key, value in args.items()}
+        with self._lock:
+            self._events.append(event)
+            self._thread_names.setdefault(thread.ident or 0, thread.name)
+
+    @property
+    def events(self) -> List[Dict[str, Any]]:
+        """Recorded span events, oldest first."""
+        with self._lock:
+            return list(self._events)
+
+    def to_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            metadata = [
+                {"name": "thread_name", "ph": "M", "pid": self._pid, "tid": tid, "args": {"name": name}}
+                for tid, name in self._thread_names.items()
+            ]
+            events = sorted(self._events, key=lambda event: event["ts"])
+        return {"traceEvents": metadata + events, "displayTimeUnit": "ms"}
+
+    def save(self, path: Path) -> Path:
+        """Write the trace as Chrome trace JSON."""
+        FileSystemManager.ensure_parent_directory(path)
+        path.write_text(json.dumps(self.to_dict()), encoding="utf-8")
+        return path
+
+
+def _json_safe(value: Any) -> Any:
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    return str(value)
+
+
+_tracer: Optional[Tracer] = None
+
+
+def start_tracing() -> Tracer:
+    """Start recording spans process-wide and return the tracer."""
+    global _tracer
+    _tracer = Tracer()
+    return _tracer
+
+
+def stop_tracing() -> Optional[Tracer]:
+    """Stop recording spans and return the tracer that was active."""
+    global _tracer
+    tracer, _tracer = _tracer, None
+    return tracer
+
+
+def get_tracer() -> Optional[Tracer]:
+    """Return the active tracer, or None when tracing is off."""
+    return _tracer
+
+
+def span(name: str, category: str = "", **args: Any) -> Span | _NullSpan:
+    """Open a span on the active tracer (a no-op when tracing is off)."""
+    tracer = _tracer
+    if tracer is None:
+        return _NULL_SPAN
+    return tracer.span(name, category, **args)
+
+
+def traced(name: Optional[str] = None, category: str = "") -> Callable[[F], F]:
+    """Decorate a function so each call is recorded as a span."""
+
+    def decorate(func: F) -> F:
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            tracer = _tracer
+            if tracer is None:
+                return func(*args, **kwargs)
+            with tracer.span(span_name, category):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorate
+
+
+@contextmanager
+def phase(name: str) -> Iterator[None]:
+    """Mark a pipeline phase as a span and, when profiling, a memory phase.
+
+    Works as a context manager or, like any generator-based context
+    manager, as a function decorator.
+    """
+    with span(name, "phase"), memory_phase(name):
+        yield
+
+
+def trace_methods(category: str) -> Callable[[type], type]:
+    """Class decorator tracing every public method defined on the class."""
+
+    def decorate(cls: type) -> type:
+        for attr, value in list(vars(cls).items()):
+            if attr.startswith("_") or not callable(value) or isinstance(value, (staticmethod, classmethod, type)):
+                continue
+            setattr(cls, attr, traced(f"{cls.__name__}.{attr}", category)(value))
+        return cls
+
+    return decorate
+
+
+def traced_task(func: Callable[..., T], name: str, category: str = "task") -> Callable[..., T]:
+    """Wrap a callable submitted to a thread pool.
+
+    The span covers the run on the worker thread; ``queued_ms`` records how
+    long the task waited for a free worker, which exposes starved pools.
+    Returns ``func`` unchanged when tracing is off.
+    """
+    if _tracer is None:
+        return func
+    submitted_ns = time.perf_counter_ns()
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> T:
+        with span(name, category) as task_span:
+            task_span.set(queued_ms=round((time.perf_counter_ns() - submitted_ns) / 1e6, 3))
+            return func(*args, **kwargs)
+
+    return wrapper
+
+
+class ThreadedProfiler:
+    """cProfile across the calling thread and every thread started meanwhile.
+
+    Before Python 3.12 ``cProfile`` only observes the thread that enabled
+    it, which misses the collectors and reviewers running in thread pools.
+    A profiler is then started on each new thread through
+    :func:`threading.setprofile` and all of them are merged into one
+    :class:`pstats.Stats` at the end. From 3.12 a single profiler already
+    sees every thread.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._profiles: List[cProfile.Profile] = []
+
+    def _start_thread_profile(self, *_: Any) -> None:
+        profile = cProfile.Profile()
+        with self._lock:
+            self._profiles.append(profile)
+        profile.enable()  # Replaces this bootstrap hook on the new thread
+
+    def start(self) -> ThreadedProfiler:
+        if sys.version_info < (3, 12):
+            threading.setprofile(self._start_thread_profile)
+        self._start_thread_profile()
+        return self
+
+    def stop(self) -> pstats.Stats:
+        if sys.version_info < (3, 12):
+            threading.setprofile(None)  # type: ignore[arg-type]
+        with self._lock:
+            profiles = list(self._profiles)
+        for profile in profiles:
+            profile.disable()
+        stats = pstats.Stats(profiles[0], stream=io.StringIO())
+        for profile in profiles[1:]:
+            stats.add(profile)
+        return stats
+
+
+def format_top_functions(stats: pstats.Stats, limit: int = 25, sort: str = "cumulative") -> str:
+    """Render the ``limit`` most expensive functions as pstats text."""
+    stream = io.StringIO()
+    stats.stream = stream  # type: ignore[attr-defined]
+    stats.sort_stats(sort).print_stats(limit)
+    return stream.getvalue()
+
+
+@contextmanager
+def instrument(
+    trace_path: Optional[Path] = None,
+    profile_path: Optional[Path] = None,
+    memory_path: Optional[Path] = None,
+) -> Iterator[None]:
+    """Trace and/or profile the enclosed block, writing results on exit.
+
+    Args:
+        trace_path: Where to write Chrome trace JSON (None disables tracing)
+        profile_path: Where to write cProfile stats, loadable by
+            :mod:`pstats` or snakeviz (None disables profiling)
+        memory_path: Where to write the per-phase tracemalloc report as
+            JSON (None disables memory profiling)
+    """
+    profiler = ThreadedProfiler().start() if profile_path else None
+    if trace_path:
+        start_tracing()
+    if memory_path:
+        start_memory_profiling()
+    try:
+        yield
+    finally:
+        if memory_path:
+            report = stop_memory_profiling()
+            if report is not None:
+                report.save(memory_path)
+        if trace_path:
+            tracer = stop_tracing()
+            if tracer is not None:
+                tracer.save(trace_path)
+        if profiler is not None and profile_path:
+            stats = profiler.stop()
+            FileSystemManager.ensure_parent_directory(profile_path)
+            stats.dump_stats(str(profile_path))
+
+
+__all__ = [
+    "Span",
+    "ThreadedProfiler",
+    "Tracer",
+    "format_top_functions",
+    "get_tracer",
+    "instrument",
+    "phase",
+    "span",
+    "start_tracing",
+    "stop_tracing",
+    "trace_methods",
+    "traced",
+    "traced_task",
+]
@@ -1,15 +1,115 @@
 """차트 렌더링 메소드."""
 from __future__ import annotations
 
-from typing import Any, Dict, List
+import functools
+import hashlib
+import math
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Sequence, Tuple
 
 from ..constants import COLOR_PALETTE
 
+# 동일한 차트를 다시 렌더링하지 않도록 보관하는 최대 항목 수
+CHART_CACHE_SIZE = 256
+
+# 문서 안의 모든 차트가 공유하는 컨테이너/제목 스타일
+_CARD_STYLE = (
+    '<div style="border: 2px solid ' + COLOR_PALETTE["gray_200"] + '; border-radius: 12px; padding: 24px; '
+    'margin: 16px 0; background: white; box-shadow: 0 4px 6px rgba(0,0,0,0.1);">'
+)
+_CARD_TITLE_STYLE = f'margin: 0 0 20px 0; color: {COLOR_PALETTE["gray_800"]}; font-size: 1.3em;'
+
+_chart_cache: "OrderedDict[str, Tuple[str, ...]]" = OrderedDict()
+_chart_cache_lock = threading.Lock()
+_chart_cache_stats = {"hits": 0, "misses": 0}
+
+
+def _cached_chart(render: Callable[..., List[str]]) -> Callable[..., List[str]]:
+    """차트 입력의 내용 해시로 렌더링 결과를 캐시하는 데코레이터.
+
+    같은 데이터로 여러 보고서(요약/통합)에서 그리는 차트는 한 번만 계산됩니다.
+    호출자는 항상 새 리스트를 받으므로 결과를 자유롭게 수정할 수 있습니다.
+    """
+
+    @functools.wraps(render)
+    def wrapper(*args: Any, **kwargs: Any) -> List[str]:
+        key = hashlib.sha256(
+            repr((render.__name__, args, sorted(kwargs.items()))).encode("utf-8")
+        ).hexdigest()
+        with _chart_cache_lock:
+            cached = _chart_cache.get(key)
+            if cached is not None:
+                _chart_cache.move_to_end(key)
+                _chart_cache_stats["hits"] += 1
+                return list(cached)
+            _chart_cache_stats["misses"] += 1
+
+        lines = render(*args, **kwargs)
+
+        with _chart_cache_lock:
+            _chart_cache[key] = tuple(lines)
+            while len(_chart_cache) > CHART_CACHE_SIZE:
+                _chart_cache.popitem(last=False)
+        return list(lines)
+
+    return wrapper
+
+
+@functools.lru_cache(maxsize=32)
+def _polar_unit_vectors(count: int) -> Tuple[Tuple[float, float], ...]:
+    """12시 방향부터 시계 방향으로 ``count``개 축의 (cos, sin) 값을 미리 계산."""
+    angle_step = 360 / count
+    angles = [(angle_step * i - 90) * 3.14159 / 180 for i in range(count)]
+    return tuple((math.cos(angle), math.sin(angle)) for angle in angles)
+
+
+def _scale_points(
+    values: Sequence[float], origin: float, extent: float, maximum: float
+) -> List[float]:
+    """값 목록을 한 번에 차트 좌표로 변환 (위쪽이 큰 값)."""
+    return [origin + extent - (value / maximum * extent) for value in values]
+
+
+# 레이더 차트 스탯 이름 매핑 (영문 -> 한글)
+_STAT_LABELS = {
+    "code_quality": "코드 품질",
+    "collaboration": "협업",
+    "problem_solving": "문제해결",
+    "productivity": "생산성",
+    "consistency": "일관성",
+    "growth": "성장"
+}
+
+# 레이더 차트 스탯 색상 매핑
+_STAT_COLORS = {
+    "code_quality": COLOR_PALETTE["stat_code_quality"],
+    "collaboration": COLOR_PALETTE["stat_collaboration"],
+    "problem_solving": COLOR_PALETTE["stat_problem_solving"],
+    "productivity": COLOR_PALETTE["stat_productivity"],
+    "consistency": COLOR_PALETTE["stat_consistency"],
+    "growth": COLOR_PALETTE["stat_growth"]
+}
+
 
 class ChartRenderer:
     """차트 스타일 렌더링 클래스."""
 
     @staticmethod
+    def cache_info() -> Dict[str, int]:
+        """차트 캐시 적중/미적중 횟수와 현재 크기."""
+        with _chart_cache_lock:
+            return {**_chart_cache_stats, "size": len(_chart_cache)}
+
+    @staticmethod
+    def clear_cache() -> None:
+        """차트 캐시와 통계를 초기화."""
+        with _chart_cache_lock:
+            _chart_cache.clear()
+            _chart_cache_stats.update(hits=0, misses=0)
+
+    @staticmethod
+    @_cached_chart
     def render_monthly_chart(
         monthly_data: List[Dict[str, Any]],
         title: str = "월별 활동 트렌드",
@@ -63,6 +163,7 @@ class ChartRenderer:
         return lines
 
     @staticmethod
+    @_cached_chart
     def render_line_chart(
         data_points: List[Dict[str, Any]],
         title: str = "추세 분석",
@@ -94,8 +195,8 @@ class ChartRenderer:
             max_value = 1
 
         # 차트 컨테이너
-        lines.append('<div style="border: 2px solid ' + COLOR_PALETTE["gray_200"] + '; border-radius: 12px; padding: 24px; margin: 16px 0; background: white; box-shadow: 0 4px 6px rgba(0,0,0,0.1);">')
-        lines.append(f'  <h4 style="margin: 0 0 20px 0; color: {COLOR_PALETTE["gray_800"]}; font-size: 1.3em;">{title}</h4>')
+        lines.append(_CARD_STYLE)
+        lines.append(f'  <h4 style="{_CARD_TITLE_STYLE}">{title}</h4>')
 
         # SVG 라인 차트
         width = 800
@@ -111,18 +212,14 @@ class ChartRenderer:
             y = padding + (chart_height / 4) * i
             lines.append(f'    <line x1="{padding}" y1="{y}" x2="{width - padding}" y2="{y}" stroke="{COLOR_PALETTE["gray_200"]}" stroke-width="1" stroke-dasharray="5,5"/>')
 
-        # 데이터 포인트 계산
+        # 데이터 포인트 좌표를 한 번에 계산
         num_points = len(data_points)
         x_step = chart_width / (num_points - 1) if num_points > 1 else 0
+        xs = [padding + idx * x_step for idx in range(num_points)]
+        ys = _scale_points([item.get(y_key, 0) for item in data_points], padding, chart_height, max_value)
 
         # 라인 패스 생성
-        path_points = []
-        for idx, item in enumerate(data_points):
-            value = item.get(y_key, 0)
-            x = padding + idx * x_step
-            y = padding + chart_height - (value / max_value * chart_height)
-            path_points.append(f"{x},{y}")
-
+        path_points = [f"{x},{y}" for x, y in zip(xs, ys)]
         path_d = "M " + " L ".join(path_points)
 
         # 그라데이션 영역
@@ -132,26 +229,24 @@ class ChartRenderer:
         ]
         area_d = "M " + " L ".join(area_points) + " Z"
 
-        # 그라데이션 정의
+        # 그라데이션 정의 (색상별 id로 한 문서 안의 여러 차트가 공유)
+        gradient_id = "lineGradient-" + "".join(ch for ch in line_color if ch.isalnum())
         lines.append(f'    <defs>')
-        lines.append(f'      <linearGradient id="lineGradient" x1="0%" y1="0%" x2="0%" y2="100%">')
+        lines.append(f'      <linearGradient id="{gradient_id}" x1="0%" y1="0%" x2="0%" y2="100%">')
         lines.append(f'        <stop offset="0%" style="stop-color:{line_color};stop-opacity:0.3" />')
         lines.append(f'        <stop offset="100%" style="stop-color:{line_color};stop-opacity:0.05" />')
         lines.append(f'      </linearGradient>')
         lines.append(f'    </defs>')
 
         # 영역 채우기
-        lines.append(f'    <path d="{area_d}" fill="url(#lineGradient)"/>')
+        lines.append(f'    <path d="{area_d}" fill="url(#{gradient_id})"/>')
 
         # 라인 그리기
         lines.append(f'    <path d="{path_d}" fill="none" stroke="{line_color}" stroke-width="3" stroke-linecap="round" stroke-linejoin="round"/>')
 
         # 데이터 포인트 및 레이블
-        for idx, item in enumerate(data_points):
-            value = item.get(y_key, 0)
+        for item, x, y in zip(data_points, xs, ys):
             label = item.get(x_key, "")
-            x = padding + idx * x_step
-            y = padding + chart_height - (value / max_value * chart_height)
 
             # 포인트
             lines.append(f'    <circle cx="{x}" cy="{y}" r="5" fill="white" stroke="{line_color}" stroke-width="3"/>')
@@ -166,6 +261,7 @@ class ChartRenderer:
         return lines
 
     @staticmethod
+    @_cached_chart
     def render_donut_chart(
         segments: List[Dict[str, Any]],
         title: str = "분포 현황",
@@ -196,8 +292,8 @@ class ChartRenderer:
             return []
 
         # 차트 컨테이너
-        lines.append('<div style="border: 2px solid ' + COLOR_PALETTE["gray_200"] + '; border-radius: 12px; padding: 24px; margin: 16px 0; background: white; box-shadow: 0 4px 6px rgba(0,0,0,0.1);">')
-        lines.append(f'  <h4 style="margin: 0 0 20px 0; color: {COLOR_PALETTE["gray_800"]}; font-size: 1.3em;">{title}</h4>')
+        lines.append(_CARD_STYLE)
+        lines.append(f'  <h4 style="{_CARD_TITLE_STYLE}">{title}</h4>')
         lines.append('  <div style="display: flex; align-items: center; justify-content: space-around; flex-wrap: wrap;">')
 
         # SVG 도넛 차트
@@ -208,31 +304,29 @@ class ChartRenderer:
 
         lines.append(f'    <svg width="{size}" height="{size}" viewBox="0 0 {size} {size}">')
 
-        # 세그먼트 그리기
-        current_angle = -90  # 12시 방향부터 시작
+        # 세그먼트별 시작/끝 각도를 한 번에 계산 (12시 방향부터 시작)
+        values = [seg.get(value_key, 0) for seg in segments]
+        sweeps = [(value / total) * 360 for value in values]
+        starts = [-90.0]
+        for sweep in sweeps[:-1]:
+            starts.append(starts[-1] + sweep)
 
-        for seg in segments:
-            value = seg.get(value_key, 0)
+        for seg, value, start, angle in zip(segments, values, starts, sweeps):
             percentage = (value / total) * 100
-            angle = (value / total) * 360
 
             # 색상 (기본값 사용)
             seg_color = seg.get(color_key, COLOR_PALETTE["primary"])
 
             # 시작 각도와 끝 각도 계산 (라디안)
-            start_angle_rad = current_angle * 3.14159 / 180
-            end_angle_rad = (current_angle + angle) * 3.14159 / 180
+            start_cos, start_sin = math.cos(start * 3.14159 / 180), math.sin(start * 3.14159 / 180)
+            end_rad = (start + angle) * 3.14159 / 180
+            end_cos, end_sin = math.cos(end_rad), math.sin(end_rad)
 
             # 호의 좌표 계산
-            x1 = center + radius * __import__('math').cos(start_angle_rad)
-            y1 = center + radius * __import__('math').sin(start_angle_rad)
-            x2 = center + radius * __import__('math').cos(end_angle_rad)
-            y2 = center + radius * __import__('math').sin(end_angle_rad)
-
-            x3 = center + inner_radius * __import__('math').cos(end_angle_rad)
-            y3 = center + inner_radius * __import__('math').sin(end_angle_rad)
-            x4 = center + inner_radius * __import__('math').cos(start_angle_rad)
-            y4 = center + inner_radius * __import__('math').sin(start_angle_rad)
+            x1, y1 = center + radius * start_cos, center + radius * start_sin
+            x2, y2 = center + radius * end_cos, center + radius * end_sin
+            x3, y3 = center + inner_radius * end_cos, center + inner_radius * end_sin
+            x4, y4 = center + inner_radius * start_cos, center + inner_radius * start_sin
 
             # 큰 호 플래그
             large_arc = 1 if angle > 180 else 0
@@ -244,8 +338,6 @@ class ChartRenderer:
             lines.append(f'        <title>{seg.get(label_key, "")}: {percentage:.1f}%</title>')
             lines.append(f'      </path>')
 
-            current_angle += angle
-
         # 중앙 텍스트
         lines.append(f'      <text x="{center}" y="{center - 10}" text-anchor="middle" fill="{COLOR_PALETTE["gray_800"]}" font-size="24" font-weight="bold">{total}</text>')
         lines.append(f'      <text x="{center}" y="{center + 15}" text-anchor="middle" fill="{COLOR_PALETTE["gray_600"]}" font-size="14">Total</text>')
@@ -276,6 +368,7 @@ class ChartRenderer:
         return lines
 
     @staticmethod
+    @_cached_chart
     def render_radar_chart(
         stats: Dict[str, int],
         title: str = "능력치 레이더",
@@ -296,29 +389,9 @@ class ChartRenderer:
 
         lines = []
 
-        # 스탯 이름 매핑 (영문 -> 한글)
-        stat_labels = {
-            "code_quality": "코드 품질",
-            "collaboration": "협업",
-            "problem_solving": "문제해결",
-            "productivity": "생산성",
-            "consistency": "일관성",
-            "growth": "성장"
-        }
-
-        # 스탯 색상 매핑
-        stat_colors = {
-            "code_quality": COLOR_PALETTE["stat_code_quality"],
-            "collaboration": COLOR_PALETTE["stat_collaboration"],
-            "problem_solving": COLOR_PALETTE["stat_problem_solving"],
-            "productivity": COLOR_PALETTE["stat_productivity"],
-            "consistency": COLOR_PALETTE["stat_consistency"],
-            "growth": COLOR_PALETTE["stat_growth"]
-        }
-
         # 차트 컨테이너
-        lines.append('<div style="border: 2px solid ' + COLOR_PALETTE["gray_200"] + '; border-radius: 12px; padding: 24px; margin: 16px 0; background: white; box-shadow: 0 4px 6px rgba(0,0,0,0.1);">')
-        lines.append(f'  <h4 style="margin: 0 0 20px 0; color: {COLOR_PALETTE["gray_800"]}; font-size: 1.3em;">{title}</h4>')
+        lines.append(_CARD_STYLE)
+        lines.append(f'  <h4 style="{_CARD_TITLE_STYLE}">{title}</h4>')
         lines.append('  <div style="display: flex; align-items: center; justify-content: center; flex-wrap: wrap; gap: 40px;">')
 
         # SVG 레이더 차트
@@ -337,24 +410,27 @@ class ChartRenderer:
                 label_y = center - radius + 5
                 lines.append(f'      <text x="{center + 5}" y="{label_y}" fill="{COLOR_PALETTE["gray_400"]}" font-size="10">{i * 20}</text>')
 
-        # 스탯 축 그리기
+        # 스탯 축 방향과 값 좌표를 한 번에 계산
         stat_items = list(stats.items())
-        num_stats = len(stat_items)
-        angle_step = 360 / num_stats
+        directions = _polar_unit_vectors(len(stat_items))
+        label_radius = max_radius + 40
+        # 값을 0-100 범위로 정규화하여 반지름 계산
+        radii = [max_radius * (min(100, max(0, stat_value)) / 100) for _, stat_value in stat_items]
+        value_points = [
+            (center + radius * cos, center + radius * sin)
+            for radius, (cos, sin) in zip(radii, directions)
+        ]
 
         # 축선 및 레이블
-        for i, (stat_key, stat_value) in enumerate(stat_items):
-            angle = (angle_step * i - 90) * 3.14159 / 180  # -90도로 12시 방향 시작
-
+        for (stat_key, stat_value), (cos, sin) in zip(stat_items, directions):
             # 축선
-            end_x = center + max_radius * __import__('math').cos(angle)
-            end_y = center + max_radius * __import__('math').sin(angle)
+            end_x = center + max_radius * cos
+            end_y = center + max_radius * sin
             lines.append(f'      <line x1="{center}" y1="{center}" x2="{end_x}" y2="{end_y}" stroke="{COLOR_PALETTE["gray_300"]}" stroke-width="1"/>')
 
             # 레이블 위치 (축선 바깥)
-            label_radius = max_radius + 40
-            label_x = center + label_radius * __import__('math').cos(angle)
-            label_y = center + label_radius * __import__('math').sin(angle)
+            label_x = center + label_radius * cos
+            label_y = center + label_radius * sin
 
             # 레이블 정렬 조정
             text_anchor = "middle"
@@ -363,36 +439,19 @@ class ChartRenderer:
             elif label_x > center + 5:
                 text_anchor = "start"
 
-            stat_label = stat_labels.get(stat_key, stat_key)
-            stat_color = stat_colors.get(stat_key, COLOR_PALETTE["primary"])
+            stat_label = _STAT_LABELS.get(stat_key, stat_key)
+            stat_color = _STAT_COLORS.get(stat_key, COLOR_PALETTE["primary"])
 
             lines.append(f'      <text x="{label_x}" y="{label_y}" text-anchor="{text_anchor}" fill="{stat_color}" font-size="14" font-weight="600">{stat_label}</text>')
             lines.append(f'      <text x="{label_x}" y="{label_y + 14}" text-anchor="{text_anchor}" fill="{COLOR_PALETTE["gray_600"]}" font-size="11">({stat_value})</text>')
 
-        # 스탯 폴리곤 (실제 값)
-        polygon_points = []
-        for i, (stat_key, stat_value) in enumerate(stat_items):
-            angle = (angle_step * i - 90) * 3.14159 / 180
-            # 값을 0-100 범위로 정규화하여 반지름 계산
-            normalized_value = min(100, max(0, stat_value))
-            radius = max_radius * (normalized_value / 100)
-            point_x = center + radius * __import__('math').cos(angle)
-            point_y = center + radius * __import__('math').sin(angle)
-            polygon_points.append(f"{point_x},{point_y}")
-
         # 폴리곤 그리기
-        polygon_str = " ".join(polygon_points)
+        polygon_str = " ".join(f"{x},{y}" for x, y in value_points)
         lines.append(f'      <polygon points="{polygon_str}" fill="{COLOR_PALETTE["primary"]}" fill-opacity="0.3" stroke="{COLOR_PALETTE["primary"]}" stroke-width="2"/>')
 
         # 스탯 포인트 표시
-        for i, (stat_key, stat_value) in enumerate(stat_items):
-            angle = (angle_step * i - 90) * 3.14159 / 180
-            normalized_value = min(100, max(0, stat_value))
-            radius = max_radius * (normalized_value / 100)
-            point_x = center + radius * __import__('math').cos(angle)
-            point_y = center + radius * __import__('math').sin(angle)
-
-            stat_color = stat_colors.get(stat_key, COLOR_PALETTE["primary"])
+        for (stat_key, _), (point_x, point_y) in zip(stat_items, value_points):
+            stat_color = _STAT_COLORS.get(stat_key, COLOR_PALETTE["primary"])
             lines.append(f'      <circle cx="{point_x}" cy="{point_y}" r="5" fill="{stat_color}" stroke="white" stroke-width="2"/>')
 
         lines.append('    </svg>')
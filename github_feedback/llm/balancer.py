@@ -0,0 +1,267 @@
+"""Latency-aware load balancing and request hedging across LLM endpoints."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from dataclasses import dataclass, field
+from typing import Any, Iterable
+
+import requests
+
+from ..core.constants import LLM_DEFAULTS
+
+logger = logging.getLogger(__name__)
+
+# Responses with these status codes are treated as a lost race when hedging
+HEDGE_RETRYABLE_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
+
+
+@dataclass(slots=True)
+class EndpointStats:
+    """Observed health of a single OpenAI-compatible endpoint."""
+
+    url: str
+    outstanding: int = 0
+    requests: int = 0
+    failures: int = 0
+    consecutive_failures: int = 0
+    hedges_won: int = 0
+    ewma_latency: float = 0.0
+    last_failure: float = 0.0
+    latencies: deque[float] = field(
+        default_factory=lambda: deque(maxlen=LLM_DEFAULTS['latency_window'])
+    )
+
+    @property
+    def score(self) -> tuple[int, float, int]:
+        """Sort key for routing a new request; lower is better.
+
+        Endpoints that failed recently rank behind healthy ones until their
+        cooldown expires, then endpoints are ordered by expected wait.
+        Endpoints without observations have zero expected wait so each one is
+        probed before latency data drives the choice.
+        """
+        cooling_down = time.monotonic() - self.last_failure < LLM_DEFAULTS['endpoint_failure_cooldown']
+        failures = self.consecutive_failures if cooling_down else 0
+        expected_wait = (self.outstanding + 1) * self.ewma_latency
+        return failures, expected_wait, self.outstanding
+
+
+def _run_in_daemon_thread(fn: Any, *args: Any) -> Future:
+    """Run ``fn`` in a daemon thread and expose the result as a future.
+
+    Daemon threads are used so that a losing hedge still in flight never
+    delays interpreter shutdown.
+    """
+    future: Future = Future()
+
+    def runner() -> None:
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(fn(*args))
+        except BaseException as exc:  # pragma: no cover - propagated via future
+            future.set_exception(exc)
+
+    threading.Thread(target=runner, daemon=True).start()
+    return future
+
+
+def _close_response(future: Future) -> None:
+    """Release the connection held by a losing hedge."""
+    if future.exception() is None:
+        future.result().close()
+
+
+class EndpointPool:
+    """Thread-safe pool that balances and hedges chat-completion requests.
+
+    Each request is routed to the endpoint with the lowest expected wait,
+    estimated from an EWMA of its latency and the number of requests still
+    outstanding on it. Once enough latency samples exist, a request that has
+    not answered within the configured latency percentile is duplicated on a
+    second endpoint and whichever answers first wins.
+    """
+
+    def __init__(
+        self,
+        urls: Iterable[str],
+        hedge_percentile: float = LLM_DEFAULTS['hedge_percentile'],
+        hedge_min_samples: int = LLM_DEFAULTS['hedge_min_samples'],
+    ) -> None:
+        unique_urls = list(dict.fromkeys(url for url in urls if url))
+        if not unique_urls:
+            raise ValueError("EndpointPool requires at least one endpoint")
+
+        self._stats = {url: EndpointStats(url=url) for url in unique_urls}
+        self._lock = threading.Lock()
+        self.hedge_percentile = hedge_percentile
+        self.hedge_min_samples = hedge_min_samples
+        self.hedged_requests = 0
+
+    def __len__(self) -> int:
+        return len(self._stats)
+
+    @property
+    def urls(self) -> list[str]:
+        """Endpoint URLs in configuration order."""
+        return list(self._stats)
+
+    def select(self, exclude: Iterable[str] = ()) -> str:
+        """Pick the endpoint with the lowest expected wait.
+
+        Args:
+            exclude: Endpoints that must not be chosen (e.g. the hedged primary)
+
+        Returns:
+            Endpoint URL; falls back to the excluded set if nothing else is left
+        """
+        excluded = set(exclude)
+        with self._lock:
+            candidates = [s for s in self._stats.values() if s.url not in excluded]
+            if not candidates:
+                candidates = list(self._stats.values())
+            return min(candidates, key=lambda s: s.score).url
+
+    def hedge_delay(self) -> float | None:
+        """Return the latency percentile after which a request is hedged.
+
+        Returns:
+            Delay in seconds, or None while too few samples have been observed
+        """
+        if len(self._stats) < 2 or self.hedge_percentile <= 0:
+            return None
+
+        with self._lock:
+            samples = sorted(
+                latency for stats in self._stats.values() for latency in stats.latencies
+            )
+
+        if len(samples) < self.hedge_min_samples:
+            return None
+
+        index = min(len(samples) - 1, int(len(samples) * self.hedge_percentile))
+        return samples[index]
+
+    def _record(self, url: str, elapsed: float, success: bool) -> None:
+        """Update endpoint statistics after a request completes."""
+        alpha = LLM_DEFAULTS['latency_ewma_alpha']
+        with self._lock:
+            stats = self._stats[url]
+            stats.outstanding -= 1
+            stats.requests += 1
+            if success:
+                stats.consecutive_failures = 0
+                stats.latencies.append(elapsed)
+                if stats.ewma_latency == 0.0:
+                    stats.ewma_latency = elapsed
+                else:
+                    stats.ewma_latency = alpha * elapsed + (1 - alpha) * stats.ewma_latency
+            else:
+                stats.failures += 1
+                stats.consecutive_failures += 1
+                stats.last_failure = time.monotonic()
+
+    def _send(
+        self, url: str, payload: dict[str, Any], timeout: int, stream: bool = False
+    ) -> requests.Response:
+        """POST a payload to one endpoint while tracking its statistics.
+
+        For streamed requests the recorded latency is the time until response
+        headers arrive, which tracks time-to-first-token.
+        """
+        with self._lock:
+            self._stats[url].outstanding += 1
+
+        start = time.monotonic()
+        try:
+            if stream:
+                response = requests.post(url, json=payload, timeout=timeout, stream=True)
+            else:
+                response = requests.post(url, json=payload, timeout=timeout)
+        except Exception:
+            self._record(url, time.monotonic() - start, success=False)
+            raise
+
+        success = response.status_code not in HEDGE_RETRYABLE_STATUS_CODES
+        self._record(url, time.monotonic() - start, success=success)
+        return response
+
+    def post(
+        self, payload: dict[str, Any], timeout: int, stream: bool = False
+    ) -> requests.Response:
+        """Send a chat-completion request, hedging it when it runs slow.
+
+        Args:
+            payload: JSON request body
+            timeout: Per-request timeout in seconds
+            stream: Whether to leave the body unread for SSE streaming
+
+        Returns:
+            The first usable HTTP response
+
+        Raises:
+            requests.RequestException: If every attempted endpoint failed
+        """
+        primary = self.select()
+        delay = self.hedge_delay()
+        if delay is None:
+            return self._send(primary, payload, timeout, stream)
+
+        futures = {_run_in_daemon_thread(self._send, primary, payload, timeout, stream): primary}
+        done, _ = wait(futures, timeout=delay)
+        if not done:
+            backup = self.select(exclude={primary})
+            if backup != primary:
+                logger.debug(f"Hedging LLM request to {backup} after {delay:.2f}s")
+                with self._lock:
+                    self.hedged_requests += 1
+                futures[_run_in_daemon_thread(self._send, backup, payload, timeout, stream)] = backup
+
+        pending = set(futures)
+        fallback_response: requests.Response | None = None
+        last_error: BaseException | None = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                error = future.exception()
+                if error is not None:
+                    last_error = error
+                    continue
+                response = future.result()
+                if response.status_code in HEDGE_RETRYABLE_STATUS_CODES:
+                    fallback_response = response
+                    continue
+                if len(futures) > 1:
+                    with self._lock:
+                        self._stats[futures[future]].hedges_won += 1
+                    for other in futures:
+                        if other is not future:
+                            other.add_done_callback(_close_response)
+                return response
+
+        if fallback_response is not None:
+            return fallback_response
+        raise last_error  # type: ignore[misc]
+
+    def snapshot(self) -> list[dict[str, Any]]:
+        """Return a serialisable view of per-endpoint statistics."""
+        with self._lock:
+            return [
+                {
+                    "url": stats.url,
+                    "requests": stats.requests,
+                    "failures": stats.failures,
+                    "outstanding": stats.outstanding,
+                    "ewma_latency": round(stats.ewma_latency, 4),
+                    "hedges_won": stats.hedges_won,
+                }
+                for stats in self._stats.values()
+            ]
+
+
+__all__ = ["EndpointPool", "EndpointStats"]
@@ -2,19 +2,22 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 import time
 from concurrent.futures import ThreadPoolExecutor
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from itertools import islice
-from typing import Any
+from typing import Any, Callable
 
 import requests
 
 from ..core.console import Console
 from ..core.constants import HEURISTIC_THRESHOLDS, LLM_DEFAULTS, TEXT_LIMITS, THREAD_POOL_CONFIG
+from ..core.tracing import span, traced
 from ..hybrid_analysis import HybridAnalyzer
+from .balancer import EndpointPool
 from .cache import (
     DEFAULT_CACHE_EXPIRE_DAYS,
     get_cache_key,
@@ -28,6 +31,13 @@ from .heuristics import (
     ReviewToneAnalyzer,
 )
 from .metrics import LLMCallMetrics, get_global_collector
+from .prompt_packer import PromptPacker, estimate_tokens, truncate_to_tokens
+from .streaming import (
+    IncrementalJSONValidator,
+    batch_review_stream_validator,
+    read_streamed_completion,
+    review_stream_validator,
+)
 from .validation import LLMResponseValidator
 from ..core.models import PullRequestReviewBundle, ReviewPoint, ReviewSummary
 from ..prompts import (
@@ -37,13 +47,13 @@ from ..prompts import (
     get_commit_analysis_user_prompt,
     get_issue_quality_analysis_system_prompt,
     get_issue_quality_analysis_user_prompt,
+    get_pr_batch_review_system_prompt,
     get_pr_review_system_prompt,
     get_pr_title_analysis_system_prompt,
     get_pr_title_analysis_user_prompt,
     get_review_tone_analysis_system_prompt,
     get_review_tone_analysis_user_prompt,
 )
-from ..core.utils import limit_items, truncate_patch
 
 logger = logging.getLogger(__name__)
 console = Console()
@@ -118,9 +128,66 @@ class LLMClient:
     cache_expire_days: int = DEFAULT_CACHE_EXPIRE_DAYS
     rate_limit_delay: float = 0.0  # Delay between requests in seconds (0 = no limit)
     web_url: str = "https://github.com"  # GitHub web URL for generating links
+    endpoints: list[str] = field(default_factory=list)  # Extra endpoints to balance across
+    hedge_percentile: float = LLM_DEFAULTS['hedge_percentile']
+    stream: bool = False  # Stream responses via SSE and validate JSON incrementally
+    prompt_token_budget: int = LLM_DEFAULTS['prompt_token_budget']
+    _pool: EndpointPool | None = field(default=None, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Build the endpoint pool when more than one endpoint is configured."""
+        urls = [self.endpoint, *self.endpoints]
+        if len({url for url in urls if url}) > 1:
+            self._pool = EndpointPool(urls, hedge_percentile=self.hedge_percentile)
+
+    @property
+    def endpoint_count(self) -> int:
+        """Number of distinct endpoints requests are spread across."""
+        return len(self._pool) if self._pool else 1
+
+    def _post(
+        self, payload: dict[str, Any], timeout: int, stream: bool = False
+    ) -> requests.Response:
+        """POST a chat-completion payload, balancing and hedging across endpoints.
 
-    def _build_messages(self, bundle: PullRequestReviewBundle) -> list[dict[str, str]]:
-        """Create the prompt messages describing the pull request."""
+        Args:
+            payload: JSON request body
+            timeout: Request timeout in seconds
+            stream: Whether to leave the body unread for SSE streaming
+
+        Returns:
+            HTTP response from the endpoint that answered first
+        """
+        if self._pool is None:
+            if stream:
+                return requests.post(self.endpoint, json=payload, timeout=timeout, stream=True)
+            return requests.post(self.endpoint, json=payload, timeout=timeout)
+        return self._pool.post(payload, timeout, stream=stream)
+
+    def prompt_fingerprint(self) -> str:
+        """Hash of the review prompt templates and prompt packing settings.
+
+        Stored reviews produced under a different fingerprint are regenerated.
+        """
+        material = json.dumps(
+            {
+                "system": get_pr_review_system_prompt(),
+                "batch_system": get_pr_batch_review_system_prompt(),
+                "prompt_token_budget": self.prompt_token_budget,
+                "max_files_in_prompt": self.max_files_in_prompt,
+                "max_files_with_patch_snippets": self.max_files_with_patch_snippets,
+                "max_patch_lines_per_file": MAX_PATCH_LINES_PER_FILE,
+            },
+            sort_keys=True,
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()[:16]
+
+    def _build_review_prompt(self, bundle: PullRequestReviewBundle) -> str:
+        """Render the user prompt describing a single pull request."""
+
+        # Free-text sections may use at most this share of the token budget
+        text_budget = self.prompt_token_budget // 4
 
         summary_lines = [
             f"저장소: {bundle.repo}",
@@ -129,36 +196,50 @@ class LLMClient:
             f"변경 통계: +{bundle.additions} / -{bundle.deletions} ({bundle.changed_files}개 파일)",
             "",
             "Pull Request 본문:",
-            bundle.body or "<비어있음>",
+            truncate_to_tokens(bundle.body, text_budget) if bundle.body else "<비어있음>",
             "",
         ]
 
         if bundle.review_bodies:
             summary_lines.append("기존 리뷰:")
-            summary_lines.extend(f"- {body}" for body in bundle.review_bodies)
+            summary_lines.append(
+                truncate_to_tokens("\n".join(f"- {body}" for body in bundle.review_bodies), text_budget)
+            )
             summary_lines.append("")
 
         if bundle.review_comments:
             summary_lines.append("인라인 리뷰 코멘트:")
-            summary_lines.extend(f"- {comment}" for comment in bundle.review_comments[:LLM_DEFAULTS['sample_size_commits']])
+            summary_lines.append(
+                truncate_to_tokens(
+                    "\n".join(
+                        f"- {comment}"
+                        for comment in bundle.review_comments[:LLM_DEFAULTS['sample_size_commits']]
+                    ),
+                    text_budget,
+                )
+            )
             summary_lines.append("")
 
         summary_lines.append("변경된 파일:")
-        for index, file in enumerate(limit_items(bundle.files, self.max_files_in_prompt)):
-            summary_lines.append(
-                f"- {file.filename} ({file.status}, +{file.additions}/-{file.deletions}, 변경={file.changes})"
-            )
-            if (
-                index < self.max_files_with_patch_snippets
-                and file.patch
-                and (snippet := truncate_patch(file.patch, MAX_PATCH_LINES_PER_FILE))
-            ):
-                summary_lines.append("```diff")
-                summary_lines.append(snippet)
-                summary_lines.append("```")
+        packer = PromptPacker(
+            token_budget=self.prompt_token_budget,
+            max_files=self.max_files_in_prompt,
+            max_files_with_snippets=self.max_files_with_patch_snippets,
+            max_lines_per_file=MAX_PATCH_LINES_PER_FILE,
+        )
+        packed = packer.pack(bundle.files, used_tokens=estimate_tokens("\n".join(summary_lines)))
+        summary_lines.extend(packed.lines)
         summary_lines.append("")
+        logger.debug(
+            f"Packed PR #{bundle.number} prompt: ~{packed.estimated_tokens} tokens, "
+            f"{packed.included_hunks} hunks included, {packed.omitted_hunks} omitted, "
+            f"{sum(len(names) for names in packed.pruned_files.values())} files pruned"
+        )
 
-        prompt = "\n".join(summary_lines)
+        return "\n".join(summary_lines)
+
+    def _build_messages(self, bundle: PullRequestReviewBundle) -> list[dict[str, str]]:
+        """Create the prompt messages describing the pull request."""
 
         return [
             {
@@ -167,10 +248,72 @@ class LLMClient:
             },
             {
                 "role": "user",
-                "content": prompt,
+                "content": self._build_review_prompt(bundle),
             },
         ]
 
+    def _build_batch_messages(
+        self, bundles: list[PullRequestReviewBundle]
+    ) -> list[dict[str, str]]:
+        """Create the prompt messages reviewing several pull requests at once."""
+
+        sections = [
+            f"=== PR #{bundle.number} ===\n{self._build_review_prompt(bundle)}"
+            for bundle in bundles
+        ]
+        return [
+            {
+                "role": "system",
+                "content": get_pr_batch_review_system_prompt(),
+            },
+            {
+                "role": "user",
+                "content": "\n".join(sections),
+            },
+        ]
+
+    def plan_review_batches(
+        self, bundles: list[PullRequestReviewBundle], max_batch_size: int
+    ) -> list[list[PullRequestReviewBundle]]:
+        """Group small pull requests so that each group fits one prompt budget.
+
+        Only small pull requests (fewer changed lines than the ``pr_small``
+        heuristic threshold, with a rendered prompt under half of
+        ``prompt_token_budget``) are batched; larger ones are always reviewed
+        on their own. Small ones are packed greedily, in order, until either
+        the batch size or the token budget would be exceeded.
+
+        Args:
+            bundles: Pull requests to review
+            max_batch_size: Maximum number of pull requests per request
+
+        Returns:
+            Batches in review order; single-element batches use the regular prompt
+        """
+        if max_batch_size <= 1:
+            return [[bundle] for bundle in bundles]
+
+        batches: list[list[PullRequestReviewBundle]] = []
+        current: list[PullRequestReviewBundle] = []
+        current_tokens = 0
+        for bundle in bundles:
+            tokens = estimate_tokens(self._build_review_prompt(bundle))
+            small = bundle.additions + bundle.deletions < HEURISTIC_THRESHOLDS['pr_small']
+            if not small or tokens > self.prompt_token_budget // 2:
+                batches.append([bundle])
+                continue
+            if current and (
+                len(current) >= max_batch_size
+                or current_tokens + tokens > self.prompt_token_budget
+            ):
+                batches.append(current)
+                current, current_tokens = [], 0
+            current.append(bundle)
+            current_tokens += tokens
+        if current:
+            batches.append(current)
+        return batches
+
     def _analyze_with_config(
         self,
         data: list[dict[str, str]],
@@ -215,7 +358,7 @@ class LLMClient:
             ]
 
             # Call LLM
-            response = self.complete(messages)
+            response = self.complete(messages, operation=f"{data_formatter_type}_analysis")
 
             # Check for empty response
             if not response or not response.strip():
@@ -269,11 +412,56 @@ class LLMClient:
         if not content:
             raise ValueError("LLM response message has empty content")
 
+        return self._parse_review_content(content)
+
+    def _parse_review_content(self, content: str) -> ReviewSummary:
+        """Parse the JSON review object produced by the model."""
+
         try:
             raw = json.loads(content)
         except json.JSONDecodeError as exc:  # pragma: no cover - defensive fallback
             raise ValueError(f"LLM response was not valid JSON: {exc}") from exc
 
+        return self._summary_from_payload(raw)
+
+    def _parse_batch_content(
+        self, content: str, numbers: list[int]
+    ) -> dict[int, ReviewSummary]:
+        """Split a batched review response into per-PR summaries.
+
+        Entries for unknown PR numbers, duplicates and entries that fail
+        validation are dropped so the caller can review those PRs again.
+        """
+
+        try:
+            raw = json.loads(content)
+        except json.JSONDecodeError as exc:
+            raise ValueError(f"LLM response was not valid JSON: {exc}") from exc
+
+        reviews = raw.get("reviews") if isinstance(raw, dict) else None
+        if not isinstance(reviews, list):
+            raise ValueError("LLM batch response missing 'reviews' array")
+
+        expected = set(numbers)
+        summaries: dict[int, ReviewSummary] = {}
+        for item in reviews:
+            if not isinstance(item, dict):
+                continue
+            try:
+                number = int(item.get("number"))
+            except (TypeError, ValueError):
+                continue
+            if number not in expected or number in summaries:
+                continue
+            try:
+                summaries[number] = self._summary_from_payload(item)
+            except ValueError as exc:
+                logger.warning(f"Discarding batched review for PR #{number}: {exc}")
+        return summaries
+
+    def _summary_from_payload(self, raw: Any) -> ReviewSummary:
+        """Validate a decoded review object and convert it to a summary."""
+
         # Validate required fields in parsed JSON
         if not isinstance(raw, dict):
             raise ValueError("LLM response JSON must be an object")
@@ -335,37 +523,63 @@ class LLMClient:
 
         last_error: Optional[Exception] = None
         for request_payload in request_payloads:
-            try:
-                response = requests.post(
-                    self.endpoint,
-                    json=request_payload,
-                    timeout=self.timeout,
+            request_start = time.time()
+            usage: Dict[str, Any] = {}
+            time_to_first_token: Optional[float] = None
+
+            def record(error: Optional[Exception] = None) -> None:
+                get_global_collector().record(
+                    LLMCallMetrics(
+                        operation="pr_review",
+                        duration_seconds=time.time() - request_start,
+                        prompt_tokens=usage.get("prompt_tokens", 0),
+                        completion_tokens=usage.get("completion_tokens", 0),
+                        total_tokens=usage.get("total_tokens", 0),
+                        success=error is None,
+                        error_type=type(error).__name__ if error is not None else None,
+                        time_to_first_token=time_to_first_token,
+                    )
                 )
-                response.raise_for_status()
-
-                # Check for empty response
-                if not response.content or not response.content.strip():
-                    last_error = ValueError("Empty response from LLM endpoint")
-                    if "response_format" in request_payload:
-                        continue
-                    raise last_error
 
-                try:
-                    response_payload = response.json()
-                except ValueError as exc:  # pragma: no cover - upstream bug/HTML error page
-                    last_error = ValueError("LLM response was not valid JSON")
-                    if "response_format" in request_payload:
-                        continue
-                    raise last_error from exc
-
-                try:
-                    return self._parse_response(response_payload)
-                except ValueError as exc:
-                    last_error = exc
-                    if "response_format" in request_payload:
-                        continue
-                    raise
+            try:
+                if self.stream:
+                    response = self._post(
+                        request_payload | {"stream": True}, self.timeout, stream=True
+                    )
+                    try:
+                        response.raise_for_status()
+                        # Malformed output aborts the stream as soon as it is detected
+                        result = read_streamed_completion(
+                            response, request_start, review_stream_validator
+                        )
+                    finally:
+                        response.close()  # Return the pooled connection on every exit
+                    usage = result.usage
+                    time_to_first_token = result.time_to_first_token
+                    summary = self._parse_review_content(result.content)
+                else:
+                    response = self._post(request_payload, self.timeout)
+                    response.raise_for_status()
+
+                    # Check for empty response
+                    if not response.content or not response.content.strip():
+                        raise ValueError("Empty response from LLM endpoint")
+
+                    try:
+                        response_payload = response.json()
+                    except ValueError as exc:  # pragma: no cover - upstream bug/HTML error page
+                        raise ValueError("LLM response was not valid JSON") from exc
+
+                    usage = response_payload.get("usage") or {}
+                    summary = self._parse_response(response_payload)
+            except ValueError as exc:
+                record(exc)
+                last_error = exc
+                if "response_format" in request_payload:
+                    continue
+                raise
             except requests.HTTPError as exc:
+                record(exc)
                 last_error = exc
 
                 # If using response_format and it's a retryable JSON format error, try again without it
@@ -374,14 +588,46 @@ class LLMClient:
 
                 raise
             except (OSError, ConnectionError, TimeoutError) as exc:  # pragma: no cover - network failures already handled elsewhere
+                record(exc)
                 last_error = exc
                 break
 
+            record()
+            return summary
+
         if last_error is not None:
             raise last_error
 
         raise RuntimeError("LLM request failed without raising an explicit error")
 
+    def generate_reviews(
+        self, bundles: list[PullRequestReviewBundle]
+    ) -> dict[int, ReviewSummary]:
+        """Review several small pull requests with a single structured request.
+
+        Args:
+            bundles: Pull requests planned into one batch
+
+        Returns:
+            Summaries keyed by PR number; PRs the model skipped or answered
+            with an invalid entry are missing from the result
+
+        Raises:
+            ValueError: If the response is not a valid batch object
+            requests.RequestException: If the request keeps failing
+        """
+        if len(bundles) == 1:
+            return {bundles[0].number: self.generate_review(bundles[0])}
+
+        content = self.complete(
+            self._build_batch_messages(bundles),
+            temperature=HEURISTIC_THRESHOLDS['llm_temperature'],
+            max_retries=1,
+            operation="pr_review_batch",
+            validator_factory=batch_review_stream_validator,
+        )
+        return self._parse_batch_content(content, [bundle.number for bundle in bundles])
+
     def test_connection(self) -> None:
         """Test connection to the LLM endpoint with a simple request.
 
@@ -519,6 +765,7 @@ class LLMClient:
         # For ValueError and other exceptions, allow retry
         return True
 
+    @traced("LLMClient.complete", "llm")
     def complete(
         self,
         messages: list[dict[str, str]],
@@ -527,6 +774,7 @@ class LLMClient:
         max_retries: int = 5,
         retry_delay: float = 2.0,
         operation: str = "unknown",
+        validator_factory: Callable[[], IncrementalJSONValidator] | None = None,
     ) -> str:
         """Execute a generic chat completion request with retry logic and caching.
 
@@ -536,6 +784,8 @@ class LLMClient:
             max_retries: Maximum number of retry attempts (default: 5)
             retry_delay: Base delay between retries in seconds (default: 2.0)
             operation: Name of the operation for metrics tracking
+            validator_factory: Optional incremental JSON validator used to abort
+                malformed generations early when streaming is enabled
 
         Returns:
             LLM response content
@@ -581,17 +831,28 @@ class LLMClient:
         }
 
         last_exception = None
+        requests_start = time.time()
 
         for attempt in range(max_retries + 1):
+            attempt_start = time.time()
             try:
-                response = requests.post(
-                    self.endpoint,
-                    json=payload,
-                    timeout=self.timeout,
-                )
-                response.raise_for_status()
-
-                content = self._validate_response(response)
+                time_to_first_token = None
+                with span(f"LLM {operation}", "llm", attempt=attempt, stream=self.stream) as llm_span:
+                    if self.stream:
+                        request_start = time.time()
+                        response = self._post(payload | {"stream": True}, self.timeout, stream=True)
+                        llm_span.set(status=response.status_code)
+                        response.raise_for_status()
+                        result = read_streamed_completion(response, request_start, validator_factory)
+                        content = result.content
+                        usage = result.usage
+                        time_to_first_token = result.time_to_first_token
+                    else:
+                        response = self._post(payload, self.timeout)
+                        llm_span.set(status=response.status_code)
+                        response.raise_for_status()
+                        content = self._validate_response(response)
+                        usage = None
 
                 # Success! Log if this was a retry
                 if attempt > 0:
@@ -604,8 +865,8 @@ class LLMClient:
                 total_tokens = 0
 
                 try:
-                    response_data = response.json()
-                    usage = response_data.get("usage", {})
+                    if usage is None:
+                        usage = response.json().get("usage", {})
                     prompt_tokens = usage.get("prompt_tokens", 0)
                     completion_tokens = usage.get("completion_tokens", 0)
                     total_tokens = usage.get("total_tokens", 0)
@@ -623,6 +884,8 @@ class LLMClient:
                     cache_hit=False,
                     success=True,
                     retry_count=retry_count,
+                    retry_seconds=attempt_start - requests_start,
+                    time_to_first_token=time_to_first_token,
                 )
                 get_global_collector().record(metrics)
 
@@ -663,6 +926,7 @@ class LLMClient:
             success=False,
             error_type=error_type,
             retry_count=retry_count,
+            retry_seconds=time.time() - requests_start,
         )
         get_global_collector().record(metrics)
 
@@ -913,10 +1177,20 @@ class LLMClient:
             with ThreadPoolExecutor(max_workers=2) as executor:
                 # Submit both tasks with operation names for metrics
                 comm_future = executor.submit(
-                    self.complete, comm_messages, 0.6, 5, 2.0, "personal_dev_communication"
+                    self.complete,
+                    comm_messages,
+                    temperature=0.6,
+                    max_retries=5,
+                    retry_delay=2.0,
+                    operation="personal_dev_communication",
                 )
                 code_future = executor.submit(
-                    self.complete, code_messages, 0.6, 5, 2.0, "personal_dev_code_quality"
+                    self.complete,
+                    code_messages,
+                    temperature=0.6,
+                    max_retries=5,
+                    retry_delay=2.0,
+                    operation="personal_dev_code_quality",
                 )
 
                 # Wait for both to complete
@@ -1032,7 +1306,7 @@ class LLMClient:
             ]
 
             # Call LLM
-            response = self.complete(messages)
+            response = self.complete(messages, operation="award_quote")
 
             # Check for empty response
             if not response or not response.strip():
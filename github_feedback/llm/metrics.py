@@ -2,14 +2,39 @@
 
 from __future__ import annotations
 
+import json
 import logging
+import math
 import time
 from dataclasses import dataclass, field
+from pathlib import Path
 from threading import Lock
 from typing import Any
 
+from ..core.histogram import LatencyHistogram
+from ..core.utils import FileSystemManager
+
 logger = logging.getLogger(__name__)
 
+# Operation name -> prompt type used for the per-prompt breakdown
+PROMPT_TYPES = {
+    "pr_review": "review",
+    "pr_review_batch": "review",
+    "commits_analysis": "commit_analysis",
+    "prs_analysis": "pr_title_analysis",
+    "reviews_analysis": "review_tone_analysis",
+    "issues_analysis": "issue_analysis",
+    "award_quote": "award_quote",
+    "team_report": "team_report",
+}
+
+
+def prompt_type_for(operation: str) -> str:
+    """Map an operation name to its prompt type."""
+    if operation.startswith("personal_dev"):
+        return "personal_development"
+    return PROMPT_TYPES.get(operation, operation)
+
 
 @dataclass
 class LLMCallMetrics:
@@ -24,8 +49,14 @@ class LLMCallMetrics:
     success: bool = True
     error_type: str | None = None
     retry_count: int = 0
+    retry_seconds: float = 0.0  # Time spent in failed attempts and backoff
+    time_to_first_token: float | None = None  # Only measured for streamed calls
     timestamp: float = field(default_factory=time.time)
 
+    @property
+    def prompt_type(self) -> str:
+        return prompt_type_for(self.operation)
+
     @property
     def cost_estimate(self) -> float:
         """Estimate cost in USD (rough approximation for GPT-4 pricing).
@@ -43,6 +74,79 @@ class LLMCallMetrics:
         return input_cost + output_cost
 
 
+@dataclass
+class PromptTypeStats:
+    """Streaming latency and token distributions for one prompt type.
+
+    Histograms cover calls that reached the LLM; cache hits are counted
+    separately and valued at the average cost of an uncached call.
+    """
+
+    prompt_type: str
+    calls: int = 0
+    failures: int = 0
+    cache_hits: int = 0
+    retries: int = 0
+    retry_seconds: float = 0.0
+    cost: float = 0.0
+    duration: LatencyHistogram = field(default_factory=LatencyHistogram)
+    prompt_tokens: LatencyHistogram = field(default_factory=LatencyHistogram)
+    completion_tokens: LatencyHistogram = field(default_factory=LatencyHistogram)
+    time_to_first_token: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+    def add(self, metrics: LLMCallMetrics) -> None:
+        self.calls += 1
+        self.retries += metrics.retry_count
+        self.retry_seconds += metrics.retry_seconds
+        if not metrics.success:
+            self.failures += 1
+            return
+        if metrics.cache_hit:
+            self.cache_hits += 1
+            return
+        self.cost += metrics.cost_estimate
+        self.duration.add(metrics.duration_seconds)
+        self.prompt_tokens.add(metrics.prompt_tokens)
+        self.completion_tokens.add(metrics.completion_tokens)
+        if metrics.time_to_first_token is not None:
+            self.time_to_first_token.add(metrics.time_to_first_token)
+
+    @property
+    def saved_seconds(self) -> float:
+        """Estimated LLM time avoided by cache hits."""
+        return self.cache_hits * self.duration.mean
+
+    @property
+    def saved_tokens(self) -> int:
+        """Estimated tokens avoided by cache hits."""
+        return round(self.cache_hits * (self.prompt_tokens.mean + self.completion_tokens.mean))
+
+    @property
+    def saved_cost(self) -> float:
+        """Estimated USD avoided by cache hits."""
+        uncached = self.duration.count
+        return self.cache_hits * self.cost / uncached if uncached else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "failures": self.failures,
+            "cache_hits": self.cache_hits,
+            "retries": self.retries,
+            "retry_seconds": round(self.retry_seconds, 3),
+            "estimated_cost": round(self.cost, 6),
+            "cache_savings": {
+                "seconds": round(self.saved_seconds, 3),
+                "tokens": self.saved_tokens,
+                "cost": round(self.saved_cost, 6),
+            },
+            "duration_seconds": self.duration.to_dict(),
+            "prompt_tokens": self.prompt_tokens.to_dict(),
+            "completion_tokens": self.completion_tokens.to_dict(),
+            "time_to_first_token_seconds": self.time_to_first_token.to_dict(),
+        }
+
+
 @dataclass
 class AggregatedMetrics:
     """Aggregated metrics across multiple LLM calls."""
@@ -56,8 +160,15 @@ class AggregatedMetrics:
     total_completion_tokens: int = 0
     total_tokens: int = 0
     total_retries: int = 0
+    total_retry_seconds: float = 0.0
+    streamed_calls: int = 0
+    total_time_to_first_token: float = 0.0
+    skipped_calls: int = 0  # Calls avoided by heuristic triage
+    triage_candidates: int = 0  # PR reviews that could have used the LLM
     operations: dict[str, int] = field(default_factory=dict)
     errors: dict[str, int] = field(default_factory=dict)
+    skip_reasons: dict[str, int] = field(default_factory=dict)
+    prompt_types: dict[str, PromptTypeStats] = field(default_factory=dict)
 
     @property
     def cache_hit_rate(self) -> float:
@@ -69,11 +180,21 @@ class AggregatedMetrics:
         """Calculate success rate."""
         return self.successful_calls / self.total_calls if self.total_calls > 0 else 0.0
 
+    @property
+    def skip_rate(self) -> float:
+        """Calculate the share of PR-review candidates that triage skipped."""
+        return self.skipped_calls / self.triage_candidates if self.triage_candidates > 0 else 0.0
+
     @property
     def avg_duration(self) -> float:
         """Calculate average duration per call."""
         return self.total_duration / self.total_calls if self.total_calls > 0 else 0.0
 
+    @property
+    def avg_time_to_first_token(self) -> float:
+        """Calculate average time-to-first-token across streamed calls."""
+        return self.total_time_to_first_token / self.streamed_calls if self.streamed_calls > 0 else 0.0
+
     @property
     def estimated_total_cost(self) -> float:
         """Estimate total cost in USD (rough approximation)."""
@@ -81,6 +202,107 @@ class AggregatedMetrics:
         output_cost = (self.total_completion_tokens / 1000) * 0.06
         return input_cost + output_cost
 
+    @property
+    def cache_saved_seconds(self) -> float:
+        """Estimated LLM time avoided by cache hits."""
+        return sum(stats.saved_seconds for stats in self.prompt_types.values())
+
+    @property
+    def cache_saved_tokens(self) -> int:
+        """Estimated tokens avoided by cache hits."""
+        return sum(stats.saved_tokens for stats in self.prompt_types.values())
+
+    @property
+    def cache_saved_cost(self) -> float:
+        """Estimated USD avoided by cache hits."""
+        return sum(stats.saved_cost for stats in self.prompt_types.values())
+
+    def to_dict(self) -> dict[str, Any]:
+        """Export the metrics as a JSON-serialisable dictionary."""
+        return {
+            "generated_at": time.time(),
+            "totals": {
+                "calls": self.total_calls,
+                "successful_calls": self.successful_calls,
+                "failed_calls": self.failed_calls,
+                "cache_hits": self.cache_hits,
+                "skipped_calls": self.skipped_calls,
+                "triage_candidates": self.triage_candidates,
+                "prompt_tokens": self.total_prompt_tokens,
+                "completion_tokens": self.total_completion_tokens,
+                "total_tokens": self.total_tokens,
+                "retries": self.total_retries,
+                "retry_seconds": round(self.total_retry_seconds, 3),
+                "duration_seconds": round(self.total_duration, 3),
+                "estimated_cost": round(self.estimated_total_cost, 6),
+                "cache_savings": {
+                    "seconds": round(self.cache_saved_seconds, 3),
+                    "tokens": self.cache_saved_tokens,
+                    "cost": round(self.cache_saved_cost, 6),
+                },
+            },
+            "prompt_types": {name: stats.to_dict() for name, stats in sorted(self.prompt_types.items())},
+            "operations": dict(sorted(self.operations.items())),
+            "errors": dict(sorted(self.errors.items())),
+            "skip_reasons": dict(sorted(self.skip_reasons.items())),
+        }
+
+    def to_prometheus(self, prefix: str = "gfa_llm") -> str:
+        """Export the metrics in the Prometheus text exposition format.
+
+        Suitable for node_exporter's textfile collector; distributions are
+        exposed as summaries with 0.5/0.9/0.95/0.99 quantiles.
+        """
+        lines: list[str] = []
+        Sample = tuple[str, dict[str, str], float]  # (name suffix, labels, value)
+
+        def metric(name: str, kind: str, help_text: str, samples: list[Sample]) -> None:
+            lines.append(f"# HELP {prefix}_{name} {help_text}")
+            lines.append(f"# TYPE {prefix}_{name} {kind}")
+            for suffix, labels, value in samples:
+                label_text = ",".join(f'{key}="{_escape_label(val)}"' for key, val in labels.items())
+                lines.append(f"{prefix}_{name}{suffix}{{{label_text}}} {_format_sample(value)}")
+
+        by_type = sorted(self.prompt_types.items())
+        counters = [
+            ("calls_total", "LLM calls, including cache hits", lambda s: s.calls),
+            ("failures_total", "LLM calls that failed after all retries", lambda s: s.failures),
+            ("cache_hits_total", "LLM calls answered from the response cache", lambda s: s.cache_hits),
+            ("retries_total", "Retried LLM request attempts", lambda s: s.retries),
+            ("retry_overhead_seconds_total", "Time spent in failed attempts and backoff", lambda s: s.retry_seconds),
+            ("cache_saved_seconds_total", "Estimated LLM time avoided by cache hits", lambda s: s.saved_seconds),
+            ("cache_saved_tokens_total", "Estimated tokens avoided by cache hits", lambda s: s.saved_tokens),
+            ("estimated_cost_usd_total", "Estimated LLM cost in USD", lambda s: s.cost),
+        ]
+        for name, help_text, value in counters:
+            metric(name, "counter", help_text, [("", {"prompt_type": key}, value(stats)) for key, stats in by_type])
+
+        summaries = [
+            ("duration_seconds", "Latency of uncached LLM calls", "duration"),
+            ("prompt_tokens", "Prompt tokens per uncached LLM call", "prompt_tokens"),
+            ("completion_tokens", "Completion tokens per uncached LLM call", "completion_tokens"),
+            ("time_to_first_token_seconds", "Time to first streamed token", "time_to_first_token"),
+        ]
+        for name, help_text, attribute in summaries:
+            samples: list[Sample] = []
+            for key, stats in by_type:
+                histogram: LatencyHistogram = getattr(stats, attribute)
+                if not histogram.count:
+                    continue
+                for quantile in (0.5, 0.9, 0.95, 0.99):
+                    labels = {"prompt_type": key, "quantile": f"{quantile:g}"}
+                    samples.append(("", labels, histogram.quantile(quantile)))
+                samples.append(("_sum", {"prompt_type": key}, histogram.total))
+                samples.append(("_count", {"prompt_type": key}, histogram.count))
+            if samples:
+                metric(name, "summary", help_text, samples)
+
+        metric(
+            "skipped_calls_total", "counter", "LLM calls avoided by heuristic triage",
+            [("", {"reason": reason}, count) for reason, count in sorted(self.skip_reasons.items())],
+        )
+        return "\n".join(lines) + "\n"
+
     def format_summary(self) -> str:
         """Format a human-readable summary of metrics."""
         lines = [
@@ -94,11 +316,40 @@ class AggregatedMetrics:
             f"Total Retries: {self.total_retries}",
         ]
 
+        if self.streamed_calls:
+            lines.append(f"Avg Time to First Token: {self.avg_time_to_first_token:.2f}s")
+
+        if self.total_retry_seconds:
+            lines.append(f"Retry Overhead: {self.total_retry_seconds:.1f}s")
+
+        if self.cache_hits:
+            lines.append(
+                f"Cache Savings: ~{self.cache_saved_seconds:.1f}s, "
+                f"~{self.cache_saved_tokens:,} tokens, ~${self.cache_saved_cost:.4f}"
+            )
+
+        if self.skipped_calls:
+            lines.append(f"Skipped by Triage: {self.skipped_calls} ({self.skip_rate:.1%})")
+
+        if self.prompt_types:
+            lines.append("\nPrompt Types (uncached p50/p95):")
+            for name, stats in sorted(self.prompt_types.items(), key=lambda x: x[1].calls, reverse=True):
+                lines.append(
+                    f"  - {name}: {stats.calls} calls, "
+                    f"{stats.duration.quantile(0.5):.2f}s/{stats.duration.quantile(0.95):.2f}s, "
+                    f"prompt {stats.prompt_tokens.quantile(0.5):.0f}/{stats.prompt_tokens.quantile(0.95):.0f} tokens"
+                )
+
         if self.operations:
             lines.append("\nOperations:")
             for op, count in sorted(self.operations.items(), key=lambda x: x[1], reverse=True):
                 lines.append(f"  - {op}: {count}")
 
+        if self.skip_reasons:
+            lines.append("\nSkip Reasons:")
+            for reason, count in sorted(self.skip_reasons.items(), key=lambda x: x[1], reverse=True):
+                lines.append(f"  - {reason}: {count}")
+
         if self.errors:
             lines.append("\nErrors:")
             for error, count in sorted(self.errors.items(), key=lambda x: x[1], reverse=True):
@@ -112,6 +363,9 @@ class LLMMetricsCollector:
 
     def __init__(self) -> None:
         self._metrics: list[LLMCallMetrics] = []
+        self._skips: dict[str, int] = {}
+        self._candidates = 0
+        self._prompt_types: dict[str, PromptTypeStats] = {}
         self._lock = Lock()
 
     def record(self, metrics: LLMCallMetrics) -> None:
@@ -122,6 +376,26 @@ class LLMMetricsCollector:
         """
         with self._lock:
             self._metrics.append(metrics)
+            stats = self._prompt_types.get(metrics.prompt_type)
+            if stats is None:
+                stats = self._prompt_types[metrics.prompt_type] = PromptTypeStats(metrics.prompt_type)
+            stats.add(metrics)
+
+    def record_skip(self, operation: str, reason: str) -> None:
+        """Record an LLM call that was avoided by heuristic triage.
+
+        Args:
+            operation: Operation that would have been called (e.g. "pr_review")
+            reason: Why the call was skipped (e.g. "docs_only")
+        """
+        key = f"{operation}:{reason}"
+        with self._lock:
+            self._skips[key] = self._skips.get(key, 0) + 1
+
+    def record_candidate(self) -> None:
+        """Record a PR review that triage could route away from the LLM."""
+        with self._lock:
+            self._candidates += 1
 
     def get_aggregated(self) -> AggregatedMetrics:
         """Get aggregated metrics across all recorded calls.
@@ -131,8 +405,28 @@ class LLMMetricsCollector:
         """
         with self._lock:
             metrics = self._metrics.copy()
-
-        agg = AggregatedMetrics()
+            skips = dict(self._skips)
+            candidates = self._candidates
+            prompt_types = {}
+            for name, stats in self._prompt_types.items():
+                prompt_types[name] = PromptTypeStats(
+                    prompt_type=name,
+                    calls=stats.calls,
+                    failures=stats.failures,
+                    cache_hits=stats.cache_hits,
+                    retries=stats.retries,
+                    retry_seconds=stats.retry_seconds,
+                    cost=stats.cost,
+                )
+                for attribute in ("duration", "prompt_tokens", "completion_tokens", "time_to_first_token"):
+                    getattr(prompt_types[name], attribute).merge(getattr(stats, attribute))
+
+        agg = AggregatedMetrics(
+            skipped_calls=sum(skips.values()),
+            triage_candidates=candidates,
+            skip_reasons=skips,
+            prompt_types=prompt_types,
+        )
 
         for m in metrics:
             agg.total_calls += 1
@@ -152,15 +446,35 @@ class LLMMetricsCollector:
             agg.total_completion_tokens += m.completion_tokens
             agg.total_tokens += m.total_tokens
             agg.total_retries += m.retry_count
+            agg.total_retry_seconds += m.retry_seconds
+
+            if m.time_to_first_token is not None:
+                agg.streamed_calls += 1
+                agg.total_time_to_first_token += m.time_to_first_token
 
             agg.operations[m.operation] = agg.operations.get(m.operation, 0) + 1
 
         return agg
 
+    def save_json(self, path: Path) -> Path:
+        """Write the aggregated metrics to ``path`` as JSON."""
+        FileSystemManager.ensure_parent_directory(path)
+        path.write_text(json.dumps(self.get_aggregated().to_dict(), indent=2) + "\n", encoding="utf-8")
+        return path
+
+    def save_prometheus(self, path: Path) -> Path:
+        """Write the aggregated metrics to ``path`` in Prometheus text format."""
+        FileSystemManager.ensure_parent_directory(path)
+        path.write_text(self.get_aggregated().to_prometheus(), encoding="utf-8")
+        return path
+
     def clear(self) -> None:
         """Clear all collected metrics."""
         with self._lock:
             self._metrics.clear()
+            self._skips.clear()
+            self._candidates = 0
+            self._prompt_types.clear()
 
     def get_recent(self, n: int = 10) -> list[LLMCallMetrics]:
         """Get the N most recent metrics.
@@ -175,6 +489,21 @@ class LLMMetricsCollector:
             return self._metrics[-n:].copy()
 
 
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_sample(value: float) -> str:
+    """Format a sample value without losing precision (ints exactly, floats via repr)."""
+    if isinstance(value, int):
+        return str(value)
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+
 # Global metrics collector instance
 _global_collector = LLMMetricsCollector()
 
@@ -197,6 +526,9 @@ __all__ = [
     "LLMCallMetrics",
     "AggregatedMetrics",
     "LLMMetricsCollector",
+    "PROMPT_TYPES",
+    "PromptTypeStats",
+    "prompt_type_for",
     "get_global_collector",
     "print_metrics_summary",
 ]
@@ -0,0 +1,341 @@
+"""Token-budgeted packing of pull request diffs into LLM prompts."""
+
+from __future__ import annotations
+
+import math
+import re
+from dataclasses import dataclass, field
+from pathlib import PurePosixPath
+from typing import Sequence
+
+from ..core.constants import LLM_DEFAULTS
+from ..core.models import PullRequestFile
+from ..core.utils import truncate_patch
+
+# Exact file names of dependency lockfiles
+LOCKFILE_NAMES = frozenset({
+    "package-lock.json",
+    "npm-shrinkwrap.json",
+    "yarn.lock",
+    "pnpm-lock.yaml",
+    "bun.lockb",
+    "poetry.lock",
+    "pipfile.lock",
+    "uv.lock",
+    "pdm.lock",
+    "cargo.lock",
+    "gemfile.lock",
+    "composer.lock",
+    "go.sum",
+    "mix.lock",
+    "podfile.lock",
+    "packages.lock.json",
+    "flake.lock",
+})
+
+# Path fragments that indicate vendored third-party code
+VENDORED_DIRS = ("vendor/", "vendors/", "third_party/", "third-party/", "node_modules/", "bower_components/")
+
+# Path patterns for generated artefacts
+GENERATED_PATTERNS = (
+    re.compile(r"(^|/)(dist|build|out)/"),
+    re.compile(r"(^|/)__snapshots__/"),
+    re.compile(r"\.snap$"),
+    re.compile(r"\.min\.(js|css)$"),
+    re.compile(r"\.(js|css)\.map$"),
+    re.compile(r"_pb2(_grpc)?\.pyi?$"),
+    re.compile(r"\.pb\.(go|cc|h)$"),
+    re.compile(r"\.g\.dart$"),
+    re.compile(r"\.generated\.\w+$"),
+    re.compile(r"\.designer\.cs$"),
+)
+
+# Path patterns for test code, matched on whole segments and file name conventions
+TEST_PATTERNS = (
+    re.compile(r"(^|/)(tests?|specs?|__tests__)/"),
+    re.compile(r"(^|/)(test_[^/]+|conftest\.py)$"),
+    re.compile(r"_test\.[^/.]+$"),
+    re.compile(r"\.(test|spec)\.[^/]+$"),
+)
+
+# JVM/.NET test classes (FooTest.java, BarTests.cs), matched case-sensitively
+TEST_CLASS_PATTERN = re.compile(r"[a-z0-9]Tests?\.(java|kt|scala|cs|swift)$")
+
+# Markers that generators conventionally put near the top of a file
+GENERATED_MARKERS = ("@generated", "code generated", "do not edit", "auto-generated", "autogenerated")
+
+# A diff line longer than this is treated as minified output
+MINIFIED_LINE_LENGTH = 500
+
+# Relative importance of hunks by file category
+CATEGORY_WEIGHTS = {
+    "source": 1.0,
+    "test": 0.8,
+    "config": 0.6,
+    "docs": 0.5,
+}
+
+SOURCE_EXTENSIONS = frozenset({
+    ".py", ".js", ".jsx", ".ts", ".tsx", ".go", ".rs", ".java", ".kt", ".kts", ".scala",
+    ".rb", ".php", ".c", ".h", ".cc", ".cpp", ".hpp", ".cs", ".swift", ".m", ".mm",
+    ".dart", ".vue", ".svelte", ".sql", ".sh", ".ex", ".exs", ".clj", ".lua",
+})
+DOC_EXTENSIONS = frozenset({".md", ".rst", ".txt", ".adoc"})
+CONFIG_EXTENSIONS = frozenset({".json", ".yaml", ".yml", ".toml", ".ini", ".cfg", ".xml", ".gradle"})
+
+# Tokens added by the ```diff fence around each file's snippet
+FENCE_TOKENS = 4
+
+_CJK_PATTERN = re.compile("[\u1100-\u11ff\u3040-\u30ff\u3130-\u318f\u3400-\u9fff\uac00-\ud7af]")
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the number of tokens in ``text`` without a model tokenizer.
+
+    BPE tokenizers average roughly four characters per token for English and
+    code, while Hangul and CJK characters usually cost about one token each.
+    The estimate errs slightly high so that packed prompts stay inside budget.
+    """
+    if not text:
+        return 0
+    cjk_chars = len(_CJK_PATTERN.findall(text))
+    other_chars = len(text) - cjk_chars
+    return cjk_chars + math.ceil(other_chars / 4)
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """Trim ``text`` so that its estimated token count fits ``max_tokens``."""
+    if estimate_tokens(text) <= max_tokens:
+        return text
+    low, high = 0, len(text)
+    while low < high:
+        middle = (low + high + 1) // 2
+        if estimate_tokens(text[:middle]) + 1 <= max_tokens:
+            low = middle
+        else:
+            high = middle - 1
+    return text[:low].rstrip() + "…"
+
+
+def classify_pruned_file(file: PullRequestFile) -> str | None:
+    """Return why a file should be left out of the prompt, if at all.
+
+    Returns:
+        One of ``"lockfile"``, ``"vendored"``, ``"generated"`` or ``"minified"``,
+        or None when the file carries reviewable changes.
+    """
+    path = file.filename.lower()
+    name = PurePosixPath(path).name
+
+    if name in LOCKFILE_NAMES or name.endswith(".lock"):
+        return "lockfile"
+    if any(f"/{fragment}" in f"/{path}" for fragment in VENDORED_DIRS):
+        return "vendored"
+    if any(pattern.search(path) for pattern in GENERATED_PATTERNS):
+        return "generated"
+
+    if file.patch:
+        head = file.patch[:1000].lower()
+        if any(marker in head for marker in GENERATED_MARKERS):
+            return "generated"
+        if any(len(line) > MINIFIED_LINE_LENGTH for line in file.patch.splitlines()):
+            return "minified"
+
+    return None
+
+
+def file_category(filename: str) -> str:
+    """Categorise a file for relevance weighting."""
+    path = filename.lower()
+    suffix = PurePosixPath(path).suffix
+    name = PurePosixPath(path).name
+
+    # Docs first: "docs/testing.md" is documentation, not a test
+    if suffix in DOC_EXTENSIONS or name.startswith("readme") or "/docs/" in f"/{path}":
+        return "docs"
+    if any(pattern.search(path) for pattern in TEST_PATTERNS) or TEST_CLASS_PATTERN.search(filename):
+        return "test"
+    if suffix in SOURCE_EXTENSIONS:
+        return "source"
+    if suffix in CONFIG_EXTENSIONS or name.startswith("."):
+        return "config"
+    return "source"
+
+
+def split_hunks(patch: str) -> list[str]:
+    """Split a unified diff into hunks, each starting with its ``@@`` header."""
+    hunks: list[list[str]] = []
+    for line in patch.splitlines():
+        if line.startswith("@@") or not hunks:
+            hunks.append([line])
+        else:
+            hunks[-1].append(line)
+    return ["\n".join(hunk) for hunk in hunks]
+
+
+def _hunk_changed_lines(hunk: str) -> int:
+    changed = 0
+    for line in hunk.splitlines()[1:]:
+        if line[:1] in "+-" and line[1:].strip():
+            changed += 1
+    return changed
+
+
+@dataclass(slots=True)
+class _Hunk:
+    file_index: int
+    hunk_index: int
+    text: str
+    score: float
+
+
+@dataclass(slots=True)
+class PackedFiles:
+    """Result of packing changed files into a token budget."""
+
+    lines: list[str]
+    estimated_tokens: int
+    included_hunks: int = 0
+    omitted_hunks: int = 0
+    pruned_files: dict[str, list[str]] = field(default_factory=dict)
+
+
+class PromptPacker:
+    """Select the most relevant diff hunks that fit a token budget.
+
+    Lockfiles, vendored code, generated artefacts and minified bundles are
+    pruned up front and only mentioned by name. The remaining hunks are
+    ranked by the number of meaningful changed lines weighted by file
+    category (source > tests > config > docs) and added greedily until the
+    budget is spent. Files and hunks are rendered in their original order so
+    the prompt still reads like the diff.
+    """
+
+    def __init__(
+        self,
+        token_budget: int = LLM_DEFAULTS['prompt_token_budget'],
+        max_files: int = LLM_DEFAULTS['max_files_in_prompt'],
+        max_files_with_snippets: int = LLM_DEFAULTS['max_files_with_patch_snippets'],
+        max_lines_per_file: int = LLM_DEFAULTS['max_patch_lines_per_file'],
+    ) -> None:
+        self.token_budget = token_budget
+        self.max_files = max_files
+        self.max_files_with_snippets = max_files_with_snippets
+        self.max_lines_per_file = max_lines_per_file
+
+    def pack(self, files: Sequence[PullRequestFile], used_tokens: int = 0) -> PackedFiles:
+        """Render the changed-files section of a review prompt.
+
+        Args:
+            files: Files in GitHub API order
+            used_tokens: Tokens already spent by the rest of the prompt
+
+        Returns:
+            PackedFiles with the rendered lines and packing statistics
+        """
+        pruned: dict[str, list[str]] = {}
+        candidates: list[int] = []
+        hunks_by_file: dict[int, list[_Hunk]] = {}
+        file_scores: dict[int, float] = {}
+
+        for index, file in enumerate(files):
+            reason = classify_pruned_file(file)
+            if reason:
+                pruned.setdefault(reason, []).append(file.filename)
+                continue
+
+            candidates.append(index)
+            weight = CATEGORY_WEIGHTS[file_category(file.filename)]
+            if file.patch:
+                hunks = [
+                    _Hunk(index, hunk_index, text, weight * _hunk_changed_lines(text))
+                    for hunk_index, text in enumerate(split_hunks(file.patch))
+                ]
+                hunks_by_file[index] = hunks
+                file_scores[index] = sum(hunk.score for hunk in hunks)
+            else:
+                file_scores[index] = weight * file.changes / 2
+
+        ranked_files = sorted(candidates, key=lambda i: (-file_scores[i], i))
+        listed = set(ranked_files[: self.max_files])
+        snippet_files = set(
+            [i for i in ranked_files if i in listed and i in hunks_by_file][: self.max_files_with_snippets]
+        )
+
+        budget = self.token_budget - used_tokens
+        listing = {i: self._describe(files[i]) for i in listed}
+        budget -= sum(estimate_tokens(line) for line in listing.values())
+
+        # Greedily include the highest-value hunks that still fit
+        selected: dict[int, list[tuple[int, str]]] = {}
+        lines_left = {i: self.max_lines_per_file for i in snippet_files}
+        ranked_hunks = sorted(
+            (hunk for i in snippet_files for hunk in hunks_by_file[i]),
+            key=lambda h: (-h.score, h.file_index, h.hunk_index),
+        )
+        omitted = sum(len(hunks) for hunks in hunks_by_file.values())
+        for hunk in ranked_hunks:
+            allowance = lines_left[hunk.file_index]
+            if allowance <= 1:
+                continue
+            text = truncate_patch(hunk.text, allowance)
+            cost = estimate_tokens(text) + (0 if hunk.file_index in selected else FENCE_TOKENS)
+            if cost > budget:
+                continue
+            budget -= cost
+            lines_left[hunk.file_index] -= len(text.splitlines())
+            selected.setdefault(hunk.file_index, []).append((hunk.hunk_index, text))
+            omitted -= 1
+
+        lines: list[str] = []
+        for index in sorted(listed):
+            lines.append(listing[index])
+            if index in selected:
+                lines.append("```diff")
+                lines.extend(text for _, text in sorted(selected[index]))
+                lines.append("```")
+
+        unlisted = len(candidates) - len(listed)
+        if unlisted > 0:
+            lines.append(f"- (관련도가 낮은 파일 {unlisted}개 생략)")
+        if pruned:
+            lines.append(self._describe_pruned(pruned))
+        if omitted > 0:
+            lines.append(f"- (토큰 예산 초과로 diff 조각 {omitted}개 생략)")
+
+        return PackedFiles(
+            lines=lines,
+            estimated_tokens=self.token_budget - used_tokens - budget,
+            included_hunks=sum(len(hunks) for hunks in selected.values()),
+            omitted_hunks=omitted,
+            pruned_files=pruned,
+        )
+
+    @staticmethod
+    def _describe(file: PullRequestFile) -> str:
+        return f"- {file.filename} ({file.status}, +{file.additions}/-{file.deletions}, 변경={file.changes})"
+
+    @staticmethod
+    def _describe_pruned(pruned: dict[str, list[str]], max_names: int = 3) -> str:
+        labels = {
+            "lockfile": "잠금 파일",
+            "vendored": "벤더 코드",
+            "generated": "자동 생성 파일",
+            "minified": "압축된 번들",
+        }
+        parts = []
+        for reason, names in pruned.items():
+            shown = ", ".join(names[:max_names])
+            extra = f" 외 {len(names) - max_names}개" if len(names) > max_names else ""
+            parts.append(f"{labels.get(reason, reason)}: {shown}{extra}")
+        return "- (리뷰에서 제외: " + "; ".join(parts) + ")"
+
+
+__all__ = [
+    "PackedFiles",
+    "PromptPacker",
+    "classify_pruned_file",
+    "estimate_tokens",
+    "split_hunks",
+    "truncate_to_tokens",
+]
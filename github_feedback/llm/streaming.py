@@ -0,0 +1,282 @@
+"""Server-sent event streaming with incremental JSON validation for LLM responses."""
+
+from __future__ import annotations
+
+import json
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable, Iterator
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+# Expected JSON types of the top-level fields in a PR review response
+REVIEW_FIELD_TYPES: dict[str, type] = {
+    "overview": str,
+    "strengths": list,
+    "improvements": list,
+}
+REVIEW_REQUIRED_FIELDS = ("overview",)
+
+_OPENING_CHARS = {str: '"', list: "[", dict: "{"}
+
+
+class StreamAbortedError(ValueError):
+    """Raised when a streamed generation is abandoned because it is malformed."""
+
+
+class IncrementalJSONValidator:
+    """Validate a JSON object while it is still being generated.
+
+    The validator consumes text chunks as they arrive and raises
+    :class:`StreamAbortedError` as soon as the output can no longer become a
+    valid response: the first character is not ``{``, a known top-level field
+    starts with the wrong JSON type, a required string field closes empty,
+    the object ends without a required field, or text follows the object.
+    Nested values are only tracked structurally, so validation is O(n) in the
+    length of the output with constant per-character work.
+    """
+
+    def __init__(
+        self,
+        field_types: dict[str, type] | None = None,
+        required: Iterable[str] = (),
+    ) -> None:
+        self.field_types = field_types or {}
+        self.required = tuple(required)
+        self.seen_keys: set[str] = set()
+        self._started = False
+        self._finished = False
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._expect_key = True
+        self._awaiting_value = False
+        self._capture_value = False
+        self._current_key: str | None = None
+        self._key_buffer: list[str] | None = None
+        self._value_buffer: list[str] | None = None
+
+    @property
+    def finished(self) -> bool:
+        """Whether the top-level JSON object has been closed."""
+        return self._finished
+
+    def feed(self, chunk: str) -> None:
+        """Consume the next chunk of generated text.
+
+        Raises:
+            StreamAbortedError: If the output is already known to be invalid
+        """
+        for char in chunk:
+            self._consume(char)
+
+    def close(self) -> None:
+        """Signal the end of the stream.
+
+        Raises:
+            StreamAbortedError: If the JSON object was never completed
+        """
+        if not self._finished:
+            raise StreamAbortedError("LLM stream ended before the JSON object was complete")
+
+    def _consume(self, char: str) -> None:
+        if self._finished:
+            if not char.isspace():
+                raise StreamAbortedError("Unexpected content after the JSON object")
+            return
+
+        if not self._started:
+            if char.isspace():
+                return
+            if char != "{":
+                raise StreamAbortedError(
+                    f"LLM response does not start with a JSON object (got {char!r})"
+                )
+            self._started = True
+            self._depth = 1
+            return
+
+        if self._in_string:
+            self._consume_string_char(char)
+            return
+
+        if char.isspace():
+            return
+
+        if self._awaiting_value:
+            self._awaiting_value = False
+            self._check_value_type(char)
+
+        if char == '"':
+            self._in_string = True
+            if self._depth == 1 and self._expect_key:
+                self._key_buffer = []
+            elif self._capture_value:
+                self._value_buffer = []
+        elif char in "{[":
+            self._depth += 1
+        elif char in "}]":
+            self._depth -= 1
+            if self._depth == 0:
+                self._finish()
+        elif self._depth == 1:
+            if char == ":":
+                self._awaiting_value = True
+                self._expect_key = False
+            elif char == ",":
+                self._expect_key = True
+
+    def _consume_string_char(self, char: str) -> None:
+        buffer = self._key_buffer if self._key_buffer is not None else self._value_buffer
+        if self._escape:
+            self._escape = False
+        elif char == "\\":
+            self._escape = True
+        elif char == '"':
+            self._in_string = False
+            self._end_string()
+            return
+        if buffer is not None:
+            buffer.append(char)
+
+    def _end_string(self) -> None:
+        if self._key_buffer is not None:
+            self._current_key = "".join(self._key_buffer)
+            self.seen_keys.add(self._current_key)
+            self._key_buffer = None
+        elif self._value_buffer is not None:
+            if self._current_key in self.required and not "".join(self._value_buffer).strip():
+                raise StreamAbortedError(f"'{self._current_key}' field cannot be empty")
+            self._value_buffer = None
+            self._capture_value = False
+
+    def _check_value_type(self, char: str) -> None:
+        expected = self.field_types.get(self._current_key or "")
+        if expected is None:
+            return
+        if char != _OPENING_CHARS.get(expected):
+            raise StreamAbortedError(
+                f"'{self._current_key}' field must be a JSON {expected.__name__}"
+            )
+        self._capture_value = expected is str
+
+    def _finish(self) -> None:
+        self._finished = True
+        missing = [key for key in self.required if key not in self.seen_keys]
+        if missing:
+            raise StreamAbortedError(f"LLM response missing required field(s): {', '.join(missing)}")
+
+
+def review_stream_validator() -> IncrementalJSONValidator:
+    """Create a validator for the PR review response schema."""
+    return IncrementalJSONValidator(REVIEW_FIELD_TYPES, required=REVIEW_REQUIRED_FIELDS)
+
+
+def batch_review_stream_validator() -> IncrementalJSONValidator:
+    """Create a validator for the batched PR review response schema."""
+    return IncrementalJSONValidator({"reviews": list}, required=("reviews",))
+
+
+@dataclass(slots=True)
+class StreamResult:
+    """Content and timing collected from a streamed completion."""
+
+    content: str
+    time_to_first_token: float | None = None
+    usage: dict[str, Any] = field(default_factory=dict)
+
+
+def iter_sse_events(response: requests.Response) -> Iterator[dict[str, Any]]:
+    """Yield decoded ``data:`` payloads from a chat-completions SSE stream."""
+    for raw_line in response.iter_lines():
+        if not raw_line:
+            continue
+        line = raw_line.decode("utf-8") if isinstance(raw_line, bytes) else raw_line
+        if not line.startswith("data:"):
+            continue  # comments and other SSE fields
+        data = line[len("data:"):].strip()
+        if data == "[DONE]":
+            return
+        try:
+            yield json.loads(data)
+        except json.JSONDecodeError:
+            logger.debug(f"Skipping undecodable SSE payload: {data[:80]}")
+
+
+def read_streamed_completion(
+    response: requests.Response,
+    start_time: float,
+    validator_factory: Callable[[], IncrementalJSONValidator] | None = None,
+) -> StreamResult:
+    """Read a chat completion streamed as server-sent events.
+
+    Endpoints that ignore ``"stream": true`` and answer with a regular JSON
+    body are handled transparently.
+
+    Args:
+        response: Response opened with ``stream=True``
+        start_time: ``time.time()`` when the request was sent, for TTFT
+        validator_factory: Optional factory for an incremental validator
+
+    Returns:
+        StreamResult with the concatenated content
+
+    Raises:
+        StreamAbortedError: If the validator rejects the partial output
+        ValueError: If the stream carried no content
+    """
+    validator = validator_factory() if validator_factory else None
+    try:
+        content_type = response.headers.get("content-type", "")
+        if "text/event-stream" not in content_type:
+            payload = response.json()
+            choices = payload.get("choices") or []
+            message = (choices[0].get("message") or {}) if choices else {}
+            content = str(message.get("content") or "").strip()
+            if validator:
+                validator.feed(content)
+                validator.close()
+            return StreamResult(content=content, usage=payload.get("usage") or {})
+
+        parts: list[str] = []
+        time_to_first_token: float | None = None
+        usage: dict[str, Any] = {}
+        for event in iter_sse_events(response):
+            if event.get("usage"):
+                usage = event["usage"]
+            choices = event.get("choices") or []
+            if not choices:
+                continue
+            delta = (choices[0].get("delta") or {}).get("content")
+            if not delta:
+                continue
+            if time_to_first_token is None:
+                time_to_first_token = time.time() - start_time
+            parts.append(delta)
+            if validator:
+                validator.feed(delta)
+
+        content = "".join(parts).strip()
+        if not content:
+            raise ValueError("LLM stream did not contain content")
+        if validator:
+            validator.close()
+        return StreamResult(content=content, time_to_first_token=time_to_first_token, usage=usage)
+    finally:
+        # Closing releases the connection (and the server slot) when aborting early
+        response.close()
+
+
+__all__ = [
+    "IncrementalJSONValidator",
+    "REVIEW_FIELD_TYPES",
+    "StreamAbortedError",
+    "StreamResult",
+    "batch_review_stream_validator",
+    "iter_sse_events",
+    "read_streamed_completion",
+    "review_stream_validator",
+]
@@ -33,6 +33,23 @@ def get_pr_review_system_prompt() -> str:
     )
 
 
+def get_pr_batch_review_system_prompt() -> str:
+    """Get system prompt for reviewing several small PRs in one request."""
+    return (
+        get_pr_review_system_prompt()
+        + "\n\n"
+        "이번 요청에는 여러 개의 Pull Request가 \"=== PR #번호 ===\" 구분선으로 나뉘어 포함되어 있습니다.\n"
+        "각 PR을 서로 독립적으로 리뷰하고, 위 형식의 리뷰 객체에 \"number\" 필드(PR 번호)를 추가하여 "
+        "다음 JSON 형식으로 응답하세요:\n\n"
+        "{\n"
+        '  "reviews": [\n'
+        '    {"number": 12, "overview": "...", "strengths": [...], "improvements": [...]}\n'
+        "  ]\n"
+        "}\n\n"
+        "모든 PR에 대해 정확히 하나의 리뷰 객체를 포함하세요."
+    )
+
+
 def get_commit_analysis_system_prompt(web_url: str, repo: str, max_samples: int) -> str:
     """Get system prompt for commit message analysis.
 
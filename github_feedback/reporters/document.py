@@ -0,0 +1,205 @@
+"""Lightweight document tree for markdown reports.
+
+Reports are assembled from line-based section builders. Parsing their output
+once into a tree of headings lets report integration look sections up by
+heading and graft them into a new document, instead of re-scanning the whole
+markdown text for every section. The same tree serialises to markdown, HTML
+or JSON in a single walk.
+"""
+
+from __future__ import annotations
+
+import html
+import json
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
+
+HEADING_PATTERN = re.compile(r"^(#{1,6}) +(.*?)\s*$")
+FENCE_PATTERN = re.compile(r"^\s*(```|~~~)")
+
+# A node is either a raw markdown line or a nested section
+Node = Union[str, "Section"]
+
+
+@dataclass(slots=True)
+class Section:
+    """A heading together with everything up to the next heading of the same or higher level."""
+
+    title: str
+    level: int
+    blocks: List[Node] = field(default_factory=list)
+
+    @property
+    def heading(self) -> str:
+        return f"{'#' * self.level} {self.title}"
+
+    @property
+    def children(self) -> List[Section]:
+        return [block for block in self.blocks if isinstance(block, Section)]
+
+    def iter_lines(self, include_heading: bool = True) -> Iterator[str]:
+        """Yield the markdown lines of the section."""
+        if include_heading:
+            yield self.heading
+        yield from _iter_block_lines(self.blocks)
+
+    def content(self) -> str:
+        """Markdown body of the section without its own heading."""
+        return "\n".join(self.iter_lines(include_heading=False)).strip()
+
+    def nested_under(self, level: int) -> List[Node]:
+        """Body blocks re-levelled so every sub-heading sits below ``level``.
+
+        Used when grafting the body of a section into another document where
+        it ends up under a heading of a different depth.
+        """
+        shift = max(0, level + 1 - min((child.level for child in self.children), default=level + 1))
+        return [_shift(block, shift) for block in self.blocks]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "title": self.title,
+            "level": self.level,
+            "content": "\n".join(block for block in self.blocks if isinstance(block, str)).strip(),
+            "sections": [child.to_dict() for child in self.children],
+        }
+
+
+def _shift(block: Node, shift: int) -> Node:
+    if isinstance(block, str) or shift == 0:
+        return block
+    return Section(
+        title=block.title,
+        level=min(6, block.level + shift),
+        blocks=[_shift(child, shift) for child in block.blocks],
+    )
+
+
+def _iter_block_lines(blocks: Iterable[Node]) -> Iterator[str]:
+    for block in blocks:
+        if isinstance(block, Section):
+            yield from block.iter_lines()
+        else:
+            yield block
+
+
+@dataclass(slots=True)
+class ReportDocument:
+    """Ordered tree of markdown sections with heading lookup."""
+
+    blocks: List[Node] = field(default_factory=list)
+    _index: Optional[Dict[str, Section]] = field(default=None, init=False, repr=False)
+
+    @classmethod
+    def parse(cls, source: Union[str, Iterable[str]]) -> ReportDocument:
+        """Build a tree from markdown text or lines in a single pass.
+
+        Headings inside fenced code blocks are treated as plain text.
+        """
+        lines = source.split("\n") if isinstance(source, str) else source
+        document = cls()
+        stack: List[Section] = []
+        in_fence = False
+
+        for line in lines:
+            if FENCE_PATTERN.match(line):
+                in_fence = not in_fence
+            match = None if in_fence else HEADING_PATTERN.match(line)
+            if match is None:
+                (stack[-1].blocks if stack else document.blocks).append(line)
+                continue
+
+            section = Section(title=match.group(2), level=len(match.group(1)))
+            while stack and stack[-1].level >= section.level:
+                stack.pop()
+            (stack[-1].blocks if stack else document.blocks).append(section)
+            stack.append(section)
+
+        return document
+
+    @property
+    def sections(self) -> List[Section]:
+        return [block for block in self.blocks if isinstance(block, Section)]
+
+    def walk(self) -> Iterator[Section]:
+        """Yield every section depth-first in document order."""
+        pending = list(reversed(self.sections))
+        while pending:
+            section = pending.pop()
+            yield section
+            pending.extend(reversed(section.children))
+
+    def find(self, heading: str) -> Optional[Section]:
+        """Return the first section whose heading line equals ``heading``.
+
+        Args:
+            heading: Full heading line such as ``"## 🏆 Awards Cabinet"``
+        """
+        if self._index is None:
+            index: Dict[str, Section] = {}
+            for section in self.walk():
+                index.setdefault(section.heading, section)
+            self._index = index
+        return self._index.get(heading.strip())
+
+    def content(self, heading: str) -> str:
+        """Markdown body of the section under ``heading``; empty when absent."""
+        section = self.find(heading)
+        return section.content() if section else ""
+
+    def append(self, *blocks: Node) -> None:
+        """Append lines or sections to the end of the document."""
+        self.blocks.extend(blocks)
+        self._index = None
+
+    def iter_lines(self) -> Iterator[str]:
+        return _iter_block_lines(self.blocks)
+
+    def to_markdown(self) -> str:
+        return "\n".join(self.iter_lines())
+
+    def to_dict(self) -> Dict[str, Any]:
+        preamble = [block for block in self.blocks if isinstance(block, str)]
+        return {
+            "preamble": "\n".join(preamble).strip(),
+            "sections": [section.to_dict() for section in self.sections],
+        }
+
+    def to_json(self, indent: Optional[int] = 2) -> str:
+        return json.dumps(self.to_dict(), ensure_ascii=False, indent=indent)
+
+    def to_html(self) -> str:
+        """Serialise to HTML, wrapping each section in a ``<section>`` element.
+
+        Headings become ``<h1>``–``<h6>``; body lines are kept as markdown
+        inside ``<div class="markdown">`` blocks for a client-side renderer,
+        since the builders already mix raw HTML into their markdown.
+        """
+        parts: List[str] = []
+        _render_html(self.blocks, parts)
+        return "\n".join(parts)
+
+
+def _render_html(blocks: Iterable[Node], parts: List[str]) -> None:
+    pending: List[str] = []
+
+    def flush() -> None:
+        text = "\n".join(pending).strip()
+        if text:
+            parts.append(f'<div class="markdown">\n{text}\n</div>')
+        pending.clear()
+
+    for block in blocks:
+        if isinstance(block, str):
+            pending.append(block)
+            continue
+        flush()
+        parts.append(f'<section class="level{block.level}">')
+        parts.append(f"<h{block.level}>{html.escape(block.title)}</h{block.level}>")
+        _render_html(block.blocks, parts)
+        parts.append("</section>")
+    flush()
+
+
+__all__ = ["ReportDocument", "Section"]
@@ -2,13 +2,18 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import hashlib
+import itertools
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 from ..core.console import Console
 from ..feedback_builders.feedback_builder import FeedbackBuilder
 from ..core.models import MetricSnapshot
+from .document import ReportDocument
+from .stream_writer import ReportStreamWriter, iter_sections
 from ..retrospective_builders.retro_builder import RetrospectiveBuilder
 from ..section_builders.awards_builder import AwardsBuilder
 from ..section_builders.character_stats_builder import CharacterStatsBuilder
@@ -29,6 +34,20 @@ from ..section_builders.witch_critique_builder import WitchCritiqueBuilder
 
 console = Console()
 
+# Font styles prepended to every markdown report
+FONT_STYLES = (
+    '<style>',
+    '  @import url("https://fonts.googleapis.com/css2?family=Noto+Sans+KR:wght@300;400;500;700&display=swap");',
+    '  * {',
+    '    font-family: "Noto Sans KR", -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, "Helvetica Neue", Arial, sans-serif;',
+    '  }',
+    '</style>',
+    '',
+)
+
+# Sections whose builders call the LLM and are rendered off the calling thread
+LLM_SECTIONS = frozenset({"summary"})
+
 
 @dataclass(slots=True)
 class Reporter:
@@ -38,6 +57,9 @@ class Reporter:
     _current_repo: Optional[str] = None  # Temporary storage for current repo during report generation
     llm_client: Optional[Any] = None  # Optional LLM client for generating summary quotes
     web_url: str = "https://github.com"  # Base URL for GitHub links (configurable for enterprise)
+    _section_cache: Dict[Tuple[str, str, bool], List[List[str]]] = field(
+        default_factory=dict, init=False, repr=False
+    )  # Rendered sections keyed by snapshot digest
 
     def ensure_structure(self) -> None:
         from ..core.utils import FileSystemManager
@@ -72,70 +94,16 @@ class Reporter:
         self.ensure_structure()
         report_path = self.output_dir / "report.md"
 
-        # Store repo for use in link generation
-        self._current_repo = metrics.repo
-
         console.log("Writing markdown report", f"path={report_path}")
 
-        # Add font styles at the beginning
-        font_styles = [
-            '<style>',
-            '  @import url("https://fonts.googleapis.com/css2?family=Noto+Sans+KR:wght@300;400;500;700&display=swap");',
-            '  * {',
-            '    font-family: "Noto Sans KR", -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, "Helvetica Neue", Arial, sans-serif;',
-            '  }',
-            '</style>',
-            ''
-        ]
-
-        # Build all sections using the new builders
-        sections = [
-            # 1. Header with basic info & Summary Overview Table
-            SummaryBuilder(metrics, self.llm_client).build(),
-            # 2. Table of Contents - Easy navigation
-            TOCBuilder(metrics).build(),
-            # 3. Dashboard - Key metrics at a glance
-            DashboardBuilder(metrics).build(),
-            # 4. Character Stats - Gamified visualization
-            CharacterStatsBuilder(metrics).build(),
-            # 5. Contribution Streak - NEW! Streak system with heatmap
-            StreakBuilder(metrics).build(),
-            # 6. Skill Tree - Game-style skill representation
-            SkillTreeBuilder(metrics).build(),
-            # 7. Awards Cabinet - Celebrate achievements first!
-            AwardsBuilder(metrics).build(),
-            # 8. Growth Highlights - Show the story
-            HighlightsBuilder(metrics).build(),
-            # 9. Time Machine - NEW! Past vs present comparison
-            TimeMachineBuilder(metrics).build(),
-            # 10. Monthly Trends - Show patterns
-            MonthlyTrendsBuilder(metrics).build(),
-            # 11. Detailed Feedback - Actionable insights
-            FeedbackBuilder(metrics, self.web_url).build(),
-            # 12. Fun Statistics - NEW! Entertaining insights
-            FunStatsBuilder(metrics).build(),
-            # 13. Future Predictions - NEW! AI-based predictions
-            PredictionBuilder(metrics).build(),
-            # 14. Storytelling - NEW! RPG quest narrative
-            StorytellingBuilder(metrics).build(),
-            # 15. Deep Retrospective - Comprehensive analysis
-            RetrospectiveBuilder(metrics).build(),
-            # 16. Witch's Critique - Harsh but constructive feedback
-            WitchCritiqueBuilder(metrics).build(),
-            # 17. Spotlight Examples - Concrete evidence
-            SpotlightBuilder(metrics).build(),
-            # 18. Tech Stack - Technical breadth
-            TechStackBuilder(metrics).build(),
-        ]
-
-        # Combine all sections
-        all_lines = []
-        all_lines.extend(font_styles)  # Add font styles first
-        for section in sections:
-            all_lines.extend(section)
+        # Store repo for use in link generation
+        self._current_repo = metrics.repo
 
         try:
-            report_path.write_text("\n".join(all_lines), encoding="utf-8")
+            with ReportStreamWriter(report_path) as writer:
+                writer.write_lines(FONT_STYLES)
+                for section in self.iter_sections(metrics):
+                    writer.write_lines(section)
         except (IOError, OSError) as e:
             raise IOError(f"Failed to write report to {report_path}: {e}") from e
 
@@ -145,6 +113,8 @@ class Reporter:
         """Generate markdown report content without writing to file.
 
         This is useful for in-memory report generation without creating files.
+        Sections are memoized per metrics snapshot, so a later
+        :meth:`generate_markdown` for the same snapshot reuses this render.
 
         Args:
             metrics: Metrics snapshot to generate report from
@@ -155,61 +125,117 @@ class Reporter:
         # Store repo for use in link generation
         self._current_repo = metrics.repo
 
-        # Add font styles at the beginning
-        font_styles = [
-            '<style>',
-            '  @import url("https://fonts.googleapis.com/css2?family=Noto+Sans+KR:wght@300;400;500;700&display=swap");',
-            '  * {',
-            '    font-family: "Noto Sans KR", -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, "Helvetica Neue", Arial, sans-serif;',
-            '  }',
-            '</style>',
-            ''
-        ]
+        all_lines = list(FONT_STYLES)  # Add font styles first
+        for section in self.render_sections(metrics):
+            all_lines.extend(section)
+
+        return "\n".join(all_lines)
+
+    def render_document(self, metrics: MetricSnapshot) -> ReportDocument:
+        """Render the report as a document tree for integration and other serialisers.
+
+        Args:
+            metrics: Metrics snapshot to generate report from
+
+        Returns:
+            ReportDocument whose markdown equals :meth:`generate_markdown_content`
+        """
+        self._current_repo = metrics.repo
+        return ReportDocument.parse(itertools.chain(FONT_STYLES, *self.render_sections(metrics)))
+
+    def render_sections(self, metrics: MetricSnapshot) -> List[List[str]]:
+        """Render every report section in display order.
 
-        # Build all sections using the new builders (same as generate_markdown)
-        sections = [
+        The LLM-backed summary quote is requested first on a worker thread and
+        the deterministic builders render while it is in flight, so the render
+        takes roughly as long as the slowest of the two rather than their sum.
+        Results are memoized by a digest of the snapshot contents.
+
+        Args:
+            metrics: Metrics snapshot to render
+
+        Returns:
+            One list of markdown lines per section
+        """
+        key = self._render_key(metrics)
+        cached = self._section_cache.get(key)
+        if cached is not None:
+            return cached
+
+        builders = self._section_builders(metrics)
+        with ThreadPoolExecutor(max_workers=len(LLM_SECTIONS), thread_name_prefix="report-llm") as executor:
+            pending = {
+                name: executor.submit(build) for name, build in builders if name in LLM_SECTIONS
+            }
+            rendered = {name: build() for name, build in builders if name not in LLM_SECTIONS}
+            rendered.update({name: future.result() for name, future in pending.items()})
+
+        sections = [rendered[name] for name, _ in builders]
+        self._section_cache[key] = sections
+        return sections
+
+    def iter_sections(self, metrics: MetricSnapshot) -> Iterator[List[str]]:
+        """Yield report sections in display order as they are rendered.
+
+        The streaming counterpart of :meth:`render_sections`: a memoized
+        render is reused, but a fresh one is not cached, so only the sections
+        rendered ahead while the summary quote is in flight are held at once.
+
+        Args:
+            metrics: Metrics snapshot to render
+        """
+        cached = self._section_cache.get(self._render_key(metrics))
+        if cached is not None:
+            yield from cached
+            return
+
+        with ThreadPoolExecutor(max_workers=len(LLM_SECTIONS), thread_name_prefix="report-llm") as executor:
+            yield from iter_sections(self._section_builders(metrics), LLM_SECTIONS, executor)
+
+    def _render_key(self, metrics: MetricSnapshot) -> Tuple[str, str, bool]:
+        """Cache key covering every input that affects the rendered sections."""
+        digest = hashlib.sha256(repr(metrics).encode("utf-8")).hexdigest()
+        return digest, self.web_url, self.llm_client is not None
+
+    def _section_builders(
+        self, metrics: MetricSnapshot
+    ) -> List[Tuple[str, Callable[[], List[str]]]]:
+        """Section factories in report order."""
+        return [
             # 1. Header with basic info & Summary Overview Table
-            SummaryBuilder(metrics, self.llm_client).build(),
+            ("summary", lambda: SummaryBuilder(metrics, self.llm_client).build()),
             # 2. Table of Contents - Easy navigation
-            TOCBuilder(metrics).build(),
+            ("toc", lambda: TOCBuilder(metrics).build()),
             # 3. Dashboard - Key metrics at a glance
-            DashboardBuilder(metrics).build(),
+            ("dashboard", lambda: DashboardBuilder(metrics).build()),
             # 4. Character Stats - Gamified visualization
-            CharacterStatsBuilder(metrics).build(),
-            # 5. Contribution Streak - NEW! Streak system with heatmap
-            StreakBuilder(metrics).build(),
+            ("character_stats", lambda: CharacterStatsBuilder(metrics).build()),
+            # 5. Contribution Streak - Streak system with heatmap
+            ("streak", lambda: StreakBuilder(metrics).build()),
             # 6. Skill Tree - Game-style skill representation
-            SkillTreeBuilder(metrics).build(),
+            ("skill_tree", lambda: SkillTreeBuilder(metrics).build()),
             # 7. Awards Cabinet - Celebrate achievements first!
-            AwardsBuilder(metrics).build(),
+            ("awards", lambda: AwardsBuilder(metrics).build()),
             # 8. Growth Highlights - Show the story
-            HighlightsBuilder(metrics).build(),
-            # 9. Time Machine - NEW! Past vs present comparison
-            TimeMachineBuilder(metrics).build(),
+            ("highlights", lambda: HighlightsBuilder(metrics).build()),
+            # 9. Time Machine - Past vs present comparison
+            ("time_machine", lambda: TimeMachineBuilder(metrics).build()),
             # 10. Monthly Trends - Show patterns
-            MonthlyTrendsBuilder(metrics).build(),
+            ("monthly_trends", lambda: MonthlyTrendsBuilder(metrics).build()),
             # 11. Detailed Feedback - Actionable insights
-            FeedbackBuilder(metrics, self.web_url).build(),
-            # 12. Fun Statistics - NEW! Entertaining insights
-            FunStatsBuilder(metrics).build(),
-            # 13. Future Predictions - NEW! AI-based predictions
-            PredictionBuilder(metrics).build(),
-            # 14. Storytelling - NEW! RPG quest narrative
-            StorytellingBuilder(metrics).build(),
+            ("feedback", lambda: FeedbackBuilder(metrics, self.web_url).build()),
+            # 12. Fun Statistics - Entertaining insights
+            ("fun_stats", lambda: FunStatsBuilder(metrics).build()),
+            # 13. Future Predictions - AI-based predictions
+            ("predictions", lambda: PredictionBuilder(metrics).build()),
+            # 14. Storytelling - RPG quest narrative
+            ("storytelling", lambda: StorytellingBuilder(metrics).build()),
             # 15. Deep Retrospective - Comprehensive analysis
-            RetrospectiveBuilder(metrics).build(),
+            ("retrospective", lambda: RetrospectiveBuilder(metrics).build()),
             # 16. Witch's Critique - Harsh but constructive feedback
-            WitchCritiqueBuilder(metrics).build(),
+            ("witch_critique", lambda: WitchCritiqueBuilder(metrics).build()),
             # 17. Spotlight Examples - Concrete evidence
-            SpotlightBuilder(metrics).build(),
+            ("spotlight", lambda: SpotlightBuilder(metrics).build()),
             # 18. Tech Stack - Technical breadth
-            TechStackBuilder(metrics).build(),
+            ("tech_stack", lambda: TechStackBuilder(metrics).build()),
         ]
-
-        # Combine all sections
-        all_lines = []
-        all_lines.extend(font_styles)  # Add font styles first
-        for section in sections:
-            all_lines.extend(section)
-
-        return "\n".join(all_lines)
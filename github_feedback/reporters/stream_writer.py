@@ -0,0 +1,135 @@
+"""Incremental writer for large markdown reports."""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import Executor
+from pathlib import Path
+from types import TracebackType
+from typing import IO, Callable, Collection, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Type
+
+from ..core.utils import FileSystemManager
+
+# Bytes buffered by the underlying file object before hitting the disk
+WRITE_BUFFER_SIZE = 64 * 1024
+
+
+class ReportStreamWriter:
+    """Write report lines to disk as builders produce them.
+
+    Lines are separated exactly like ``"\\n".join(lines)`` would, so streaming a
+    report gives the same file as joining it in memory, while only the write
+    buffer is held at any time. The report is written to a temporary file that
+    replaces the target on success, so a failed render never leaves a
+    truncated report behind.
+
+    Example:
+        >>> with ReportStreamWriter(Path("report.md")) as writer:
+        ...     writer.write_lines(header_lines)
+        ...     for chunk in iter_repository_sections(repos):
+        ...         writer.write_lines(chunk)
+    """
+
+    def __init__(self, path: Path, *, strip: bool = False) -> None:
+        """Create a writer for ``path``.
+
+        Args:
+            path: Destination file
+            strip: Drop blank lines at the start and end of the report, like
+                ``str.strip()`` on the joined text
+        """
+        self.path = path
+        self.strip = strip
+        self.lines_written = 0
+        self._tmp_path = path.with_name(f".{path.name}.tmp")
+        self._file: Optional[IO[str]] = None
+        self._pending_blank = 0  # Blank lines held back while stripping the tail
+
+    def __enter__(self) -> ReportStreamWriter:
+        FileSystemManager.ensure_parent_directory(self.path)
+        self._file = open(self._tmp_path, "w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE)
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        assert self._file is not None
+        self._file.close()
+        self._file = None
+        if exc_type is None:
+            os.replace(self._tmp_path, self.path)
+        else:
+            self._tmp_path.unlink(missing_ok=True)
+
+    def write(self, line: str) -> None:
+        """Append one line (which may itself contain newlines)."""
+        if self._file is None:
+            raise RuntimeError("ReportStreamWriter must be used as a context manager")
+
+        if self.strip and not line.strip():
+            # Leading blanks are dropped; trailing ones wait for more content
+            if self.lines_written:
+                self._pending_blank += 1
+            return
+
+        if self._pending_blank:
+            self._file.write("\n" * self._pending_blank)
+            self.lines_written += self._pending_blank
+            self._pending_blank = 0
+        if self.lines_written:
+            self._file.write("\n")
+        self._file.write(line)
+        self.lines_written += 1
+
+    def write_lines(self, lines: Iterable[str]) -> None:
+        """Append lines from a list or generator without materialising them."""
+        for line in lines:
+            self.write(line)
+
+
+def iter_sections(
+    builders: Sequence[Tuple[str, Callable[[], List[str]]]],
+    background: Collection[str],
+    executor: Executor,
+) -> Iterator[List[str]]:
+    """Yield rendered sections in report order as soon as each one is ready.
+
+    Sections named in ``background`` (LLM requests) are submitted to
+    ``executor`` up front; the others render lazily on the calling thread.
+    A section is rendered ahead of its turn only while an earlier background
+    section is still in flight, so the wait overlaps useful work and
+    otherwise a single section's lines are held at a time.
+
+    Args:
+        builders: ``(name, build)`` pairs in report order
+        background: Names of the sections to render on ``executor``
+        executor: Executor for the background sections
+    """
+    names = [name for name, _ in builders]
+    pending = {name: executor.submit(build) for name, build in builders if name in background}
+    rendered: Dict[str, List[str]] = {}
+    position = 0  # Index of the next section to yield
+
+    for name, build in builders:
+        if name not in background:
+            rendered[name] = build()
+        while position < len(names):
+            head = names[position]
+            future = pending.get(head)
+            if future is not None:
+                if not future.done():
+                    break
+                rendered[head] = pending.pop(head).result()
+            if head not in rendered:
+                break
+            yield rendered.pop(head)
+            position += 1
+
+    for head in names[position:]:
+        yield pending.pop(head).result() if head in pending else rendered.pop(head)
+
+
+__all__ = ["ReportStreamWriter", "iter_sections"]
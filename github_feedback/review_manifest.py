@@ -0,0 +1,141 @@
+"""Per-repository manifest recording the inputs each stored PR review was built from."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Optional
+
+from .core.utils import FileSystemManager
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILENAME = "review_manifest.json"
+MANIFEST_VERSION = 1
+
+
+@dataclass(slots=True)
+class ManifestEntry:
+    """Inputs that determine whether a stored review is still current."""
+
+    head_sha: str
+    updated_at: str  # ISO timestamp in UTC
+    model: str
+    prompt_hash: str
+    reviewed_at: str
+
+    def matches(self, model: str, prompt_hash: str) -> bool:
+        """Whether the review was produced by the same model and prompt version."""
+        return self.model == model and self.prompt_hash == prompt_hash
+
+    def updated_at_datetime(self) -> Optional[datetime]:
+        """Parse ``updated_at``; None when the stored value is malformed."""
+        try:
+            return datetime.fromisoformat(self.updated_at)
+        except ValueError:
+            return None
+
+
+class ReviewManifest:
+    """Thread-safe JSON manifest stored next to a repository's PR review folders.
+
+    The manifest answers "is this review stale?" for every PR of a repository
+    from a single small file, without opening the per-PR artefacts. With
+    ``autosave`` off, changes only mark it dirty and :meth:`flush` writes
+    them once, so a run over many PRs does not rewrite it per PR.
+    """
+
+    def __init__(self, path: Path, autosave: bool = True) -> None:
+        self.path = path
+        self.autosave = autosave
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._entries: Dict[int, ManifestEntry] = self._load()
+
+    def _load(self) -> Dict[int, ManifestEntry]:
+        if not self.path.exists():
+            return {}
+        try:
+            payload = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError) as exc:
+            logger.warning(f"Ignoring unreadable review manifest {self.path}: {exc}")
+            return {}
+
+        if not isinstance(payload, dict) or payload.get("version") != MANIFEST_VERSION:
+            return {}
+
+        entries: Dict[int, ManifestEntry] = {}
+        for number, raw in (payload.get("pull_requests") or {}).items():
+            try:
+                entries[int(number)] = ManifestEntry(**raw)
+            except (TypeError, ValueError):
+                logger.debug(f"Skipping malformed manifest entry for PR #{number}")
+        return entries
+
+    def get(self, number: int) -> Optional[ManifestEntry]:
+        """Return the entry recorded for a pull request, if any."""
+        with self._lock:
+            return self._entries.get(number)
+
+    def record(
+        self,
+        number: int,
+        head_sha: str,
+        updated_at: datetime,
+        model: str,
+        prompt_hash: str,
+    ) -> ManifestEntry:
+        """Record the inputs of a freshly generated review (saved per ``autosave``)."""
+        entry = ManifestEntry(
+            head_sha=head_sha,
+            updated_at=updated_at.astimezone(timezone.utc).isoformat(),
+            model=model,
+            prompt_hash=prompt_hash,
+            reviewed_at=datetime.now(timezone.utc).isoformat(),
+        )
+        with self._lock:
+            self._entries[number] = entry
+            self._changed_locked()
+        return entry
+
+    def touch(self, number: int, updated_at: datetime) -> None:
+        """Advance ``updated_at`` for a PR whose reviewed inputs did not change."""
+        with self._lock:
+            entry = self._entries.get(number)
+            if entry is None:
+                return
+            entry.updated_at = updated_at.astimezone(timezone.utc).isoformat()
+            self._changed_locked()
+
+    def flush(self) -> None:
+        """Write pending changes to disk."""
+        with self._lock:
+            if self._dirty:
+                self._save_locked()
+
+    def _changed_locked(self) -> None:
+        self._dirty = True
+        if self.autosave:
+            self._save_locked()
+
+    def _save_locked(self) -> None:
+        payload = {
+            "version": MANIFEST_VERSION,
+            "pull_requests": {
+                str(number): asdict(entry) for number, entry in sorted(self._entries.items())
+            },
+        }
+        FileSystemManager.ensure_parent_directory(self.path)
+        # Write then rename so readers never observe a partially written manifest
+        tmp_path = self.path.with_suffix(".json.tmp")
+        tmp_path.write_text(json.dumps(payload, ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp_path, self.path)
+        self._dirty = False
+
+
+__all__ = ["MANIFEST_FILENAME", "ManifestEntry", "ReviewManifest"]
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import json
-from typing import List
+from typing import Callable, Iterable, List, Optional
 
 from ..core.console import Console
 from ..llm.client import LLMClient
@@ -29,25 +29,45 @@ class PersonalDevelopmentAnalyzer:
     def __init__(self, llm: LLMClient | None = None) -> None:
         self.llm = llm
 
-    def analyze(self, repo: str, reviews: List[StoredReview]) -> PersonalDevelopmentAnalysis:
-        """Analyze personal development based on PR reviews."""
+    def analyze(
+        self,
+        repo: str,
+        reviews: List[StoredReview],
+        details: Optional[Callable[[], Iterable[StoredReview]]] = None,
+    ) -> PersonalDevelopmentAnalysis:
+        """Analyze personal development based on PR reviews.
+
+        Args:
+            repo: Repository name
+            reviews: Reviews in creation order
+            details: Optional source streaming the same reviews with the PR
+                bodies and review comments the prompt quotes, for callers
+                whose ``reviews`` were loaded without them
+        """
         if not self.llm or not reviews:
             return self._fallback_analysis(reviews)
 
         try:
-            messages = self._build_messages(repo, reviews)
+            messages = self._build_messages(repo, reviews, details)
             # Increased temperature from 0.4 to 0.6 for better response quality
             # Increased max_retries to 5 for more robust analysis
-            content = self.llm.complete(messages, temperature=0.6, max_retries=5)
+            content = self.llm.complete(
+                messages, temperature=0.6, max_retries=5, operation="personal_dev_reviews"
+            )
             data = json.loads(content)
             return self._build_analysis_from_llm(data)
         except Exception as exc:  # pragma: no cover
             console.log("LLM 개인 발전 분석 실패", str(exc))
             return self._fallback_analysis(reviews)
 
-    def _build_messages(self, repo: str, reviews: List[StoredReview]) -> List[dict]:
+    def _build_messages(
+        self,
+        repo: str,
+        reviews: List[StoredReview],
+        details: Optional[Callable[[], Iterable[StoredReview]]] = None,
+    ) -> List[dict]:
         """Create LLM messages for personal development prompt."""
-        context = self._build_prompt_context(repo, reviews)
+        context = self._build_prompt_context(repo, details() if details else reviews, len(reviews))
         early_reviews, recent_reviews = self._split_reviews_for_growth(reviews)
 
         return [
@@ -63,11 +83,11 @@ class PersonalDevelopmentAnalyzer:
             },
         ]
 
-    def _build_prompt_context(self, repo: str, reviews: List[StoredReview]) -> str:
-        """Build context string for LLM prompt."""
+    def _build_prompt_context(self, repo: str, reviews: Iterable[StoredReview], total: int) -> str:
+        """Build context string for LLM prompt, consuming ``reviews`` once."""
         lines: List[str] = []
         lines.append(f"Repository: {repo}")
-        lines.append(f"총 리뷰 PR 수: {len(reviews)}")
+        lines.append(f"총 리뷰 PR 수: {total}")
         lines.append("")
         lines.append("Pull Request 요약:")
 
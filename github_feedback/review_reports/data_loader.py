@@ -3,15 +3,26 @@
 from __future__ import annotations
 
 import json
+import logging
+import sqlite3
+import threading
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import List
+from typing import Dict, Iterable, Iterator, List, Optional
 
 from ..core.console import Console
 from ..core.models import ReviewPoint
+from .store import COLUMNS, STORE_FILENAME, ReviewStore
 
 console = Console()
+logger = logging.getLogger(__name__)
+
+SUMMARY_FILENAME = "review_summary.json"
+ARTEFACTS_FILENAME = "artefacts.json"
+
+# Fields that are always loaded, whatever projection is requested
+KEY_FIELDS = ("number", "created_at")
 
 
 @dataclass(slots=True)
@@ -39,6 +50,8 @@ class ReviewDataLoader:
 
     def __init__(self, output_dir: Path = Path("reports/reviews")) -> None:
         self.output_dir = output_dir
+        self._stores: Dict[str, ReviewStore] = {}
+        self._stores_lock = threading.Lock()
 
     def _repo_dir(self, repo: str) -> Path:
         safe_repo = repo.replace("/", "__")
@@ -62,25 +75,167 @@ class ReviewDataLoader:
             points.append(ReviewPoint(message=message, example=example))
         return points
 
-    def load_reviews(self, repo: str) -> List[StoredReview]:
-        """Load all reviews for a repository."""
+    def store(self, repo: str) -> ReviewStore:
+        """Return the consolidated review store of a repository (one per loader)."""
+        with self._stores_lock:
+            store = self._stores.get(repo)
+            if store is None:
+                store = self._stores[repo] = ReviewStore(self._repo_dir(repo) / STORE_FILENAME)
+            return store
+
+    def load_reviews(self, repo: str, fields: Optional[Iterable[str]] = None) -> List[StoredReview]:
+        """Load all reviews for a repository.
+
+        Args:
+            repo: Repository name in owner/repo format
+            fields: Optional projection; see :meth:`iter_reviews`
+        """
+        return list(self.iter_reviews(repo, fields))
+
+    def iter_reviews(
+        self, repo: str, fields: Optional[Iterable[str]] = None, *, sync: bool = True
+    ) -> Iterator[StoredReview]:
+        """Stream reviews ordered by creation date from the repository store.
+
+        The store is refreshed first from any ``pr-*`` folder whose files are
+        newer than its record, so reviews written by older versions are picked
+        up once and unchanged PRs are never re-parsed.
+
+        Args:
+            repo: Repository name in owner/repo format
+            fields: StoredReview fields to load (``number`` and ``created_at``
+                are always included); omitted fields keep empty defaults.
+                None loads everything.
+            sync: Refresh the store from the review folders first; later
+                passes over a store synced moments ago can skip it
+
+        Raises:
+            ValueError: If ``fields`` names an unknown field
+        """
         repo_dir = self._repo_dir(repo)
         if not repo_dir.exists():
-            return []
+            return
 
-        reviews: List[StoredReview] = []
-        for pr_dir in sorted(repo_dir.glob("pr-*")):
-            summary_data = self._load_json_payload(pr_dir / "review_summary.json")
-            artefact_data = self._load_json_payload(pr_dir / "artefacts.json")
-            if not summary_data or not artefact_data:
+        columns = list(COLUMNS) if fields is None else list(dict.fromkeys([*KEY_FIELDS, *fields]))
+        store = self.store(repo)
+        try:
+            if sync:
+                self.sync_store(repo)
+        except sqlite3.Error as exc:
+            logger.warning(f"Review store unavailable ({exc}); reading review files directly")
+            yield from self._iter_reviews_from_files(repo_dir)
+            return
+
+        for record in store.iter_records(columns):
+            yield self._review_from_record(record)
+
+    def sync_store(self, repo: str) -> None:
+        """Import new or modified ``pr-*`` folders into the store and drop deleted ones."""
+        repo_dir = self._repo_dir(repo)
+        store = self.store(repo)
+        known = store.source_mtimes()
+        seen: set[int] = set()
+
+        for pr_dir in repo_dir.glob("pr-*"):
+            try:
+                number = int(pr_dir.name[len("pr-"):])
+                mtime_ns = max(
+                    (pr_dir / SUMMARY_FILENAME).stat().st_mtime_ns,
+                    (pr_dir / ARTEFACTS_FILENAME).stat().st_mtime_ns,
+                )
+            except (ValueError, OSError):
+                continue
+            seen.add(number)
+            if known.get(number) == mtime_ns:
                 continue
 
-            stored_review = self._build_stored_review(summary_data, artefact_data, pr_dir)
+            review = self._load_review_dir(pr_dir)
+            if review is None:
+                continue
+            self.save_review(store, review, mtime_ns)
+
+        removed = set(known) - seen
+        if removed:
+            store.delete(removed)
+
+    def record_review(self, repo: str, summary_data: dict, artefact_data: dict) -> None:
+        """Store a review that was just written to its ``pr-*`` folder.
+
+        Keeps the store current without re-parsing the files on the next load.
+        """
+        pr_dir = self._repo_dir(repo) / f"pr-{artefact_data.get('number')}"
+        review = self._build_stored_review(summary_data, artefact_data, pr_dir)
+        if review is None:
+            return
+        mtime_ns = max(
+            (pr_dir / SUMMARY_FILENAME).stat().st_mtime_ns,
+            (pr_dir / ARTEFACTS_FILENAME).stat().st_mtime_ns,
+        )
+        self.save_review(self.store(repo), review, mtime_ns)
+
+    @staticmethod
+    def save_review(store: ReviewStore, review: StoredReview, source_mtime_ns: int) -> None:
+        """Write a review into the store."""
+        record = {
+            "number": review.number,
+            "title": review.title,
+            "author": review.author,
+            "html_url": review.html_url,
+            "created_at": review.created_at.isoformat(),
+            "overview": review.overview,
+            "strengths": [point.to_dict() for point in review.strengths],
+            "improvements": [point.to_dict() for point in review.improvements],
+            "body": review.body,
+            "review_bodies": review.review_bodies or [],
+            "review_comments": review.review_comments or [],
+            "additions": review.additions,
+            "deletions": review.deletions,
+            "changed_files": review.changed_files,
+        }
+        created_ts = (
+            review.created_at.timestamp()
+            if review.created_at.tzinfo
+            else review.created_at.replace(tzinfo=timezone.utc).timestamp()
+        )
+        store.upsert(record, created_ts, source_mtime_ns)
+
+    def _review_from_record(self, record: dict) -> StoredReview:
+        """Build a StoredReview from a (possibly projected) store record."""
+        return StoredReview(
+            number=record["number"],
+            title=record.get("title", ""),
+            author=record.get("author", ""),
+            html_url=record.get("html_url", ""),
+            created_at=datetime.fromisoformat(record["created_at"]),
+            overview=record.get("overview", ""),
+            strengths=self._load_points(record.get("strengths", [])),
+            improvements=self._load_points(record.get("improvements", [])),
+            body=record.get("body", ""),
+            review_bodies=record.get("review_bodies", []),
+            review_comments=record.get("review_comments", []),
+            additions=record.get("additions", 0),
+            deletions=record.get("deletions", 0),
+            changed_files=record.get("changed_files", 0),
+        )
+
+    def _load_review_dir(self, pr_dir: Path) -> StoredReview | None:
+        """Parse the review files of a single ``pr-*`` folder."""
+        summary_data = self._load_json_payload(pr_dir / SUMMARY_FILENAME)
+        artefact_data = self._load_json_payload(pr_dir / ARTEFACTS_FILENAME)
+        if not summary_data or not artefact_data:
+            return None
+        return self._build_stored_review(summary_data, artefact_data, pr_dir)
+
+    def _iter_reviews_from_files(self, repo_dir: Path) -> Iterator[StoredReview]:
+        """Read reviews straight from the ``pr-*`` folders (store fallback)."""
+        reviews: List[StoredReview] = []
+        for pr_dir in sorted(repo_dir.glob("pr-*")):
+            stored_review = self._load_review_dir(pr_dir)
             if stored_review:
                 reviews.append(stored_review)
 
         reviews.sort(key=lambda item: (item.created_at, item.number))
-        return reviews
+        yield from reviews
 
     def _load_json_payload(self, path: Path) -> dict | None:
         """Load and validate JSON payload from file."""
@@ -2,13 +2,17 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
 from ..core.console import Console
-from ..game_elements import GameRenderer
+from ..core.constants import REVIEW_REPORT_LIMITS
+from ..core.models import PersonalDevelopmentAnalysis
 from ..llm.client import LLMClient
+from ..reporters.stream_writer import ReportStreamWriter, iter_sections
 from ..prompts import get_team_report_system_prompt, get_team_report_user_prompt
 from .analysis import PersonalDevelopmentAnalyzer
 from .data_loader import ReviewDataLoader, StoredReview
@@ -19,18 +23,46 @@ from .sections import (
     render_pr_activity_timeline,
     render_statistics_dashboard,
 )
+from .sections.pr_list import PR_LIST_PAGE_DIR, iter_pr_list_pages, render_pr_list
 
 console = Console()
 
+# Review fields the report sections read; PR bodies and review texts stay on disk
+REPORT_FIELDS = (
+    "title",
+    "author",
+    "html_url",
+    "overview",
+    "strengths",
+    "improvements",
+    "additions",
+    "deletions",
+    "changed_files",
+)
+# Streamed once into the personal development prompt
+PROMPT_FIELDS = (*REPORT_FIELDS, "body", "review_comments")
+# Streamed once to count PRs with review engagement
+ENGAGEMENT_FIELDS = ("review_bodies", "review_comments")
+
 
 class ReviewReporter:
     """Build integrated Korean reports from individual pull request reviews."""
 
-    def __init__(self, *, output_dir: Path = Path("reports/reviews"), llm: LLMClient | None = None) -> None:
+    def __init__(
+        self,
+        *,
+        output_dir: Path = Path("reports/reviews"),
+        llm: LLMClient | None = None,
+        pr_page_size: int = REVIEW_REPORT_LIMITS['pr_list_page_size'],
+    ) -> None:
         self.output_dir = output_dir
         self.llm = llm
+        self.pr_page_size = pr_page_size
         self.data_loader = ReviewDataLoader(output_dir)
         self.analyzer = PersonalDevelopmentAnalyzer(llm)
+        # LLM-backed section results keyed by (repo, reviews digest)
+        self._personal_dev_cache: Dict[Tuple[str, str], PersonalDevelopmentAnalysis] = {}
+        self._team_report_cache: Dict[Tuple[str, str], Optional[str]] = {}
 
     def create_integrated_report(self, repo: str) -> Path:
         """Create or refresh the integrated review report for a repository.
@@ -47,25 +79,33 @@ class ReviewReporter:
         if not repo_input:
             raise ValueError("Repository cannot be empty")
 
-        reviews = self.data_loader.load_reviews(repo_input)
+        loader = self.data_loader
+        reviews = list(loader.iter_reviews(repo_input, fields=REPORT_FIELDS))
         if not reviews:
             raise ValueError("No review summaries found for the given repository")
+        reviewed_prs = sum(
+            1
+            for review in loader.iter_reviews(repo_input, fields=ENGAGEMENT_FIELDS, sync=False)
+            if review.review_bodies or review.review_comments
+        )
 
-        # Generate integrated report with all sections
-        console.log("통합 보고서 생성 중... (캐릭터 스탯 + 개인 피드백 + 팀 분석)")
-        report_text = self._generate_report_text(repo_input, reviews)
-
-        # Save report
-        from ..core.utils import FileSystemManager
+        def details() -> Iterable[StoredReview]:
+            return loader.iter_reviews(repo_input, fields=PROMPT_FIELDS, sync=False)
 
+        # Generate integrated report with all sections, streaming them to disk
+        # as they are rendered instead of joining them into one string
+        console.log("통합 보고서 생성 중... (캐릭터 스탯 + 개인 피드백 + 팀 분석)")
         repo_dir = self.data_loader._repo_dir(repo_input)
-        FileSystemManager.ensure_directory(repo_dir)
         report_path = repo_dir / "integrated_report.md"
-        report_path.write_text(report_text, encoding="utf-8")
+        with ReportStreamWriter(report_path, strip=True) as writer:
+            for section in self._iter_sections(repo_input, reviews, reviewed_prs=reviewed_prs, details=details):
+                writer.write_lines(section)
+        self._write_pr_list_pages(repo_dir, repo_input, reviews)
 
-        # Also save personal development analysis as JSON for programmatic access
+        # Also save personal development analysis as JSON for programmatic access,
+        # reusing the (memoized) analysis rendered into the markdown report
         console.log("개인 성장 분석 JSON 저장 중...")
-        personal_dev = self.analyzer.analyze(repo_input, reviews)
+        personal_dev = self._analyze_personal_development(repo_input, reviews, details)
         personal_dev_path = repo_dir / "personal_development.json"
         personal_dev_path.write_text(
             json.dumps(personal_dev.to_dict(), indent=2, ensure_ascii=False),
@@ -76,8 +116,98 @@ class ReviewReporter:
         console.log(f"✅ 개인 성장 분석: {personal_dev_path}")
         return report_path
 
+    def _write_pr_list_pages(self, repo_dir: Path, repo: str, reviews: List[StoredReview]) -> None:
+        """Write the PR list pages linked from the report, rendering one page at a time."""
+        page_dir = repo_dir / PR_LIST_PAGE_DIR
+        written = set()
+        for name, lines in iter_pr_list_pages(repo, reviews, self.pr_page_size):
+            with ReportStreamWriter(page_dir / name) as writer:
+                writer.write_lines(lines)
+            written.add(name)
+
+        # Drop pages left over from an earlier, longer PR list
+        if page_dir.is_dir():
+            for stale in page_dir.glob("page-*.md"):
+                if stale.name not in written:
+                    stale.unlink()
+
+    @staticmethod
+    def _reviews_key(repo: str, reviews: List[StoredReview]) -> Tuple[str, str]:
+        """Memoization key identifying a repository's set of reviews."""
+        digest = hashlib.sha256(repr(reviews).encode("utf-8")).hexdigest()
+        return repo, digest
+
+    def _analyze_personal_development(
+        self,
+        repo: str,
+        reviews: List[StoredReview],
+        details: Optional[Callable[[], Iterable[StoredReview]]] = None,
+    ) -> PersonalDevelopmentAnalysis:
+        """Run (or reuse) the personal development analysis for ``reviews``."""
+        key = self._reviews_key(repo, reviews)
+        if key not in self._personal_dev_cache:
+            self._personal_dev_cache[key] = self.analyzer.analyze(repo, reviews, details)
+        return self._personal_dev_cache[key]
+
+    def _generate_team_report(self, repo: str, reviews: List[StoredReview]) -> Optional[str]:
+        """Request (or reuse) the LLM team report.
+
+        Returns:
+            Report markdown, or None when the LLM request failed
+        """
+        key = self._reviews_key(repo, reviews)
+        if key in self._team_report_cache:
+            return self._team_report_cache[key]
+
+        try:
+            context = self._build_prompt_context(repo, reviews)
+            messages = [
+                {
+                    "role": "system",
+                    "content": get_team_report_system_prompt(),
+                },
+                {
+                    "role": "user",
+                    "content": get_team_report_user_prompt(context),
+                },
+            ]
+            # Increased temperature from 0.4 to 0.5 for better response quality
+            # Increased max_retries to 5 for more robust analysis
+            team_report: Optional[str] = self.llm.complete(
+                messages, temperature=0.5, max_retries=5, operation="team_report"
+            )
+        except Exception as exc:  # pragma: no cover
+            console.log("LLM 팀 보고서 생성 실패, 기본 통계로 대체", str(exc))
+            team_report = None
+
+        self._team_report_cache[key] = team_report
+        return team_report
+
     def _generate_report_text(self, repo: str, reviews: List[StoredReview]) -> str:
-        """Generate integrated report with consistent structure regardless of LLM availability.
+        """Generate integrated report with consistent structure regardless of LLM availability."""
+        return self._build_report(repo, reviews)[0]
+
+    def _build_report(
+        self, repo: str, reviews: List[StoredReview]
+    ) -> Tuple[str, PersonalDevelopmentAnalysis]:
+        """Render the integrated report text and return it with its personal analysis."""
+        text = "\n".join(line for section in self._iter_sections(repo, reviews) for line in section).strip()
+        return text, self._analyze_personal_development(repo, reviews)
+
+    def _iter_sections(
+        self,
+        repo: str,
+        reviews: List[StoredReview],
+        reviewed_prs: Optional[int] = None,
+        details: Optional[Callable[[], Iterable[StoredReview]]] = None,
+    ) -> Iterator[List[str]]:
+        """Yield the integrated report sections in report order.
+
+        The personal development analysis and the team report are independent
+        LLM requests and run concurrently on worker threads. Deterministic
+        sections render on this thread, ahead of their turn only while an
+        earlier LLM section is still in flight; every section is yielded as
+        soon as the ones before it were.
 
         Structure:
         1. Header and intro
@@ -86,7 +216,47 @@ class ReviewReporter:
         4. Team report (if LLM available) or statistics
         5. PR activity visualizations
         6. PR list and closing
+
+        Args:
+            repo: Repository name
+            reviews: Reviews, possibly loaded without PR bodies and review texts
+            reviewed_prs: PRs with review bodies or comments, when ``reviews``
+                lacks those texts
+            details: Streams the reviews with the texts the personal
+                development prompt quotes (default: ``reviews``)
         """
+        builders: List[Tuple[str, Callable[[], List[str]]]] = [
+            ("header", lambda: self._render_header(repo, reviews)),
+            ("character_stats", lambda: render_character_stats(reviews, reviewed_prs)),
+            (
+                "personal_development",
+                lambda: render_personal_development(
+                    self._analyze_personal_development(repo, reviews, details), reviews
+                ),
+            ),
+            ("team", lambda: self._render_team_section(repo, reviews)),
+            (
+                "activity",
+                lambda: [*render_pr_activity_timeline(reviews), *render_code_changes_visualization(reviews)],
+            ),
+            ("closing", lambda: self._render_pr_list_and_closing(reviews, self.pr_page_size)),
+        ]
+        background = {"personal_development", "team"} if self.llm else {"personal_development"}
+        with ThreadPoolExecutor(max_workers=2, thread_name_prefix="review-report") as executor:
+            yield from iter_sections(builders, background, executor)
+
+    def _render_team_section(self, repo: str, reviews: List[StoredReview]) -> List[str]:
+        """Render the LLM team report, or the statistics dashboard without one."""
+        team_report = self._generate_team_report(repo, reviews) if self.llm else None
+        if team_report is None:
+            return render_statistics_dashboard(reviews)
+        if team_report.strip():
+            return ["---", "", team_report.strip(), "", "---", ""]
+        return []
+
+    @staticmethod
+    def _render_header(repo: str, reviews: List[StoredReview]) -> List[str]:
+        """Render font styles, title and intro of the report."""
         lines: List[str] = []
 
         # Add font styles at the beginning
@@ -102,7 +272,6 @@ class ReviewReporter:
         lines.append("</style>")
         lines.append("")
 
-        # ============ 1. Header ============
         lines.append("# 🎯 개발자 성장 리포트")
         lines.append("")
         lines.append(f"**저장소**: {repo}")
@@ -114,65 +283,15 @@ class ReviewReporter:
         lines.append("")
         lines.append("---")
         lines.append("")
+        return lines
 
-        # ============ 2. Character Stats (RPG-style) ============
-        lines.extend(render_character_stats(reviews))
-
-        # ============ 3. Personal Development Analysis ============
-        personal_dev = self.analyzer.analyze(repo, reviews)
-        lines.extend(render_personal_development(personal_dev, reviews))
-
-        # ============ 4. Team Report (if LLM available) ============
-        if self.llm:
-            try:
-                context = self._build_prompt_context(repo, reviews)
-                messages = [
-                    {
-                        "role": "system",
-                        "content": get_team_report_system_prompt(),
-                    },
-                    {
-                        "role": "user",
-                        "content": get_team_report_user_prompt(context),
-                    },
-                ]
-                # Increased temperature from 0.4 to 0.5 for better response quality
-                # Increased max_retries to 5 for more robust analysis
-                team_report = self.llm.complete(messages, temperature=0.5, max_retries=5)
-                if team_report.strip():
-                    lines.append("---")
-                    lines.append("")
-                    lines.append(team_report.strip())
-                    lines.append("")
-                    lines.append("---")
-                    lines.append("")
-            except Exception as exc:  # pragma: no cover
-                console.log("LLM 팀 보고서 생성 실패, 기본 통계로 대체", str(exc))
-                lines.extend(render_statistics_dashboard(reviews))
-        else:
-            lines.extend(render_statistics_dashboard(reviews))
-
-        # ============ 5. PR Activity Visualizations ============
-        lines.extend(render_pr_activity_timeline(reviews))
-        lines.extend(render_code_changes_visualization(reviews))
-
-        # ============ 6. PR List and Closing ============
-        lines.append("## 📝 전체 PR 목록")
-        lines.append("")
-        lines.append("> 분석에 포함된 모든 PR 목록입니다")
-        lines.append("")
-
-        # Build table data
-        headers = ["#", "PR", "제목", "날짜", "링크"]
-        rows = []
-        for i, review in enumerate(reviews, 1):
-            date_str = review.created_at.strftime("%Y-%m-%d")
-            title_short = review.title[:50] + "..." if len(review.title) > 50 else review.title
-            link = f"[보기]({review.html_url})" if review.html_url else "-"
-            rows.append([str(i), f"#{review.number}", title_short, date_str, link])
-
-        # Render as HTML table
-        lines.extend(GameRenderer.render_html_table(headers=headers, rows=rows, title="", description="", striped=True))
+    @staticmethod
+    def _render_pr_list_and_closing(
+        reviews: List[StoredReview],
+        page_size: int = REVIEW_REPORT_LIMITS['pr_list_page_size'],
+    ) -> List[str]:
+        """Render the PR list (inline or as a page index) and the closing message."""
+        lines = render_pr_list(reviews, page_size)
 
         lines.append("---")
         lines.append("")
@@ -186,8 +305,7 @@ class ReviewReporter:
             "다음 리포트에서 더 멋진 성장을 기대합니다! 🌟"
         )
         lines.append("")
-
-        return "\n".join(lines).strip()
+        return lines
 
     def _build_prompt_context(self, repo: str, reviews: List[StoredReview]) -> str:
         """Build context string for team report prompt."""
@@ -4,6 +4,7 @@ from .character_stats import render_character_stats
 from .code_changes import render_code_changes_visualization
 from .personal_development import render_personal_development
 from .pr_activity import render_pr_activity_timeline
+from .pr_list import iter_pr_list_pages, render_pr_list
 from .statistics import render_statistics_dashboard
 
 __all__ = [
@@ -12,4 +13,6 @@ __all__ = [
     "render_statistics_dashboard",
     "render_pr_activity_timeline",
     "render_code_changes_visualization",
+    "render_pr_list",
+    "iter_pr_list_pages",
 ]
@@ -2,18 +2,18 @@
 
 from __future__ import annotations
 
-from typing import List
+from typing import List, Optional
 
 from ...game_elements import GameRenderer, LevelCalculator
 from ..data_loader import StoredReview
 from ..stats import ReviewStatsCalculator
 
 
-def render_character_stats(reviews: List[StoredReview]) -> List[str]:
+def render_character_stats(reviews: List[StoredReview], reviewed_prs: Optional[int] = None) -> List[str]:
     """Render RPG-style character stats visualization (티어 시스템 사용)."""
     lines: List[str] = []
 
-    stats = ReviewStatsCalculator.calculate_character_stats(reviews)
+    stats = ReviewStatsCalculator.calculate_character_stats(reviews, reviewed_prs)
     avg_stat = sum(stats.values()) / len(stats) if stats else 0
 
     # 티어 시스템으로 등급 계산
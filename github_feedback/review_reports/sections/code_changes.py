@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import heapq
 import html
 from typing import List
 
+from ...core.constants import REVIEW_REPORT_LIMITS
 from ...game_elements import GameRenderer
 from ..data_loader import StoredReview
 
@@ -18,18 +20,19 @@ def render_code_changes_visualization(reviews: List[StoredReview]) -> List[str]:
     lines.append("## 📊 PR별 코드 변경량 분석")
     lines.append("")
 
-    # Sort by total changes
-    sorted_reviews = sorted(reviews, key=lambda r: r.additions + r.deletions, reverse=True)
+    # Select the largest PRs without sorting the whole list
+    top_count = REVIEW_REPORT_LIMITS['top_changed_prs']
+    top_reviews = heapq.nlargest(top_count, reviews, key=lambda r: r.additions + r.deletions)
 
-    # Show top 10 PRs with most changes
-    lines.append("### 상위 10개 PR (변경량 기준)")
+    # Show top PRs with most changes
+    lines.append(f"### 상위 {top_count}개 PR (변경량 기준)")
     lines.append("")
 
     # Build table data
     headers = ["PR", "제목", "추가", "삭제", "총 변경", "시각화"]
     rows = []
 
-    for review in sorted_reviews[:10]:
+    for review in top_reviews:
         total_changes = review.additions + review.deletions
         max_bar_length = 20
 
@@ -68,8 +71,11 @@ def render_code_changes_visualization(reviews: List[StoredReview]) -> List[str]:
     lines.append("### 코드 변경량 분포")
     lines.append("")
 
-    total_additions = sum(r.additions for r in reviews)
-    total_deletions = sum(r.deletions for r in reviews)
+    total_additions = 0
+    total_deletions = 0
+    for review in reviews:
+        total_additions += review.additions
+        total_deletions += review.deletions
     total_changes = total_additions + total_deletions
 
     # Build table data for code change distribution
@@ -3,20 +3,36 @@
 from __future__ import annotations
 
 import html
-from typing import List
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set
 
+from ...core.constants import REVIEW_REPORT_LIMITS
 from ...game_elements import GameRenderer
 from ..data_loader import StoredReview
 
 
-def render_pr_activity_timeline(reviews: List[StoredReview]) -> List[str]:
-    """Render PR activity timeline using HTML table."""
+def render_pr_activity_timeline(
+    reviews: List[StoredReview],
+    max_rows: int = REVIEW_REPORT_LIMITS['timeline_max_rows'],
+) -> List[str]:
+    """Render PR activity timeline using HTML table.
+
+    Up to ``max_rows`` PRs are listed one per row; larger sets are summarised
+    in time buckets so the section size does not grow with the PR count.
+    """
     if not reviews:
         return []
 
     lines: List[str] = []
     lines.append("## 📅 PR 활동 타임라인")
     lines.append("")
+
+    if len(reviews) > max_rows:
+        lines.extend(_render_bucketed_timeline(reviews))
+        lines.append("---")
+        lines.append("")
+        return lines
+
     lines.append("> PR 활동의 시간 순서를 확인하세요")
     lines.append("")
 
@@ -67,4 +83,80 @@ def render_pr_activity_timeline(reviews: List[StoredReview]) -> List[str]:
     return lines
 
 
+@dataclass(slots=True)
+class _Bucket:
+    prs: int = 0
+    additions: int = 0
+    deletions: int = 0
+    authors: Set[str] = field(default_factory=set)
+    largest: Optional[StoredReview] = None
+
+
+def _render_bucketed_timeline(
+    reviews: List[StoredReview],
+    max_buckets: int = REVIEW_REPORT_LIMITS['timeline_max_buckets'],
+) -> List[str]:
+    """Summarise PRs per month (or per year for long histories) in one pass."""
+    monthly: Dict[str, _Bucket] = {}
+    for review in reviews:
+        bucket = monthly.setdefault(review.created_at.strftime("%Y-%m"), _Bucket())
+        bucket.prs += 1
+        bucket.additions += review.additions
+        bucket.deletions += review.deletions
+        bucket.authors.add(review.author)
+        changes = review.additions + review.deletions
+        if bucket.largest is None or changes > bucket.largest.additions + bucket.largest.deletions:
+            bucket.largest = review
+
+    buckets = monthly
+    period_label = "월"
+    if len(monthly) > max_buckets:
+        period_label = "연도"
+        buckets = {}
+        for month, bucket in monthly.items():
+            merged = buckets.setdefault(month[:4], _Bucket())
+            merged.prs += bucket.prs
+            merged.additions += bucket.additions
+            merged.deletions += bucket.deletions
+            merged.authors |= bucket.authors
+            largest = bucket.largest
+            if merged.largest is None or (
+                largest.additions + largest.deletions
+                > merged.largest.additions + merged.largest.deletions
+            ):
+                merged.largest = largest
+
+    lines = [
+        f"> PR {len(reviews)}개의 활동을 {period_label}별로 요약했습니다. 개별 PR은 전체 PR 목록을 참고하세요",
+        "",
+    ]
+
+    headers = [period_label, "PR 수", "작성자 수", "코드 변경", "최대 변경 PR"]
+    rows = []
+    for period in sorted(buckets):
+        bucket = buckets[period]
+        largest = bucket.largest
+        title_raw = largest.title[:40] + "..." if len(largest.title) > 40 else largest.title
+        largest_label = f"#{largest.number} {html.escape(title_raw, quote=False)}"
+        if largest.html_url:
+            largest_label = f"[{largest_label}]({html.escape(largest.html_url, quote=True)})"
+        rows.append(
+            [
+                period,
+                f"{bucket.prs:,}",
+                str(len(bucket.authors)),
+                f'<span style="color: #10b981;">+{bucket.additions:,}</span> / '
+                f'<span style="color: #ef4444;">-{bucket.deletions:,}</span>',
+                largest_label,
+            ]
+        )
+
+    lines.extend(
+        GameRenderer.render_html_table(
+            headers=headers, rows=rows, title="", description="", striped=True, escape_cells=False
+        )
+    )
+    return lines
+
+
 __all__ = ["render_pr_activity_timeline"]
@@ -0,0 +1,109 @@
+"""Full PR list section rendering with paging for large review sets."""
+
+from __future__ import annotations
+
+from typing import Iterator, List, Sequence, Tuple
+
+from ...core.constants import REVIEW_REPORT_LIMITS
+from ...game_elements import GameRenderer
+from ..data_loader import StoredReview
+
+# Directory next to the integrated report holding the PR list pages
+PR_LIST_PAGE_DIR = "pr_list"
+
+
+def pr_list_page_name(page: int) -> str:
+    """File name of a 1-based PR list page."""
+    return f"page-{page:03d}.md"
+
+
+def page_count(total: int, page_size: int) -> int:
+    """Number of pages needed for ``total`` PRs (at least one)."""
+    return max(1, -(-total // page_size))
+
+
+def _render_rows_table(reviews: Sequence[StoredReview], start: int) -> List[str]:
+    headers = ["#", "PR", "제목", "날짜", "링크"]
+    rows = []
+    for i, review in enumerate(reviews, start):
+        date_str = review.created_at.strftime("%Y-%m-%d")
+        title_short = review.title[:50] + "..." if len(review.title) > 50 else review.title
+        link = f"[보기]({review.html_url})" if review.html_url else "-"
+        rows.append([str(i), f"#{review.number}", title_short, date_str, link])
+    return GameRenderer.render_html_table(headers=headers, rows=rows, title="", description="", striped=True)
+
+
+def render_pr_list(
+    reviews: Sequence[StoredReview],
+    page_size: int = REVIEW_REPORT_LIMITS['pr_list_page_size'],
+) -> List[str]:
+    """Render the full PR table, or an index of page files when it is too long.
+
+    Args:
+        reviews: Reviews in report order
+        page_size: Maximum PRs rendered inline; larger sets link to pages
+            written by :func:`iter_pr_list_pages`
+    """
+    lines: List[str] = ["## 📝 전체 PR 목록", ""]
+
+    if len(reviews) <= page_size:
+        lines.append("> 분석에 포함된 모든 PR 목록입니다")
+        lines.append("")
+        lines.extend(_render_rows_table(reviews, 1))
+        return lines
+
+    pages = page_count(len(reviews), page_size)
+    lines.append(f"> 분석에 포함된 PR {len(reviews)}개를 {pages}개 페이지로 나누어 제공합니다")
+    lines.append("")
+
+    headers = ["페이지", "범위", "기간", "링크"]
+    rows = []
+    for page in range(1, pages + 1):
+        chunk = reviews[(page - 1) * page_size : page * page_size]
+        first, last = chunk[0], chunk[-1]
+        start = (page - 1) * page_size + 1
+        rows.append(
+            [
+                str(page),
+                f"{start}–{start + len(chunk) - 1}",
+                f"{first.created_at:%Y-%m-%d} ~ {last.created_at:%Y-%m-%d}",
+                f"[열기]({PR_LIST_PAGE_DIR}/{pr_list_page_name(page)})",
+            ]
+        )
+    lines.extend(GameRenderer.render_html_table(headers=headers, rows=rows, title="", description="", striped=True))
+    return lines
+
+
+def iter_pr_list_pages(
+    repo: str,
+    reviews: Sequence[StoredReview],
+    page_size: int = REVIEW_REPORT_LIMITS['pr_list_page_size'],
+) -> Iterator[Tuple[str, List[str]]]:
+    """Lazily render PR list pages as ``(file name, lines)`` pairs.
+
+    Yields nothing when the list fits inline in the main report.
+    """
+    if len(reviews) <= page_size:
+        return
+
+    pages = page_count(len(reviews), page_size)
+    for page in range(1, pages + 1):
+        start = (page - 1) * page_size
+        chunk = reviews[start : start + page_size]
+        nav = ["[← 통합 보고서](../integrated_report.md)"]
+        if page > 1:
+            nav.append(f"[이전 페이지]({pr_list_page_name(page - 1)})")
+        if page < pages:
+            nav.append(f"[다음 페이지]({pr_list_page_name(page + 1)})")
+
+        lines = [
+            f"# 📝 {repo} PR 목록 ({page}/{pages})",
+            "",
+            " · ".join(nav),
+            "",
+            *_render_rows_table(chunk, start + 1),
+        ]
+        yield pr_list_page_name(page), lines
+
+
+__all__ = ["PR_LIST_PAGE_DIR", "iter_pr_list_pages", "pr_list_page_name", "render_pr_list"]
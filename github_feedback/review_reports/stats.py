@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import List
+from typing import List, Optional
 
 from ..core.constants import (
     STAT_WEIGHTS_CODE_QUALITY,
@@ -18,8 +18,15 @@ class ReviewStatsCalculator:
     """Calculate RPG-style character stats from PR reviews."""
 
     @staticmethod
-    def calculate_character_stats(reviews: List[StoredReview]) -> dict:
-        """Calculate RPG-style character stats from PR reviews."""
+    def calculate_character_stats(reviews: List[StoredReview], reviewed_prs: Optional[int] = None) -> dict:
+        """Calculate RPG-style character stats from PR reviews.
+
+        Args:
+            reviews: Reviews to score
+            reviewed_prs: PRs that received review bodies or comments, for
+                callers that did not load those texts; counted from
+                ``reviews`` when omitted
+        """
         if not reviews:
             return {
                 "code_quality": 0,
@@ -42,8 +49,10 @@ class ReviewStatsCalculator:
         )
 
         # Collaboration (0-100): Based on review engagement
+        if reviewed_prs is None:
+            reviewed_prs = sum(1 for r in reviews if r.review_bodies or r.review_comments)
         collaboration = ReviewStatsCalculator._calculate_collaboration(
-            reviews, total_prs, total_strengths, total_improvements
+            reviewed_prs, total_prs, total_strengths, total_improvements
         )
 
         # Problem Solving (0-100): Based on PR complexity and scope
@@ -92,11 +101,10 @@ class ReviewStatsCalculator:
 
     @staticmethod
     def _calculate_collaboration(
-        reviews: List[StoredReview], total_prs: int, total_strengths: int, total_improvements: int
+        reviewed_prs: int, total_prs: int, total_strengths: int, total_improvements: int
     ) -> int:
         """Calculate collaboration stat."""
-        has_reviews = sum(1 for r in reviews if r.review_bodies or r.review_comments)
-        collaboration_rate = has_reviews / total_prs if total_prs > 0 else 0
+        collaboration_rate = reviewed_prs / total_prs if total_prs > 0 else 0
         avg_feedback = (total_strengths + total_improvements) / total_prs if total_prs > 0 else 0
 
         w_col = STAT_WEIGHTS_COLLABORATION
@@ -0,0 +1,170 @@
+"""Per-repository SQLite store of review records for fast report loading."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+from contextlib import closing
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, Mapping, Sequence
+
+STORE_FILENAME = "reviews.sqlite3"
+SCHEMA_VERSION = 1
+
+# Columns holding JSON-encoded lists
+JSON_COLUMNS = frozenset({"strengths", "improvements", "review_bodies", "review_comments"})
+
+COLUMNS = (
+    "number",
+    "title",
+    "author",
+    "html_url",
+    "created_at",
+    "overview",
+    "strengths",
+    "improvements",
+    "body",
+    "review_bodies",
+    "review_comments",
+    "additions",
+    "deletions",
+    "changed_files",
+)
+
+# Rows fetched per round trip while streaming
+FETCH_SIZE = 256
+
+# Statements run one by one: executescript() would commit the migration transaction
+_SCHEMA = (
+    """
+CREATE TABLE IF NOT EXISTS reviews (
+    number INTEGER PRIMARY KEY,
+    title TEXT NOT NULL,
+    author TEXT NOT NULL,
+    html_url TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    created_ts REAL NOT NULL,
+    overview TEXT NOT NULL,
+    strengths TEXT NOT NULL,
+    improvements TEXT NOT NULL,
+    body TEXT NOT NULL,
+    review_bodies TEXT NOT NULL,
+    review_comments TEXT NOT NULL,
+    additions INTEGER NOT NULL,
+    deletions INTEGER NOT NULL,
+    changed_files INTEGER NOT NULL,
+    source_mtime_ns INTEGER NOT NULL
+)
+""",
+    "CREATE INDEX IF NOT EXISTS idx_reviews_created ON reviews (created_ts, number)",
+)
+
+
+class ReviewStore:
+    """Single-file store holding every reviewed PR of a repository.
+
+    Records carry the review summary plus the PR metadata the reports use,
+    but none of the diffs kept in ``artefacts.json``. Each record remembers
+    the modification time of the files it was built from so that callers can
+    refresh only the PRs whose files changed.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._schema_ready = False
+        self._schema_lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(self.path), timeout=30)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")  # Concurrent readers while reviews are written
+        conn.execute("PRAGMA synchronous=NORMAL")
+        if not self._schema_ready:
+            with self._schema_lock:
+                if not self._schema_ready:
+                    self._migrate(conn)
+                    self._schema_ready = True
+        return conn
+
+    @staticmethod
+    def _migrate(conn: sqlite3.Connection) -> None:
+        """Create or upgrade the schema atomically.
+
+        The version check and the migration share one write transaction, so
+        a process that opens the store while another is creating it waits
+        and then sees the finished schema instead of dropping its rows.
+        """
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version != SCHEMA_VERSION:
+                if version != 0:  # Written by an older schema; records are rebuilt from review files
+                    conn.execute("DROP TABLE IF EXISTS reviews")
+                for statement in _SCHEMA:
+                    conn.execute(statement)
+                conn.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    def upsert(self, record: Mapping[str, Any], created_ts: float, source_mtime_ns: int) -> None:
+        """Insert or replace a review record.
+
+        Args:
+            record: Values for every column in :data:`COLUMNS`
+            created_ts: PR creation time as a POSIX timestamp, used for ordering
+            source_mtime_ns: Modification time of the files the record came from
+        """
+        values = [
+            json.dumps(record[column], ensure_ascii=False) if column in JSON_COLUMNS else record[column]
+            for column in COLUMNS
+        ]
+        placeholders = ", ".join("?" for _ in range(len(COLUMNS) + 2))
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                f"INSERT OR REPLACE INTO reviews ({', '.join(COLUMNS)}, created_ts, source_mtime_ns) "
+                f"VALUES ({placeholders})",
+                [*values, created_ts, source_mtime_ns],
+            )
+
+    def delete(self, numbers: Iterable[int]) -> None:
+        """Remove the records of the given PR numbers."""
+        with closing(self._connect()) as conn, conn:
+            conn.executemany("DELETE FROM reviews WHERE number = ?", [(n,) for n in numbers])
+
+    def source_mtimes(self) -> Dict[int, int]:
+        """Return the source modification time recorded for each PR."""
+        with closing(self._connect()) as conn:
+            return {
+                row["number"]: row["source_mtime_ns"]
+                for row in conn.execute("SELECT number, source_mtime_ns FROM reviews")
+            }
+
+    def iter_records(self, columns: Sequence[str] = COLUMNS) -> Iterator[Dict[str, Any]]:
+        """Stream records ordered by creation time, reading only ``columns``.
+
+        Raises:
+            ValueError: If an unknown column is requested
+        """
+        unknown = set(columns) - set(COLUMNS)
+        if unknown:
+            raise ValueError(f"Unknown review store column(s): {', '.join(sorted(unknown))}")
+
+        with closing(self._connect()) as conn:
+            cursor = conn.execute(
+                f"SELECT {', '.join(columns)} FROM reviews ORDER BY created_ts, number"
+            )
+            while True:
+                rows = cursor.fetchmany(FETCH_SIZE)
+                if not rows:
+                    return
+                for row in rows:
+                    yield {
+                        column: json.loads(row[column]) if column in JSON_COLUMNS else row[column]
+                        for column in columns
+                    }
+
+
+__all__ = ["COLUMNS", "STORE_FILENAME", "ReviewStore"]
@@ -0,0 +1,97 @@
+"""Cheap heuristic triage deciding which pull requests need an LLM review."""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from pathlib import PurePosixPath
+from typing import Optional
+
+from .core.models import PullRequestReviewBundle
+from .llm.prompt_packer import LOCKFILE_NAMES, file_category
+
+# Dependency manifests that bump PRs typically touch besides lockfiles
+DEPENDENCY_MANIFESTS = frozenset({
+    "package.json",
+    "requirements.txt",
+    "pyproject.toml",
+    "setup.cfg",
+    "pipfile",
+    "go.mod",
+    "cargo.toml",
+    "gemfile",
+    "composer.json",
+    "pom.xml",
+    "build.gradle",
+    "build.gradle.kts",
+    "mix.exs",
+    "podfile",
+    "pubspec.yaml",
+    "pubspec.lock",
+})
+
+BOT_AUTHOR_PATTERN = re.compile(r"\[bot\]$|^(dependabot|renovate|greenkeeper|pyup-bot|snyk-bot)", re.IGNORECASE)
+BUMP_TITLE_PATTERN = re.compile(
+    r"^(\w+(\([^)]*\))?!?:\s*)?(bump|update|upgrade)\s+\S+.*\bto\s+v?\d", re.IGNORECASE
+)
+
+# Human readable reasons used in review overviews
+TRIAGE_REASON_LABELS = {
+    "docs_only": "문서만 변경된 PR",
+    "tiny": "변경 규모가 매우 작은 PR",
+    "dependency_bump": "의존성 버전 업데이트 PR",
+}
+
+
+def _is_dependency_file(filename: str) -> bool:
+    name = PurePosixPath(filename.lower()).name
+    return (
+        name in LOCKFILE_NAMES
+        or name in DEPENDENCY_MANIFESTS
+        or name.endswith(".lock")
+        or (name.startswith("requirements") and name.endswith(".txt"))
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class TriageRules:
+    """Rules routing trivial pull requests to the heuristic review path.
+
+    Attributes:
+        docs_only: Skip the LLM when every changed file is documentation
+        dependency_bumps: Skip bot-style bumps that only touch manifests/lockfiles
+        max_changed_lines: Skip PRs with at most this many changed lines (0 disables)
+    """
+
+    docs_only: bool = True
+    dependency_bumps: bool = True
+    max_changed_lines: int = 5
+
+    def classify(self, bundle: PullRequestReviewBundle) -> Optional[str]:
+        """Return why ``bundle`` is trivial, or None when it deserves an LLM review.
+
+        Returns:
+            One of ``"docs_only"``, ``"dependency_bump"`` or ``"tiny"``
+        """
+        filenames = [f.filename for f in bundle.files]
+
+        # Checked first: requirements files would otherwise count as docs
+        if self.dependency_bumps and filenames and all(map(_is_dependency_file, filenames)):
+            if BOT_AUTHOR_PATTERN.search(bundle.author or "") or BUMP_TITLE_PATTERN.match(
+                bundle.title.strip()
+            ):
+                return "dependency_bump"
+
+        if self.docs_only and filenames and all(
+            file_category(name) == "docs" for name in filenames
+        ):
+            return "docs_only"
+
+        total_changes = bundle.additions + bundle.deletions
+        if self.max_changed_lines > 0 and total_changes <= self.max_changed_lines:
+            return "tiny"
+
+        return None
+
+
+__all__ = ["TRIAGE_REASON_LABELS", "TriageRules"]
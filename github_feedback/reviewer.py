@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
-from dataclasses import dataclass
+import sqlite3
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
 from pathlib import Path
-from typing import Iterable, List, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 import requests
 
@@ -14,8 +19,12 @@ from .collectors.collector import Collector
 from .core.console import Console
 from .core.constants import HEURISTIC_THRESHOLDS, TEXT_LIMITS
 from .llm.client import LLMClient
+from .llm.metrics import get_global_collector
 from .core.models import PullRequestReviewBundle, ReviewPoint, ReviewSummary
 from .core.utils import truncate_patch
+from .review_manifest import MANIFEST_FILENAME, ReviewManifest
+from .review_reports.data_loader import ReviewDataLoader
+from .review_triage import TRIAGE_REASON_LABELS, TriageRules
 
 console = Console()
 logger = logging.getLogger(__name__)
@@ -33,11 +42,67 @@ class Reviewer:
     collector: Collector
     llm: Optional[LLMClient] = None
     output_dir: Path = Path("reports/reviews")
+    batch_size: int = 1  # Small PRs reviewed per LLM request (1 disables batching)
+    triage: Optional[TriageRules] = None  # Route trivial PRs to heuristics (None disables)
+    _manifests: Dict[str, ReviewManifest] = field(default_factory=dict, init=False, repr=False)
+    _manifest_lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+    _data_loader: Optional[ReviewDataLoader] = field(default=None, init=False, repr=False)
+    _manifest_batches: int = field(default=0, init=False, repr=False)  # Open batched_manifest_writes()
+    triage_skipped: int = field(default=0, init=False)  # PRs this reviewer routed to heuristics
+    _triage_lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
 
     def _target_dir(self, repo: str, number: int) -> Path:
         safe_repo = repo.replace("/", "__")
         return self.output_dir / safe_repo / f"pr-{number}"
 
+    def _manifest(self, repo: str) -> ReviewManifest:
+        """Return the (lazily loaded) review manifest of a repository."""
+        with self._manifest_lock:
+            manifest = self._manifests.get(repo)
+            if manifest is None:
+                path = self.output_dir / repo.replace("/", "__") / MANIFEST_FILENAME
+                manifest = self._manifests[repo] = ReviewManifest(
+                    path, autosave=not self._manifest_batches
+                )
+            return manifest
+
+    @contextmanager
+    def batched_manifest_writes(self) -> Iterator[None]:
+        """Save review manifests once when the block ends instead of after every PR."""
+        with self._manifest_lock:
+            self._manifest_batches += 1
+            for manifest in self._manifests.values():
+                manifest.autosave = False
+        try:
+            yield
+        finally:
+            with self._manifest_lock:
+                self._manifest_batches -= 1
+                manifests = list(self._manifests.values()) if not self._manifest_batches else []
+                for manifest in manifests:
+                    manifest.autosave = True
+            for manifest in manifests:
+                manifest.flush()
+
+    def _review_store_loader(self) -> ReviewDataLoader:
+        """Return the loader whose review stores are shared by every PR of this run."""
+        with self._manifest_lock:
+            if self._data_loader is None:
+                self._data_loader = ReviewDataLoader(self.output_dir)
+            return self._data_loader
+
+    def _review_fingerprint(self) -> Tuple[str, str]:
+        """Return the (model, prompt hash) pair that produced new reviews."""
+
+        if not self.llm:
+            return "", "heuristic"
+        prompt_fingerprint = getattr(self.llm, "prompt_fingerprint", None)
+        material = (prompt_fingerprint() if prompt_fingerprint else type(self.llm).__name__) + repr(self.triage)
+        return (
+            getattr(self.llm, "model", "") or "default-model",
+            hashlib.sha256(material.encode("utf-8")).hexdigest()[:16],
+        )
+
     def _ensure_target_dir(self, repo: str, number: int) -> Path:
         """Create and return the target directory for PR review files."""
         from .core.utils import FileSystemManager
@@ -269,6 +334,13 @@ class Reviewer:
         console.log(f"[warning]{message}[/]")
         return self._fallback_summary(bundle)
 
+    def _triage_reason(self, bundle: PullRequestReviewBundle) -> Optional[str]:
+        """Return why a PR can skip the LLM review, if triage is enabled."""
+
+        if not self.llm or not self.triage:
+            return None
+        return self.triage.classify(bundle)
+
     def generate_summary(self, bundle: PullRequestReviewBundle) -> ReviewSummary:
         """Request LLM feedback while falling back gracefully when required."""
 
@@ -276,6 +348,17 @@ class Reviewer:
             console.log("LLM client not configured; using fallback summary")
             return self._fallback_summary(bundle)
 
+        get_global_collector().record_candidate()
+        reason = self._triage_reason(bundle)
+        if reason:
+            logger.info(f"Skipping LLM review for PR #{bundle.number}: {reason}")
+            get_global_collector().record_skip("pr_review", reason)
+            with self._triage_lock:
+                self.triage_skipped += 1
+            summary = self._fallback_summary(bundle)
+            summary.overview += f" ({TRIAGE_REASON_LABELS.get(reason, reason)}로 분류되어 휴리스틱 리뷰로 대체했습니다.)"
+            return summary
+
         try:
             summary = self.llm.generate_review(bundle)
         except requests.HTTPError as exc:  # pragma: no cover - network errors are hard to simulate
@@ -423,11 +506,135 @@ class Reviewer:
             raise
         return markdown_path
 
+    def cached_review(
+        self, repo: str, number: int, updated_at: Optional[datetime] = None
+    ) -> Optional[tuple[Path, Path, Path]]:
+        """Return the paths of a stored review if it is still current.
+
+        A review is current when all its files exist and the manifest shows it
+        was produced by the active model and prompt version. When ``updated_at``
+        (from the PR listing) differs from the recorded value, the PR's head
+        SHA is fetched: a new head means new commits and a stale review, while
+        an unchanged head (comments, labels, ...) keeps the review.
+
+        Args:
+            repo: Repository name in owner/repo format
+            number: Pull request number
+            updated_at: Last update time reported by the PR listing, if known
+
+        Returns:
+            Tuple of (artefact_path, summary_path, markdown_path), or None
+        """
+
+        target_dir = self._target_dir(repo, number)
+        paths = (
+            target_dir / ARTEFACTS_FILENAME,
+            target_dir / REVIEW_SUMMARY_FILENAME,
+            target_dir / REVIEW_MARKDOWN_FILENAME,
+        )
+        if not all(p.exists() for p in paths):
+            return None
+
+        manifest = self._manifest(repo)
+        entry = manifest.get(number)
+        if entry is None or not entry.matches(*self._review_fingerprint()):
+            logger.info(f"Stored review for PR #{number} predates the current model or prompt")
+            return None
+
+        if updated_at is not None and entry.updated_at_datetime() != updated_at:
+            head_sha = self.collector.get_pull_request_head_sha(repo, number)
+            if not head_sha or head_sha != entry.head_sha:
+                logger.info(f"PR #{number} has new commits since its last review")
+                return None
+            manifest.touch(number, updated_at)
+
+        logger.info(f"Using cached review for PR #{number} from {target_dir}")
+        return paths
+
+    def collect_bundle(self, repo: str, number: int) -> PullRequestReviewBundle:
+        """Collect pull request artefacts and persist them for later reuse."""
+
+        logger.info(f"Generating new review for PR #{number}")
+        bundle = self.collector.collect_pull_request_details(repo=repo, number=number)
+        self.persist_bundle(bundle)
+        return bundle
+
+    def _write_review(
+        self, bundle: PullRequestReviewBundle, summary: ReviewSummary
+    ) -> tuple[Path, Path, Path]:
+        """Persist the summary and markdown for an already collected bundle."""
+
+        artefact_path = self._target_dir(bundle.repo, bundle.number) / ARTEFACTS_FILENAME
+        summary_path = self.persist_summary(bundle, summary)
+        markdown_path = self.create_markdown(bundle, summary)
+        model, prompt_hash = self._review_fingerprint()
+        self._manifest(bundle.repo).record(
+            bundle.number, bundle.head_sha, bundle.updated_at, model, prompt_hash
+        )
+        try:
+            self._review_store_loader().record_review(
+                bundle.repo, summary.to_dict(), bundle.to_dict()
+            )
+        except (sqlite3.Error, OSError) as exc:
+            # The store is rebuilt from the review files on the next load
+            logger.debug(f"Could not update review store for PR #{bundle.number}: {exc}")
+        return artefact_path, summary_path, markdown_path
+
+    def plan_batches(
+        self, bundles: List[PullRequestReviewBundle]
+    ) -> List[List[PullRequestReviewBundle]]:
+        """Group collected pull requests into LLM review batches."""
+
+        if not self.llm or self.batch_size <= 1:
+            return [[bundle] for bundle in bundles]
+        # Triaged PRs never reach the LLM, so they must not occupy batch slots
+        trivial: List[PullRequestReviewBundle] = []
+        candidates: List[PullRequestReviewBundle] = []
+        for bundle in bundles:
+            (trivial if self._triage_reason(bundle) else candidates).append(bundle)
+        return self.llm.plan_review_batches(candidates, self.batch_size) + [[b] for b in trivial]
+
+    def review_batch(
+        self, bundles: List[PullRequestReviewBundle]
+    ) -> List[tuple[int, Path, Path, Path]]:
+        """Review a batch of collected pull requests with one LLM request.
+
+        PRs missing from the batched response, or every PR when the batched
+        request fails, are reviewed individually via :meth:`generate_summary`.
+
+        Returns:
+            List of (pr_number, artefact_path, summary_path, markdown_path)
+        """
+
+        summaries: dict[int, ReviewSummary] = {}
+        if self.llm and len(bundles) > 1:
+            try:
+                summaries = self.llm.generate_reviews(bundles)
+            except (requests.RequestException, ValueError) as exc:
+                logger.warning(
+                    f"Batched review of PRs {[b.number for b in bundles]} failed: {exc}; "
+                    "reviewing individually"
+                )
+            missing = [b.number for b in bundles if b.number not in summaries]
+            if missing:
+                logger.info(f"Reviewing PRs {missing} individually after batched request")
+
+        results: List[tuple[int, Path, Path, Path]] = []
+        for bundle in bundles:
+            summary = summaries.get(bundle.number)
+            if summary is None:
+                summary = self.generate_summary(bundle)
+            else:
+                get_global_collector().record_candidate()  # Reviewed by the batched request
+            results.append((bundle.number, *self._write_review(bundle, summary)))
+        return results
+
     def review_pull_request(
         self,
         repo: str,
         number: int,
-        force_refresh: bool = False
+        force_refresh: bool = False,
+        updated_at: Optional[datetime] = None,
     ) -> tuple[Path, Path, Path]:
         """End-to-end review helper used by the CLI command.
 
@@ -435,38 +642,21 @@ class Reviewer:
             repo: Repository name in owner/repo format
             number: Pull request number
             force_refresh: If True, regenerate review even if cached version exists
+            updated_at: Last update time from the PR listing, used to detect new commits
 
         Returns:
             Tuple of (artefact_path, summary_path, markdown_path)
         """
 
-        # Check if cached review exists
-        target_dir = self._target_dir(repo, number)
-        artefact_path = target_dir / ARTEFACTS_FILENAME
-        summary_path = target_dir / REVIEW_SUMMARY_FILENAME
-        markdown_path = target_dir / REVIEW_MARKDOWN_FILENAME
-
         # Return cached results if all files exist and force_refresh is False
-        if not force_refresh and all(p.exists() for p in [artefact_path, summary_path, markdown_path]):
-            logger.info(f"Using cached review for PR #{number} from {target_dir}")
-            return artefact_path, summary_path, markdown_path
-
-        # Generate new review
-        logger.info(f"Generating new review for PR #{number}")
-        bundle = self.collector.collect_pull_request_details(repo=repo, number=number)
-
-        # Create target directory once at the start for better performance
-        target_dir = self._ensure_target_dir(bundle.repo, bundle.number)
-
-        # Write all review files
-        artefact_path = self.persist_bundle(bundle)
+        if not force_refresh:
+            cached = self.cached_review(repo, number, updated_at)
+            if cached:
+                return cached
 
+        bundle = self.collect_bundle(repo, number)
         summary = self.generate_summary(bundle)
-        summary_path = self.persist_summary(bundle, summary)
-
-        markdown_path = self.create_markdown(bundle, summary)
-
-        return artefact_path, summary_path, markdown_path
+        return self._write_review(bundle, summary)
 
 
 __all__ = ["Reviewer"]
@@ -0,0 +1,20 @@
+"""Offline stand-ins for GitHub and the LLM endpoint used for load and failure testing."""
+
+from .fake_llm import FakeLLMConfig, FakeLLMServer, FakeLLMStats, lognormal_latency, uniform_latency
+from .mock_github import FaultConfig, MockGitHubServer, ServerStats
+from .synthetic import RepoSpec, SyntheticGitHub, SyntheticRepository, generate_repository
+
+__all__ = [
+    "FakeLLMConfig",
+    "FakeLLMServer",
+    "FakeLLMStats",
+    "FaultConfig",
+    "MockGitHubServer",
+    "RepoSpec",
+    "ServerStats",
+    "SyntheticGitHub",
+    "SyntheticRepository",
+    "generate_repository",
+    "lognormal_latency",
+    "uniform_latency",
+]
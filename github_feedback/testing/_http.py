@@ -0,0 +1,99 @@
+"""Threaded local HTTP server shared by the offline test doubles."""
+
+from __future__ import annotations
+
+import json
+import threading
+from abc import ABC, abstractmethod
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import TracebackType
+from typing import Any, Dict, Optional, Type
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: "_Server"
+    protocol_version = "HTTP/1.1"  # Keep-alive, like the real services
+
+    def do_GET(self) -> None:  # noqa: N802 - http.server naming
+        self.server.owner.handle(self, "GET")
+
+    def do_POST(self) -> None:  # noqa: N802 - http.server naming
+        self.server.owner.handle(self, "POST")
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass  # Keep test and benchmark output clean
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    owner: "BackgroundServer"
+
+
+class BackgroundServer(ABC):
+    """HTTP server running on a daemon thread; subclasses implement :meth:`handle`."""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0) -> None:
+        self._httpd = _Server((host, port), _Handler)
+        self._httpd.owner = self
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @abstractmethod
+    def handle(self, request: BaseHTTPRequestHandler, method: str) -> None:
+        """Answer one request; ``method`` is ``"GET"`` or ``"POST"``."""
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._httpd.serve_forever, name=type(self).__name__, daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.stop()
+
+    @staticmethod
+    def send_json(
+        request: BaseHTTPRequestHandler,
+        status: int,
+        payload: Any,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> None:
+        body = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        BackgroundServer.send_body(request, status, body, headers)
+
+    @staticmethod
+    def send_body(
+        request: BaseHTTPRequestHandler,
+        status: int,
+        body: bytes,
+        headers: Optional[Dict[str, str]] = None,
+        content_type: str = "application/json; charset=utf-8",
+    ) -> None:
+        request.send_response(status)
+        request.send_header("Content-Type", content_type)
+        request.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            request.send_header(name, value)
+        request.end_headers()
+        request.wfile.write(body)
@@ -0,0 +1,479 @@
+"""In-process fake of an OpenAI-compatible chat-completions endpoint.
+
+The server recognises the prompts in :mod:`github_feedback.prompts` and
+answers each with JSON in the shape that prompt asks for, sized from the
+items in the user message, so the analysis pipeline runs end to end without
+a model. Latency distributions, token usage, 5xx errors, 429 rate limiting,
+``response_format`` rejection and malformed output can be injected to
+exercise retries, fallbacks, streaming and metrics under load.
+
+Example:
+    >>> config = FakeLLMConfig(latency=lognormal_latency(0.8), rate_limit_rate=0.05)
+    >>> with FakeLLMServer(config) as server:
+    ...     client = LLMClient(endpoint=server.endpoint, enable_cache=False)
+    ...     client.analyze_pr_titles(pr_titles)
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import random
+import re
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+
+from .. import prompts
+from ..llm.prompt_packer import estimate_tokens
+from ._http import BackgroundServer
+
+CHAT_COMPLETIONS_PATH = "/v1/chat/completions"
+
+Latency = Union[float, Callable[[], float]]
+
+# Numbered data lines of the analysis user prompts ("3. #42: Fix login")
+_ITEM_LINE = re.compile(r"^\s*(\d+)\.\s+(.*)$", re.MULTILINE)
+_PR_NUMBER = re.compile(r"#(\d+)")
+_SHA = re.compile(r"\(SHA: ([0-9a-f]+)\)")
+_BATCH_HEADER = re.compile(r"^=== PR #(\d+) ===", re.MULTILINE)
+
+
+def lognormal_latency(median: float, sigma: float = 0.5, seed: int = 0) -> Callable[[], float]:
+    """Right-skewed latency around ``median`` seconds, like real inference servers."""
+    rng = random.Random(seed)
+    mu = math.log(median) if median > 0 else 0.0
+    return lambda: rng.lognormvariate(mu, sigma) if median > 0 else 0.0
+
+
+def uniform_latency(low: float, high: float, seed: int = 0) -> Callable[[], float]:
+    """Latency drawn uniformly between ``low`` and ``high`` seconds."""
+    rng = random.Random(seed)
+    return lambda: rng.uniform(low, high)
+
+
+@dataclass(slots=True)
+class FakeLLMConfig:
+    """Behaviour of the fake endpoint.
+
+    Attributes:
+        latency: Seconds before the response starts, or a callable returning them
+        seconds_per_token: Generation time added per completion token
+        error_rate: Fraction of requests answered with a status from ``error_statuses``
+        error_statuses: 5xx statuses to pick from
+        rate_limit_rate: Fraction of requests answered with 429 and ``Retry-After``
+        retry_after: Value of the ``Retry-After`` header on 429 responses
+        reject_response_format: Answer 400 to requests carrying ``response_format``,
+            like servers without JSON mode
+        invalid_json_rate: Fraction of completions cut off mid-object
+        stream_chunk_chars: Characters per SSE ``delta`` when streaming
+        seed: Seed of the fault random generator, for reproducible runs
+    """
+
+    latency: Latency = 0.0
+    seconds_per_token: float = 0.0
+    error_rate: float = 0.0
+    error_statuses: Sequence[int] = (500, 502, 503)
+    rate_limit_rate: float = 0.0
+    retry_after: float = 1.0
+    reject_response_format: bool = False
+    invalid_json_rate: float = 0.0
+    stream_chunk_chars: int = 24
+    seed: int = 0
+
+
+@dataclass(slots=True)
+class FakeLLMStats:
+    """Request counters collected by the server."""
+
+    requests: int = 0
+    completions: int = 0
+    streamed: int = 0
+    faults: int = 0
+    rate_limited: int = 0
+    rejected_response_format: int = 0
+    invalid_json: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    by_kind: Counter = field(default_factory=Counter)
+
+
+def _first_line(text: str) -> str:
+    return text.strip().split("\n", 1)[0].strip()
+
+
+# First line of each system prompt → response kind. Single and batched PR
+# reviews share their opening and are told apart by the "reviews" schema.
+_PROMPT_KINDS: Dict[str, str] = {
+    _first_line(prompts.get_pr_review_system_prompt()): "pr_review",
+    _first_line(prompts.get_commit_analysis_system_prompt("", "", 0)): "commit_messages",
+    _first_line(prompts.get_pr_title_analysis_system_prompt()): "pr_titles",
+    _first_line(prompts.get_review_tone_analysis_system_prompt()): "review_tone",
+    _first_line(prompts.get_issue_quality_analysis_system_prompt()): "issue_quality",
+    _first_line(prompts.get_personal_development_system_prompt()): "personal_development",
+    _first_line(prompts.get_communication_analysis_prompt()): "communication",
+    _first_line(prompts.get_code_quality_analysis_prompt()): "code_quality",
+    _first_line(prompts.get_growth_assessment_prompt()): "growth",
+    _first_line(prompts.get_team_report_system_prompt()): "team_report",
+    _first_line(prompts.get_award_summary_quote_system_prompt()): "award_quote",
+}
+
+
+def classify_prompt(messages: List[Dict[str, Any]]) -> str:
+    """Name the prompt a chat request was built from, or ``"generic"``."""
+    system = next((str(m.get("content", "")) for m in messages if m.get("role") == "system"), "")
+    kind = _PROMPT_KINDS.get(_first_line(system), "generic")
+    if kind == "pr_review" and '"reviews"' in system:
+        return "pr_batch_review"
+    return kind
+
+
+def _items(user: str) -> List[str]:
+    return [match.group(2) for match in _ITEM_LINE.finditer(user)]
+
+
+def _review(rng: random.Random, number: Optional[int] = None) -> Dict[str, Any]:
+    review: Dict[str, Any] = {} if number is None else {"number": number}
+    review["overview"] = "변경 범위가 명확하고 테스트가 함께 추가되었습니다."
+    review["strengths"] = [
+        {"message": "책임이 잘 분리된 함수 구성", "example": "핵심 로직을 헬퍼로 분리", "impact": "high"}
+    ]
+    review["improvements"] = [
+        {
+            "message": "경계 조건 테스트 보강",
+            "example": "빈 입력에 대한 테스트 추가",
+            "priority": rng.choice(["critical", "important", "nice-to-have"]),
+            "category": rng.choice(["testing", "readability", "performance"]),
+        }
+    ]
+    return review
+
+
+def _split(items: List[str], rng: random.Random) -> tuple[List[str], List[str]]:
+    good: List[str] = []
+    poor: List[str] = []
+    for item in items:
+        (good if rng.random() < 0.6 else poor).append(item)
+    return good, poor
+
+
+def _number(item: str, default: int) -> int:
+    match = _PR_NUMBER.search(item)
+    return int(match.group(1)) if match else default
+
+
+def _skill(category: str) -> Dict[str, Any]:
+    return {
+        "category": category,
+        "description": f"{category} 영역에서 PR 전반에 걸쳐 일관된 패턴이 관찰됩니다. "
+        "구체적인 사례와 함께 꾸준히 개선되고 있습니다.",
+        "evidence": ["PR #1: 변경 의도를 설명하는 상세한 본문", "PR #2: 리뷰 반영 후 테스트 추가"],
+        "impact": "팀이 변경 사항을 빠르게 이해하고 리뷰할 수 있습니다.",
+    }
+
+
+def _improvement(category: str, priority: str) -> Dict[str, Any]:
+    return _skill(category) | {
+        "suggestions": ["PR 템플릿을 활용해 테스트 방법을 명시하세요."],
+        "priority": priority,
+    }
+
+
+def _growth_indicator() -> Dict[str, Any]:
+    return {
+        "aspect": "코드 리뷰 반영 속도",
+        "description": "초기보다 최근 PR에서 리뷰 반영이 빨라졌습니다.",
+        "before_examples": ["PR #1: 리뷰 반영까지 여러 차례 왕복"],
+        "after_examples": ["PR #9: 첫 리뷰 후 바로 승인"],
+        "progress_summary": "리뷰 왕복 횟수가 줄었습니다.",
+    }
+
+
+def build_completion(kind: str, messages: List[Dict[str, Any]], rng: random.Random) -> str:
+    """Build the assistant message for ``kind`` sized from the user message."""
+    user = "\n".join(str(m.get("content", "")) for m in messages if m.get("role") == "user")
+    items = _items(user)
+    good, poor = _split(items, rng)
+    payload: Dict[str, Any]
+
+    if kind == "pr_review":
+        payload = _review(rng)
+    elif kind == "pr_batch_review":
+        payload = {"reviews": [_review(rng, int(n)) for n in _BATCH_HEADER.findall(user)]}
+    elif kind == "commit_messages":
+
+        def commit(item: str) -> Dict[str, Any]:
+            sha = _SHA.search(item)
+            return {"sha": sha.group(1) if sha else "0000000", "message": item.split(" (SHA:")[0]}
+
+        payload = {
+            "good_count": len(good),
+            "poor_count": len(poor),
+            "suggestions": ["첫 줄을 50자 이내의 명령형으로 작성하세요."],
+            "examples_good": [commit(i) | {"reason": "변경 의도가 명확합니다."} for i in good[:5]],
+            "examples_poor": [
+                commit(i) | {"reason": "무엇을 바꿨는지 알기 어렵습니다.", "suggestion": "fix: 로그인 세션 만료 처리"}
+                for i in poor[:5]
+            ],
+            "trends": {"common_patterns": ["feat/fix 접두사 사용"], "improvement_areas": ["본문 설명 부족"]},
+        }
+    elif kind == "pr_titles":
+
+        def title(index: int, item: str) -> Dict[str, Any]:
+            return {"number": _number(item, index), "title": item.split(": ", 1)[-1]}
+
+        payload = {
+            "clear_count": len(good),
+            "vague_count": len(poor),
+            "suggestions": ["변경 대상과 동작을 제목에 함께 적으세요."],
+            "examples_good": [
+                title(n, i) | {"reason": "범위가 명확합니다.", "score": rng.randint(7, 10)}
+                for n, i in enumerate(good[:5], 1)
+            ],
+            "examples_poor": [
+                title(n, i) | {"reason": "모호합니다.", "suggestion": "feat: 사용자 설정 페이지 추가"}
+                for n, i in enumerate(poor[:5], 1)
+            ],
+            "patterns": {"common_types": ["feat", "fix"], "naming_conventions": ["Conventional Commits"]},
+        }
+    elif kind == "review_tone":
+        harsh = poor[: len(poor) // 2]
+        payload = {
+            "constructive_count": len(good),
+            "harsh_count": len(harsh),
+            "neutral_count": len(poor) - len(harsh),
+            "suggestions": ["제안에는 이유와 대안을 함께 적어주세요."],
+            "examples_good": [
+                {"pr_number": _number(i, n), "author": "reviewer", "comment": i[:200], "url": "",
+                 "strengths": ["구체적인 대안 제시"]}
+                for n, i in enumerate(good[:3], 1)
+            ],
+            "examples_improve": [
+                {"pr_number": _number(i, n), "author": "reviewer", "comment": i[:200], "url": "",
+                 "issues": ["이유 설명 없음"], "improved_version": "이 부분은 이런 이유로 바꾸면 어떨까요?"}
+                for n, i in enumerate(poor[:3], 1)
+            ],
+            "team_culture_insights": {"positive_patterns": ["빠른 응답"], "areas_for_growth": ["칭찬 표현"]},
+        }
+    elif kind == "issue_quality":
+        payload = {
+            "well_described_count": len(good),
+            "poorly_described_count": len(poor),
+            "type_breakdown": {"bug": len(items) // 2, "feature": len(items) - len(items) // 2,
+                               "question": 0, "other": 0},
+            "suggestions": ["재현 단계와 기대 동작을 적어주세요."],
+            "examples_good": [
+                {"number": _number(i, n), "title": i.split(": ", 1)[-1].split("\n")[0], "url": "",
+                 "type": "bug", "strengths": ["재현 단계 포함"], "completeness_score": rng.randint(7, 10)}
+                for n, i in enumerate(good[:3], 1)
+            ],
+            "examples_poor": [
+                {"number": _number(i, n), "title": i.split(": ", 1)[-1].split("\n")[0], "url": "",
+                 "missing_elements": ["재현 단계"], "suggestion": "환경 정보와 로그를 추가하세요."}
+                for n, i in enumerate(poor[:3], 1)
+            ],
+            "template_recommendations": ["버그 리포트 템플릿 추가"],
+        }
+    elif kind in ("communication", "code_quality"):
+        area = "커뮤니케이션" if kind == "communication" else "코드 품질"
+        payload = {
+            "strengths": [_skill(f"{area} - 명확성")],
+            "improvement_areas": [_improvement(f"{area} - 테스트 설명", "medium")],
+        }
+    elif kind == "growth":
+        payload = {
+            "growth_indicators": [_growth_indicator()],
+            "overall_assessment": "꾸준히 성장하고 있으며 리뷰 품질이 향상되었습니다.",
+            "key_achievements": ["리뷰 반영 시간 단축"],
+            "next_focus_areas": ["테스트 커버리지 확대"],
+        }
+    elif kind == "personal_development":
+        payload = {
+            "tldr_summary": {
+                "top_strength": "명확한 PR 설명",
+                "primary_focus": "테스트 보강",
+                "measurable_goal": "다음 분기 PR의 80%에 테스트 포함",
+            },
+            "strengths": [_skill("커뮤니케이션 - 명확성")],
+            "improvement_areas": [_improvement("코드 품질 - 테스트", "high")],
+            "growth_indicators": [_growth_indicator()],
+        }
+    elif kind == "team_report":
+        return "# 팀 리뷰 보고서\n\n## 요약\n\n리뷰 활동이 꾸준히 이어졌습니다.\n"
+    elif kind == "award_quote":
+        payload = {"quote": "커밋하라, 그러면 머지될 것이다.", "reference": "마태복음 7:7"}
+    else:
+        payload = {"content": "ok"}
+
+    return json.dumps(payload, ensure_ascii=False)
+
+
+class FakeLLMServer(BackgroundServer):
+    """Threaded HTTP server answering ``POST /v1/chat/completions``."""
+
+    def __init__(
+        self,
+        config: Optional[FakeLLMConfig] = None,
+        *,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        """Create the server; it starts listening on :meth:`start`.
+
+        Args:
+            config: Latency and failure behaviour
+            host: Interface to bind
+            port: Port to bind (0 picks a free one)
+        """
+        self.config = config or FakeLLMConfig()
+        self.stats = FakeLLMStats()
+        self._lock = threading.Lock()
+        self._rng = random.Random(self.config.seed)
+        super().__init__(host, port)
+
+    def __enter__(self) -> FakeLLMServer:
+        return self.start()
+
+    @property
+    def endpoint(self) -> str:
+        """Chat-completions URL to pass as ``LLMClient.endpoint``."""
+        return f"{self.url}{CHAT_COMPLETIONS_PATH}"
+
+    def handle(self, request: BaseHTTPRequestHandler, method: str) -> None:
+        if method != "POST" or request.path.split("?")[0] != CHAT_COMPLETIONS_PATH:
+            return self.send_json(request, 404, {"error": {"message": "Not Found"}})
+
+        length = int(request.headers.get("Content-Length") or 0)
+        try:
+            body = json.loads(request.rfile.read(length) or b"{}")
+        except json.JSONDecodeError:
+            return self._send_error(request, 400, "invalid_request_error", "Request body is not valid JSON")
+        messages = body.get("messages") or []
+
+        config = self.config
+        with self._lock:
+            self.stats.requests += 1
+            roll = self._rng.random()
+            truncate = self._rng.random() < config.invalid_json_rate
+            seed = self._rng.getrandbits(32)
+            status = self._rng.choice(list(config.error_statuses)) if config.error_statuses else 500
+
+        delay = config.latency() if callable(config.latency) else config.latency
+        if delay > 0:
+            time.sleep(delay)
+
+        if roll < config.rate_limit_rate:
+            with self._lock:
+                self.stats.faults += 1
+                self.stats.rate_limited += 1
+            return self._send_error(
+                request, 429, "rate_limit_exceeded", "Rate limit reached",
+                {"Retry-After": f"{config.retry_after:g}"},
+            )
+        if roll < config.rate_limit_rate + config.error_rate:
+            with self._lock:
+                self.stats.faults += 1
+            return self._send_error(request, status, "server_error", "The server had an error")
+        if config.reject_response_format and "response_format" in body:
+            with self._lock:
+                self.stats.rejected_response_format += 1
+            return self._send_error(
+                request, 400, "invalid_request_error",
+                "'response_format' of type 'json_object' is not supported with this model",
+            )
+
+        kind = classify_prompt(messages)
+        content = build_completion(kind, messages, random.Random(seed))
+        if truncate:
+            content = content[: max(1, len(content) // 2)]
+        prompt_tokens = sum(estimate_tokens(str(m.get("content", ""))) for m in messages)
+        completion_tokens = estimate_tokens(content)
+        usage = {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+        }
+        with self._lock:
+            self.stats.completions += 1
+            self.stats.streamed += bool(body.get("stream"))
+            self.stats.invalid_json += truncate
+            self.stats.prompt_tokens += prompt_tokens
+            self.stats.completion_tokens += completion_tokens
+            self.stats.by_kind[kind] += 1
+
+        model = body.get("model") or "fake-model"
+        if body.get("stream"):
+            return self._stream(request, model, content, usage)
+
+        if config.seconds_per_token > 0:
+            time.sleep(completion_tokens * config.seconds_per_token)
+        self.send_json(
+            request,
+            200,
+            {
+                "id": f"chatcmpl-{seed:08x}",
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": model,
+                "choices": [
+                    {"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"}
+                ],
+                "usage": usage,
+            },
+        )
+
+    def _send_error(
+        self,
+        request: BaseHTTPRequestHandler,
+        status: int,
+        error_type: str,
+        message: str,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> None:
+        self.send_json(request, status, {"error": {"message": message, "type": error_type}}, headers)
+
+    def _stream(self, request: BaseHTTPRequestHandler, model: str, content: str, usage: Dict[str, int]) -> None:
+        """Send ``content`` as chat-completion chunks over server-sent events."""
+        request.send_response(200)
+        request.send_header("Content-Type", "text/event-stream")
+        request.send_header("Cache-Control", "no-cache")
+        request.send_header("Connection", "close")  # Unframed body ends with the connection
+        request.end_headers()
+        request.close_connection = True
+
+        step = max(1, self.config.stream_chunk_chars)
+        chunk_delay = self.config.seconds_per_token * estimate_tokens(content[:step])
+
+        def event(payload: Dict[str, Any]) -> None:
+            data = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+            request.wfile.write(f"data: {data}\n\n".encode("utf-8"))
+            request.wfile.flush()
+
+        try:
+            for start in range(0, len(content), step):
+                if chunk_delay > 0:
+                    time.sleep(chunk_delay)
+                event({
+                    "object": "chat.completion.chunk",
+                    "model": model,
+                    "choices": [{"index": 0, "delta": {"content": content[start:start + step]}}],
+                })
+            event({"object": "chat.completion.chunk", "model": model, "choices": [], "usage": usage})
+            request.wfile.write(b"data: [DONE]\n\n")
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # Client aborted the stream early
+
+
+__all__ = [
+    "CHAT_COMPLETIONS_PATH",
+    "FakeLLMConfig",
+    "FakeLLMServer",
+    "FakeLLMStats",
+    "build_completion",
+    "classify_prompt",
+    "lognormal_latency",
+    "uniform_latency",
+]
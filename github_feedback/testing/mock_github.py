@@ -0,0 +1,318 @@
+"""In-process mock of the GitHub REST API backed by synthetic repositories.
+
+The server answers the endpoints the collectors and repository manager use,
+with GitHub's pagination (``Link`` headers), conditional requests
+(``ETag``/``If-None-Match`` → 304) and rate-limit headers. Latency and
+403/429/5xx faults can be injected to exercise retry and throttling paths.
+Point ``ServerConfig.api_url`` at :attr:`MockGitHubServer.url` to run the
+real client against it.
+
+Example:
+    >>> dataset = SyntheticGitHub.generate([RepoSpec("octo/big", pull_requests=10_000)])
+    >>> with MockGitHubServer(dataset) as server:
+    ...     config.server.api_url = server.url
+    ...     Collector(config).list_pull_requests("octo/big", since, filters)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+from urllib.parse import parse_qs, urlencode, urlsplit
+
+from ._http import BackgroundServer
+from .synthetic import SyntheticGitHub, SyntheticRepository
+
+# Items per page when the client does not ask, and GitHub's hard maximum
+DEFAULT_PER_PAGE = 30
+MAX_PER_PAGE = 100
+
+Latency = Union[float, Callable[[], float]]
+
+
+@dataclass(slots=True)
+class FaultConfig:
+    """Failures injected into a fraction of requests.
+
+    Attributes:
+        error_rate: Fraction of requests answered with a status from ``error_statuses``
+        error_statuses: 5xx statuses to pick from
+        rate_limit_rate: Fraction of requests answered with 403 or 429 rate limiting
+        seed: Seed of the fault random generator, for reproducible runs
+    """
+
+    error_rate: float = 0.0
+    error_statuses: Sequence[int] = (500, 502, 503)
+    rate_limit_rate: float = 0.0
+    seed: int = 0
+
+
+@dataclass(slots=True)
+class ServerStats:
+    """Request counters collected by the server."""
+
+    requests: int = 0
+    not_modified: int = 0
+    faults: int = 0
+    by_route: Counter = field(default_factory=Counter)
+
+
+def _parse_time(value: str) -> datetime:
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+class MockGitHubServer(BackgroundServer):
+    """Threaded HTTP server speaking a subset of the GitHub REST API."""
+
+    def __init__(
+        self,
+        dataset: SyntheticGitHub,
+        *,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: Latency = 0.0,
+        faults: Optional[FaultConfig] = None,
+        rate_limit: int = 5000,
+    ) -> None:
+        """Create the server; it starts listening on :meth:`start`.
+
+        Args:
+            dataset: Synthetic account to serve
+            host: Interface to bind
+            port: Port to bind (0 picks a free one)
+            latency: Seconds to wait before answering, or a callable returning them
+            faults: Failures to inject
+            rate_limit: Requests allowed before answering 403 with ``X-RateLimit-Remaining: 0``
+        """
+        self.dataset = dataset
+        self.latency = latency
+        self.faults = faults or FaultConfig()
+        self.rate_limit = rate_limit
+        self.stats = ServerStats()
+        self._lock = threading.Lock()
+        self._fault_rng = random.Random(self.faults.seed)
+        self._reset_at = int(time.time()) + 3600
+        super().__init__(host, port)
+        self._routes: List[Tuple[re.Pattern, Callable[..., Any]]] = [
+            (re.compile(r"^/user$"), self._user),
+            (re.compile(r"^/user/repos$"), self._user_repos),
+            (re.compile(r"^/user/orgs$"), lambda query: []),
+            (re.compile(r"^/rate_limit$"), self._rate_limit),
+            (re.compile(r"^/repos/(?P<repo>[^/]+/[^/]+)$"), self._repo),
+            (re.compile(r"^/repos/(?P<repo>[^/]+/[^/]+)/commits$"), self._commits),
+            (re.compile(r"^/repos/(?P<repo>[^/]+/[^/]+)/commits/(?P<sha>[0-9a-f]+)$"), self._commit),
+            (re.compile(r"^/repos/(?P<repo>[^/]+/[^/]+)/branches$"), self._branches),
+            (re.compile(r"^/repos/(?P<repo>[^/]+/[^/]+)/pulls$"), self._pulls),
+            (re.compile(r"^/repos/(?P<repo>[^/]+/[^/]+)/pulls/(?P<number>\d+)$"), self._pull),
+            (re.compile(r"^/repos/(?P<repo>[^/]+/[^/]+)/pulls/(?P<number>\d+)/reviews$"), self._reviews),
+            (re.compile(r"^/repos/(?P<repo>[^/]+/[^/]+)/pulls/(?P<number>\d+)/comments$"), self._review_comments),
+            (re.compile(r"^/repos/(?P<repo>[^/]+/[^/]+)/pulls/(?P<number>\d+)/files$"), self._files),
+            (re.compile(r"^/repos/(?P<repo>[^/]+/[^/]+)/issues$"), self._issues),
+        ]
+
+    def __enter__(self) -> MockGitHubServer:
+        return self.start()
+
+    # ------------------------------------------------------------------
+    # Request handling
+    # ------------------------------------------------------------------
+    def handle(self, request: BaseHTTPRequestHandler, method: str) -> None:
+        if method != "GET":
+            return self.send_json(request, 404, {"message": "Not Found"})
+
+        delay = self.latency() if callable(self.latency) else self.latency
+        if delay > 0:
+            time.sleep(delay)
+
+        parts = urlsplit(request.path)
+        query = {key: values[-1] for key, values in parse_qs(parts.query).items()}
+
+        with self._lock:
+            self.stats.requests += 1
+            used = self.stats.requests
+            roll = self._fault_rng.random()
+        remaining = max(0, self.rate_limit - used)
+        rate_headers = {
+            "X-RateLimit-Limit": str(self.rate_limit),
+            "X-RateLimit-Remaining": str(remaining),
+            "X-RateLimit-Used": str(min(used, self.rate_limit)),
+            "X-RateLimit-Reset": str(self._reset_at),
+            "X-RateLimit-Resource": "core",
+        }
+
+        if not request.headers.get("Authorization"):
+            return self._send(request, 401, {"message": "Requires authentication"}, rate_headers)
+
+        if used > self.rate_limit:
+            return self._send_fault(request, 403, {"message": "API rate limit exceeded"}, rate_headers)
+        if roll < self.faults.rate_limit_rate:
+            status = 429 if self._fault_rng.random() < 0.5 else 403
+            headers = rate_headers | {"X-RateLimit-Remaining": "0", "Retry-After": "1"}
+            return self._send_fault(request, status, {"message": "API rate limit exceeded"}, headers)
+        if roll < self.faults.rate_limit_rate + self.faults.error_rate:
+            status = self._fault_rng.choice(list(self.faults.error_statuses))
+            return self._send_fault(request, status, {"message": "Server Error"}, rate_headers)
+
+        for pattern, handler in self._routes:
+            match = pattern.match(parts.path)
+            if match is None:
+                continue
+            with self._lock:
+                self.stats.by_route[pattern.pattern] += 1
+            payload = handler(query, **match.groupdict())
+            if payload is None:
+                return self._send(request, 404, {"message": "Not Found"}, rate_headers)
+            if isinstance(payload, list):
+                payload, link = self._page(parts.path, query, payload)
+                if link:
+                    rate_headers["Link"] = link
+            return self._send(request, 200, payload, rate_headers)
+
+        return self._send(request, 404, {"message": "Not Found"}, rate_headers)
+
+    def _send_fault(self, request: BaseHTTPRequestHandler, status: int, payload: Any, headers: Dict[str, str]) -> None:
+        with self._lock:
+            self.stats.faults += 1
+        self._send(request, status, payload, headers)
+
+    def _send(self, request: BaseHTTPRequestHandler, status: int, payload: Any, headers: Dict[str, str]) -> None:
+        body = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        etag = f'W/"{hashlib.sha1(body).hexdigest()}"'
+        if status == 200 and request.headers.get("If-None-Match") == etag:
+            with self._lock:
+                self.stats.not_modified += 1
+            status, body = 304, b""
+        if status in (200, 304):
+            headers = headers | {"ETag": etag}
+        self.send_body(request, status, body, headers)
+
+    def _page(self, path: str, query: Dict[str, str], items: List[Any]) -> Tuple[List[Any], str]:
+        """Slice ``items`` for the requested page and build the ``Link`` header."""
+        per_page = min(MAX_PER_PAGE, max(1, int(query.get("per_page") or DEFAULT_PER_PAGE)))
+        page = max(1, int(query.get("page") or 1))
+        last = max(1, -(-len(items) // per_page))
+
+        def link(target: int, rel: str) -> str:
+            return f'<{self.url}{path}?{urlencode(query | {"page": target, "per_page": per_page})}>; rel="{rel}"'
+
+        links = []
+        if page < last:
+            links += [link(page + 1, "next"), link(last, "last")]
+        if page > 1:
+            links += [link(1, "first"), link(min(page - 1, last), "prev")]
+        return items[(page - 1) * per_page : page * per_page], ", ".join(links)
+
+    # ------------------------------------------------------------------
+    # Routes
+    # ------------------------------------------------------------------
+    def _repository(self, repo: str) -> Optional[SyntheticRepository]:
+        return self.dataset.repository(repo)
+
+    def _user(self, query: Dict[str, str]) -> Dict[str, Any]:
+        return {"login": self.dataset.login, "id": 1, "type": "User"}
+
+    def _user_repos(self, query: Dict[str, str]) -> List[Dict[str, Any]]:
+        repos = [repository.repo for repository in self.dataset.repositories.values()]
+        if query.get("sort", "updated") in ("updated", "pushed"):
+            repos.sort(key=lambda repo: repo["updated_at"], reverse=True)
+        return repos
+
+    def _rate_limit(self, query: Dict[str, str]) -> Dict[str, Any]:
+        core = {
+            "limit": self.rate_limit,
+            "remaining": max(0, self.rate_limit - self.stats.requests),
+            "reset": self._reset_at,
+            "used": self.stats.requests,
+        }
+        return {"resources": {"core": core}, "rate": core}
+
+    def _repo(self, query: Dict[str, str], repo: str) -> Optional[Dict[str, Any]]:
+        repository = self._repository(repo)
+        return repository.repo if repository else None
+
+    def _commits(self, query: Dict[str, str], repo: str) -> Optional[List[Dict[str, Any]]]:
+        repository = self._repository(repo)
+        if repository is None:
+            return None
+        author = query.get("author")
+        since = _parse_time(query["since"]) if query.get("since") else None
+        until = _parse_time(query["until"]) if query.get("until") else None
+        commits = []
+        for commit in repository.commits:
+            if author and (commit.get("author") or {}).get("login") != author:
+                continue
+            moment = _parse_time(commit["commit"]["author"]["date"])
+            if since and moment < since:
+                continue
+            if until and moment > until:
+                continue
+            commits.append(commit)
+        return commits
+
+    def _commit(self, query: Dict[str, str], repo: str, sha: str) -> Optional[Dict[str, Any]]:
+        repository = self._repository(repo)
+        return repository.commit(sha) if repository else None
+
+    def _branches(self, query: Dict[str, str], repo: str) -> Optional[List[Dict[str, Any]]]:
+        repository = self._repository(repo)
+        return repository.branches if repository else None
+
+    @staticmethod
+    def _by_state(items: List[Dict[str, Any]], query: Dict[str, str]) -> List[Dict[str, Any]]:
+        state = query.get("state", "open")
+        if state != "all":
+            items = [item for item in items if item["state"] == state]
+        key = "updated_at" if query.get("sort") == "updated" else "created_at"
+        reverse = query.get("direction", "desc") == "desc"
+        return sorted(items, key=lambda item: item[key], reverse=reverse)
+
+    def _pulls(self, query: Dict[str, str], repo: str) -> Optional[List[Dict[str, Any]]]:
+        repository = self._repository(repo)
+        return self._by_state(repository.pulls, query) if repository else None
+
+    def _pull(self, query: Dict[str, str], repo: str, number: str) -> Optional[Dict[str, Any]]:
+        repository = self._repository(repo)
+        return repository.pull(int(number)) if repository else None
+
+    def _reviews(self, query: Dict[str, str], repo: str, number: str) -> Optional[List[Dict[str, Any]]]:
+        repository = self._repository(repo)
+        if repository is None or repository.pull(int(number)) is None:
+            return None
+        return repository.pull_reviews(int(number))
+
+    def _review_comments(self, query: Dict[str, str], repo: str, number: str) -> Optional[List[Dict[str, Any]]]:
+        repository = self._repository(repo)
+        if repository is None or repository.pull(int(number)) is None:
+            return None
+        return repository.pull_review_comments(int(number))
+
+    def _files(self, query: Dict[str, str], repo: str, number: str) -> Optional[List[Dict[str, Any]]]:
+        repository = self._repository(repo)
+        if repository is None or repository.pull(int(number)) is None:
+            return None
+        return repository.pull_files(int(number))
+
+    def _issues(self, query: Dict[str, str], repo: str) -> Optional[List[Dict[str, Any]]]:
+        repository = self._repository(repo)
+        if repository is None:
+            return None
+        issues = repository.issues
+        creator = query.get("creator")
+        if creator:
+            issues = [issue for issue in issues if issue["user"]["login"] == creator]
+        if query.get("since"):
+            since = _parse_time(query["since"])
+            issues = [issue for issue in issues if _parse_time(issue["updated_at"]) >= since]
+        return self._by_state(issues, query)
+
+
+__all__ = ["FaultConfig", "MockGitHubServer", "ServerStats"]
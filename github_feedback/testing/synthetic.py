@@ -0,0 +1,358 @@
+"""Deterministic generator of synthetic GitHub repositories.
+
+Repositories are described by a :class:`RepoSpec` (how many commits, pull
+requests, reviews, files, branches and issues) and fabricated with the same
+payload shapes the GitHub REST API returns, so the collectors can be driven
+at arbitrary scale. Per-PR payloads (reviews, comments, files) are derived
+from a per-PR seed on demand, which keeps a 10k-PR repository cheap to hold
+in memory.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import random
+import zlib
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+DEFAULT_AUTHORS = ("octocat", "hubot", "monalisa", "dependabot[bot]")
+
+# (extension, language-typical path) pairs used for changed files
+_FILE_KINDS = (
+    ("py", "src/app/module_{n}.py"),
+    ("ts", "web/src/components/Widget{n}.ts"),
+    ("go", "services/api/handler_{n}.go"),
+    ("md", "docs/guide_{n}.md"),
+    ("yml", ".github/workflows/ci_{n}.yml"),
+    ("java", "backend/src/main/java/Service{n}.java"),
+)
+
+_TITLE_VERBS = ("Add", "Fix", "Refactor", "Update", "Remove", "Improve", "Document")
+_TITLE_TOPICS = ("pagination", "cache layer", "login flow", "CI pipeline", "report export", "rate limiting")
+_REVIEW_STATES = ("APPROVED", "COMMENTED", "CHANGES_REQUESTED")
+
+
+def _iso(moment: datetime) -> str:
+    return moment.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _sha(*parts: Any) -> str:
+    return hashlib.sha1(":".join(str(part) for part in parts).encode()).hexdigest()
+
+
+def _user(login: str) -> Dict[str, Any]:
+    return {
+        "login": login,
+        "id": zlib.crc32(login.encode()),
+        "type": "Bot" if login.endswith("[bot]") else "User",
+    }
+
+
+@dataclass(slots=True)
+class RepoSpec:
+    """Size and shape of a synthetic repository."""
+
+    full_name: str
+    commits: int = 200
+    pull_requests: int = 50
+    reviews_per_pr: int = 2
+    comments_per_review: int = 1
+    files_per_pr: int = 5
+    branches: int = 3
+    issues: int = 20
+    authors: Sequence[str] = DEFAULT_AUTHORS
+    start: datetime = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    end: datetime = datetime(2024, 12, 31, tzinfo=timezone.utc)
+
+
+@dataclass(slots=True)
+class SyntheticRepository:
+    """Payloads of one fabricated repository, newest first like the API."""
+
+    spec: RepoSpec
+    seed: int
+    web_url: str
+    repo: Dict[str, Any]
+    commits: List[Dict[str, Any]]
+    pulls: List[Dict[str, Any]]
+    issues: List[Dict[str, Any]]  # Includes pull requests, as the Issues API does
+    branches: List[Dict[str, Any]]
+    _pulls_by_number: Dict[int, Dict[str, Any]] = field(default_factory=dict, repr=False)
+    _commits_by_sha: Dict[str, Dict[str, Any]] = field(default_factory=dict, repr=False)
+
+    @property
+    def full_name(self) -> str:
+        return self.spec.full_name
+
+    def pull(self, number: int) -> Optional[Dict[str, Any]]:
+        return self._pulls_by_number.get(number)
+
+    def commit(self, sha: str) -> Optional[Dict[str, Any]]:
+        """Single-commit payload including its changed files."""
+        commit = self._commits_by_sha.get(sha)
+        if commit is None:
+            return None
+        rng = random.Random(f"{self.seed}:commit:{sha}")
+        return {**commit, "files": [self._file(rng, index) for index in range(rng.randint(1, 4))]}
+
+    def pull_files(self, number: int) -> List[Dict[str, Any]]:
+        pull = self.pull(number)
+        if pull is None:
+            return []
+        rng = random.Random(f"{self.seed}:files:{number}")
+        return [self._file(rng, index) for index in range(pull["changed_files"])]
+
+    def pull_reviews(self, number: int) -> List[Dict[str, Any]]:
+        pull = self.pull(number)
+        if pull is None:
+            return []
+        rng = random.Random(f"{self.seed}:reviews:{number}")
+        created = datetime.fromisoformat(pull["created_at"].replace("Z", "+00:00"))
+        reviewers = [login for login in self.spec.authors if login != pull["user"]["login"]] or list(self.spec.authors)
+        reviews = []
+        for index in range(self.spec.reviews_per_pr):
+            reviewer = rng.choice(reviewers)
+            reviews.append(
+                {
+                    "id": number * 1000 + index,
+                    "user": _user(reviewer),
+                    "body": rng.choice(
+                        (
+                            "Looks good to me, thanks for the clear description.",
+                            "Could we add a test for the empty page case?",
+                            "Please split this into smaller functions.",
+                            "",
+                        )
+                    ),
+                    "state": rng.choice(_REVIEW_STATES),
+                    "submitted_at": _iso(created + timedelta(hours=rng.randint(1, 72))),
+                    "html_url": f"{pull['html_url']}#pullrequestreview-{number * 1000 + index}",
+                }
+            )
+        return reviews
+
+    def pull_review_comments(self, number: int) -> List[Dict[str, Any]]:
+        rng = random.Random(f"{self.seed}:comments:{number}")
+        files = self.pull_files(number)
+        comments = []
+        for review in self.pull_reviews(number):
+            for index in range(self.spec.comments_per_review):
+                comments.append(
+                    {
+                        "id": review["id"] * 100 + index,
+                        "pull_request_review_id": review["id"],
+                        "user": review["user"],
+                        "body": rng.choice(("nit: naming", "Is this branch reachable?", "Consider caching this.")),
+                        "path": files[index % len(files)]["filename"] if files else "README.md",
+                        "created_at": review["submitted_at"],
+                    }
+                )
+        return comments
+
+    @staticmethod
+    def _file(rng: random.Random, index: int) -> Dict[str, Any]:
+        _, template = rng.choice(_FILE_KINDS)
+        additions = rng.randint(0, 120)
+        deletions = rng.randint(0, 60)
+        return {
+            "sha": _sha("file", rng.random()),
+            "filename": template.format(n=index),
+            "status": rng.choice(("modified", "added", "removed")),
+            "additions": additions,
+            "deletions": deletions,
+            "changes": additions + deletions,
+            "patch": "@@ -1,3 +1,4 @@\n-old line\n+new line\n+another line",
+        }
+
+
+def _spread(rng: random.Random, start: datetime, end: datetime, count: int) -> List[datetime]:
+    """Random timestamps between ``start`` and ``end``, newest first."""
+    span = max(1, int((end - start).total_seconds()))
+    return sorted((start + timedelta(seconds=rng.randrange(span)) for _ in range(count)), reverse=True)
+
+
+def generate_repository(
+    spec: RepoSpec,
+    seed: int = 0,
+    api_url: str = "https://api.github.com",
+    web_url: str = "https://github.com",
+) -> SyntheticRepository:
+    """Fabricate a repository matching ``spec``; the same seed gives the same data."""
+    repo_seed = seed ^ zlib.crc32(spec.full_name.encode())
+    rng = random.Random(repo_seed)
+    owner, name = spec.full_name.split("/", 1)
+    authors = list(spec.authors)
+    html_root = f"{web_url.rstrip('/')}/{spec.full_name}"
+    api_root = f"{api_url.rstrip('/')}/repos/{spec.full_name}"
+
+    branches = [{"name": "main", "commit": {"sha": _sha(spec.full_name, "branch", 0)}, "protected": True}]
+    branches += [
+        {"name": f"feature/{index}", "commit": {"sha": _sha(spec.full_name, "branch", index)}, "protected": False}
+        for index in range(1, spec.branches)
+    ]
+
+    commits = []
+    for index, moment in enumerate(_spread(rng, spec.start, spec.end, spec.commits)):
+        login = rng.choice(authors)
+        sha = _sha(spec.full_name, "commit", index)
+        verb = rng.choice(_TITLE_VERBS)
+        commits.append(
+            {
+                "sha": sha,
+                "commit": {
+                    "message": f"{verb} {rng.choice(_TITLE_TOPICS)}",
+                    "author": {"name": login, "email": f"{login}@users.noreply.github.com", "date": _iso(moment)},
+                    "committer": {"name": login, "date": _iso(moment)},
+                },
+                "author": _user(login),
+                "committer": _user(login),
+                "html_url": f"{html_root}/commit/{sha}",
+                "url": f"{api_root}/commits/{sha}",
+            }
+        )
+
+    pulls = []
+    issue_items: List[Tuple[datetime, Dict[str, Any]]] = []
+    pr_times = _spread(rng, spec.start, spec.end, spec.pull_requests)
+    issue_times = _spread(rng, spec.start, spec.end, spec.issues)
+    total = spec.pull_requests + spec.issues
+    numbers = list(range(1, total + 1))
+    rng.shuffle(numbers)
+    pr_numbers = sorted(numbers[: spec.pull_requests], reverse=True)
+    issue_numbers = sorted(numbers[spec.pull_requests :], reverse=True)
+
+    for number, created in zip(pr_numbers, pr_times):
+        login = rng.choice(authors)
+        updated = created + timedelta(hours=rng.randint(1, 240))
+        merged = rng.random() < 0.7
+        closed = merged or rng.random() < 0.5
+        head_ref = rng.choice(branches[1:] or branches)["name"]
+        files = max(1, int(rng.gauss(spec.files_per_pr, spec.files_per_pr / 3)))
+        pull = {
+            "number": number,
+            "title": f"{rng.choice(_TITLE_VERBS)} {rng.choice(_TITLE_TOPICS)}",
+            "body": "## Summary\nSynthetic change for load testing.\n\n## Testing\nUnit tests.",
+            "state": "closed" if closed else "open",
+            "user": _user(login),
+            "created_at": _iso(created),
+            "updated_at": _iso(updated),
+            "closed_at": _iso(updated) if closed else None,
+            "merged_at": _iso(updated) if merged else None,
+            "html_url": f"{html_root}/pull/{number}",
+            "url": f"{api_root}/pulls/{number}",
+            "head": {"ref": head_ref, "sha": _sha(spec.full_name, "head", number)},
+            "base": {"ref": "main", "sha": branches[0]["commit"]["sha"]},
+            "additions": rng.randint(1, 400),
+            "deletions": rng.randint(0, 200),
+            "changed_files": files,
+            "comments": rng.randint(0, 5),
+            "review_comments": spec.reviews_per_pr * spec.comments_per_review,
+            "labels": [],
+        }
+        pulls.append(pull)
+        issue_items.append(
+            (
+                created,
+                {
+                    key: pull[key]
+                    for key in ("number", "title", "body", "state", "user", "created_at", "updated_at", "closed_at", "html_url", "labels", "comments")
+                }
+                | {"pull_request": {"url": pull["url"], "html_url": pull["html_url"], "merged_at": pull["merged_at"]}},
+            )
+        )
+
+    for number, created in zip(issue_numbers, issue_times):
+        login = rng.choice(authors)
+        updated = created + timedelta(hours=rng.randint(1, 480))
+        closed = rng.random() < 0.6
+        issue_items.append(
+            (
+                created,
+                {
+                    "number": number,
+                    "title": f"{rng.choice(('Bug', 'Feature request', 'Question'))}: {rng.choice(_TITLE_TOPICS)}",
+                    "body": "Steps to reproduce:\n1. Run the command\n2. Observe the error" if rng.random() < 0.7 else "",
+                    "state": "closed" if closed else "open",
+                    "user": _user(login),
+                    "created_at": _iso(created),
+                    "updated_at": _iso(updated),
+                    "closed_at": _iso(updated) if closed else None,
+                    "html_url": f"{html_root}/issues/{number}",
+                    "labels": [{"name": rng.choice(("bug", "enhancement", "question"))}],
+                    "comments": rng.randint(0, 8),
+                },
+            )
+        )
+    issue_items.sort(key=lambda item: item[0], reverse=True)
+
+    last_push = commits[0]["commit"]["author"]["date"] if commits else _iso(spec.end)
+    repo = {
+        "id": zlib.crc32(spec.full_name.encode()),
+        "name": name,
+        "full_name": spec.full_name,
+        "owner": _user(owner),
+        "private": False,
+        "fork": False,
+        "archived": False,
+        "html_url": html_root,
+        "url": api_root,
+        "description": f"Synthetic repository with {spec.pull_requests} pull requests",
+        "language": "Python",
+        "default_branch": "main",
+        "stargazers_count": rng.randint(0, 500),
+        "forks_count": rng.randint(0, 80),
+        "open_issues_count": sum(1 for _, issue in issue_items if issue["state"] == "open"),
+        "created_at": _iso(spec.start),
+        "updated_at": last_push,
+        "pushed_at": last_push,
+    }
+
+    return SyntheticRepository(
+        spec=spec,
+        seed=repo_seed,
+        web_url=web_url,
+        repo=repo,
+        commits=commits,
+        pulls=pulls,
+        issues=[issue for _, issue in issue_items],
+        branches=branches,
+        _pulls_by_number={pull["number"]: pull for pull in pulls},
+        _commits_by_sha={commit["sha"]: commit for commit in commits},
+    )
+
+
+@dataclass(slots=True)
+class SyntheticGitHub:
+    """A fabricated GitHub account: the authenticated user and their repositories."""
+
+    login: str = "octocat"
+    repositories: Dict[str, SyntheticRepository] = field(default_factory=dict)
+
+    @classmethod
+    def generate(
+        cls,
+        specs: Iterable[RepoSpec],
+        login: str = "octocat",
+        seed: int = 0,
+        api_url: str = "https://api.github.com",
+        web_url: str = "https://github.com",
+    ) -> SyntheticGitHub:
+        repositories = {
+            spec.full_name: generate_repository(spec, seed=seed, api_url=api_url, web_url=web_url)
+            for spec in specs
+        }
+        return cls(login=login, repositories=repositories)
+
+    def repository(self, full_name: str) -> Optional[SyntheticRepository]:
+        return self.repositories.get(full_name)
+
+
+__all__ = [
+    "DEFAULT_AUTHORS",
+    "RepoSpec",
+    "SyntheticGitHub",
+    "SyntheticRepository",
+    "generate_repository",
+]
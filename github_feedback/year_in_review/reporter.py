@@ -8,13 +8,14 @@ from typing import List
 
 from ..core.console import Console
 from ..game_elements import get_animation_styles
+from ..reporters.stream_writer import ReportStreamWriter
 from .models import RepositoryAnalysis
 from .sections.character_stats import generate_character_stats
 from .sections.communication_section import generate_communication_skills_section
 from .sections.executive_summary import generate_executive_summary
 from .sections.goals_section import generate_footer, generate_goals_section
 from .sections.header_section import generate_header
-from .sections.repository_breakdown import generate_repository_breakdown
+from .sections.repository_breakdown import iter_repository_breakdown
 from .sections.tech_stack_section import generate_tech_stack_analysis
 
 console = Console()
@@ -70,21 +71,22 @@ class YearInReviewReporter:
         # Add animation styles
         animation_styles = get_animation_styles()
 
-        # Generate report with game character theme
-        lines = font_styles[:]
-        lines.append(animation_styles)
-        lines.extend(generate_header(year, username, total_repos, total_prs, total_commits))
-        lines.extend(generate_character_stats(year, total_repos, total_prs, total_commits, repository_analyses))
-        lines.extend(generate_executive_summary(repository_analyses, sorted_tech_stack))
-        lines.extend(generate_communication_skills_section(repository_analyses))
-        lines.extend(generate_tech_stack_analysis(sorted_tech_stack))
-        lines.extend(generate_repository_breakdown(repository_analyses, self.output_dir))
-        lines.extend(generate_goals_section(repository_analyses, year))
-        lines.extend(generate_footer())
-
-        # Save report
+        # Stream sections to disk one at a time; each is released once written
         report_path = self.output_dir / f"year_{year}_in_review.md"
-        report_path.write_text("\n".join(lines), encoding="utf-8")
+        with ReportStreamWriter(report_path) as writer:
+            writer.write_lines(font_styles)
+            writer.write(animation_styles)
+            writer.write_lines(generate_header(year, username, total_repos, total_prs, total_commits))
+            writer.write_lines(
+                generate_character_stats(year, total_repos, total_prs, total_commits, repository_analyses)
+            )
+            writer.write_lines(generate_executive_summary(repository_analyses, sorted_tech_stack))
+            writer.write_lines(generate_communication_skills_section(repository_analyses))
+            writer.write_lines(generate_tech_stack_analysis(sorted_tech_stack))
+            for chunk in iter_repository_breakdown(repository_analyses, self.output_dir):
+                writer.write_lines(chunk)
+            writer.write_lines(generate_goals_section(repository_analyses, year))
+            writer.write_lines(generate_footer())
 
         console.log(f"✅ Year-in-review report saved: {report_path}")
         return report_path
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any, List
+from typing import Any, Iterator, List
 
 from ...game_elements import GameRenderer
 
@@ -12,7 +12,18 @@ def generate_repository_breakdown(
     repository_analyses: List[Any], output_dir: Path
 ) -> List[str]:
     """던전별 탐험 기록 생성."""
-    lines = [
+    return [
+        line
+        for chunk in iter_repository_breakdown(repository_analyses, output_dir)
+        for line in chunk
+    ]
+
+
+def iter_repository_breakdown(
+    repository_analyses: List[Any], output_dir: Path
+) -> Iterator[List[str]]:
+    """던전별 탐험 기록을 저장소 단위 청크로 생성 (스트리밍 작성용)."""
+    yield [
         "## 🏰 던전 탐험 기록",
         "",
         "> 각 저장소 던전에서의 모험을 상세히 기록합니다",
@@ -20,6 +31,7 @@ def generate_repository_breakdown(
     ]
 
     for idx, repo in enumerate(repository_analyses, 1):
+        lines: List[str] = []
         # Calculate dungeon difficulty based on activity
         total_activity = repo.pr_count + repo.year_commits
         difficulty, difficulty_emoji = _calculate_difficulty(total_activity)
@@ -62,8 +74,7 @@ def generate_repository_breakdown(
 
         lines.append("---")
         lines.append("")
-
-    return lines
+        yield lines
 
 
 def _calculate_difficulty(total_activity: int) -> tuple[str, str]:
@@ -225,4 +236,4 @@ def _render_growth_indicators_table(growth_indicators: List[Any]) -> List[str]:
     return lines
 
 
-__all__ = ["generate_repository_breakdown"]
+__all__ = ["generate_repository_breakdown", "iter_repository_breakdown"]
@@ -0,0 +1,196 @@
+"""Tests for the API response cache: compression, LRU eviction, maintenance and stale-while-revalidate."""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+
+import pytest
+import requests_cache
+
+from github_feedback.api import cache as cache_module
+from github_feedback.api import client as client_module
+from github_feedback.api.cache import (
+    BackgroundRevalidator,
+    CachePolicy,
+    ResponseCache,
+    cache_serializer,
+    default_cache_name,
+)
+from github_feedback.api.client import GitHubApiClient
+from github_feedback.cli import cache as cli_cache
+from github_feedback.core.config import Config
+from github_feedback.testing import MockGitHubServer, RepoSpec, SyntheticGitHub
+
+
+@pytest.fixture(autouse=True)
+def _isolated(monkeypatch, tmp_path):
+    import keyring
+
+    monkeypatch.setattr(keyring, "get_password", lambda service, username: "token")
+    monkeypatch.setattr(client_module.time, "sleep", lambda seconds: None)
+    monkeypatch.setenv("HOME", str(tmp_path))
+
+
+@pytest.fixture(scope="module")
+def dataset():
+    return SyntheticGitHub.generate([RepoSpec("octo/app", pull_requests=120)], login="octocat")
+
+
+def _client(api_url, **api_settings):
+    config = Config()
+    config.server.api_url = api_url
+    for key, value in api_settings.items():
+        setattr(config.api, key, value)
+    return GitHubApiClient(config)
+
+
+def _rows(db_path):
+    with sqlite3.connect(str(db_path)) as conn:
+        return conn.execute("SELECT key, value FROM responses").fetchall()
+
+
+def test_compression_can_be_toggled_without_losing_entries(tmp_path, dataset):
+    def session(compress):
+        cached_session = requests_cache.CachedSession(
+            str(tmp_path / "mixed"), backend="sqlite", serializer=cache_serializer(compress)
+        )
+        cached_session.headers["Authorization"] = "Bearer token"
+        return cached_session
+
+    with MockGitHubServer(dataset) as server:
+        first, second = (f"{server.url}/repos/octo/app/pulls?state=all&per_page=100&page={page}" for page in (1, 2))
+        session(False).get(first)
+        compressed = session(True)
+        cached = compressed.get(first)
+        assert cached.from_cache and len(cached.json()) == 100
+
+        compressed.get(second)
+        assert session(False).get(second).from_cache
+
+    values = [bytes(value) for _, value in _rows(tmp_path / "mixed.sqlite")]
+    assert sum(value.startswith(b"GFZ1") for value in values) == 1
+    stats = ResponseCache(tmp_path / "mixed").stats()
+    assert stats.entries == 2 and stats.compression_ratio > 1
+    assert stats.endpoints["repos/{owner}/{repo}/pulls"].entries == 2
+
+
+def test_client_tracks_hits_and_reports_stats(dataset, capsys):
+    with MockGitHubServer(dataset) as server:
+        client = _client(server.url)
+        for _ in range(2):
+            client.request_all("repos/octo/app/pulls", {"state": "all"})
+        client.request_json("user")
+        client.close()
+        assert server.stats.requests == 3
+
+    stats = ResponseCache(default_cache_name()).stats()
+    pulls = stats.endpoints["repos/{owner}/{repo}/pulls"]
+    assert (pulls.entries, pulls.hits, pulls.misses) == (2, 2, 2)
+    assert stats.endpoints["user"].hit_ratio == 0.0
+    assert stats.hit_ratio == pytest.approx(2 / 5)
+    assert stats.age_histogram["< 1h"] == 3 and stats.expired == 0
+    assert stats.stored_bytes < stats.body_bytes
+
+    cli_cache.cache_stats(limit=5)
+    assert "repos/{owner}/{repo}/pulls" in capsys.readouterr().out
+
+
+def test_size_limit_evicts_least_recently_used(tmp_path, dataset, monkeypatch):
+    monkeypatch.setattr(cache_module, "_FLUSH_THRESHOLD", 1)
+    with MockGitHubServer(dataset) as server:
+        client = _client(server.url, cache_compression=False)
+        for page in (1, 2):
+            client.request_list("repos/octo/app/pulls", {"state": "all", "per_page": 50, "page": page})
+        client.request_list("repos/octo/app/pulls", {"state": "all", "per_page": 50, "page": 1})
+        client.close()
+
+    cache = ResponseCache(default_cache_name(), max_size_mb=1)
+    rows = _rows(cache.db_path)
+    sizes = {key: len(value) for key, value in rows}
+    cache.max_bytes = int(max(sizes.values()) / 0.9) + 1
+    assert cache.enforce_size_limit() == 1
+
+    remaining = [key for key, _ in _rows(cache.db_path)]
+    assert len(remaining) == 1
+    with sqlite3.connect(str(cache.db_path)) as conn:
+        page_one = conn.execute("SELECT key FROM gfa_cache_access ORDER BY last_access DESC").fetchone()[0]
+    assert remaining == [page_one]
+
+
+def test_prune_expired_and_vacuum(dataset, capsys):
+    with MockGitHubServer(dataset) as server:
+        client = _client(server.url)
+        client.request_all("repos/octo/app/pulls", {"state": "all"})
+        client.request_json("user")
+        client.close()
+
+    cache = ResponseCache(default_cache_name())
+    with sqlite3.connect(str(cache.db_path)) as conn:
+        conn.execute("UPDATE responses SET expires = ? WHERE key IN (SELECT key FROM responses LIMIT 2)",
+                     (int(time.time()) - 10,))
+    assert cache.stats().expired == 2
+
+    cli_cache.cache_prune_expired()
+    assert "Removed 2 expired responses" in capsys.readouterr().out
+    assert cache.stats().entries == 1
+
+    before, after = cache.vacuum()
+    assert 0 < after <= before
+    assert GitHubApiClient.clear_cache() and not cache.db_path.exists()
+
+
+def test_stale_entries_are_served_and_revalidated_in_background(dataset):
+    params = {"state": "all", "per_page": 100, "page": 1}
+    with MockGitHubServer(dataset) as server:
+        strict = _client(server.url, cache_stale_while_revalidate=False)
+        strict.request_list("repos/octo/app/pulls", params)  # Stored for the 30-minute TTL only
+        strict.close()
+
+        client = _client(server.url)
+        assert len(client.request_list("repos/octo/app/pulls", params)) == 100
+        client.revalidator.wait(timeout=10)
+        assert server.stats.requests == 2 and server.stats.not_modified == 1
+
+        client.request_list("repos/octo/app/pulls", params)  # Fresh again after the 304
+        client.close()
+        assert server.stats.requests == 2
+
+    totals = client.metrics.get_aggregated().to_dict()["totals"]
+    # The 304 refresh returns the cached body, so it counts as a hit as well
+    assert (totals["cache_hits"], totals["stale_hits"], totals["not_modified"]) == (3, 1, 1)
+
+
+def test_revalidations_are_deduplicated_per_entry():
+    revalidator = BackgroundRevalidator()
+    release = threading.Event()
+    calls = []
+
+    def refresh():
+        calls.append(1)
+        release.wait(5)
+
+    assert revalidator.submit("key", refresh)
+    assert not revalidator.submit("key", refresh) and revalidator.pending == 1
+    release.set()
+    assert revalidator.wait(timeout=5) and revalidator.pending == 0
+    assert revalidator.submit("key", lambda: 1 / 0)  # Failures are logged, not raised
+    revalidator.shutdown()
+    assert len(calls) == 1 and revalidator.pending == 0
+
+
+def test_cache_policies_match_endpoints():
+    client = _client("https://api.github.com")
+    assert client._cache_policy("repos/octo/app/pulls/1/files") == GitHubApiClient.CACHE_POLICIES["files"]
+    assert client._cache_policy("user/repos").is_stale(3600)
+    assert client._cache_policy("rate_limit") == CachePolicy(3600)
+    # Repository names never select an endpoint policy
+    assert client._cache_policy("repos/octo/reviews-bot/pulls") == GitHubApiClient.CACHE_POLICIES["pulls"]
+    assert client._cache_policy("repos/octo/files") == CachePolicy(3600)
+    assert GitHubApiClient.POLICY_PATTERNS["pulls"].search("https://api.github.com/repos/octo/reviews-bot/pulls?page=2")
+    assert not GitHubApiClient.POLICY_PATTERNS["files"].search("https://api.github.com/repos/octo/files-app")
+    assert not CachePolicy(60, max_stale=600).is_stale(660) and CachePolicy(60, 600).is_stale(599)
+
+    client.config.api.cache_stale_while_revalidate = False
+    assert client._cache_policy("repos/octo/app/pulls") == CachePolicy(1800)
@@ -0,0 +1,79 @@
+"""Tests for recording and replaying GitHub API traffic."""
+
+from __future__ import annotations
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from github_feedback.api.cassette import CassetteMissError, use_cassette
+from github_feedback.api.client import GitHubApiClient
+from github_feedback.core.config import Config
+from github_feedback.core.exceptions import ApiError
+
+COMMITS = [{"sha": f"{index:040x}"} for index in range(5)]
+
+
+class _CommitsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):  # noqa: N802 - http.server naming
+        query = parse_qs(urlsplit(self.path).query)
+        page = int(query["page"][0])
+        per_page = int(query["per_page"][0])
+        body = json.dumps(COMMITS[(page - 1) * per_page : page * per_page]).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Link", f'<{self.path}>; rel="next"')
+        self.send_header("X-RateLimit-Remaining", str(4999 - page))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def api_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _CommitsHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def _client(monkeypatch, api_url):
+    import keyring
+
+    monkeypatch.setattr(keyring, "get_password", lambda service, username: "secret-token")
+    config = Config()
+    config.server.api_url = api_url
+    return GitHubApiClient(config, enable_cache=False)
+
+
+def test_record_then_replay_offline(monkeypatch, tmp_path, api_server):
+    cassette = tmp_path / "commits.json"
+
+    client = _client(monkeypatch, api_server)
+    with use_cassette(client, cassette, mode="record") as recorder:
+        recorded = client.request_all("repos/octo/repo/commits", {"per_page": 2})
+    assert recorded == COMMITS
+    assert len(recorder.interactions) == 3
+
+    text = cassette.read_text(encoding="utf-8")
+    assert "secret-token" not in text
+    response = json.loads(text)["interactions"][0]["response"]
+    assert response["headers"]["X-RateLimit-Remaining"] == "4998"
+    assert "Link" in response["headers"]
+
+    # Replay answers from the cassette without touching the network
+    offline = _client(monkeypatch, api_server)
+    with use_cassette(offline, cassette) as player:
+        assert player.mode == "replay"
+        assert offline.request_all("repos/octo/repo/commits", {"per_page": 2}) == COMMITS
+        with pytest.raises(ApiError) as excinfo:
+            offline.request_list("repos/octo/other/commits")
+    assert isinstance(excinfo.value.__cause__, CassetteMissError)
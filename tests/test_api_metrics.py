@@ -0,0 +1,123 @@
+"""Tests for per-endpoint GitHub API telemetry."""
+
+from __future__ import annotations
+
+import json
+import random
+
+import pytest
+import requests_cache
+
+from github_feedback.api import client as client_module
+from github_feedback.api.client import GitHubApiClient
+from github_feedback.api.metrics import ApiCallMetrics, ApiMetricsCollector, endpoint_template, get_global_api_collector
+from github_feedback.cli import feedback as cli_feedback
+from github_feedback.core.config import Config
+from github_feedback.core.histogram import LatencyHistogram
+from github_feedback.testing import FaultConfig, MockGitHubServer, RepoSpec, SyntheticGitHub
+
+
+@pytest.fixture(autouse=True)
+def _isolated(monkeypatch):
+    import keyring
+
+    monkeypatch.setattr(keyring, "get_password", lambda service, username: "token")
+    monkeypatch.setattr(client_module.time, "sleep", lambda seconds: None)
+    get_global_api_collector().clear()
+    yield
+    get_global_api_collector().clear()
+
+
+def _client(api_url, session=None):
+    config = Config()
+    config.server.api_url = api_url
+    return GitHubApiClient(config, session=session, enable_cache=False)
+
+
+@pytest.mark.parametrize(
+    ("path", "template"),
+    [
+        ("repos/octo/app/pulls/12/files", "repos/{owner}/{repo}/pulls/{number}/files"),
+        ("/repos/octo/app/commits/" + "a" * 40, "repos/{owner}/{repo}/commits/{sha}"),
+        ("users/octocat/repos", "users/{user}/repos"),
+        ("search/issues", "search/issues"),
+        ("user", "user"),
+    ],
+)
+def test_endpoint_template(path, template):
+    assert endpoint_template(path) == template
+
+
+def test_histogram_quantiles_are_within_relative_accuracy():
+    rng = random.Random(1)
+    values = [rng.lognormvariate(-2, 1) for _ in range(5000)]
+    first, second = LatencyHistogram(), LatencyHistogram()
+    for index, value in enumerate(values):
+        (first if index % 2 else second).add(value)
+    first.merge(second)
+
+    ordered = sorted(values)
+    for q in (0.5, 0.95, 0.99):
+        exact = ordered[int(q * (len(ordered) - 1))]
+        assert first.quantile(q) == pytest.approx(exact, rel=0.03)
+    assert first.count == 5000 and first.max == max(values)
+    assert LatencyHistogram().quantile(0.5) == 0.0
+
+
+def test_client_counts_requests_cache_hits_and_rate_limit(tmp_path):
+    dataset = SyntheticGitHub.generate([RepoSpec("octo/app", pull_requests=150)], login="octocat")
+    with MockGitHubServer(dataset) as server:
+        session = requests_cache.CachedSession(str(tmp_path / "cache"), backend="sqlite")
+        cached_client = _client(server.url, session)
+        session.headers.update(cached_client._headers)
+        for _ in range(2):
+            cached_client.request_all("repos/octo/app/pulls", {"state": "all"})
+        other_client = _client(server.url)
+        other_client.request_json("user")
+
+    pulls = cached_client.metrics.get_aggregated().endpoints["repos/{owner}/{repo}/pulls"]
+    assert pulls.requests == 4 and pulls.cache_hits == 2
+    assert pulls.p50 > 0 and pulls.p95 >= pulls.p50 and pulls.bytes_received > 0
+
+    overall = get_global_api_collector().get_aggregated()
+    assert set(overall.endpoints) == {"repos/{owner}/{repo}/pulls", "user"}
+    assert overall.total_requests == 5
+    assert overall.rate_limits["core"].consumed == server.stats.requests == 3
+    assert overall.rate_limits["core"].remaining == 5000 - 3
+
+
+def test_retries_and_errors_are_counted():
+    dataset = SyntheticGitHub.generate([RepoSpec("octo/flaky", pull_requests=5)])
+    with MockGitHubServer(dataset, faults=FaultConfig(error_rate=0.5, error_statuses=(502,), seed=4)) as server:
+        client = _client(server.url)
+        for _ in range(4):
+            client.request_list("repos/octo/flaky/pulls", {"state": "all"})
+
+    stats = client.metrics.get_aggregated().endpoints["repos/{owner}/{repo}/pulls"]
+    assert stats.retries > 0
+    assert stats.errors == stats.statuses.get(502, 0) > 0
+    assert stats.requests == sum(stats.statuses.values())
+
+
+def test_rate_limit_budget_spans_reset_windows():
+    collector = ApiMetricsCollector()
+    for reset, remaining in [(100, 50), (100, 47), (200, 5000), (200, 4998)]:
+        collector.record(ApiCallMetrics(
+            endpoint="user", duration_seconds=0.01, status=200, rate_limit_resource="core",
+            rate_limit_limit=5000, rate_limit_remaining=remaining, rate_limit_reset=reset,
+        ))
+
+    usage = collector.get_aggregated().rate_limits["core"]
+    assert usage.consumed == 4 + 3
+    assert usage.remaining == 4998
+
+
+def test_feedback_summary_exports_json(tmp_path):
+    collector = get_global_api_collector()
+    assert cli_feedback.display_api_metrics(tmp_path) is None
+
+    collector.record(ApiCallMetrics(endpoint="user", duration_seconds=0.2, status=200, bytes_received=512))
+    path = cli_feedback.display_api_metrics(tmp_path)
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    assert payload["totals"]["requests"] == 1
+    assert payload["endpoints"]["user"]["latency_seconds"]["p50"] == pytest.approx(0.2, rel=0.03)
@@ -0,0 +1,124 @@
+"""Tests for the benchmark harness and the ``gfa bench`` command."""
+
+from __future__ import annotations
+
+import pytest
+import typer
+
+from github_feedback.api import client as client_module
+from github_feedback.benchmarks import (
+    SCENARIOS,
+    BenchmarkReport,
+    BenchmarkResult,
+    compare_to_baseline,
+    run_benchmarks,
+    run_scenario,
+)
+from github_feedback.cli import bench as cli_bench
+
+SCALE = 0.01
+
+
+@pytest.fixture(autouse=True)
+def _no_sleep(monkeypatch):
+    monkeypatch.setattr(client_module.time, "sleep", lambda seconds: None)
+
+
+@pytest.mark.parametrize("name", sorted(SCENARIOS))
+def test_scenarios_run_at_small_scale(name):
+    result = run_scenario(SCENARIOS[name], SCALE)
+    assert result.wall_seconds > 0
+    assert result.items > 0
+    if name.startswith("collect"):
+        assert result.requests + result.cache_hits > 0
+    if name == "collect_cached":
+        assert result.cache_hit_ratio > 0.5
+
+
+def test_compare_flags_only_real_regressions():
+    baseline = BenchmarkReport(
+        results=[
+            BenchmarkResult("slow", wall_seconds=1.0, requests=10, peak_rss_mb=100.0),
+            BenchmarkResult("noisy", wall_seconds=0.01),
+            BenchmarkResult("cached", wall_seconds=1.0, requests=2, cache_hits=8),
+        ],
+        scale=1.0,
+    )
+    current = BenchmarkReport(
+        results=[
+            BenchmarkResult("slow", wall_seconds=1.5, requests=11, peak_rss_mb=110.0),
+            BenchmarkResult("noisy", wall_seconds=0.03),  # Under the noise floor
+            BenchmarkResult("cached", wall_seconds=1.0, requests=6, cache_hits=4),
+            BenchmarkResult("new", wall_seconds=9.0),
+        ],
+        scale=1.0,
+    )
+
+    regressions = {(r.scenario, r.metric) for r in compare_to_baseline(current, baseline)}
+    assert regressions == {
+        ("slow", "wall_seconds"),
+        ("slow", "requests"),
+        ("cached", "requests"),
+        ("cached", "cache_hit_ratio"),
+    }
+    assert not compare_to_baseline(current, baseline, {"wall_seconds": 1.0, "requests": 3.0, "cache_hit_ratio": 1.0})
+
+    current.scale = 0.5
+    with pytest.raises(ValueError, match="scale"):
+        compare_to_baseline(current, baseline)
+
+
+def test_bench_command_records_and_checks_baseline(tmp_path):
+    baseline_path = tmp_path / "baseline.json"
+    options = dict(
+        scenarios=["heuristic_commits"],
+        baseline_path=baseline_path,
+        output=None,
+        scale=SCALE,
+        repeat=1,
+        threshold=None,
+        isolate=False,
+        list_scenarios=False,
+    )
+    cli_bench.bench(update_baseline=True, **options)
+    saved = BenchmarkReport.load(baseline_path)
+    assert [result.name for result in saved.results] == ["heuristic_commits"]
+
+    # An impossibly lean baseline must fail the check
+    saved.results[0].peak_rss_mb = 1.0
+    saved.save(baseline_path)
+    with pytest.raises(typer.Exit) as excinfo:
+        cli_bench.bench(update_baseline=False, **options)
+    assert excinfo.value.exit_code == 1
+
+    with pytest.raises(typer.Exit) as excinfo:
+        cli_bench.bench(update_baseline=False, **options | {"scenarios": ["missing"]})
+    assert excinfo.value.exit_code == 2
+
+
+def test_update_baseline_with_a_subset_keeps_other_scenarios(tmp_path):
+    baseline_path = tmp_path / "baseline.json"
+    options = dict(
+        baseline_path=baseline_path,
+        update_baseline=True,
+        output=None,
+        scale=SCALE,
+        repeat=1,
+        threshold=None,
+        isolate=False,
+        list_scenarios=False,
+    )
+    cli_bench.bench(scenarios=["heuristic_commits"], **options)
+    recorded = BenchmarkReport.load(baseline_path).results[0]
+
+    cli_bench.bench(scenarios=["count_commits"], **options)
+    saved = BenchmarkReport.load(baseline_path)
+
+    assert [result.name for result in saved.results] == ["heuristic_commits", "count_commits"]
+    assert saved.results[0] == recorded
+
+
+def test_isolated_run_reports_per_process_rss():
+    report = run_benchmarks([SCENARIOS["heuristic_commits"]], scale=SCALE, isolate=True)
+    assert report.results[0].peak_rss_mb > 0
+    assert report.to_dict()["results"]["heuristic_commits"]["items"] == 1000
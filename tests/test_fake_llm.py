@@ -0,0 +1,93 @@
+"""Tests for the fake OpenAI-compatible LLM server."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+from datetime import datetime, timezone
+
+import pytest
+
+from github_feedback.core.models import PullRequestReviewBundle
+from github_feedback.llm import client as client_module
+from github_feedback.llm.client import LLMClient
+from github_feedback.testing import FakeLLMConfig, FakeLLMServer, lognormal_latency
+
+
+@pytest.fixture(autouse=True)
+def _no_sleep(monkeypatch):
+    monkeypatch.setattr(client_module.time, "sleep", lambda seconds: None)
+
+
+def _bundle(number: int) -> PullRequestReviewBundle:
+    return PullRequestReviewBundle(
+        repo="example/repo",
+        number=number,
+        title=f"Fix typo {number}",
+        body="",
+        author="octocat",
+        html_url=f"https://github.com/example/repo/pull/{number}",
+        created_at=datetime.now(timezone.utc),
+        updated_at=datetime.now(timezone.utc),
+        additions=1,
+        deletions=1,
+        changed_files=1,
+        review_bodies=[],
+        review_comments=[],
+        files=[],
+    )
+
+
+PR_TITLES = [{"number": n, "title": f"feat: add widget {n}"} for n in range(1, 13)]
+COMMITS = [{"sha": f"{n:07x}abc", "message": f"fix: handle case {n}"} for n in range(20)]
+
+
+def test_analysis_prompts_get_schema_valid_answers():
+    with FakeLLMServer() as server:
+        client = LLMClient(endpoint=server.endpoint, enable_cache=False)
+        titles = client.analyze_pr_titles(PR_TITLES)
+        commits = client.analyze_commit_messages(COMMITS, repo="example/repo")
+        review = client.generate_review(_bundle(1))
+        batch = client.generate_reviews([_bundle(2), _bundle(3)])
+        development = client.analyze_personal_development(PR_TITLES, [])
+
+    assert titles["clear_titles"] + titles["vague_titles"] == len(PR_TITLES)
+    assert all(example["number"] in range(1, 13) for example in titles["examples_good"])
+    assert commits["good_messages"] + commits["poor_messages"] == len(COMMITS)
+    assert review.overview
+    assert set(batch) == {2, 3}
+    assert development["growth_indicators"] and development["overall_assessment"]
+    assert server.stats.by_kind["pr_titles"] == 1
+    assert server.stats.by_kind["pr_batch_review"] == 1
+    assert server.stats.prompt_tokens > 0 and server.stats.completion_tokens > 0
+
+
+def test_response_format_rejection_falls_back():
+    with FakeLLMServer(FakeLLMConfig(reject_response_format=True)) as server:
+        review = LLMClient(endpoint=server.endpoint, enable_cache=False).generate_review(_bundle(1))
+
+    assert review.overview
+    assert server.stats.rejected_response_format == 1
+    assert server.stats.completions == 1
+
+
+def test_rate_limits_and_errors_are_retried():
+    config = FakeLLMConfig(rate_limit_rate=0.3, error_rate=0.3, seed=3)
+    with FakeLLMServer(config) as server:
+        client = LLMClient(endpoint=server.endpoint, enable_cache=False)
+        for _ in range(5):
+            client.complete([{"role": "user", "content": "hi"}], max_retries=20)
+
+    assert server.stats.completions == 5
+    assert server.stats.rate_limited > 0
+    assert server.stats.faults > server.stats.rate_limited
+    assert server.stats.requests == server.stats.completions + server.stats.faults
+
+
+def test_streaming_and_latency():
+    config = FakeLLMConfig(latency=lognormal_latency(0.01, seed=1), stream_chunk_chars=5)
+    with FakeLLMServer(config) as server:
+        client = replace(LLMClient(endpoint=server.endpoint, enable_cache=False), stream=True)
+        review = client.generate_review(_bundle(4))
+
+    assert review.strengths and review.improvements
+    assert server.stats.streamed == 1
@@ -20,3 +20,29 @@ def test_render_html_table_escapes_markup_by_default():
     html_output = "\n".join(html_lines)
 
     assert "&lt;em&gt;text&lt;/em&gt;" in html_output
+
+
+def test_chart_renders_are_cached_by_content():
+    from github_feedback.game_elements.renderers import ChartRenderer
+
+    ChartRenderer.clear_cache()
+    stats = {"code_quality": 80, "collaboration": 55, "growth": 120}
+
+    first = GameRenderer.render_radar_chart(stats, title="능력치")
+    first.append("mutated by caller")
+    second = GameRenderer.render_radar_chart(dict(stats), title="능력치")
+    other = GameRenderer.render_radar_chart({**stats, "growth": 10}, title="능력치")
+
+    assert second == first[:-1]
+    assert other != second
+    assert ChartRenderer.cache_info() == {"hits": 1, "misses": 2, "size": 2}
+
+
+def test_line_chart_gradient_ids_are_colour_specific():
+    points = [{"label": "1월", "value": 3}, {"label": "2월", "value": 5}]
+
+    red = "\n".join(GameRenderer.render_line_chart(points, color="#ef4444"))
+    blue = "\n".join(GameRenderer.render_line_chart(points, color="#3b82f6"))
+
+    assert 'id="lineGradient-ef4444"' in red and "url(#lineGradient-ef4444)" in red
+    assert 'id="lineGradient-3b82f6"' in blue
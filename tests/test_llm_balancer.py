@@ -0,0 +1,95 @@
+"""Tests for latency-aware LLM endpoint balancing and hedging."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+requests = pytest.importorskip("requests")
+
+from github_feedback.llm.balancer import EndpointPool
+from github_feedback.llm.client import LLMClient
+
+
+class DummyResponse:
+    def __init__(self, url: str, status_code: int = 200) -> None:
+        self.url = url
+        self.status_code = status_code
+
+
+def test_single_endpoint_client_has_no_pool():
+    client = LLMClient(endpoint="https://llm.example.com")
+
+    assert client.endpoint_count == 1
+
+
+def test_pool_deduplicates_endpoints():
+    client = LLMClient(
+        endpoint="https://a.example.com",
+        endpoints=["https://a.example.com", "https://b.example.com"],
+    )
+
+    assert client.endpoint_count == 2
+
+
+def test_pool_prefers_faster_endpoint(monkeypatch):
+    latencies = {"https://fast": 0.0, "https://slow": 0.02}
+
+    def fake_post(url, json=None, timeout=None):
+        time.sleep(latencies[url])
+        return DummyResponse(url)
+
+    monkeypatch.setattr("requests.post", fake_post)
+    pool = EndpointPool(["https://slow", "https://fast"], hedge_percentile=0)
+
+    for _ in range(6):
+        pool.post({}, timeout=1)
+
+    stats = {entry["url"]: entry for entry in pool.snapshot()}
+    assert stats["https://fast"]["requests"] > stats["https://slow"]["requests"]
+
+
+def test_pool_hedges_slow_request(monkeypatch):
+    release = threading.Event()
+
+    def fake_post(url, json=None, timeout=None):
+        if url == "https://stuck" and release.is_set():
+            time.sleep(0.5)
+        return DummyResponse(url)
+
+    monkeypatch.setattr("requests.post", fake_post)
+    pool = EndpointPool(["https://stuck", "https://backup"], hedge_min_samples=2)
+
+    # Warm up both endpoints so latency percentiles are available
+    for _ in range(4):
+        pool.post({}, timeout=1)
+
+    release.set()
+    # Force the stuck endpoint to be chosen first
+    monkeypatch.setattr(pool, "select", lambda exclude=(): "https://backup" if exclude else "https://stuck")
+    response = pool.post({}, timeout=1)
+
+    assert response.url == "https://backup"
+    assert pool.hedged_requests == 1
+
+
+def test_pool_routes_retry_to_other_endpoint_after_error(monkeypatch):
+    attempted = []
+
+    def fake_post(url, json=None, timeout=None):
+        attempted.append(url)
+        if url == "https://down":
+            raise requests.ConnectionError("refused")
+        return DummyResponse(url)
+
+    monkeypatch.setattr("requests.post", fake_post)
+    pool = EndpointPool(["https://down", "https://up"], hedge_percentile=0)
+
+    with pytest.raises(requests.ConnectionError):
+        pool.post({}, timeout=1)
+
+    # The failing endpoint is penalised, so the caller's retry is answered by the healthy one
+    assert pool.post({}, timeout=1).url == "https://up"
+    assert attempted == ["https://down", "https://up"]
@@ -0,0 +1,136 @@
+"""Tests for LLM metrics percentiles, savings accounting and exports."""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+from github_feedback.cli import feedback as cli_feedback
+from github_feedback.core.models import PullRequestReviewBundle
+from github_feedback.llm import client as client_module
+from github_feedback.llm.client import LLMClient
+from github_feedback.llm.metrics import LLMCallMetrics, LLMMetricsCollector, get_global_collector, prompt_type_for
+from github_feedback.testing import FakeLLMConfig, FakeLLMServer
+
+
+@pytest.fixture(autouse=True)
+def _isolated(monkeypatch):
+    monkeypatch.setattr(client_module.time, "sleep", lambda seconds: None)
+    get_global_collector().clear()
+    yield
+    get_global_collector().clear()
+
+
+def _collector() -> LLMMetricsCollector:
+    collector = LLMMetricsCollector()
+    for index in range(1, 101):
+        collector.record(LLMCallMetrics(
+            operation="pr_review",
+            duration_seconds=index / 10,
+            prompt_tokens=1000 + index,
+            completion_tokens=200,
+            total_tokens=1200 + index,
+        ))
+    collector.record(LLMCallMetrics(operation="pr_review_batch", duration_seconds=0.001, cache_hit=True))
+    collector.record(LLMCallMetrics(
+        operation="commits_analysis", duration_seconds=3.0, success=False,
+        error_type="HTTPError", retry_count=5, retry_seconds=3.0,
+    ))
+    collector.record_skip("pr_review", "docs_only")
+    return collector
+
+
+@pytest.mark.parametrize(
+    ("operation", "prompt_type"),
+    [
+        ("pr_review_batch", "review"),
+        ("commits_analysis", "commit_analysis"),
+        ("personal_dev_growth", "personal_development"),
+        ("award_quote", "award_quote"),
+        ("unknown", "unknown"),
+    ],
+)
+def test_prompt_type_for(operation, prompt_type):
+    assert prompt_type_for(operation) == prompt_type
+
+
+def test_percentiles_savings_and_retry_overhead():
+    aggregated = _collector().get_aggregated()
+
+    review = aggregated.prompt_types["review"]
+    assert review.calls == 101 and review.cache_hits == 1
+    assert review.duration.quantile(0.5) == pytest.approx(5.0, rel=0.03)
+    assert review.duration.quantile(0.95) == pytest.approx(9.5, rel=0.03)
+    assert review.prompt_tokens.quantile(0.99) == pytest.approx(1099, rel=0.03)
+    assert review.saved_seconds == pytest.approx(5.05)
+    assert review.saved_tokens == 1250
+    assert aggregated.cache_saved_cost == pytest.approx(review.cost / 100)
+
+    commits = aggregated.prompt_types["commit_analysis"]
+    assert commits.failures == 1 and commits.duration.count == 0
+    assert aggregated.total_retries == 5 and aggregated.total_retry_seconds == 3.0
+    assert "Cache Savings" in aggregated.format_summary()
+
+
+def test_exports_json_and_prometheus(tmp_path):
+    collector = _collector()
+    payload = json.loads(collector.save_json(tmp_path / "llm.json").read_text(encoding="utf-8"))
+    assert payload["totals"]["cache_savings"]["tokens"] == 1250
+    assert payload["prompt_types"]["review"]["duration_seconds"]["count"] == 100
+    assert payload["skip_reasons"] == {"pr_review:docs_only": 1}
+
+    text = collector.save_prometheus(tmp_path / "llm.prom").read_text(encoding="utf-8")
+    samples = {
+        line.rsplit(" ", 1)[0]: float(line.rsplit(" ", 1)[1])
+        for line in text.splitlines()
+        if line and not line.startswith("#")
+    }
+    assert samples['gfa_llm_calls_total{prompt_type="review"}'] == 101
+    assert samples['gfa_llm_duration_seconds_count{prompt_type="review"}'] == 100
+    assert samples['gfa_llm_duration_seconds{prompt_type="review",quantile="0.95"}'] == pytest.approx(9.5, rel=0.03)
+    assert samples['gfa_llm_retry_overhead_seconds_total{prompt_type="commit_analysis"}'] == 3.0
+    assert samples['gfa_llm_skipped_calls_total{reason="pr_review:docs_only"}'] == 1
+    assert "# TYPE gfa_llm_duration_seconds summary" in text
+
+
+def test_client_records_prompt_types_and_run_export(tmp_path):
+    with FakeLLMServer(FakeLLMConfig(error_rate=0.4, seed=2)) as server:
+        client = LLMClient(endpoint=server.endpoint, enable_cache=False)
+        for _ in range(4):
+            client.complete([{"role": "user", "content": "hi"}], operation="personal_dev_growth")
+
+    stats = get_global_collector().get_aggregated().prompt_types["personal_development"]
+    assert stats.calls == 4 and stats.retries == server.stats.faults
+    assert stats.prompt_tokens.count == 4 and stats.prompt_tokens.quantile(0.5) > 0
+
+    json_path, prometheus_path = cli_feedback.display_llm_metrics(tmp_path)
+    assert json.loads(json_path.read_text(encoding="utf-8"))["totals"]["calls"] == 4
+    assert 'prompt_type="personal_development"' in prometheus_path.read_text(encoding="utf-8")
+
+
+def test_non_streamed_review_records_prompt_metrics():
+    now = datetime.now(timezone.utc)
+    bundle = PullRequestReviewBundle(
+        repo="example/repo", number=7, title="Add parser", body="", author="octocat",
+        html_url="https://github.com/example/repo/pull/7", created_at=now, updated_at=now,
+        additions=12, deletions=3, changed_files=1, review_bodies=[], review_comments=[], files=[],
+    )
+    with FakeLLMServer(FakeLLMConfig(seed=1)) as server:
+        client = LLMClient(endpoint=server.endpoint, enable_cache=False, stream=False)
+        client.generate_review(bundle)
+
+    review = get_global_collector().get_aggregated().prompt_types["review"]
+    assert review.calls == 1 and review.failures == 0
+    assert review.duration.count == 1
+    assert review.prompt_tokens.quantile(0.5) > 0
+
+
+def test_prometheus_keeps_large_counts_exact():
+    collector = LLMMetricsCollector()
+    collector.record(LLMCallMetrics(operation="pr_review", duration_seconds=0.1, prompt_tokens=3_703_501))
+    text = collector.get_aggregated().to_prometheus()
+
+    assert 'gfa_llm_prompt_tokens_sum{prompt_type="review"} 3703501' in text
+    assert 'gfa_llm_duration_seconds_sum{prompt_type="review"} 0.1\n' in text
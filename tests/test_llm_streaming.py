@@ -0,0 +1,159 @@
+"""Tests for SSE streaming and incremental JSON validation of LLM responses."""
+
+from __future__ import annotations
+
+import json as jsonlib
+from datetime import datetime, timezone
+
+import pytest
+
+requests = pytest.importorskip("requests")
+
+from github_feedback.core.models import PullRequestReviewBundle
+from github_feedback.llm.client import LLMClient
+from github_feedback.llm.metrics import get_global_collector
+from github_feedback.llm.streaming import (
+    IncrementalJSONValidator,
+    StreamAbortedError,
+    review_stream_validator,
+)
+
+
+class StreamingResponse:
+    """Minimal stand-in for a streamed ``requests.Response``."""
+
+    def __init__(self, chunks: list[str], status_code: int = 200) -> None:
+        self.status_code = status_code
+        self.headers = {"content-type": "text/event-stream"}
+        self.lines_read = 0
+        self.closed = False
+        self._lines = [
+            f"data: {jsonlib.dumps({'choices': [{'delta': {'content': chunk}}]})}"
+            for chunk in chunks
+        ] + ["data: [DONE]"]
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} error", response=self)
+
+    def iter_lines(self):
+        for line in self._lines:
+            self.lines_read += 1
+            yield line.encode("utf-8")
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def _bundle() -> PullRequestReviewBundle:
+    return PullRequestReviewBundle(
+        repo="example/repo",
+        number=1,
+        title="Fix typo",
+        body="",
+        author="octocat",
+        html_url="https://github.com/example/repo/pull/1",
+        created_at=datetime.now(timezone.utc),
+        updated_at=datetime.now(timezone.utc),
+        additions=1,
+        deletions=1,
+        changed_files=1,
+        review_bodies=[],
+        review_comments=[],
+        files=[],
+    )
+
+
+def test_validator_accepts_valid_review_in_chunks():
+    validator = review_stream_validator()
+    payload = '{"overview": "Nice \\"fix\\"", "strengths": [{"message": "ok"}], "improvements": []}'
+    for index in range(0, len(payload), 7):
+        validator.feed(payload[index:index + 7])
+    validator.close()
+
+    assert validator.finished
+    assert validator.seen_keys == {"overview", "strengths", "improvements"}
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "Sure! Here is the review",
+        '{"overview": ["not", "a", "string"]',
+        '{"overview": "  "',
+        '{"strengths": []}',
+        '{"overview": "ok"} trailing',
+    ],
+)
+def test_validator_rejects_malformed_output(text):
+    validator = review_stream_validator()
+
+    with pytest.raises(StreamAbortedError):
+        validator.feed(text)
+        validator.close()
+
+
+def test_validator_ignores_untyped_nested_fields():
+    validator = IncrementalJSONValidator({"overview": str}, required=["overview"])
+    validator.feed('{"meta": {"overview": [1, 2]}, "overview": "fine"}')
+    validator.close()
+
+
+def test_generate_review_streams_and_records_ttft(monkeypatch):
+    chunks = ['{"overview": "Lo', 'oks good.", "strengths": [],', ' "improvements": []}']
+    requests_sent = []
+
+    def fake_post(url, json=None, timeout=None, stream=False):
+        requests_sent.append((json, stream))
+        return StreamingResponse(chunks)
+
+    monkeypatch.setattr("requests.post", fake_post)
+    get_global_collector().clear()
+    client = LLMClient(endpoint="https://llm.example.com", stream=True)
+
+    summary = client.generate_review(_bundle())
+
+    assert summary.overview == "Looks good."
+    assert requests_sent[0][0]["stream"] is True
+    assert requests_sent[0][1] is True
+    recorded = get_global_collector().get_recent(1)[0]
+    assert recorded.operation == "pr_review"
+    assert recorded.time_to_first_token is not None
+
+
+def test_generate_review_aborts_malformed_stream_early(monkeypatch):
+    responses = []
+
+    def fake_post(url, json=None, timeout=None, stream=False):
+        if "response_format" in json:
+            response = StreamingResponse(["I cannot", " produce JSON", " but here", " is prose"])
+        else:
+            response = StreamingResponse(['{"overview": "Recovered."}'])
+        responses.append(response)
+        return response
+
+    monkeypatch.setattr("requests.post", fake_post)
+    client = LLMClient(endpoint="https://llm.example.com", stream=True)
+
+    summary = client.generate_review(_bundle())
+
+    assert summary.overview == "Recovered."
+    # The malformed generation was abandoned after the first chunk
+    assert responses[0].lines_read == 1
+    assert responses[0].closed
+
+
+def test_generate_review_closes_failed_stream(monkeypatch):
+    responses = []
+
+    def fake_post(url, json=None, timeout=None, stream=False):
+        responses.append(StreamingResponse([], status_code=500))
+        return responses[-1]
+
+    monkeypatch.setattr("requests.post", fake_post)
+    client = LLMClient(endpoint="https://llm.example.com", stream=True)
+
+    with pytest.raises(requests.HTTPError):
+        client.generate_review(_bundle())
+
+    assert responses and all(response.closed for response in responses)
@@ -0,0 +1,128 @@
+"""Tests for memory profiling and the bounded-memory collection caps."""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+from github_feedback.api import client as client_module
+from github_feedback.cli import feedback as cli_feedback
+from github_feedback.collectors.collector import Collector
+from github_feedback.core import memory, tracing
+from github_feedback.core.config import Config
+from github_feedback.testing import MockGitHubServer, RepoSpec, SyntheticGitHub
+
+
+@pytest.fixture(autouse=True)
+def _isolated(monkeypatch):
+    import keyring
+
+    monkeypatch.setattr(keyring, "get_password", lambda service, username: "token")
+    monkeypatch.setattr(client_module.time, "sleep", lambda seconds: None)
+    yield
+    memory.stop_memory_profiling()
+
+
+def _collector(api_url, **limits):
+    config = Config()
+    config.server.api_url = api_url
+    for key, value in limits.items():
+        setattr(config.memory, key, value)
+    collector = Collector(config)
+    collector.api_client.enable_cache = False
+    return collector
+
+
+def test_phases_report_peaks_and_top_allocation_sites(tmp_path):
+    assert memory.memory_phase("off").__enter__() is None  # No-op while profiling is off
+
+    memory.start_memory_profiling(top=5)
+    kept = []
+
+    @tracing.phase("Phase 1: Allocate")
+    def allocate():
+        kept.append([bytearray(1024) for _ in range(500)])
+        with tracing.phase("Phase 1.1: Transient"):
+            transient = bytearray(4 * 1024 * 1024)
+            del transient
+
+    allocate()
+    report = memory.stop_memory_profiling()
+
+    inner, outer = report.phases
+    assert inner.name == "Phase 1.1: Transient" and outer.name == "Phase 1: Allocate"
+    assert inner.peak_bytes >= 4 * 1024 * 1024 and abs(inner.retained_bytes) < 1024 * 1024
+    assert outer.peak_bytes >= inner.peak_bytes  # Nested peaks roll up
+    assert outer.retained_bytes >= 500 * 1024
+    assert outer.top_sites and outer.top_sites[0].location.startswith(__file__)
+    assert outer.top_sites[0].count_diff >= 500
+
+    path = report.save(tmp_path / "memory.json")
+    loaded = memory.MemoryReport.load(path)
+    assert loaded == report
+    assert json.loads(path.read_text(encoding="utf-8"))["phases"][1]["retained_bytes"] == outer.retained_bytes
+    assert "Phase 1: Allocate: peak" in loaded.format_summary()
+
+
+def test_instrument_writes_memory_profile(tmp_path):
+    path = tmp_path / "memory.json"
+    with tracing.instrument(memory_path=path):
+        with tracing.phase("Phase 3: Metrics Computation"):
+            data = [str(index) for index in range(1000)]
+    assert data and memory.memory_phase("after").__enter__() is None
+
+    cli_feedback._report_instrumentation(None, None, path)
+    assert memory.MemoryReport.load(path).phases[0].name == "Phase 3: Metrics Computation"
+
+
+def test_pull_request_details_respect_memory_caps():
+    spec = RepoSpec("octo/wide", pull_requests=3, reviews_per_pr=4, comments_per_review=2, files_per_pr=12)
+    dataset = SyntheticGitHub.generate([spec])
+    repository = dataset.repository("octo/wide")
+    number = max(repository.pulls, key=lambda pr: len(repository.pull_files(pr["number"])))["number"]
+    with MockGitHubServer(dataset) as server:
+        full = _collector(server.url).collect_pull_request_details("octo/wide", number)
+        capped = _collector(
+            server.url,
+            max_patch_chars=30,
+            max_patch_chars_per_pr=100,
+            max_files_per_pr=5,
+            max_review_text_chars=10,
+            max_review_comments_per_pr=2,
+        ).collect_pull_request_details("octo/wide", number)
+
+    assert len(full.files) > 5 and len(capped.files) == 5
+    assert capped.changed_files == full.changed_files
+    patches = [file.patch for file in capped.files]
+    assert patches[0].endswith("... [truncated]") and patches[0].startswith(full.files[0].patch.splitlines()[0])
+    assert patches[-1] is None  # Past the per-PR budget
+    assert sum(len(patch or "") for patch in patches[:-1]) <= 100 + 2 * len("\n... [truncated]")
+    assert len(capped.review_bodies) <= 2 and len(capped.review_comments) == 2
+    assert all(len(text) <= 10 + len("\n... [truncated]") for text in capped.review_comments)
+
+
+def test_monthly_trends_stream_pages():
+    spec = RepoSpec("octo/busy", commits=250, pull_requests=120)
+    dataset = SyntheticGitHub.generate([spec])
+    with MockGitHubServer(dataset) as server:
+        collector = _collector(server.url)
+        pages = list(collector.api_client.iter_pages("repos/octo/busy/pulls", {"state": "all"}, per_page=50))
+        trends = collector.collect_monthly_trends("octo/busy", datetime(2024, 1, 1, tzinfo=timezone.utc))
+
+    assert [len(page) for page in pages] == [50, 50, 20]
+    assert sum(month["commits"] for month in trends) > 0
+    with pytest.raises(ValueError):
+        next(collector.api_client.iter_pages("repos/octo/busy/pulls", {}, max_pages=0))
+
+
+def test_memory_section_round_trips(tmp_path):
+    config = Config()
+    config.set_value("memory.max_files_per_pr", "50")
+    path = tmp_path / "config.toml"
+    config.dump(path, backup=False)
+    assert Config.load(path).memory.max_files_per_pr == 50
+
+    with pytest.raises(ValueError):
+        config.set_value("memory.max_patch_chars", "0")
@@ -0,0 +1,104 @@
+"""Tests for compact metrics snapshot files."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from github_feedback.cli import yearinreview
+from github_feedback.core.snapshot import (
+    MetricsSnapshotFile,
+    SnapshotFormatError,
+    export_json,
+    is_snapshot,
+    read_metrics,
+    update_snapshot,
+    write_snapshot,
+)
+
+
+def _metrics():
+    return {
+        "repo": "octo/repo",
+        "summary": {"overall": "Busy quarter"},
+        "evidence": {"commits": [f"commit {i} " * 20 for i in range(50)]},
+        "detailed_feedback": {"commit_feedback": {"total_commits": 10, "good_messages": 7}},
+    }
+
+
+def test_round_trip_and_lazy_section_access(tmp_path, monkeypatch):
+    path = write_snapshot(tmp_path / "metrics.gfms", _metrics())
+    assert is_snapshot(path)
+
+    decoded = []
+    original = json.loads
+    monkeypatch.setattr(
+        "github_feedback.core.snapshot.json.loads",
+        lambda blob, *a, **kw: decoded.append(blob) or original(blob, *a, **kw),
+    )
+
+    snapshot = MetricsSnapshotFile(path)
+    assert snapshot.sections() == list(_metrics())
+    assert snapshot.section("detailed_feedback") == _metrics()["detailed_feedback"]
+    # Index plus the one requested section; evidence stays undecoded
+    assert len(decoded) == 2
+    assert snapshot.section("missing", {}) == {}
+    assert snapshot.load() == _metrics()
+
+
+def test_update_replaces_section_and_keeps_others(tmp_path):
+    path = write_snapshot(tmp_path / "metrics.gfms", _metrics())
+
+    update_snapshot(path, {"detailed_feedback": {"new": True}, "extra": [1, 2]})
+
+    data = read_metrics(path)
+    assert data["detailed_feedback"] == {"new": True}
+    assert data["extra"] == [1, 2]
+    assert data["evidence"] == _metrics()["evidence"]
+
+
+def test_reads_legacy_json_and_exports(tmp_path):
+    legacy = tmp_path / "metrics.json"
+    legacy.write_text(json.dumps(_metrics()), encoding="utf-8")
+    assert read_metrics(legacy, section="summary") == {"overall": "Busy quarter"}
+
+    snapshot = write_snapshot(tmp_path / "metrics.gfms", _metrics())
+    exported = export_json(snapshot, tmp_path / "export" / "metrics.json")
+    assert json.loads(exported.read_text(encoding="utf-8")) == _metrics()
+
+    with pytest.raises(SnapshotFormatError):
+        MetricsSnapshotFile(legacy)
+
+
+def test_year_in_review_migrates_legacy_metrics(tmp_path):
+    legacy = tmp_path / "octo__repo" / "metrics.json"
+    legacy.parent.mkdir()
+    legacy.write_text(json.dumps({"summary": {"overall": "ok"}}), encoding="utf-8")
+
+    class Feedback:
+        def to_dict(self):
+            return {"pr_title_feedback": {"total_prs": 4, "clear_titles": 3, "unclear_titles": 1}}
+
+    yearinreview._save_detailed_feedback_to_metrics(tmp_path, "octo/repo", Feedback())
+
+    snapshot_path = yearinreview._get_year_in_review_metrics_path(tmp_path, "octo/repo")
+    assert not legacy.exists()
+    assert read_metrics(snapshot_path, section="summary") == {"overall": "ok"}
+
+    detailed_feedback = read_metrics(snapshot_path, section="detailed_feedback")
+    assert yearinreview._communication_skills_from_feedback(detailed_feedback)[1] == pytest.approx(75.0)
+
+
+def test_year_in_review_replaces_corrupt_snapshot(tmp_path):
+    snapshot_path = yearinreview._get_year_in_review_metrics_path(tmp_path, "octo/repo")
+    write_snapshot(snapshot_path, {"summary": {"overall": "ok"}, "detailed_feedback": {}})
+    snapshot_path.write_bytes(snapshot_path.read_bytes()[:-4])  # Truncated by an interrupted write
+
+    class Feedback:
+        def to_dict(self):
+            return {"pr_title_feedback": {"total_prs": 2}}
+
+    yearinreview._save_detailed_feedback_to_metrics(tmp_path, "octo/repo", Feedback())
+
+    assert read_metrics(snapshot_path) == {"detailed_feedback": {"pr_title_feedback": {"total_prs": 2}}}
@@ -0,0 +1,92 @@
+"""Tests for the mock GitHub server and synthetic repository generator."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+import pytest
+import requests
+
+from github_feedback.api import client as client_module
+from github_feedback.collectors.collector import Collector
+from github_feedback.core.config import Config
+from github_feedback.core.models import AnalysisFilters
+from github_feedback.testing._http import BackgroundServer
+from github_feedback.testing import FaultConfig, MockGitHubServer, RepoSpec, SyntheticGitHub, generate_repository
+
+SPEC = RepoSpec("octo/big", commits=250, pull_requests=230, issues=40, files_per_pr=3)
+
+
+def _collector(monkeypatch, api_url):
+    import keyring
+
+    monkeypatch.setattr(keyring, "get_password", lambda service, username: "token")
+    monkeypatch.setattr(client_module.time, "sleep", lambda seconds: None)
+    config = Config()
+    config.server.api_url = api_url
+    collector = Collector(config)
+    collector.api_client.enable_cache = False
+    return collector
+
+
+def test_generator_is_deterministic():
+    first = generate_repository(SPEC, seed=7)
+    second = generate_repository(SPEC, seed=7)
+    assert first.pulls == second.pulls
+    assert len(first.pulls) == 230
+    assert sum("pull_request" in issue for issue in first.issues) == 230
+    assert first.pull_files(first.pulls[0]["number"]) == second.pull_files(first.pulls[0]["number"])
+
+
+def test_collectors_page_through_mock_server(monkeypatch):
+    dataset = SyntheticGitHub.generate([SPEC], login="octocat")
+    with MockGitHubServer(dataset) as server:
+        collector = _collector(monkeypatch, server.url)
+        since = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        filters = AnalysisFilters()
+
+        count, metadata = collector.list_pull_requests("octo/big", since, filters)
+        humans = [pr for pr in dataset.repository("octo/big").pulls if pr["user"]["type"] != "Bot"]
+        assert count == len(humans)
+        assert collector.get_authenticated_user() == "octocat"
+        commits = collector.api_client.request_all("repos/octo/big/commits", {"author": "octocat"})
+        assert commits and all(commit["author"]["login"] == "octocat" for commit in commits)
+
+        response = requests.get(
+            f"{server.url}/repos/octo/big/pulls?state=all&per_page=100",
+            headers={"Authorization": "Bearer token"},
+        )
+        assert 'rel="next"' in response.headers["Link"]
+        assert response.headers["X-RateLimit-Remaining"]
+        cached = requests.get(
+            response.url,
+            headers={"Authorization": "Bearer token", "If-None-Match": response.headers["ETag"]},
+        )
+        assert cached.status_code == 304
+        assert server.stats.not_modified == 1
+
+
+def test_injected_faults_are_retried(monkeypatch):
+    dataset = SyntheticGitHub.generate([RepoSpec("octo/small", pull_requests=5)])
+    faults = FaultConfig(error_rate=0.3, seed=3)
+    with MockGitHubServer(dataset, faults=faults) as server:
+        collector = _collector(monkeypatch, server.url)
+        for _ in range(10):
+            assert collector.api_client.request_json("user")["login"] == "octocat"
+        assert server.stats.faults > 0
+
+
+def test_rate_limit_exhaustion():
+    dataset = SyntheticGitHub.generate([RepoSpec("octo/small", pull_requests=1)])
+    with MockGitHubServer(dataset, rate_limit=2) as server:
+        headers = {"Authorization": "Bearer token"}
+        statuses = [requests.get(f"{server.url}/user", headers=headers).status_code for _ in range(3)]
+    assert statuses == [200, 200, 403]
+
+
+def test_server_without_handler_cannot_be_created():
+    class Incomplete(BackgroundServer):
+        pass
+
+    with pytest.raises(TypeError):
+        Incomplete()
@@ -0,0 +1,125 @@
+"""Tests for the token-budgeted PR prompt packer."""
+
+from __future__ import annotations
+
+import pytest
+
+from github_feedback.core.models import PullRequestFile
+from github_feedback.llm.prompt_packer import (
+    PromptPacker,
+    classify_pruned_file,
+    file_category,
+    estimate_tokens,
+    split_hunks,
+    truncate_to_tokens,
+)
+
+
+def _file(filename: str, patch: str | None = None, changes: int = 1) -> PullRequestFile:
+    return PullRequestFile(
+        filename=filename,
+        status="modified",
+        additions=changes,
+        deletions=0,
+        changes=changes,
+        patch=patch,
+    )
+
+
+def test_estimate_tokens_counts_hangul_per_character():
+    assert estimate_tokens("") == 0
+    assert estimate_tokens("abcd" * 10) == 10
+    assert estimate_tokens("한글") == 2
+
+
+def test_truncate_to_tokens_respects_budget():
+    text = "word " * 200
+    truncated = truncate_to_tokens(text, 20)
+
+    assert estimate_tokens(truncated) <= 20
+    assert truncated.endswith("…")
+
+
+def test_classify_pruned_file_detects_noise():
+    assert classify_pruned_file(_file("web/package-lock.json")) == "lockfile"
+    assert classify_pruned_file(_file("go.sum")) == "lockfile"
+    assert classify_pruned_file(_file("vendor/github.com/x/y.go")) == "vendored"
+    assert classify_pruned_file(_file("static/app.min.js")) == "generated"
+    assert classify_pruned_file(_file("src/__snapshots__/App.test.js.snap")) == "generated"
+    assert classify_pruned_file(_file("api/v1/service.pb.go")) == "generated"
+    assert classify_pruned_file(_file("gen.py", "@@ -0,0 +1 @@\n+# @generated by tool")) == "generated"
+    assert classify_pruned_file(_file("bundle.js", "@@ -1 +1 @@\n+" + "x" * 600)) == "minified"
+    assert classify_pruned_file(_file("src/app.py", "@@ -1 +1 @@\n+print()")) is None
+
+
+@pytest.mark.parametrize(
+    ("filename", "category"),
+    [
+        ("tests/test_api.py", "test"),
+        ("pkg/test/helpers.py", "test"),
+        ("src/test_parser.py", "test"),
+        ("conftest.py", "test"),
+        ("server/handler_test.go", "test"),
+        ("web/app.spec.ts", "test"),
+        ("web/__tests__/App.js", "test"),
+        ("src/main/java/FooTest.java", "test"),
+        ("src/inspector.py", "source"),
+        ("app/latest.py", "source"),
+        ("lib/respect.rb", "source"),
+        ("src/special/offers.ts", "source"),
+        ("contest/Contest.java", "source"),
+        ("docs/testing.md", "docs"),
+    ],
+)
+def test_file_category_matches_test_paths_by_segment(filename, category):
+    assert file_category(filename) == category
+
+
+def test_split_hunks_keeps_headers():
+    patch = "@@ -1 +1 @@\n-a\n+b\n@@ -10 +10 @@\n-c\n+d"
+
+    assert split_hunks(patch) == ["@@ -1 +1 @@\n-a\n+b", "@@ -10 +10 @@\n-c\n+d"]
+
+
+def test_packer_prunes_lockfiles_and_prefers_source_hunks():
+    lock_patch = "@@ -1,3 +1,3 @@\n" + "\n".join(f"+dep-{i}@1.0.0" for i in range(200))
+    source_patch = "@@ -1 +1,3 @@\n+def handler():\n+    return compute()\n+"
+    files = [
+        _file("package-lock.json", lock_patch, changes=200),
+        _file("src/handler.py", source_patch, changes=3),
+    ]
+
+    packed = PromptPacker(token_budget=500).pack(files)
+    rendered = "\n".join(packed.lines)
+
+    assert "def handler()" in rendered
+    assert "dep-0" not in rendered
+    assert packed.pruned_files == {"lockfile": ["package-lock.json"]}
+    assert "잠금 파일: package-lock.json" in rendered
+
+
+def test_packer_stays_within_budget_and_reports_omissions():
+    hunk = "@@ -1 +1,40 @@\n" + "\n".join(f"+value_{i} = {i}" for i in range(40))
+    files = [_file(f"src/module{i}.py", hunk, changes=40) for i in range(5)]
+
+    packer = PromptPacker(token_budget=300, max_lines_per_file=50)
+    packed = packer.pack(files, used_tokens=50)
+
+    assert packed.estimated_tokens <= 250
+    assert packed.included_hunks >= 1
+    assert packed.omitted_hunks >= 1
+    assert "토큰 예산 초과" in packed.lines[-1]
+
+
+def test_packer_ranks_files_when_listing_is_capped():
+    files = [
+        _file("docs/notes.md", "@@ -1 +1 @@\n+note", changes=1),
+        _file("src/core.py", "@@ -1 +1,3 @@\n+a = 1\n+b = 2\n+c = 3", changes=3),
+    ]
+
+    packed = PromptPacker(max_files=1).pack(files)
+    rendered = "\n".join(packed.lines)
+
+    assert "src/core.py" in rendered
+    assert "docs/notes.md" not in rendered
+    assert "관련도가 낮은 파일 1개 생략" in rendered
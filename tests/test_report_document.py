@@ -0,0 +1,109 @@
+"""Tests for the markdown report document tree."""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime
+from pathlib import Path
+
+from github_feedback.cli import report_integration
+from github_feedback.core.models import AnalysisStatus, MetricSnapshot
+from github_feedback.reporters.document import ReportDocument, Section
+from github_feedback.reporters.reporter import Reporter
+
+SAMPLE = """<style></style>
+
+# Report
+
+## 🏆 Awards Cabinet
+
+| 1 | 코드 장인 |
+
+### Details
+
+```python
+# not a heading
+```
+
+## ✨ Growth Highlights
+
+- shipped
+"""
+
+
+def test_parse_builds_tree_and_round_trips():
+    document = ReportDocument.parse(SAMPLE)
+
+    assert document.to_markdown() == SAMPLE
+    assert [section.heading for section in document.walk()] == [
+        "# Report",
+        "## 🏆 Awards Cabinet",
+        "### Details",
+        "## ✨ Growth Highlights",
+    ]
+    awards = document.content("## 🏆 Awards Cabinet")
+    assert awards.startswith("| 1 | 코드 장인 |")
+    assert "# not a heading" in awards
+    assert "shipped" not in awards
+    assert document.find("## Missing") is None
+
+
+def test_nested_under_relevels_subsections():
+    awards = ReportDocument.parse(SAMPLE).find("## 🏆 Awards Cabinet")
+
+    grafted = Section("🏅 획득 어워드", 3, awards.nested_under(3))
+
+    assert "#### Details" in list(grafted.iter_lines())
+    assert awards.children[0].level == 3
+
+
+def test_json_and_html_serialisers_follow_the_tree():
+    document = ReportDocument.parse(SAMPLE)
+
+    payload = json.loads(document.to_json())
+    report = payload["sections"][0]
+    assert report["title"] == "Report"
+    assert [child["title"] for child in report["sections"]] == ["🏆 Awards Cabinet", "✨ Growth Highlights"]
+
+    rendered = document.to_html()
+    assert '<section class="level2">' in rendered
+    assert "<h3>Details</h3>" in rendered
+    assert rendered.count("<section") == rendered.count("</section>") == 4
+
+
+def test_reporter_document_matches_markdown_content(tmp_path):
+    metrics = MetricSnapshot(
+        repo="example/repo",
+        months=3,
+        generated_at=datetime(2024, 1, 1),
+        status=AnalysisStatus.REPORTED,
+        summary={"overall": "Busy"},
+        stats={},
+        evidence={},
+        awards=["🏆 코드 대장장이 상 — 100회 이상의 커밋"],
+    )
+    reporter = Reporter(output_dir=tmp_path)
+
+    document = reporter.render_document(metrics)
+
+    assert document.to_markdown() == reporter.generate_markdown_content(metrics)
+    assert document.find("## 🏆 Awards Cabinet") is not None
+
+
+def test_integrated_report_merges_document_sections(tmp_path: Path):
+    brief = ReportDocument.parse(SAMPLE + "\n## 🔮 마녀의 독설\n\n마녀의 경고\n")
+    feedback_path = tmp_path / "feedback.md"
+    feedback_path.write_text("## 👤 개인 성장 분석\n\n- 성장 포인트\n", encoding="utf-8")
+
+    report_path = report_integration.generate_integrated_full_report(
+        output_dir=tmp_path,
+        repo_name="example/repo",
+        brief_content=brief,
+        feedback_report_path=feedback_path,
+    )
+
+    merged = ReportDocument.parse(report_path.read_text(encoding="utf-8"))
+    assert merged.content("### 🔮 마녀의 독설") == "마녀의 경고"
+    assert "#### Details" in merged.content("### 🏅 획득 어워드")
+    assert "- 성장 포인트" in merged.content("## 3. 💡 개선 피드백")
+    assert "**🏆 획득 어워드**: 1개" in merged.content("## 🎯 한눈에 보기 (Executive Summary)")
@@ -0,0 +1,99 @@
+"""Tests for the incremental report writer."""
+
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from github_feedback.reporters.stream_writer import ReportStreamWriter, iter_sections
+from github_feedback.year_in_review.models import RepositoryAnalysis
+from github_feedback.year_in_review.reporter import YearInReviewReporter
+from github_feedback.year_in_review.sections.repository_breakdown import (
+    generate_repository_breakdown,
+)
+
+
+def test_streamed_output_matches_joined_lines(tmp_path):
+    sections = [["# Title", "", "body"], ["", "multi\nline", ""], []]
+    path = tmp_path / "report.md"
+
+    with ReportStreamWriter(path) as writer:
+        for section in sections:
+            writer.write_lines(iter(section))
+
+    expected = "\n".join(line for section in sections for line in section)
+    assert path.read_text(encoding="utf-8") == expected
+    assert writer.lines_written == 6
+
+
+def test_strip_drops_outer_blank_lines_only(tmp_path):
+    lines = ["", "  ", "first", "", "", "last", "", ""]
+    path = tmp_path / "report.md"
+
+    with ReportStreamWriter(path, strip=True) as writer:
+        writer.write_lines(lines)
+
+    assert path.read_text(encoding="utf-8") == "\n".join(lines).strip()
+
+
+def test_failed_render_keeps_previous_report(tmp_path):
+    path = tmp_path / "report.md"
+    path.write_text("previous", encoding="utf-8")
+
+    with pytest.raises(RuntimeError):
+        with ReportStreamWriter(path) as writer:
+            writer.write("partial")
+            raise RuntimeError("builder failed")
+
+    assert path.read_text(encoding="utf-8") == "previous"
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_year_in_review_streams_every_repository(tmp_path):
+    analyses = [
+        RepositoryAnalysis(
+            full_name=f"octo/repo{i}", pr_count=i, commit_count=i * 3, year_commits=i * 2,
+            tech_stack={"Python": i + 1},
+        )
+        for i in range(1, 4)
+    ]
+
+    report_path = YearInReviewReporter(output_dir=tmp_path).create_year_in_review_report(
+        2024, "octo", analyses
+    )
+
+    content = report_path.read_text(encoding="utf-8")
+    assert "\n".join(generate_repository_breakdown(analyses, tmp_path)) in content
+    assert all(f"octo/repo{i}" in content for i in range(1, 4))
+
+
+def test_iter_sections_renders_ahead_only_while_background_work_runs():
+    calls = []
+    release = threading.Event()
+
+    def section(name):
+        def build():
+            calls.append(name)
+            return [name]
+        return build
+
+    def llm():
+        release.wait(5)
+        return ["llm"]
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        # Deterministic sections render while the first (background) one is in flight
+        threading.Timer(0.1, release.set).start()
+        sections = iter_sections([("llm", llm), ("a", section("a")), ("b", section("b"))], {"llm"}, executor)
+        assert next(sections) == ["llm"]
+        assert calls == ["a", "b"]
+        assert list(sections) == [["a"], ["b"]]
+
+        # Without a pending background section each one renders when consumed
+        calls.clear()
+        sections = iter_sections([("a", section("a")), ("b", section("b"))], {"llm"}, executor)
+        assert next(sections) == ["a"]
+        assert calls == ["a"]
+        assert list(sections) == [["b"]]
@@ -102,6 +102,35 @@ def test_generate_markdown_content_returns_string(tmp_path, sample_metrics):
     assert not report_path.exists()
 
 
+def test_markdown_outputs_share_one_render(tmp_path, sample_metrics):
+    """File and in-memory outputs should reuse a single memoized render."""
+
+    import threading
+
+    class QuoteClient:
+        def __init__(self) -> None:
+            self.threads: list[str] = []
+
+        def generate_award_summary_quote(self, awards, highlights, summary):
+            self.threads.append(threading.current_thread().name)
+            return "한 해를 빛낸 기여"
+
+    client = QuoteClient()
+    reporter = Reporter(output_dir=tmp_path, llm_client=client)
+
+    content = reporter.generate_markdown_content(sample_metrics)
+    md_path = reporter.generate_markdown(sample_metrics)
+
+    assert md_path.read_text(encoding="utf-8") == content
+    assert "> ✨ **한 해를 빛낸 기여**" in content
+    assert len(client.threads) == 1
+    assert client.threads[0] != threading.current_thread().name
+
+    sample_metrics.months = 6
+    assert "**Period**: 6 months" in reporter.generate_markdown_content(sample_metrics)
+    assert len(client.threads) == 2
+
+
 def test_generate_prompt_packets_builds_multi_angle_requests(
     tmp_path, sample_metrics
 ):
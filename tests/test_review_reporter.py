@@ -180,3 +180,89 @@ def test_review_reporter_empty_strengths_and_improvements(tmp_path) -> None:
 
     content = report_path.read_text(encoding="utf-8")
     assert "통합 코드 리뷰 보고서" in content
+
+
+def test_review_reporter_runs_llm_sections_once_and_concurrently(tmp_path) -> None:
+    import threading
+
+    _write_review(tmp_path, "octocat/hello", 1)
+    _write_review(tmp_path, "octocat/hello", 2)
+
+    class ConcurrentLLM:
+        def __init__(self) -> None:
+            self.calls = 0
+            self.overlapped = 0
+            self._barrier = threading.Barrier(2, timeout=5)
+            self._lock = threading.Lock()
+
+        def complete(self, messages, **kwargs):  # type: ignore[no-untyped-def]
+            with self._lock:
+                self.calls += 1
+            # Both LLM-backed sections must be in flight at the same time
+            self._barrier.wait()
+            with self._lock:
+                self.overlapped += 1
+            return "## 팀 보고서\n\n협업이 활발합니다."
+
+    llm = ConcurrentLLM()
+    reporter = ReviewReporter(output_dir=tmp_path / "reviews", llm=llm)  # type: ignore[arg-type]
+
+    report_path = reporter.create_integrated_report("octocat/hello")
+
+    assert llm.calls == 2
+    assert llm.overlapped == 2
+    assert "협업이 활발합니다." in report_path.read_text(encoding="utf-8")
+    assert (report_path.parent / "personal_development.json").exists()
+
+    # Unchanged reviews reuse the memoized section results
+    reporter.create_integrated_report("octocat/hello")
+    assert llm.calls == 2
+
+
+def test_review_reporter_pages_large_pr_lists(tmp_path) -> None:
+    for number in range(1, 8):
+        _write_review(tmp_path, "octocat/hello", number)
+
+    reporter = ReviewReporter(output_dir=tmp_path / "reviews", llm=None, pr_page_size=3)
+    report_path = reporter.create_integrated_report("octocat/hello")
+
+    page_dir = report_path.parent / "pr_list"
+    assert sorted(p.name for p in page_dir.iterdir()) == ["page-001.md", "page-002.md", "page-003.md"]
+    content = report_path.read_text(encoding="utf-8")
+    assert "3개 페이지로 나누어 제공합니다" in content
+    assert "pr_list/page-003.md" in content
+    last_page = (page_dir / "page-003.md").read_text(encoding="utf-8")
+    assert "#7" in last_page and "(3/3)" in last_page
+
+    # A shorter list fits inline again and stale pages are removed
+    reporter.pr_page_size = 10
+    reporter.create_integrated_report("octocat/hello")
+    assert list(page_dir.iterdir()) == []
+
+
+def test_pr_activity_timeline_aggregates_large_review_sets() -> None:
+    from github_feedback.review_reports.data_loader import StoredReview
+    from github_feedback.review_reports.sections import render_pr_activity_timeline
+
+    reviews = [
+        StoredReview(
+            number=n,
+            title=f"Change {n}",
+            author=f"dev{n % 3}",
+            html_url=f"https://example.com/pull/{n}",
+            created_at=datetime(2024, 1 + n % 2, 1 + n % 28),
+            overview="",
+            strengths=[],
+            improvements=[],
+            additions=n,
+            deletions=1,
+        )
+        for n in range(1, 301)
+    ]
+
+    lines = render_pr_activity_timeline(reviews, max_rows=50)
+    rendered = "\n".join(lines)
+
+    assert "PR 300개의 활동을 월별로 요약했습니다" in rendered
+    assert rendered.count("<tr") == 3  # header + two monthly buckets
+    assert "#299 Change 299" in rendered and "#300 Change 300" in rendered
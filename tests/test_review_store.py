@@ -0,0 +1,154 @@
+"""Tests for the consolidated per-repository review store."""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import types
+from datetime import datetime, timezone
+
+import pytest
+
+from github_feedback.review_reports.data_loader import ReviewDataLoader
+from github_feedback.review_reports.reporter import ReviewReporter
+from github_feedback.review_reports.store import STORE_FILENAME, ReviewStore
+
+
+def _write_review(reviews_dir, number: int, *, overview: str = "", day: int | None = None) -> None:
+    root = reviews_dir / "octocat__hello" / f"pr-{number}"
+    root.mkdir(parents=True, exist_ok=True)
+    artefacts = {
+        "repo": "octocat/hello",
+        "number": number,
+        "title": f"Feature {number}",
+        "author": "alice",
+        "html_url": f"https://example.com/octocat/hello/pull/{number}",
+        "created_at": datetime(2024, 1, day or number, tzinfo=timezone.utc).isoformat(),
+        "body": "Long description " * 20,
+        "review_comments": ["Nit"],
+        "additions": 10,
+        "deletions": 2,
+        "files": [{"filename": "a.py", "patch": "@@ -1 +1 @@\n+x"}],
+    }
+    summary = {
+        "overview": overview or f"PR #{number} overview.",
+        "strengths": [{"message": "Clear structure", "example": "a.py"}],
+        "improvements": [],
+    }
+    (root / "artefacts.json").write_text(json.dumps(artefacts), encoding="utf-8")
+    (root / "review_summary.json").write_text(json.dumps(summary), encoding="utf-8")
+
+
+def test_load_reviews_builds_store_and_orders_by_creation(tmp_path):
+    _write_review(tmp_path, 2, day=5)
+    _write_review(tmp_path, 1, day=9)
+    loader = ReviewDataLoader(tmp_path)
+
+    reviews = loader.load_reviews("octocat/hello")
+
+    assert [r.number for r in reviews] == [2, 1]
+    assert reviews[0].strengths[0].example == "a.py"
+    assert reviews[0].review_comments == ["Nit"]
+    assert (tmp_path / "octocat__hello" / STORE_FILENAME).exists()
+
+
+def test_store_refreshes_only_changed_reviews(tmp_path, monkeypatch):
+    _write_review(tmp_path, 1)
+    _write_review(tmp_path, 2)
+    loader = ReviewDataLoader(tmp_path)
+    loader.load_reviews("octocat/hello")
+
+    parsed = []
+    original = ReviewDataLoader._load_review_dir
+
+    def tracking(self, pr_dir):
+        parsed.append(pr_dir.name)
+        return original(self, pr_dir)
+
+    monkeypatch.setattr(ReviewDataLoader, "_load_review_dir", tracking)
+
+    _write_review(tmp_path, 2, overview="Rewritten overview.")
+    summary_path = tmp_path / "octocat__hello" / "pr-2" / "review_summary.json"
+    stat = summary_path.stat()
+    os.utime(summary_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    reviews = loader.load_reviews("octocat/hello")
+
+    assert parsed == ["pr-2"]
+    assert reviews[1].overview == "Rewritten overview."
+
+    # Deleted review folders disappear from the store
+    for child in (tmp_path / "octocat__hello" / "pr-1").iterdir():
+        child.unlink()
+    (tmp_path / "octocat__hello" / "pr-1").rmdir()
+    assert [r.number for r in loader.load_reviews("octocat/hello")] == [2]
+
+
+def test_iter_reviews_streams_projected_fields(tmp_path):
+    for number in (1, 2, 3):
+        _write_review(tmp_path, number)
+    loader = ReviewDataLoader(tmp_path)
+
+    iterator = loader.iter_reviews("octocat/hello", fields=["title", "overview"])
+
+    assert isinstance(iterator, types.GeneratorType)
+    first = next(iterator)
+    assert first.title == "Feature 1"
+    assert first.body == ""
+    assert first.strengths == []
+    assert [r.number for r in iterator] == [2, 3]
+
+    with pytest.raises(ValueError):
+        list(loader.iter_reviews("octocat/hello", fields=["patches"]))
+
+
+def test_concurrent_writers_on_fresh_store_keep_every_review(tmp_path):
+    path = tmp_path / STORE_FILENAME
+    barrier = threading.Barrier(8)
+
+    def write(number):
+        store = ReviewStore(path)  # Separate store objects, as separate processes would have
+        barrier.wait()
+        record = {
+            "number": number, "title": f"PR {number}", "author": "alice", "html_url": "",
+            "created_at": "2024-01-01T00:00:00+00:00", "overview": "", "strengths": [],
+            "improvements": [], "body": "", "review_bodies": [], "review_comments": [],
+            "additions": 0, "deletions": 0, "changed_files": 0,
+        }
+        store.upsert(record, float(number), 0)
+
+    threads = [threading.Thread(target=write, args=(number,)) for number in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(ReviewStore(path).source_mtimes()) == list(range(8))
+    loader = ReviewDataLoader(tmp_path)
+    assert loader.store("octocat/hello") is loader.store("octocat/hello")
+
+
+def test_integrated_report_loads_projected_reviews(tmp_path, monkeypatch):
+    _write_review(tmp_path, 1)
+    _write_review(tmp_path, 2)
+    prompts = []
+
+    class DummyLLM:
+        def complete(self, messages, **kwargs):
+            prompts.append(messages[-1]["content"])
+            return "{}"
+
+    reporter = ReviewReporter(output_dir=tmp_path, llm=DummyLLM())
+    built = {}
+    original = ReviewReporter._iter_sections
+
+    def spy(self, repo, reviews, **kwargs):
+        built.update(bodies=[review.body for review in reviews], reviewed_prs=kwargs["reviewed_prs"])
+        return original(self, repo, reviews, **kwargs)
+
+    monkeypatch.setattr(ReviewReporter, "_iter_sections", spy)
+    assert reporter.create_integrated_report("octocat/hello").exists()
+
+    assert built == {"bodies": ["", ""], "reviewed_prs": 2}  # Texts are not held for the sections
+    assert any("Long description" in prompt and "Nit" in prompt for prompt in prompts)
@@ -0,0 +1,109 @@
+"""Tests for heuristic triage of trivial pull requests."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+from github_feedback.core.config import LLMConfig
+from github_feedback.core.models import PullRequestFile, PullRequestReviewBundle, ReviewSummary
+from github_feedback.llm.metrics import LLMCallMetrics, get_global_collector
+from github_feedback.review_triage import TriageRules
+from github_feedback.reviewer import Reviewer
+
+
+def _bundle(filenames: list[str], additions: int = 40, title: str = "Add feature", author: str = "octocat"):
+    now = datetime.now(timezone.utc)
+    return PullRequestReviewBundle(
+        repo="example/repo",
+        number=3,
+        title=title,
+        body="",
+        author=author,
+        html_url="https://github.com/example/repo/pull/3",
+        created_at=now,
+        updated_at=now,
+        additions=additions,
+        deletions=0,
+        changed_files=len(filenames),
+        review_bodies=[],
+        review_comments=[],
+        files=[
+            PullRequestFile(filename=name, status="modified", additions=1, deletions=0, changes=1)
+            for name in filenames
+        ],
+    )
+
+
+def test_classify_detects_trivial_prs():
+    rules = TriageRules()
+
+    assert rules.classify(_bundle(["README.md", "docs/guide.rst"])) == "docs_only"
+    assert rules.classify(_bundle(["docs/testing.md", "docs/spec/api.md"])) == "docs_only"
+    assert rules.classify(_bundle(["src/app.py"], additions=2)) == "tiny"
+    assert rules.classify(
+        _bundle(["package.json", "package-lock.json"], author="dependabot[bot]")
+    ) == "dependency_bump"
+    assert rules.classify(
+        _bundle(["requirements-dev.txt"], title="chore(deps): bump pytest from 7.4.0 to 8.0.0")
+    ) == "dependency_bump"
+
+
+def test_classify_keeps_substantive_prs():
+    rules = TriageRules()
+
+    assert rules.classify(_bundle(["src/app.py", "README.md"])) is None
+    # Manifest edits by a human without a bump title still get reviewed
+    assert rules.classify(_bundle(["pyproject.toml"], title="Add ruff configuration")) is None
+    assert TriageRules(docs_only=False, max_changed_lines=0).classify(_bundle(["README.md"])) is None
+
+
+def test_triage_is_opt_in():
+    llm = LLMConfig()
+    rules = TriageRules(
+        docs_only=llm.triage_docs_only,
+        dependency_bumps=llm.triage_dependency_bumps,
+        max_changed_lines=llm.triage_max_changed_lines,
+    )
+    assert rules.classify(_bundle(["README.md"], additions=1)) is None
+
+
+def test_reviewer_skips_llm_for_triaged_pr():
+    class FailingLLM:
+        def generate_review(self, bundle):
+            raise AssertionError("LLM must not be called for trivial PRs")
+
+    get_global_collector().clear()
+    reviewer = Reviewer(collector=None, llm=FailingLLM(), triage=TriageRules())  # type: ignore[arg-type]
+
+    summary = reviewer.generate_summary(_bundle(["docs/index.md"]))
+
+    assert "문서만 변경된 PR" in summary.overview
+    aggregated = get_global_collector().get_aggregated()
+    assert aggregated.skipped_calls == 1
+    assert aggregated.skip_reasons == {"pr_review:docs_only": 1}
+    assert aggregated.skip_rate == 1.0
+
+    # Each reviewer (one per repository) counts only its own skips
+    other = Reviewer(collector=None, llm=FailingLLM(), triage=TriageRules())  # type: ignore[arg-type]
+    other.generate_summary(_bundle(["docs/guide.md"]))
+    assert (reviewer.triage_skipped, other.triage_skipped) == (1, 1)
+    assert get_global_collector().get_aggregated().skipped_calls == 2
+
+
+def test_skip_rate_counts_only_pr_review_candidates():
+    class ReviewingLLM:
+        def generate_review(self, bundle):
+            return ReviewSummary(overview="Reviewed")
+
+    collector = get_global_collector()
+    collector.clear()
+    for _ in range(6):  # Other LLM work must not dilute the rate
+        collector.record(LLMCallMetrics(operation="commit_analysis", duration_seconds=0.1))
+    reviewer = Reviewer(collector=None, llm=ReviewingLLM(), triage=TriageRules())  # type: ignore[arg-type]
+
+    reviewer.generate_summary(_bundle(["docs/index.md"]))
+    assert reviewer.generate_summary(_bundle(["src/app.py"])).overview == "Reviewed"
+
+    aggregated = collector.get_aggregated()
+    assert (aggregated.skipped_calls, aggregated.triage_candidates) == (1, 2)
+    assert aggregated.skip_rate == 0.5
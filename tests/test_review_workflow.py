@@ -9,6 +9,7 @@ import pytest
 
 requests = pytest.importorskip("requests")
 
+from github_feedback.cli import feedback as cli_feedback
 from github_feedback.collectors.collector import Collector
 from github_feedback.core.config import Config
 from github_feedback.core.models import PullRequestFile, PullRequestReviewBundle, ReviewPoint, ReviewSummary
@@ -370,3 +371,172 @@ def test_llm_prompt_includes_truncated_diff_snippets():
 
     trailing_section = prompt.split(f"- {files[MAX_FILES_WITH_PATCH_SNIPPETS].filename}", 1)[1]
     assert "```diff" not in trailing_section
+
+
+def _small_bundle(number: int) -> PullRequestReviewBundle:
+    bundle = _make_bundle()
+    bundle.number = number
+    bundle.additions = 5
+    bundle.deletions = 1
+    bundle.body = ""
+    bundle.review_bodies = []
+    bundle.review_comments = []
+    bundle.files = bundle.files[:1]
+    return bundle
+
+
+def test_plan_review_batches_packs_small_prs_within_budget():
+    client = LLMClient(endpoint="https://llm.example.com", prompt_token_budget=2000)
+    large = _small_bundle(4)
+    large.additions = 400
+
+    batches = client.plan_review_batches(
+        [_small_bundle(1), _small_bundle(2), _small_bundle(3), large, _small_bundle(5)],
+        max_batch_size=2,
+    )
+
+    assert [[b.number for b in batch] for batch in batches] == [[1, 2], [4], [3, 5]]
+
+
+def test_generate_reviews_splits_batched_response(monkeypatch):
+    client = LLMClient(endpoint="https://llm.example.com", enable_cache=False)
+    sent = []
+
+    def fake_complete(self, messages, **kwargs):
+        sent.append((messages, kwargs))
+        return jsonlib.dumps(
+            {
+                "reviews": [
+                    {"number": 2, "overview": "Second.", "strengths": ["ok"], "improvements": []},
+                    {"number": 1, "overview": "First.", "strengths": [], "improvements": ["tests"]},
+                    {"number": 9, "overview": "Unknown PR."},
+                    {"number": 3, "overview": ""},
+                ]
+            }
+        )
+
+    monkeypatch.setattr(LLMClient, "complete", fake_complete)
+
+    summaries = client.generate_reviews([_small_bundle(1), _small_bundle(2), _small_bundle(3)])
+
+    assert set(summaries) == {1, 2}
+    assert summaries[1].overview == "First."
+    assert summaries[2].strengths[0].message == "ok"
+    user_prompt = sent[0][0][1]["content"]
+    assert "=== PR #1 ===" in user_prompt and "=== PR #3 ===" in user_prompt
+    assert sent[0][1]["operation"] == "pr_review_batch"
+
+
+def test_reviewer_reviews_prs_missing_from_batch_individually(tmp_path):
+    bundles = {number: _small_bundle(number) for number in (1, 2)}
+
+    class DummyCollector:
+        def collect_pull_request_details(self, repo: str, number: int) -> PullRequestReviewBundle:
+            return bundles[number]
+
+    class BatchLLM(DummyLLM):
+        def __init__(self) -> None:
+            self.single_calls: list[int] = []
+
+        def plan_review_batches(self, items, max_batch_size):
+            return [list(items)]
+
+        def generate_reviews(self, items):
+            return {1: ReviewSummary(overview="Batched review.")}
+
+        def generate_review(self, bundle):
+            self.single_calls.append(bundle.number)
+            return super().generate_review(bundle)
+
+    llm = BatchLLM()
+    reviewer = Reviewer(collector=DummyCollector(), llm=llm, output_dir=tmp_path, batch_size=4)
+
+    updates = {1: None, 2: None}
+    results = cli_feedback._run_batched_reviews(reviewer, "example/repo", updates, max_workers=2)
+
+    assert set(results) == {"pr_1", "pr_2"}
+    assert llm.single_calls == [2]
+    assert "Batched review." in results["pr_1"][1].read_text(encoding="utf-8")
+    assert all(path.exists() for paths in results.values() for path in paths)
+
+    # A second run reuses the persisted reviews without calling the LLM
+    llm.single_calls.clear()
+    assert cli_feedback._run_batched_reviews(reviewer, "example/repo", updates, max_workers=2) == results
+    assert llm.single_calls == []
+
+
+def test_review_manifest_only_refreshes_changed_prs(tmp_path):
+    from datetime import timedelta
+
+    from github_feedback.review_manifest import MANIFEST_FILENAME
+
+    bundle = _make_bundle()
+    bundle.head_sha = "abc123"
+
+    class TrackingCollector:
+        def __init__(self) -> None:
+            self.collected = 0
+            self.head_sha = "abc123"
+
+        def collect_pull_request_details(self, repo: str, number: int) -> PullRequestReviewBundle:
+            self.collected += 1
+            bundle.head_sha = self.head_sha
+            return bundle
+
+        def get_pull_request_head_sha(self, repo: str, number: int) -> str:
+            return self.head_sha
+
+    collector = TrackingCollector()
+    reviewer = Reviewer(collector=collector, llm=DummyLLM(), output_dir=tmp_path)
+
+    reviewer.review_pull_request(bundle.repo, bundle.number, updated_at=bundle.updated_at)
+    manifest_path = tmp_path / "example__repo" / MANIFEST_FILENAME
+    entry = jsonlib.loads(manifest_path.read_text(encoding="utf-8"))["pull_requests"]["7"]
+    assert entry["head_sha"] == "abc123"
+    assert collector.collected == 1
+
+    # Unchanged listing timestamp: reuse without any API call
+    reviewer.review_pull_request(bundle.repo, bundle.number, updated_at=bundle.updated_at)
+    assert collector.collected == 1
+
+    # Activity without new commits only advances the manifest timestamp
+    later = bundle.updated_at + timedelta(hours=1)
+    reviewer.review_pull_request(bundle.repo, bundle.number, updated_at=later)
+    assert collector.collected == 1
+    entry = jsonlib.loads(manifest_path.read_text(encoding="utf-8"))["pull_requests"]["7"]
+    assert entry["updated_at"] == later.isoformat()
+
+    # New commits make the stored review stale
+    collector.head_sha = "def456"
+    reviewer.review_pull_request(bundle.repo, bundle.number, updated_at=later + timedelta(hours=1))
+    assert collector.collected == 2
+
+    # A different prompt version invalidates every stored review
+    client = LLMClient(endpoint="https://llm.example.com", model="other-model")
+    fresh_reviewer = Reviewer(collector=collector, llm=client, output_dir=tmp_path)
+    assert fresh_reviewer.cached_review(bundle.repo, bundle.number) is None
+
+
+def test_batched_manifest_writes_save_once(tmp_path, monkeypatch):
+    from github_feedback.review_manifest import MANIFEST_FILENAME, ReviewManifest
+
+    bundles = {number: _small_bundle(number) for number in (1, 2, 3)}
+
+    class DummyCollector:
+        def collect_pull_request_details(self, repo: str, number: int) -> PullRequestReviewBundle:
+            return bundles[number]
+
+    saves = []
+    original = ReviewManifest._save_locked
+    monkeypatch.setattr(ReviewManifest, "_save_locked", lambda self: (saves.append(1), original(self)))
+    reviewer = Reviewer(collector=DummyCollector(), llm=DummyLLM(), output_dir=tmp_path)
+
+    with reviewer.batched_manifest_writes():
+        for number in bundles:
+            reviewer.review_pull_request("example/repo", number)
+        assert not (tmp_path / "example__repo" / MANIFEST_FILENAME).exists()
+
+    manifest_text = (tmp_path / "example__repo" / MANIFEST_FILENAME).read_text(encoding="utf-8")
+    assert len(saves) == 1
+    assert set(jsonlib.loads(manifest_text)["pull_requests"]) == {"1", "2", "3"}
+    assert "\n" not in manifest_text
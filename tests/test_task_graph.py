@@ -0,0 +1,167 @@
+"""Tests for the critical-path-first task graph and the year-in-review graph."""
+
+from __future__ import annotations
+
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from github_feedback.cli import yearinreview
+from github_feedback.core.snapshot import write_snapshot
+from github_feedback.core.task_graph import DependencyFailedError, TaskGraph
+
+
+def test_results_flow_along_dependencies_and_critical_path_runs_first():
+    order = []
+
+    def record(name, value=None):
+        def run(*args):
+            order.append(name)
+            return value if value is not None else sum(args)
+        return run
+
+    graph = TaskGraph()
+    graph.add("quick", record("quick", 1), cost=1)
+    graph.add("slow_root", record("slow_root", 2), cost=1)
+    graph.add("slow_tail", record("slow_tail"), deps=["slow_root"], cost=10)
+    graph.add("join", record("join"), deps=["quick", "slow_tail"], cost=0)
+
+    assert graph.critical_path() == ["slow_root", "slow_tail", "join"]
+
+    run = graph.run(max_workers=1)
+    assert run.results == {"quick": 1, "slow_root": 2, "slow_tail": 2, "join": 3}
+    assert order[0] == "slow_root"
+
+
+def test_failure_skips_only_dependents():
+    graph = TaskGraph()
+    graph.add("broken", lambda: 1 / 0)
+    graph.add("after", lambda value: value, deps=["broken"])
+    graph.add("independent", lambda: "ok")
+
+    events = []
+    run = graph.run(max_workers=2, on_done=lambda task, error: events.append((task.key, type(error))))
+
+    assert run.results == {"independent": "ok"}
+    assert isinstance(run.errors["broken"], ZeroDivisionError)
+    assert isinstance(run.errors["after"], DependencyFailedError)
+    assert events.index(("broken", ZeroDivisionError)) < events.index(("after", DependencyFailedError))
+
+
+def test_group_limit_and_timeout():
+    active = []
+    peak = []
+    lock = threading.Lock()
+
+    def limited():
+        with lock:
+            active.append(1)
+            peak.append(len(active))
+        time.sleep(0.05)
+        with lock:
+            active.pop()
+
+    graph = TaskGraph()
+    for index in range(4):
+        graph.add(f"llm_{index}", limited, group="llm")
+    graph.add("hung", lambda: time.sleep(1), timeout=0.1)
+
+    run = graph.run(max_workers=4, group_limits={"llm": 2})
+    assert max(peak) == 2
+    assert isinstance(run.errors["hung"], TimeoutError)
+    assert run.elapsed < 1
+
+
+def test_timed_out_task_keeps_its_group_slot_until_it_ends():
+    release = threading.Event()
+    started = []
+
+    graph = TaskGraph()
+    graph.add("slow", lambda: release.wait(5), group="llm", timeout=0.2, cost=10)
+    graph.add("next", lambda: started.append(release.is_set()), group="llm")
+    threading.Timer(0.3, release.set).start()
+
+    run = graph.run(max_workers=2, group_limits={"llm": 1})
+    assert isinstance(run.errors["slow"], TimeoutError)
+    assert started == [True]  # Ran only after the timed out thread returned
+
+    blocked = TaskGraph()
+    blocked.add("stuck", lambda: threading.Event().wait(1), group="llm", timeout=0.05, cost=10)
+    blocked.add("waiter", lambda: "ran", group="llm")
+    run = blocked.run(max_workers=2, group_limits={"llm": 1})
+    assert isinstance(run.errors["waiter"], TimeoutError) and run.elapsed < 1
+
+
+def test_rejects_cycles_and_unknown_dependencies():
+    graph = TaskGraph()
+    graph.add("a", lambda b: b, deps=["b"])
+    graph.add("b", lambda a: a, deps=["a"])
+    with pytest.raises(ValueError, match="cycle"):
+        graph.run(max_workers=1)
+
+    graph = TaskGraph()
+    graph.add("a", lambda missing: missing, deps=["missing"])
+    with pytest.raises(ValueError, match="unknown"):
+        graph.priorities()
+
+
+def test_year_in_review_graph_shares_fetches(tmp_path):
+    calls = []
+
+    class FakeApi:
+        def get_user_commits_in_repo(self, owner, repo, author, max_pages=1):
+            calls.append(("commits", repo))
+            return [{}] * 7
+
+        def request_all(self, *args, **kwargs):
+            raise AssertionError("year commits come from repository discovery")
+
+    class FakeCollector:
+        api_client = FakeApi()
+
+        def get_authenticated_user(self):
+            raise AssertionError("author is resolved once by the caller")
+
+        def list_authored_pull_request_updates(self, repo, author, state):
+            calls.append(("prs", repo))
+            return {1: None, 2: None}
+
+        def list_pull_requests(self, repo, since, filters, author):
+            return 0, []
+
+    def run_feedback(config, repo_input, output_dir, *, collector, author, updates):
+        calls.append(("feedback", repo_input))
+        return None, [(number, None, None, None) for number in updates]
+
+    def collect_detailed(**kwargs):
+        if kwargs["repo"] != "octo/one":
+            return None
+        feedback = {"pr_title_feedback": {"total_prs": 4, "clear_titles": 3, "unclear_titles": 1}}
+        return SimpleNamespace(to_dict=lambda: feedback)
+
+    # A snapshot left by an earlier run must not stand in for a collection that found nothing
+    stale = {"pr_title_feedback": {"total_prs": 2, "clear_titles": 2, "unclear_titles": 0}}
+    write_snapshot(yearinreview._get_year_in_review_metrics_path(tmp_path, "octo/two"), {"detailed_feedback": stale})
+
+    config = SimpleNamespace(server=SimpleNamespace(web_url="https://github.com"))
+    results = yearinreview.run_year_in_review_graph(
+        config,
+        FakeCollector(),
+        "octocat",
+        [{"full_name": "octo/one", "_year_commits": 3}, {"full_name": "octo/two", "_year_commits": 5}],
+        2024,
+        tmp_path,
+        run_feedback,
+        collect_detailed,
+    )
+
+    assert results["octo/one"].pr_count == 2
+    assert results["octo/one"].pr_title_quality == pytest.approx(75.0)  # Handed over in memory
+    assert results["octo/two"].pr_title_quality is None
+    assert results["octo/two"].year_commits == 5
+    assert results["octo/two"].commit_count == 7
+    for repo in ("one", "two"):
+        assert calls.count(("prs", f"octo/{repo}")) == 1
+        assert calls.count(("commits", repo)) == 1
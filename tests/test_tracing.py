@@ -0,0 +1,135 @@
+"""Tests for span tracing and the ``--profile``/``--trace`` instrumentation."""
+
+from __future__ import annotations
+
+import json
+import pstats
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+import pytest
+
+from github_feedback.api import client as api_client_module
+from github_feedback.collectors.collector import Collector
+from github_feedback.core import tracing
+from github_feedback.core.config import Config
+from github_feedback.core.models import AnalysisFilters
+from github_feedback.llm import client as llm_client_module
+from github_feedback.llm.client import LLMClient
+from github_feedback.testing import FakeLLMServer, MockGitHubServer, RepoSpec, SyntheticGitHub
+
+
+@pytest.fixture(autouse=True)
+def _reset_tracer(monkeypatch):
+    monkeypatch.setattr(api_client_module.time, "sleep", lambda seconds: None)
+    monkeypatch.setattr(llm_client_module.time, "sleep", lambda seconds: None)
+    yield
+    tracing.stop_tracing()
+
+
+def _spans(tracer, category=None):
+    return [event for event in tracer.events if category is None or event["cat"] == category]
+
+
+def test_spans_nest_and_record_thread_ids():
+    tracer = tracing.start_tracing()
+
+    @tracing.traced(category="work")
+    def work():
+        with tracing.span("inner", "work", size=3) as inner:
+            inner.set(done=True)
+
+    with tracing.span("outer", "phase"):
+        work()
+        worker = threading.Thread(target=work, name="worker-1")
+        worker.start()
+        worker.join()
+    with pytest.raises(RuntimeError), tracing.span("failing"):
+        raise RuntimeError("boom")
+
+    events = {(event["name"], event["tid"]): event for event in tracer.events}
+    main_id, worker_id = threading.main_thread().ident, worker.ident
+    outer = events[("outer", main_id)]
+    inner = events[("inner", main_id)]
+    assert outer["ts"] <= inner["ts"] and inner["ts"] + inner["dur"] <= outer["ts"] + outer["dur"]
+    assert inner["args"] == {"size": 3, "done": True}
+    assert ("inner", worker_id) in events
+    assert events[("failing", main_id)]["args"] == {"error": "RuntimeError"}
+
+    payload = tracer.to_dict()
+    names = {event["args"]["name"] for event in payload["traceEvents"] if event["ph"] == "M"}
+    assert {"MainThread", "worker-1"} <= names
+    json.dumps(payload)
+
+
+def test_disabled_tracing_is_a_no_op():
+    def task():
+        return 42
+
+    assert tracing.get_tracer() is None
+    assert tracing.traced_task(task, "task") is task
+    with tracing.span("ignored") as ignored:
+        ignored.set(value=1)
+    assert tracing.traced()(task)() == 42
+
+
+def test_traced_task_reports_queue_wait():
+    def block(seconds):
+        threading.Event().wait(seconds)  # time.sleep is patched out above
+
+    tracer = tracing.start_tracing()
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        futures = [executor.submit(tracing.traced_task(block, f"sleep-{n}"), 0.05) for n in range(2)]
+        for future in futures:
+            future.result()
+
+    waits = {event["name"]: event["args"]["queued_ms"] for event in _spans(tracer, "task")}
+    assert waits["sleep-1"] >= 40  # Waited for the only worker to finish sleep-0
+
+
+def test_http_collector_and_llm_calls_are_traced(monkeypatch):
+    import keyring
+
+    monkeypatch.setattr(keyring, "get_password", lambda service, username: "token")
+    dataset = SyntheticGitHub.generate([RepoSpec("octo/traced", pull_requests=5)], login="octocat")
+    tracer = tracing.start_tracing()
+    with MockGitHubServer(dataset) as server, FakeLLMServer() as llm_server:
+        config = Config()
+        config.server.api_url = server.url
+        collector = Collector(config)
+        collector.api_client.enable_cache = False
+        collector.list_pull_requests("octo/traced", datetime(2024, 1, 1, tzinfo=timezone.utc), AnalysisFilters())
+        LLMClient(endpoint=llm_server.endpoint, enable_cache=False).complete(
+            [{"role": "user", "content": "hello"}], operation="greeting"
+        )
+
+    http = _spans(tracer, "http")
+    assert http and all(event["args"]["status"] == 200 for event in http)
+    assert any(event["name"] == "GET repos/octo/traced/pulls" for event in http)
+    collector_names = {event["name"] for event in _spans(tracer, "collector")}
+    assert {"Collector.list_pull_requests", "PullRequestCollector.list_pull_requests"} <= collector_names
+    llm_names = [event["name"] for event in _spans(tracer, "llm")]
+    assert llm_names.count("LLMClient.complete") == 1 and "LLM greeting" in llm_names
+
+
+def test_instrument_writes_trace_and_threaded_profile(tmp_path):
+    trace_path = tmp_path / "out" / "trace.json"
+    profile_path = tmp_path / "out" / "run.prof"
+
+    def busy_worker():
+        return sum(index * index for index in range(20_000))
+
+    with tracing.instrument(trace_path=trace_path, profile_path=profile_path):
+        with tracing.span("Phase 1", "phase"):
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                executor.submit(busy_worker).result()
+
+    assert tracing.get_tracer() is None
+    trace = json.loads(trace_path.read_text(encoding="utf-8"))
+    assert any(event.get("name") == "Phase 1" for event in trace["traceEvents"])
+
+    stats = pstats.Stats(str(profile_path))
+    profiled = {function for _, _, function in stats.stats}  # type: ignore[attr-defined]
+    assert "busy_worker" in profiled
+    assert "busy_worker" in tracing.format_top_functions(stats, limit=50)